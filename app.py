@@ -8,9 +8,11 @@ import uuid
 import logging
 import socket
 import io
+import argparse
 from contextlib import redirect_stdout
 
-from baziAgent import run_bazi_analysis, TaskResult, MessageHandler
+# baziAgent 只在顶层导入轻量部分，autogen 等在预热或首个任务时导入
+from baziAgent import MessageHandler, warm_up, ziwei_metrics
 
 # 配置日志
 logging.basicConfig(
@@ -77,13 +79,13 @@ def task_worker(task_id: str, task: str):
 async def run_bazi_analysis_with_queue(task: str, message_handler):
     """修改后的 run_bazi_analysis 函数，将消息发送到列表而不是打印"""
     try:
-        from baziAgent import BaziAnalysisTeam
+        from baziAgent import BaziAnalysisTeam, TaskResult
         
         team_manager = BaziAnalysisTeam()
         team = team_manager.get_team()
         await team.reset()
         
-        async for message in team.run_stream(task=task):
+        async for message in team.run_stream(task=team_manager.prepare_task(task)):
             if isinstance(message, TaskResult):
                 await message_handler(f"停止原因: {message.stop_reason}")
             else:
@@ -164,7 +166,29 @@ def get_latest():
         logging.error(f"获取任务状态时出错: {str(e)}")
         return jsonify({"error": f"获取任务状态失败: {str(e)}"}), 500
 
+@app.route('/ziwei-status', methods=['GET'])
+def ziwei_status():
+    """紫微斗数客户端的熔断器、缓存和进程池状态"""
+    try:
+        return jsonify(ziwei_metrics())
+    except Exception as e:
+        logging.error(f"获取紫微斗数状态时出错: {str(e)}")
+        return jsonify({"error": f"获取紫微斗数状态失败: {str(e)}"}), 500
+
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="FortuneTell 服务器")
+    parser.add_argument("--no-warm-up", action="store_true", help="跳过预热，autogen 等在首个任务时导入")
+    parser.add_argument("--startup-report", action="store_true", help="输出各模块的导入耗时后退出")
+    options = parser.parse_args()
+
+    if options.startup_report:
+        from utils.startup import print_import_report
+        # 启动时导入的部分，以及推迟到预热或首个任务时导入的部分
+        print_import_report(["app"])
+        print()
+        print_import_report(["autogen_agentchat.agents", "autogen_ext.models.openai", "utils.bazi_json", "utils.ziwei_json"])
+        exit(0)
+
     try:
         logging.info("正在启动服务器...")
         print("\n" + "="*50)
@@ -181,6 +205,13 @@ if __name__ == '__main__':
             print("错误：端口 5001 已被占用，请检查是否有其他程序正在运行")
             exit(1)
             
+        # 预热完成后才开始监听端口，此后的第一个请求不再承担导入和加载的耗时
+        if not options.no_warm_up:
+            print("正在预热...")
+            for name, elapsed, error in warm_up():
+                print(f"- {name}: {elapsed * 1000:.0f} ms" + (f"（出错: {error}）" if error else ""))
+            print()
+
         print("服务器配置信息：")
         print(f"- 主机: 0.0.0.0")
         print(f"- 端口: 5001")
@@ -2,27 +2,44 @@ import asyncio
 from typing_extensions import Annotated
 import json
 from typing import Literal, Dict, Any
-from pydantic import BaseModel
 import logging
 import codecs
 import time
 from datetime import datetime
 import re
+from collections import OrderedDict
+import functools
+import importlib
+import threading
+from types import SimpleNamespace
 
-from autogen_core.tools import FunctionTool
-from autogen_agentchat.ui import Console
-from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_core.models import ModelFamily
-from autogen_agentchat.conditions import TextMentionTermination
-from autogen_agentchat.teams import RoundRobinGroupChat
-from autogen_agentchat.base import TaskResult
-from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.messages import StructuredMessage
-
-from utils.bazi_json import BaziAnalyzer
-from utils.ziwei_json import get_astrolabe_text
 from utils.prompt import AgentSystemMessage, ToolDescription
-from config import QWEN_MAX_CONFIG, DEEPSEEK_CONFIG, ZHIPU_CONFIG, QWEN3_CONFIG
+from utils.startup import run_steps
+from config import QWEN_MAX_CONFIG, DEEPSEEK_CONFIG, ZHIPU_CONFIG, QWEN3_CONFIG, BAZI_PILLAR_TABLE, ZIWEI_CONFIG, ZIWEI_COMPACT_TEXT
+
+# autogen（连带 openai、httpx、pydantic）、排盘引擎和紫微斗数客户端导入较慢，首次用到时才导入，
+# 服务启动时由 warm_up 提前完成
+_AUTOGEN = {
+    "FunctionTool": "autogen_core.tools",
+    "OpenAIChatCompletionClient": "autogen_ext.models.openai",
+    "TextMentionTermination": "autogen_agentchat.conditions",
+    "RoundRobinGroupChat": "autogen_agentchat.teams",
+    "TaskResult": "autogen_agentchat.base",
+    "AssistantAgent": "autogen_agentchat.agents",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def autogen():
+    """导入 autogen，返回以类名为属性的命名空间"""
+    return SimpleNamespace(**{name: getattr(importlib.import_module(module), name) for name, module in _AUTOGEN.items()})
+
+
+def __getattr__(name):
+    # 兼容 from baziAgent import TaskResult 等写法
+    if name in _AUTOGEN:
+        return getattr(autogen(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 配置日志，同时输出到控制台和文件
 logging.basicConfig(
@@ -35,6 +52,27 @@ logging.basicConfig(
 
 class MessageHandler:
     """消息处理器，根据规范处理不同类型的消息"""
+
+    # 八字排盘工具输出 -> 前端摘要，由工具在返回前写入，最多保留 SUMMARY_LIMIT 条；
+    # 多个任务的团队在各自的线程中同时读写，由 _summaries_lock 保护
+    SUMMARY_LIMIT = 256
+    summaries = OrderedDict()
+    _summaries_lock = threading.Lock()
+
+    @classmethod
+    def remember_summary(cls, content: str, summary: Dict[str, Any]) -> None:
+        """记录工具输出对应的摘要，超出上限时丢弃最早的记录"""
+        with cls._summaries_lock:
+            cls.summaries[content] = summary
+            cls.summaries.move_to_end(content)
+            while len(cls.summaries) > cls.SUMMARY_LIMIT:
+                cls.summaries.popitem(last=False)
+
+    @classmethod
+    def get_summary(cls, content: str):
+        """工具输出对应的摘要，没有记录时返回 None"""
+        with cls._summaries_lock:
+            return cls.summaries.get(content)
     
     @staticmethod
     def handle_message(message: Dict[str, Any]) -> None:
@@ -53,27 +91,12 @@ class MessageHandler:
                 if message_type == "ToolCallRequestEvent":
                     print(f"{{ type: {message_type}, source: {message.source}, message: {{ params: {message.content[0].arguments} }} }}")
                 elif message_type == "ToolCallExecutionEvent":
-                    # 提取关键信息
+                    # 摘要由排盘工具直接从结构化结果生成，不再解析输出文本
                     content = message.content[0].content
-                    try:
-                        bazi_data = json.loads(content)
-                        extracted_data = {
-                            "性别": next((item.split(": ")[1] for item in bazi_data["基本信息"] if "性别" in item), ""),
-                            "真太阳时": next((item.split(": ")[1] for item in bazi_data["基本信息"] if "公历" in item), ""),
-                            "命宫": next((item.split(": ")[1] for item in bazi_data["基本信息"] if "命宫" in item), ""),
-                            "胎元": next((item.split(": ")[1] for item in bazi_data["基本信息"] if "胎元" in item), ""),
-                            "四柱": next((item for item in bazi_data["四柱"] if "四柱：" in item), "").replace("四柱：", ""),
-                            "五行分数": next((item for item in bazi_data["五行分数"] if "五行分数" in item), "").replace("五行分数: ", ""),
-                            "五行总结": next((item for item in bazi_data["五行分数"] if "八字强弱" in item), "").replace("八字强弱: ", ""),
-                            "格局分析": {
-                                "调候": next((item for item in bazi_data["格局分析"] if "调候" in item), "").replace("调候: ", ""),
-                                "格局选用": next((item for item in bazi_data["格局分析"] if "格局选用" in item), "").replace("格局选用: ", ""),
-                                "命宫分析": next((item for item in bazi_data["格局分析"] if "命宫:" in item), "").replace("命宫: ", ""),
-                                "坐支分析": next((item for item in bazi_data["格局分析"] if "坐:" in item), "").replace("坐: ", "")
-                            }
-                        }
+                    extracted_data = MessageHandler.get_summary(content)
+                    if extracted_data is not None:
                         print(f"{{ type: {message_type}, source: {message.source}, message: {json.dumps(extracted_data, ensure_ascii=False)} }}")
-                    except json.JSONDecodeError:
+                    else:
                         print("你需要的json数据")
                 elif message_type == "TextMessage":
                     content = message.content
@@ -104,18 +127,42 @@ class MessageHandler:
         except Exception as e:
             logging.error(f"处理消息时出错: {str(e)}")
 
+# 紫微斗数服务不可用、团队中没有紫微斗数智能体时附在任务后面，让总结只基于八字分析
+ZIWEI_SKIPPED_NOTE = "\n（紫微斗数服务暂不可用，本次只做八字分析，总结时不要等待紫微斗数的结果）"
+
+
+def ziwei_available():
+    """紫微斗数服务是否可用：熔断中或健康检查失败时为 False"""
+    try:
+        from utils.ziwei_json import get_async_client
+        # 与紫微斗数工具用同一个客户端，读到的是工具调用所经过的熔断器
+        return get_async_client(**ZIWEI_CONFIG).api.available()
+    except Exception as e:
+        logging.error(f"检查紫微斗数服务时出错: {str(e)}")
+        return False
+
+
+def ziwei_metrics():
+    """紫微斗数客户端的熔断器、缓存和进程池状态"""
+    from utils.ziwei_json import get_async_client
+    return get_async_client(**ZIWEI_CONFIG).api.metrics()
+
+
 class BaziAnalysisTeam:
     """
     一个封装了八字和紫微斗数分析团队的类。
     该类初始化所有必要的代理、工具和团队本身。
+    紫微斗数服务不可用时团队中不含紫微斗数智能体，不为注定出错的工具调用花一轮模型调用。
     """
     
-    def __init__(self):
+    def __init__(self, ziwei=None):
+        """ziwei 为 None 时由 ziwei_available() 决定是否加入紫微斗数智能体"""
         try:
+            ag = autogen()
             logging.info("开始初始化模型客户端...")
             
             # 初始化模型客户端
-            self.model_client_qwenMax = OpenAIChatCompletionClient(
+            self.model_client_qwenMax = ag.OpenAIChatCompletionClient(
                 model=QWEN_MAX_CONFIG["model"],
                 api_key=QWEN_MAX_CONFIG["api_key"],
                 base_url=QWEN_MAX_CONFIG["base_url"],
@@ -125,7 +172,7 @@ class BaziAnalysisTeam:
             )
             logging.info("QWEN模型客户端初始化成功")
 
-            self.model_client_deepseekR1 = OpenAIChatCompletionClient(
+            self.model_client_deepseekR1 = ag.OpenAIChatCompletionClient(
                 model=DEEPSEEK_CONFIG["model"],
                 api_key=DEEPSEEK_CONFIG["api_key"],
                 base_url=DEEPSEEK_CONFIG["base_url"],
@@ -135,7 +182,7 @@ class BaziAnalysisTeam:
             )
             logging.info("Deepseek模型客户端初始化成功")
 
-            self.model_client_glmZ1Airx = OpenAIChatCompletionClient(
+            self.model_client_glmZ1Airx = ag.OpenAIChatCompletionClient(
                 model=ZHIPU_CONFIG["model"],
                 api_key=ZHIPU_CONFIG["api_key"],
                 base_url=ZHIPU_CONFIG["base_url"],
@@ -147,13 +194,13 @@ class BaziAnalysisTeam:
             
             # 初始化工具
             logging.info("开始初始化工具...")
-            self.bazi_paipan_tool = FunctionTool(self._bazi_paipan_tool, description=ToolDescription.get("bazi_paipan_tool"))
-            self.ziwei_paipan_tool = FunctionTool(self._ziwei_paipan_tool, description=ToolDescription.get("ziwei_paipan_tool"))
+            self.bazi_paipan_tool = ag.FunctionTool(self._bazi_paipan_tool, description=ToolDescription.get("bazi_paipan_tool"))
+            self.ziwei_paipan_tool = ag.FunctionTool(self._ziwei_paipan_tool, description=ToolDescription.get("ziwei_paipan_tool"))
             logging.info("工具初始化成功")
             
             # 初始化代理
             logging.info("开始初始化代理...")
-            self.agentBazi = AssistantAgent(
+            self.agentBazi = ag.AssistantAgent(
                 name="agentBazi",
                 model_client=self.model_client_qwenMax,
                 tools=[self.bazi_paipan_tool],
@@ -162,7 +209,7 @@ class BaziAnalysisTeam:
                 reflect_on_tool_use=True,
             )
 
-            self.agentZiwei = AssistantAgent(
+            self.agentZiwei = ag.AssistantAgent(
                 name="agentZiwei",
                 model_client=self.model_client_qwenMax,
                 tools=[self.ziwei_paipan_tool],
@@ -171,7 +218,7 @@ class BaziAnalysisTeam:
                 reflect_on_tool_use=True,
             )
 
-            self.agentSummary = AssistantAgent(
+            self.agentSummary = ag.AssistantAgent(
                 name="summary",
                 model_client=self.model_client_glmZ1Airx,
                 system_message=AgentSystemMessage.get("summary"),
@@ -179,11 +226,17 @@ class BaziAnalysisTeam:
             logging.info("代理初始化成功")
             
             # 创建终止条件
-            self.text_termination = TextMentionTermination("分析完成")
+            self.text_termination = ag.TextMentionTermination("分析完成")
             
             # 创建团队
-            self.team = RoundRobinGroupChat(
-                [self.agentBazi, self.agentZiwei, self.agentSummary], 
+            self.ziwei_enabled = ziwei_available() if ziwei is None else ziwei
+            if self.ziwei_enabled:
+                participants = [self.agentBazi, self.agentZiwei, self.agentSummary]
+            else:
+                logging.warning("紫微斗数服务不可用，本次分析跳过紫微斗数智能体")
+                participants = [self.agentBazi, self.agentSummary]
+            self.team = ag.RoundRobinGroupChat(
+                participants, 
                 termination_condition=self.text_termination,
                 max_turns=10,
             )
@@ -200,21 +253,24 @@ class BaziAnalysisTeam:
                                minute: Annotated[int, "分钟"] = 0, 
                                gender: Annotated[bool, "是否为女性"] = False, 
                                solar: Annotated[bool, "公历"] = False, 
-                               run_month: Annotated[bool, "是否为闰月"] = False) -> str:
+                               run_month: Annotated[bool, "是否为闰月"] = False,
+                               period: Annotated[list, "涉及的日期，格式为 ['YYYY-MM-DD', 'YYYY-MM-DD']，为空时输出全部大运流年"] = None) -> str:
         """
         根据用户输入的阳历或阴历的出生年份、月份、日期、时间，并结合用户是否为女性，得到用户的八字相关数据
         """
         try:
-            analyzer = BaziAnalyzer()
-            result = json.dumps(analyzer.analyze_bazi(year, month, day, time, minute, gender, solar, run_month), ensure_ascii=False, indent=None)
-            
-            # 清理特殊字符
-            result = result.replace('\u3000', ' ')
-            result = result.replace('\\n', ' ')
-            result = result.replace('\\t', ' ')
-            result = result.replace('\\r', ' ')
-            result = ' '.join(result.split())
-            
+            from utils.bazi_json import get_analyzer
+            from utils.bazi_model import render_json, render_summary
+
+            # 排盘引擎无状态，整个进程共享一个实例
+            analyzer = get_analyzer(BAZI_PILLAR_TABLE)
+            # 大运流年只输出 period 覆盖的年份
+            years = [int(str(item)[:4]) for item in period] if period else None
+            chart = analyzer.analyze(year, month, day, time, minute, gender, solar, run_month, years)
+            # 紧凑 JSON 给大模型，摘要留给 MessageHandler 展示
+            result = render_json(chart)
+            MessageHandler.remember_summary(result, render_summary(chart))
+
             return result
         except Exception as e:
             logging.error(f"八字排盘工具执行出错: {str(e)}")
@@ -223,12 +279,32 @@ class BaziAnalysisTeam:
     async def _ziwei_paipan_tool(self, date: Annotated[str, "日期，格式为YYYY-MM-DD"], 
                                 hour: Annotated[int, "出生时间（24小时制）"], 
                                 gender: Annotated[str, "性别，男或女"], 
-                                period: Annotated[list, "涉及的日期，格式为 ['YYYY-MM-DD', 'YYYY-MM-DD']"]) -> str:
+                                from_year: Annotated[int, "分析范围的起始年份"] = None,
+                                to_year: Annotated[int, "分析范围的结束年份（含）"] = None,
+                                granularity: Annotated[Literal["decade", "year", "month"], "按大限、按年或按月"] = "year",
+                                period: Annotated[list, "涉及的日期，格式为 ['YYYY-MM-DD', 'YYYY-MM-DD']，给出年份范围时不用"] = None) -> str:
         """
         根据用户输入的出生日期、时间和性别，获取紫微斗数命盘信息
         """
+        from utils.ziwei_json import ZiweiUnavailable, get_astrolabe_text_async, year_range
+
         try:
-            return get_astrolabe_text(date, hour, gender, period, is_solar=True, base_url="http://localhost:3000")
+            # 优先用年份范围，由服务端展开；只补上缺少的一端：起始年缺省为今年（不晚于结束年），
+            # 结束年缺省为起始年起 5 年
+            if from_year is not None or to_year is not None or not period:
+                this_year = datetime.now().year
+                if from_year is None:
+                    from_year = this_year if to_year is None else min(this_year, to_year)
+                if to_year is None:
+                    to_year = from_year + 4
+                period = year_range(from_year, to_year, granularity)
+            # 请求在客户端的线程池中进行，不阻塞驱动整个团队的事件循环；紧凑文本减少提示词长度
+            return await get_astrolabe_text_async(date, hour, gender, period, is_solar=True,
+                                                  compact=ZIWEI_COMPACT_TEXT, **ZIWEI_CONFIG)
+        except ZiweiUnavailable as e:
+            # 熔断中：不再重试，让智能体直接说明
+            logging.warning(f"紫微斗数服务暂不可用: {str(e)}")
+            return "紫微斗数服务暂不可用，请不要再调用本工具，直接说明本次未做紫微斗数分析。"
         except Exception as e:
             logging.error(f"紫微斗数排盘工具执行出错: {str(e)}")
             return f"紫微斗数排盘出错: {str(e)}"
@@ -237,6 +313,33 @@ class BaziAnalysisTeam:
         """返回初始化好的团队"""
         return self.team
 
+    def prepare_task(self, task):
+        """团队中没有紫微斗数智能体时在任务后附上说明"""
+        return task if self.ziwei_enabled else task + ZIWEI_SKIPPED_NOTE
+
+
+def warm_up():
+    """
+    服务就绪前的预热：导入 autogen、加载排盘用的节气表和古籍索引（配置了四柱表时一并打开）、
+    导入紫微斗数客户端，并完整构建一次团队以检查模型配置。返回 [(步骤名, 秒, 错误)]
+
+    模型客户端绑定在首次使用它的事件循环上，而 app.py 每个任务各用一个事件循环，
+    因此这里构建的团队不复用，每个任务仍新建自己的团队。
+    """
+    def bazi():
+        from utils.bazi_json import get_analyzer
+        from utils.bazi_model import render_json, render_summary
+
+        chart = get_analyzer(BAZI_PILLAR_TABLE).analyze(1996, 1, 1, 0, 31, False, True, False)
+        render_json(chart), render_summary(chart)
+
+    return run_steps([
+        ("autogen", autogen),
+        ("八字排盘", bazi),
+        ("紫微斗数", lambda: importlib.import_module("utils.ziwei_json").get_async_client(**ZIWEI_CONFIG)),
+        ("分析团队", BaziAnalysisTeam),
+    ])
+
 
 async def run_bazi_analysis(task):
     """使用给定的任务运行分析"""
@@ -245,7 +348,7 @@ async def run_bazi_analysis(task):
         team = team_manager.get_team()
         await team.reset()
         
-        async for message in team.run_stream(task=task):
+        async for message in team.run_stream(task=team_manager.prepare_task(task)):
             MessageHandler.handle_message(message)
     except Exception as e:
         logging.error(f"运行八字分析时出错: {str(e)}")
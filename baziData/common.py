@@ -12,7 +12,6 @@ from bidict import bidict
 
 from .datas import *
 from .ganzhi import *
-from .sizi import summarys
 
 def check_gan(gan, gans):
     result = ''
@@ -0,0 +1,1813 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 由 python -m utils.bazi_calendar build 根据 lunar_python 生成，请勿手工修改
+
+JIEQI_FIRST_YEAR = 1849
+JIEQI_NAMES = ('小寒', '大寒', '立春', '雨水', '惊蛰', '春分', '清明', '谷雨', '立夏', '小满', '芒种', '夏至', '小暑', '大暑', '立秋', '处暑', '白露', '秋分', '寒露', '霜降', '立冬', '小雪', '大雪', '冬至')
+
+# 交节时刻：从 JIEQI_FIRST_YEAR 年起每年 24 个，顺序同 JIEQI_NAMES，
+# 值为 datetime.date.toordinal() * 86400 加当天的秒数（北京时间）
+JIEQI_SECONDS = (
+    58317728829, 58319001412, 58320277219, 58321559770, 58322850344, 58324151551,
+    58325463540, 58326787415, 58328121959, 58329466440, 58330818471, 58332175610,
+    58333535009, 58334893148, 58336247603, 58337594787, 58338933478, 58340261001,
+    58341577761, 58342882534, 58344177321, 58345462336, 58346740833, 58348014035,
+    58349285899, 58350558047, 58351834495, 58353116600, 58354407786, 58355708505,
+    58357021031, 58358344405, 58359679379, 58361023452, 58362375767, 58363732716,
+    58365092180, 58366450379, 58367804651, 58369152121, 58370490449, 58371818402,
+    58373134692, 58374439953, 58375734226, 58377019748, 58378297732, 58379571439,
+    58380842795, 58382115417, 58383391338, 58384673880, 58385964496, 58387265635,
+    58388577521, 58389901333, 58391235619, 58392580182, 58393931873, 58395289358,
+    58396648400, 58398007082, 58399361183, 58400708970, 58402047341, 58403375420,
+    58404691879, 58405997098, 58407291556, 58408576911, 58409855025, 58411128507,
+    58412399944, 58413672360, 58414948362, 58416230741, 58417521484, 58418822462,
+    58420134569, 58421458141, 58422792776, 58424136949, 58425489123, 58426846091,
+    58428205734, 58429563882, 58430918604, 58432265896, 58433604771, 58434932409,
+    58436249219, 58437554043, 58438848743, 58440133719, 58441412036, 58442685140,
+    58443956804, 58445228855, 58446505142, 58447787200, 58449078277, 58450379021,
+    58451691455, 58453014920, 58454349770, 58455693992, 58457046146, 58458403320,
+    58459762652, 58461121165, 58462475384, 58463823199, 58465161519, 58466489760,
+    58467806022, 58469111457, 58470405623, 58471691191, 58472968966, 58474242636,
+    58475513735, 58476786334, 58478062037, 58479344636, 58480635117, 58481936378,
+    58483248202, 58484572124, 58485906396, 58487250974, 58488602669, 58489960022,
+    58491319093, 58492677553, 58494031771, 58495379358, 58496717960, 58498045905,
+    58499362661, 58500667787, 58501962544, 58503247794, 58504526164, 58505799485,
+    58507071115, 58508343301, 58509619442, 58510901544, 58512192405, 58513493099,
+    58514805331, 58516128648, 58517463411, 58518807377, 58520159638, 58521516446,
+    58522876063, 58524234103, 58525588709, 58526936032, 58528274828, 58529602688,
+    58530919509, 58532224676, 58533519418, 58534804745, 58536083058, 58537356429,
+    58538627984, 58539900169, 58541176220, 58542458290, 58543749030, 58545049733,
+    58546361789, 58547685249, 58549019751, 58550364068, 58551715960, 58553073334,
+    58554432514, 58555791251, 58557145395, 58558493360, 58559831666, 58561159992,
+    58562476320, 58563781835, 58565076136, 58566361806, 58567639737, 58568913503,
+    58570184710, 58571457342, 58572733053, 58574015583, 58575305982, 58576607095,
+    58577918833, 58579242590, 58580576863, 58581921283, 58583273097, 58584630290,
+    58585989589, 58587347897, 58588702384, 58590049804, 58591388600, 58592716336,
+    58594033190, 58595338099, 58596632928, 58597918008, 58599196499, 58600469724,
+    58601741554, 58603013705, 58604290092, 58605572172, 58606863260, 58608163896,
+    58609476275, 58610799491, 58612134298, 58613478165, 58614830371, 58616187138,
+    58617546623, 58618904727, 58620259169, 58621606660, 58622945266, 58624273314,
+    58625589904, 58626895244, 58628189748, 58629475265, 58630753375, 58632026980,
+    58633298380, 58634570838, 58635846767, 58637129125, 58638419740, 58639720694,
+    58641032566, 58642356188, 58643690421, 58645034796, 58646386391, 58647743741,
+    58649102686, 58650461348, 58651815406, 58653163320, 58654501727, 58655830058,
+    58657146616, 58658452135, 58659746681, 58661032292, 58662310410, 58663584040,
+    58664855369, 58666127825, 58667403634, 58668685993, 58669976507, 58671277462,
+    58672589347, 58673912924, 58675247357, 58676591549, 58677943537, 58679300508,
+    58680659997, 58682018137, 58683372788, 58684720102, 58686059028, 58687386749,
+    58688703731, 58690008693, 58691303627, 58692588749, 58693867277, 58695140463,
+    58696412240, 58697684261, 58698960537, 58700242456, 58701533435, 58702833977,
+    58704146304, 58705469560, 58706804365, 58708148406, 58709500590, 58710857607,
+    58712217006, 58713575378, 58714929670, 58716277380, 58717615785, 58718943995,
+    58720260379, 58721565866, 58722860200, 58724145877, 58725423842, 58726697619,
+    58727968876, 58729241510, 58730517284, 58731799808, 58733090251, 58734391348,
+    58735703053, 58737026798, 58738360932, 58739705404, 58741056991, 58742414357,
+    58743773354, 58745131916, 58746486061, 58747833778, 58749172291, 58750500363,
+    58751817036, 58753122298, 58754417008, 58755702428, 58756980789, 58758254310,
+    58759525945, 58760798325, 58762074439, 58763356680, 58764647439, 58765948186,
+    58767260237, 58768583533, 58769918089, 58771262007, 58772614116, 58773970902,
+    58775330490, 58776688549, 58778043248, 58779390594, 58780729531, 58782057370,
+    58783374314, 58784679406, 58785974241, 58787259467, 58788537867, 58789811147,
+    58791082808, 58792354926, 58793631102, 58794913115, 58796203974, 58797504592,
+    58798816734, 58800140056, 58801474605, 58802818747, 58804170677, 58805527900,
+    58806887145, 58808245820, 58809600074, 58810948093, 58812286526, 58813614966,
+    58814931383, 58816236990, 58817531300, 58818816996, 58820094863, 58821368600,
+    58822639715, 58823912305, 58825187939, 58826470454, 58827760808, 58829061945,
+    58830373648, 58831697456, 58833031670, 58834376154, 58835727872, 58837085154,
+    58838444347, 58839802782, 58841157206, 58842504800, 58843843613, 58845171559,
+    58846488482, 58847793584, 58849088460, 58850373662, 58851652116, 58852925365,
+    58854197061, 58855469159, 58856745361, 58858027365, 58859318278, 58860618870,
+    58861931136, 58863254352, 58864589126, 58865933011, 58867285257, 58868642029,
+    58870001615, 58871359700, 58872714292, 58874061760, 58875400564, 58876728622,
+    58878045453, 58879350830, 58880645579, 58881931112, 58883209414, 58884482955,
+    58885754446, 58887026731, 58888302648, 58889584748, 58890875295, 58892175976,
+    58893487800, 58894811211, 58896145471, 58897489741, 58898841426, 58900198779,
+    58901557835, 58902916587, 58904270737, 58905618789, 58906957252, 58908285750,
+    58909602348, 58910908061, 58912202649, 58913488464, 58914766607, 58916040408,
+    58917311708, 58918584252, 58919859934, 58921142272, 58922432557, 58923733415,
+    58925045012, 58926368500, 58927702676, 58929046870, 58930398702, 58931755787,
+    58933115240, 58934473563, 58935828275, 58937175779, 58938514804, 58939842665,
+    58941159742, 58942464792, 58943759815, 58945045006, 58946323622, 58947596872,
+    58948868720, 58950140781, 58951417078, 58952698973, 58953989896, 58955290317,
+    58956602515, 58957925565, 58959260234, 58960604051, 58961956190, 58963313053,
+    58964672547, 58966030866, 58967385369, 58968733119, 58970071785, 58971400071,
+    58972716687, 58974022218, 58975316715, 58976602388, 58977880464, 58979154205,
+    58980425555, 58981698135, 58982973993, 58984256441, 58985546935, 58986847913,
+    58988159598, 58989483172, 58990817199, 58992161481, 58993512914, 58994870169,
+    58996229047, 58997587648, 58998941759, 59000289660, 59001628217, 59002956566,
+    59004273318, 59005578857, 59006873605, 59008159230, 59009437544, 59010711182,
+    59011982696, 59013255139, 59014531097, 59015813385, 59017103982, 59018404777,
+    59019716661, 59021039990, 59022374359, 59023718265, 59025070172, 59026426904,
+    59027786340, 59029144357, 59030499032, 59031846393, 59033185446, 59034513361,
+    59035830520, 59037135717, 59038430789, 59039716090, 59040994669, 59042267942,
+    59043539685, 59044811706, 59046087886, 59047369747, 59048660583, 59049961036,
+    59051273173, 59052596337, 59053930917, 59055274898, 59056626869, 59057983908,
+    59059343170, 59060701667, 59062055940, 59063403858, 59064742349, 59066070803,
+    59067387332, 59068693047, 59069987509, 59071273350, 59072551361, 59073825205,
+    59075096400, 59076369005, 59077644627, 59078927062, 59080217326, 59081518339,
+    59082829916, 59084153623, 59085487715, 59086832168, 59088183777, 59089541097,
+    59090900163, 59092258658, 59093612929, 59094960589, 59096299266, 59097627304,
+    59098944152, 59100249388, 59101544255, 59102829633, 59104108113, 59105381550,
+    59106653258, 59107925505, 59109201651, 59110483723, 59111774496, 59113075073,
+    59114387146, 59115710304, 59117044902, 59118388730, 59119740884, 59121097626,
+    59122457227, 59123815283, 59125169949, 59126517344, 59127856226, 59129184169,
+    59130501077, 59131806331, 59133101177, 59134386613, 59135665045, 59136938523,
+    59138210168, 59139482400, 59140758463, 59142040483, 59143331130, 59144631671,
+    59145943535, 59147266755, 59148601020, 59149945094, 59151296792, 59152654016,
+    59154013124, 59155371862, 59156726091, 59158074213, 59159412724, 59160741296,
+    59162057869, 59163363617, 59164658112, 59165943928, 59167221950, 59168495750,
+    59169766938, 59171039500, 59172315101, 59173597476, 59174887691, 59176188593,
+    59177500098, 59178823622, 59180157664, 59181501897, 59182853574, 59184210728,
+    59185570058, 59186928499, 59188283171, 59189630837, 59190969900, 59192297919,
+    59193615042, 59194920180, 59196215189, 59197500372, 59198778889, 59200052058,
+    59201323753, 59202595710, 59203871855, 59205153672, 59206444485, 59207744871,
+    59209057016, 59210380048, 59211714714, 59213058495, 59214410676, 59215767477,
+    59217127063, 59218485316, 59219839974, 59221187698, 59222526577, 59223854888,
+    59225171743, 59226477306, 59227772000, 59229057642, 59230335817, 59231609416,
+    59232880753, 59234153091, 59235428865, 59236711028, 59238001433, 59239302157,
+    59240613803, 59241937205, 59243271255, 59244615465, 59245966950, 59247324222,
+    59248683146, 59250041837, 59251395978, 59252744035, 59254082625, 59255411191,
+    59256727993, 59258033780, 59259328570, 59260614414, 59261892709, 59263166474,
+    59264437857, 59265710300, 59266986006, 59268268188, 59269558454, 59270859115,
+    59272170672, 59273493929, 59274828058, 59276172002, 59277523797, 59278880659,
+    59280240097, 59281598278, 59282953036, 59284300544, 59285639724, 59286967757,
+    59288285076, 59289590373, 59290885622, 59292171010, 59293449747, 59294723065,
+    59295994896, 59297266876, 59298543030, 59299824731, 59301115427, 59302415615,
+    59303727560, 59305050425, 59306384869, 59307728607, 59309080585, 59310437500,
+    59311796919, 59313155410, 59314509928, 59315857917, 59317196656, 59318525203,
+    59319841934, 59321147731, 59322442353, 59323728262, 59325006408, 59326280295,
+    59327551595, 59328824191, 59330099858, 59331382199, 59332672408, 59333973232,
+    59335284648, 59336608111, 59337941979, 59339286224, 59340637631, 59341994888,
+    59343353853, 59344712474, 59346066758, 59347414688, 59348753452, 59350081807,
+    59351398749, 59352704264, 59353999176, 59355284766, 59356563233, 59357836830,
+    59359108481, 59360380851, 59361656901, 59362939054, 59364229680, 59365530276,
+    59366842136, 59368165233, 59369499567, 59370843270, 59372195177, 59373551797,
+    59374911273, 59376269285, 59377624019, 59378971474, 59380310588, 59381638662,
+    59382955882, 59384261270, 59385556410, 59386841917, 59388120560, 59389394017,
+    59390665783, 59391937921, 59393214047, 59394495930, 59395786610, 59397086986,
+    59398398862, 59399721881, 59401056134, 59402399967, 59403751629, 59405108609,
+    59406467678, 59407826250, 59409180498, 59410528607, 59411867225, 59413195938,
+    59414512690, 59415818667, 59417113358, 59418399403, 59419677569, 59420951523,
+    59422222763, 59423495377, 59424770941, 59426053294, 59427343419, 59428644272,
+    59429955659, 59431279146, 59432613049, 59433957271, 59435308779, 59436665942,
+    59438025074, 59439383532, 59440738024, 59442085744, 59443424718, 59444752874,
+    59446070031, 59447375386, 59448670517, 59449955956, 59451234611, 59452508013,
+    59453779790, 59455051902, 59456328031, 59457609902, 59458900614, 59460200978,
+    59461512983, 59462835959, 59464170506, 59465514214, 59466866339, 59468223051,
+    59469582642, 59470940777, 59472295470, 59473643046, 59474981985, 59476310171,
+    59477627143, 59478932649, 59480227534, 59481513187, 59482791606, 59484065251,
+    59485336837, 59486609199, 59487885172, 59489167283, 59490457800, 59491758385,
+    59493070068, 59494393289, 59495727346, 59497071395, 59498422891, 59499780074,
+    59501139015, 59502497701, 59503851842, 59505199935, 59506538469, 59507867071,
+    59509183773, 59510489608, 59511784304, 59513070238, 59514348485, 59515622394,
+    59516893780, 59518166400, 59519442128, 59520724477, 59522014731, 59523315510,
+    59524626979, 59525950304, 59527284283, 59528628278, 59529979914, 59531336843,
+    59532696167, 59534054442, 59535409166, 59536756776, 59538095970, 59539424058,
+    59540741371, 59542046641, 59543341845, 59544627159, 59545905840, 59547179094,
+    59548450895, 59549722861, 59550999033, 59552280769, 59553571522, 59554871758,
+    59556183767, 59557506636, 59558841134, 59560184809, 59561536850, 59562893666,
+    59564253182, 59565611580, 59566966239, 59568314180, 59569653091, 59570981626,
+    59572298507, 59573604265, 59574898959, 59576184754, 59577462886, 59578736594,
+    59580007839, 59581280241, 59582555875, 59583838064, 59585128305, 59586429053,
+    59587740560, 59589064013, 59590397976, 59591742240, 59593093696, 59594451002,
+    59595809966, 59597168682, 59598522938, 59599871011, 59601209749, 59602538293,
+    59603855221, 59605160929, 59606455805, 59607741530, 59609019881, 59610293517,
+    59611564951, 59612837274, 59614113047, 59615395129, 59616685490, 59617986063,
+    59619297735, 59620620902, 59621955145, 59623298985, 59624650874, 59626007638,
+    59627367144, 59628725269, 59630080080, 59631427605, 59632766838, 59634094956,
+    59635412330, 59636717751, 59638013051, 59639298560, 59640577314, 59641850698,
+    59643122475, 59644394436, 59645670466, 59646952083, 59648242612, 59649542696,
+    59650854455, 59652177241, 59653511496, 59654855205, 59656207006, 59657563959,
+    59658923242, 59660281844, 59661636306, 59662984471, 59664323257, 59665652034,
+    59666968903, 59668274946, 59669569726, 59670855831, 59672134058, 59673408035,
+    59674679284, 59675951846, 59677227334, 59678509537, 59679799491, 59681100122,
+    59682411278, 59683734555, 59685068245, 59686412375, 59687763764, 59689121011,
+    59690480125, 59691838804, 59693193340, 59694541334, 59695880369, 59697208777,
+    59698525969, 59699831517, 59701126644, 59702412228, 59703690847, 59704964362,
+    59706236065, 59707508249, 59708784249, 59710066123, 59711356629, 59712656908,
+    59713968638, 59715291457, 59716625716, 59717969257, 59719321189, 59720677805,
+    59722037389, 59723395534, 59724750403, 59726098067, 59727437286, 59728765580,
+    59730082838, 59731388400, 59732683507, 59733969133, 59735247696, 59736521245,
+    59737792917, 59739065138, 59740341157, 59741623087, 59742913608, 59744213962,
+    59745525601, 59746848544, 59748182515, 59749526265, 59750877668, 59752234613,
+    59753593516, 59754952125, 59756306332, 59757654531, 59758993216, 59760322051,
+    59761638933, 59762945030, 59764239864, 59765526000, 59766804288, 59768078298,
+    59769349624, 59770622254, 59771897853, 59773180157, 59774470244, 59775770958,
+    59777082231, 59778405492, 59779739240, 59781083179, 59782434558, 59783791447,
+    59785150535, 59786508822, 59787863416, 59789211131, 59790550346, 59791878631,
+    59793196083, 59794501596, 59795796984, 59797082518, 59798361334, 59799634724,
+    59800906549, 59802178538, 59803454621, 59804736289, 59806026886, 59807327004,
+    59808638850, 59809961584, 59811295955, 59812639480, 59813991451, 59815348096,
+    59816707591, 59818065808, 59819420501, 59820768300, 59822107327, 59823435815,
+    59824752904, 59826058712, 59827353680, 59828639573, 59829917984, 59831191765,
+    59832463225, 59833735607, 59835011349, 59836293401, 59837583646, 59838884173,
+    59840195622, 59841518839, 59842852730, 59844196806, 59845548200, 59846905404,
+    59848264305, 59849622998, 59850977169, 59852325270, 59853663910, 59854992540,
+    59856309402, 59857615269, 59858910140, 59860196089, 59861474484, 59862748368,
+    59864019847, 59865292385, 59866568142, 59867850351, 59869140591, 59870441191,
+    59871752644, 59873075777, 59874409764, 59875753575, 59877105251, 59878462028,
+    59879821411, 59881179585, 59882534361, 59883881923, 59885221165, 59886549276,
+    59887866674, 59889172061, 59890467412, 59891752903, 59893031744, 59894305150,
+    59895577047, 59896849061, 59898125216, 59899406874, 59900697491, 59901997546,
+    59903309329, 59904631992, 59905966228, 59907309755, 59908661558, 59910018336,
+    59911377687, 59912736177, 59914090773, 59915438900, 59916777838, 59918106609,
+    59919423582, 59920729593, 59922024409, 59923310444, 59924588673, 59925862572,
+    59927133837, 59928406345, 59929681891, 59930964074, 59932254112, 59933554741,
+    59934865961, 59936189226, 59937522912, 59938867015, 59940218335, 59941575585,
+    59942934608, 59944293367, 59945647834, 59946995989, 59948334998, 59949663611,
+    59950980789, 59952286516, 59953581584, 59954867270, 59956145750, 59957419294,
+    59958690803, 59959962988, 59961238792, 59962520694, 59963811053, 59965111415,
+    59966423061, 59967746006, 59969080224, 59970423879, 59971775787, 59973132466,
+    59974492054, 59975850225, 59977205166, 59978552849, 59979892215, 59981220536,
+    59982537988, 59983843574, 59985138869, 59986424473, 59987703157, 59988976595,
+    59990248293, 59991520316, 59992796290, 59994077982, 59995368452, 59996668593,
+    59997980246, 59999303048, 60000637128, 60001980811, 60003332387, 60004689308,
+    60006048379, 60007406992, 60008761336, 60010109583, 60011448385, 60012777320,
+    60014094310, 60015400538, 60016695466, 60017981723, 60019260061, 60020534131,
+    60021805423, 60023078012, 60024353477, 60025635648, 60026925532, 60028226086,
+    60029537153, 60030860319, 60032193922, 60033537901, 60034889227, 60036246295,
+    60037605396, 60038963925, 60040318550, 60041666495, 60043005741, 60044334221,
+    60045651704, 60046957383, 60048252803, 60049538484, 60050817319, 60052090825,
+    60053362622, 60054634671, 60055910647, 60057192291, 60058482699, 60059782714,
+    60061094331, 60062416928, 60063751114, 60065094535, 60066446458, 60067803081,
+    60069162701, 60070520975, 60071875911, 60073223784, 60074563078, 60075891612,
+    60077208934, 60078514742, 60079809898, 60081095753, 60082374320, 60083648036,
+    60084919626, 60086191916, 60087467749, 60088749658, 60090039936, 60091340251,
+    60092651668, 60093974625, 60095308444, 60096652276, 60098003613, 60099360682,
+    60100719599, 60102078337, 60103432617, 60104780916, 60106119706, 60107448596,
+    60108765576, 60110071675, 60111366586, 60112652693, 60113931047, 60115205021,
+    60116476407, 60117748994, 60119024634, 60120306867, 60121596966, 60122897567,
+    60124208836, 60125531950, 60126865709, 60128209495, 60129560934, 60130917708,
+    60132276916, 60133635152, 60134989894, 60136337612, 60137676972, 60139005299,
+    60140322893, 60141628483, 60142924014, 60144209631, 60145488565, 60146761996,
+    60148033885, 60149305847, 60150581929, 60151863498, 60153154025, 60154453979,
+    60155765687, 60157088233, 60158422415, 60159765794, 60161117576, 60162474179,
+    60163833550, 60165191876, 60166546558, 60167894603, 60169233722, 60170562532,
+    60171879762, 60173185890, 60174480977, 60175767123, 60177045566, 60178319492,
+    60179590867, 60180863284, 60182138833, 60183420834, 60184710814, 60186011234,
+    60187322386, 60188645475, 60189979100, 60191323086, 60192674343, 60194031541,
+    60195390480, 60196749245, 60198103602, 60199451819, 60200790736, 60202119495,
+    60203436651, 60204742607, 60206037721, 60207323677, 60208602217, 60209876004,
+    60211147513, 60212419855, 60213695551, 60214977499, 60216267647, 60217567976,
+    60218879365, 60220202264, 60221536250, 60222879892, 60224231636, 60225588331,
+    60226947837, 60228306026, 60229660948, 60231008610, 60232347995, 60233676269,
+    60234993788, 60236299350, 60237594783, 60238880415, 60240159289, 60241432787,
+    60242704677, 60243976736, 60245252842, 60246534487, 60247824990, 60249124972,
+    60250436575, 60251759142, 60253093160, 60254436608, 60255788180, 60257144921,
+    60258504062, 60259862576, 60261217028, 60262565240, 60263904130, 60265233044,
+    60266550065, 60267856268, 60269151203, 60270437450, 60271715813, 60272989903,
+    60274261252, 60275533883, 60276809416, 60278091616, 60279381530, 60280682060,
+    60281993072, 60283316155, 60284649618, 60285993513, 60287344672, 60288701730,
+    60290060695, 60291419316, 60292773865, 60294121977, 60295461196, 60296789850,
+    60298107296, 60299413091, 60300708420, 60301994153, 60303272854, 60304546389,
+    60305818049, 60307090146, 60308366011, 60309647734, 60310938059, 60312238159,
+    60313549695, 60314872341, 60316206423, 60317549826, 60318901649, 60320258211,
+    60321617802, 60322976020, 60324331030, 60325678879, 60327018339, 60328346879,
+    60329664402, 60330970200, 60332265518, 60333551288, 60334829933, 60336103479,
+    60337375074, 60338647144, 60339922958, 60341204652, 60342494938, 60343795075,
+    60345106551, 60346429371, 60347763279, 60349106991, 60350458404, 60351815366,
+    60353174332, 60354533021, 60355887347, 60357235689, 60358574544, 60359903561,
+    60361220620, 60362526889, 60363821862, 60365108112, 60366386461, 60367660491,
+    60368931771, 60370204309, 60371479756, 60372761874, 60374051748, 60375352242,
+    60376663310, 60377986392, 60379320003, 60380663858, 60382015196, 60383372100,
+    60384731232, 60386089612, 60387444311, 60388792174, 60390131546, 60391460027,
+    60392777687, 60394083436, 60395379061, 60396664821, 60397943825, 60399217342,
+    60400489216, 60401761170, 60403037126, 60404318583, 60405608896, 60406908674,
+    60408220155, 60409542526, 60410876564, 60412219823, 60413571607, 60414928160,
+    60416287665, 60417645981, 60419000861, 60420348898, 60421688225, 60423017025,
+    60424334452, 60425640579, 60426935858, 60428222006, 60429500633, 60430774544,
+    60432046067, 60433318413, 60434594038, 60435875879, 60437165841, 60438466010,
+    60439777069, 60441099875, 60442433385, 60443777150, 60445128339, 60446485461,
+    60447844413, 60449203268, 60450557695, 60451906111, 60453245099, 60454574083,
+    60455891271, 60457197431, 60458492535, 60459778664, 60461057169, 60462331109,
+    60463602567, 60464875038, 60466150652, 60467432684, 60468722688, 60470023031,
+    60471334194, 60472657042, 60473990742, 60475334311, 60476685790, 60478042456,
+    60479401813, 60480760065, 60482115007, 60483462818, 60484802361, 60486130806,
+    60487448528, 60488754217, 60490049814, 60491335492, 60492614459, 60493887937,
+    60495159863, 60496431872, 60497707985, 60498989561, 60500280055, 60501579937,
+    60502891512, 60504213923, 60505547891, 60506891127, 60508242657, 60509599174,
+    60510958327, 60512316683, 60513671244, 60515019427, 60516358526, 60517687537,
+    60519004817, 60520311167, 60521606332, 60522892682, 60524171189, 60525445287,
+    60526716688, 60527989240, 60529264763, 60530546845, 60531836729, 60533137145,
+    60534448124, 60535771115, 60537104520, 60538448344, 60539799396, 60541156410,
+    60542515230, 60543873866, 60545228281, 60546576496, 60547915657, 60549244518,
+    60550562000, 60551868074, 60553163490, 60554449507, 60555728267, 60557002021,
+    60558273647, 60559545860, 60560821586, 60562103337, 60563393462, 60564693555,
+    60566004894, 60567327547, 60568661477, 60570004903, 60571356622, 60572713185,
+    60574072716, 60575430893, 60576785894, 60578133675, 60579473192, 60580801685,
+    60582119348, 60583425159, 60584720694, 60586006523, 60587285416, 60588559016,
+    60589830820, 60591102879, 60592378812, 60593660396, 60594950709, 60596250658,
+    60597562121, 60598884734, 60600218657, 60601562200, 60602913685, 60604270535,
+    60605629594, 60606988215, 60608342605, 60609690907, 60611029779, 60612358782,
+    60613675836, 60614982135, 60616277130, 60617563467, 60618841885, 60620116043,
+    60621387415, 60622660074, 60623935584, 60625217769, 60626507629, 60627808113,
+    60629119080, 60630442112, 60631775570, 60633119413, 60634470615, 60635827599,
+    60637186645, 60638545178, 60639899828, 60641247849, 60642587179, 60643915772,
+    60645233365, 60646539172, 60647834712, 60649120509, 60650399438, 60651673012,
+    60652944840, 60654216885, 60655492817, 60656774380, 60658064666, 60659364522,
+    60660675947, 60661998333, 60663332294, 60664675513, 60666027258, 60667383762,
+    60668743331, 60670101629, 60671456669, 60672804705, 60674144229, 60675473010,
+    60676790602, 60678096649, 60679392020, 60680678016, 60681956673, 60683230393,
+    60684501933, 60685774101, 60687049772, 60688331476, 60689621532, 60690921605,
+    60692232787, 60693555513, 60694889139, 60696232825, 60697584091, 60698941158,
+    60700300164, 60701659047, 60703013534, 60704362073, 60705701130, 60707030293,
+    60708347529, 60709653862, 60710948951, 60712235182, 60713513579, 60714787524,
+    60716058794, 60717331208, 60718606605, 60719888579, 60721178390, 60722478726,
+    60723789747, 60725112665, 60726446271, 60727789973, 60729141382, 60730498194,
+    60731857494, 60733215887, 60734570825, 60735918785, 60737258401, 60738586999,
+    60739904842, 60741210662, 60742506373, 60743792124, 60745071137, 60746344595,
+    60747616457, 60748888345, 60750164296, 60751445683, 60752735981, 60754035668,
+    60755347097, 60756669363, 60758003300, 60759346466, 60760698097, 60762054598,
+    60763413936, 60764772284, 60766127052, 60767475234, 60768814551, 60770143592,
+    60771461091, 60772767494, 60774062862, 60775349253, 60776627919, 60777901998,
+    60779173477, 60780445908, 60781721402, 60783003253, 60784293016, 60785593142,
+    60786903966, 60788226698, 60789559984, 60790903667, 60792254685, 60793611727,
+    60794970595, 60796329401, 60797683883, 60799032323, 60800371525, 60801700612,
+    60803018105, 60804324397, 60805619814, 60806906035, 60808184778, 60809458706,
+    60810730271, 60812002596, 60813278182, 60814559952, 60815849834, 60817149851,
+    60818460871, 60819783400, 60821117009, 60822460339, 60823811829, 60825168383,
+    60826527855, 60827886133, 60829241250, 60830589185, 60831928905, 60833257526,
+    60834575391, 60835881268, 60837176970, 60838462812, 60839741836, 60841015416,
+    60842287321, 60843559330, 60844835323, 60846116808, 60847407117, 60848706885,
+    60850018273, 60851340615, 60852674420, 60854017653, 60855369047, 60856725633,
+    60858084698, 60859443194, 60860797721, 60862146072, 60863485174, 60864814335,
+    60866131622, 60867438084, 60868733247, 60870019683, 60871298184, 60872572361,
+    60873843752, 60875116376, 60876391867, 60877673985, 60878963793, 60880264182,
+    60881575042, 60882897945, 60884231219, 60885574919, 60886925882, 60888282765,
+    60889641580, 60891000113, 60892354618, 60893702777, 60895042102, 60896370952,
+    60897688648, 60898994757, 60900290412, 60901576465, 60902855437, 60904129169,
+    60905400935, 60906673047, 60907948838, 60909230414, 60910520526, 60911820374,
+    60913131626, 60914453985, 60915787775, 60917130921, 60918482505, 60919838880,
+    60921198334, 60922556480, 60923911492, 60925259413, 60926599035, 60927927795,
+    60929245611, 60930551726, 60931847391, 60933133478, 60934412415, 60935686171,
+    60936957903, 60938230005, 60939505760, 60940787299, 60942077359, 60943377212,
+    60944688379, 60946010881, 60947344508, 60948687993, 60950039263, 60951396154,
+    60952755135, 60954113879, 60955468308, 60956816770, 60958155772, 60959484949,
+    60960802178, 60962108630, 60963403780, 60964690205, 60965968702, 60967242852,
+    60968514200, 60969786759, 60971062156, 60972344175, 60973633884, 60974934183,
+    60976245029, 60977567894, 60978901305, 60980245005, 60981596239, 60982953105,
+    60984312257, 60985670722, 60987025530, 60988373539, 60989713046, 60991041666,
+    60992359433, 60993665283, 60994960978, 60996246804, 60997525865, 60998799446,
+    61000071387, 61001343411, 61002619417, 61003900897, 61005191180, 61006490873,
+    61007802219, 61009124407, 61010458244, 61011801291, 61013152881, 61014509271,
+    61015868665, 61017226927, 61018581818, 61019929920, 61021269368, 61022598308,
+    61023915899, 61025222175, 61026517601, 61027803860, 61029082591, 61030356562,
+    61031628139, 61032900497, 61034176121, 61035457916, 61036747810, 61038047863,
+    61039358781, 61040681404, 61042014722, 61043358287, 61044709295, 61046066271,
+    61047425132, 61048783974, 61050138468, 61051487036, 61052826244, 61054155487,
+    61055472940, 61056779349, 61058074651, 61059360922, 61060639490, 61061913423,
+    61063184797, 61064457133, 61065732556, 61067014380, 61068304146, 61069604268,
+    61070915204, 61072237864, 61073571390, 61074914844, 61076266240, 61077622894,
+    61078982298, 61080340670, 61081695790, 61083043828, 61084383635, 61085712354,
+    61087030345, 61088336282, 61089632078, 61090917900, 61092196933, 61093470397,
+    61094742224, 61096014057, 61097289933, 61098571241, 61099861464, 61101161101,
+    61102472482, 61103794748, 61105128635, 61106471827, 61107823368, 61109179916,
+    61110539155, 61111897613, 61113252320, 61114600669, 61115939963, 61117269174,
+    61118586654, 61119893190, 61121188515, 61122474987, 61123753576, 61125027696,
+    61126299068, 61127571522, 61128846898, 61130128773, 61131418426, 61132718582,
+    61134029319, 61135352081, 61136685309, 61138029008, 61139379997, 61140737012,
+    61142095881, 61143454622, 61144809161, 61146157546, 61147496888, 61148825967,
+    61150143684, 61151450024, 61152745699, 61154031962, 61155310918, 61156584801,
+    61157856471, 61159128640, 61160404226, 61161685755, 61162975571, 61164275306,
+    61165586244, 61166908505, 61168242062, 61169585198, 61170936698, 61172293162,
+    61173652700, 61175010996, 61176366207, 61177714268, 61179054121, 61180382965,
+    61181700996, 61183007149, 61184303010, 61185589108, 61186868220, 61188141955,
+    61189413820, 61190685843, 61191961652, 61193243022, 61194533038, 61195832621,
+    61197143674, 61198465852, 61199799376, 61201142580, 61202493842, 61203850582,
+    61205209681, 61206568443, 61207923089, 61209271710, 61210610954, 61211940332,
+    61213257743, 61214564358, 61215859606, 61217146135, 61218424671, 61219698881,
+    61220970234, 61222242817, 61223518184, 61224800181, 61226089804, 61227390019,
+    61228700695, 61230023424, 61231356590, 61232700167, 61234051152, 61235407995,
+    61236766984, 61238125568, 61239480352, 61240828611, 61242168228, 61243497162,
+    61244815092, 61246121229, 61247417043, 61248703067, 61249982158, 61251255846,
+    61252527738, 61253799808, 61255075714, 61256357206, 61257647360, 61258947034,
+    61260258230, 61261580345, 61262914010, 61264256918, 61265608351, 61266964573,
+    61268323906, 61269682043, 61271037018, 61272385090, 61273724767, 61275053784,
+    61276371702, 61277678108, 61278973867, 61280260221, 61281539207, 61282813171,
+    61284084890, 61285357132, 61286632804, 61287914413, 61289204310, 61290504154,
+    61291815070, 61293137489, 61294470801, 61295814169, 61297165137, 61298521937,
+    61299880730, 61301239470, 61302593910, 61303942499, 61305281708, 61306611101,
+    61307928629, 61309235295, 61310530723, 61311817286, 61313095970, 61314370144,
+    61315641555, 61316914024, 61318189375, 61319471225, 61320760826, 61322060912,
+    61323371638, 61324694265, 61326027583, 61327371046, 61328722253, 61330078934,
+    61331438162, 61332796549, 61334151531, 61335499586, 61336839332, 61338168095,
+    61339486123, 61340792156, 61342088079, 61343374050, 61344653258, 61345926885,
+    61347198866, 61348470816, 61349746762, 61351028091, 61352318279, 61353617830,
+    61354929106, 61356251211, 61357584995, 61358928012, 61360279524, 61361635920,
+    61362995206, 61364353523, 61365708303, 61367056516, 61368395887, 61369724984,
+    61371042547, 61372349014, 61373644451, 61374930911, 61376209659, 61377483812,
+    61378755379, 61380027875, 61381303433, 61382585310, 61383875078, 61385175157,
+    61386485912, 61387808528, 61389141689, 61390485233, 61391836122, 61393193057,
+    61394551848, 61395910620, 61397265095, 61398613579, 61399952845, 61401282034,
+    61402599647, 61403906079, 61405201629, 61406487975, 61407766811, 61409040797,
+    61410312380, 61411584690, 61412860221, 61414141913, 61415431676, 61416731558,
+    61418042408, 61419364762, 61420698177, 61422041340, 61423392672, 61424749127,
+    61426108548, 61427466849, 61428822051, 61430170136, 61431510063, 61432838915,
+    61434157037, 61435463150, 61436759062, 61438045056, 61439324171, 61440597763,
+    61441869613, 61443141502, 61444417320, 61445698598, 61446988673, 61448288203,
+    61449599360, 61450921490, 61452255133, 61453598255, 61454949619, 61456306232,
+    61457665408, 61459024049, 61460378777, 61461727350, 61463066699, 61464396099,
+    61465713616, 61467020277, 61468315592, 61469602127, 61470880657, 61472154793,
+    61473426068, 61474698512, 61475973769, 61477255623, 61478545156, 61479845281,
+    61481155916, 61482478635, 61483811794, 61485155438, 61486506409, 61487863363,
+    61489222295, 61490580999, 61491935696, 61493284091, 61494623649, 61495952748,
+    61497270662, 61498576977, 61499872786, 61501158962, 61502438004, 61503711771,
+    61504983523, 61506255575, 61507531246, 61508812649, 61510102526, 61511402106,
+    61512713067, 61514035146, 61515368681, 61516711627, 61518063060, 61519419360,
+    61520778797, 61522136993, 61523492111, 61524840189, 61526180019, 61527509012,
+    61528827099, 61530133483, 61531429423, 61532715749, 61533994900, 61535268798,
+    61536540622, 61537812722, 61539088406, 61540369778, 61541659600, 61542959141,
+    61544269958, 61545592083, 61546925355, 61548268522, 61549619552, 61550976288,
+    61552335231, 61553694037, 61555048646, 61556397365, 61557736690, 61559066210,
+    61560383783, 61561690560, 61562985996, 61564272663, 61565551338, 61566825601,
+    61568096985, 61569369502, 61570644774, 61571926600, 61573216038, 61574516022,
+    61575826502, 61577148997, 61578482041, 61579825429, 61581176418, 61582533150,
+    61583892278, 61585250845, 61586605857, 61587954167, 61589294022, 61590623019,
+    61591941145, 61593247330, 61594543294, 61595829336, 61597108533, 61598382186,
+    61599654122, 61600926078, 61602201953, 61603483265, 61604773346, 61606072830,
+    61607383956, 61608705921, 61610039538, 61611382367, 61612733764, 61614089993,
+    61615449294, 61616807526, 61618162475, 61619510709, 61620850363, 61622179552,
+    61623497425, 61624803974, 61626099657, 61627386123, 61628665019, 61629939085,
+    61631210717, 61632483061, 61633758641, 61635040338, 61636330112, 61637630003,
+    61638940750, 61640263172, 61641596290, 61642939642, 61644290449, 61645647240,
+    61647005950, 61648364694, 61649719144, 61651067752, 61652407071, 61653736513,
+    61655054238, 61656360979, 61657656634, 61658943250, 61660222109, 61661496259,
+    61662767752, 61664040110, 61665315456, 61666597125, 61667886657, 61669186504,
+    61670497124, 61671819470, 61673152678, 61674495859, 61675847005, 61677203479,
+    61678562752, 61679921070, 61681276202, 61682624333, 61683964306, 61685293250,
+    61686611528, 61687917781, 61689213909, 61690500051, 61691779366, 61693053052,
+    61694325017, 61695596896, 61696872715, 61698153877, 61699443867, 61700743215,
+    61702054269, 61703376205, 61704709798, 61706052752, 61707404147, 61708760621,
+    61710119879, 61711478392, 61712833212, 61714181686, 61715521136, 61716850502,
+    61718168153, 61719474859, 61720770354, 61722056990, 61723335726, 61724609967,
+    61725881425, 61727153915, 61728429277, 61729711078, 61731000607, 61732300587,
+    61733611129, 61734933672, 61736266702, 61737610223, 61738961083, 61740318028,
+    61741676889, 61743035688, 61744390323, 61745738851, 61747078331, 61748407562,
+    61749725398, 61751031850, 61752327601, 61753613940, 61754892956, 61756166914,
+    61757438660, 61758710907, 61759986551, 61761268106, 61762557892, 61763857547,
+    61765168341, 61766490418, 61767823750, 61769166660, 61770517931, 61771874211,
+    61773233605, 61774591826, 61775947030, 61777295153, 61778635129, 61779964129,
+    61781282348, 61782588678, 61783884713, 61785170946, 61786450175, 61787723980,
+    61788995898, 61790267930, 61791543730, 61792825053, 61794114995, 61795414469,
+    61796725382, 61798047387, 61799380722, 61800723725, 61802074803, 61803431384,
+    61804790392, 61806149125, 61807503844, 61808852609, 61810192074, 61811521704,
+    61812839388, 61814146258, 61815441723, 61816728413, 61818007036, 61819281258,
+    61820552547, 61821825002, 61823100189, 61824381977, 61825671366, 61826971358,
+    61828281813, 61829604351, 61830937353, 61832280808, 61833631714, 61834988535,
+    61836347559, 61837706245, 61839061184, 61840409662, 61841749522, 61843078730,
+    61844396919, 61845703309, 61846999321, 61848285500, 61849564664, 61850838353,
+    61852110156, 61853382066, 61854657746, 61855938987, 61857228879, 61858528324,
+    61859839327, 61861161302, 61862494876, 61863837734, 61865189160, 61866545404,
+    61867904795, 61869263014, 61870618099, 61871966310, 61873306152, 61874635345,
+    61875953456, 61877260041, 61878555971, 61879842460, 61881121554, 61882395566,
+    61883667296, 61884939473, 61886215040, 61887496474, 61888786169, 61890085771,
+    61891396454, 61892718640, 61894051768, 61895394990, 61896745875, 61898102645,
+    61899461465, 61900820276, 61902174820, 61903523547, 61904862920, 61906192511,
+    61907510273, 61908817199, 61910112894, 61911399710, 61912678599, 61913952914,
+    61915224386, 61916496831, 61917772064, 61919053714, 61920343029, 61921642779,
+    61922953119, 61924275367, 61925608317, 61926951487, 61928302466, 61929659040,
+    61931018257, 61932376751, 61933731924, 61935080249, 61936420310, 61937749407,
+    61939067774, 61940374128, 61941670339, 61942956560, 61944235956, 61945509712,
+    61946781740, 61948053663, 61949329495, 61950610637, 61951900559, 61953199790,
+    61954510700, 61955832428, 61957165861, 61958508585, 61959859903, 61961216207,
+    61962575527, 61963933963, 61965288969, 61966637461, 61967977166, 61969306598,
+    61970624490, 61971931240, 61973226906, 61974513533, 61975792383, 61977066571,
+    61978338117, 61979610531, 61980885966, 61982167668, 61983457238, 61984757084,
+    61986067603, 61987389963, 61988722892, 61990066213, 61991416926, 61992773740,
+    61994132482, 61995491289, 61996845876, 61998194560, 61999534070, 62000863557,
+    62002181467, 62003488195, 62004783992, 62006070548, 62007349532, 62008623623,
+    62009895260, 62011167579, 62012443068, 62013724667, 62015014281, 62016313974,
+    62017624589, 62018946690, 62020279826, 62021622721, 62022973777, 62024330001,
+    62025689219, 62027047390, 62028402536, 62029750662, 62031090721, 62032419788,
+    62033738203, 62035044645, 62036340915, 62037627245, 62038906665, 62040180488,
+    62041452499, 62042724450, 62044000249, 62045281418, 62046571313, 62047870606,
+    62049181481, 62050503307, 62051836646, 62053179472, 62054530578, 62055886969,
+    62057245999, 62058604549, 62059959291, 62061307944, 62062647462, 62063977081,
+    62065294871, 62066601824, 62067897443, 62069184266, 62070463048, 62071737377,
+    62073008770, 62074281246, 62075556443, 62076838153, 62078127465, 62079427321,
+    62080737653, 62082060067, 62083392947, 62084736350, 62086087145, 62087443996,
+    62088802897, 62090161643, 62091516431, 62092864971, 62094204684, 62095533970,
+    62096852063, 62098158574, 62099454557, 62100740911, 62102020095, 62103293985,
+    62104565808, 62105837890, 62107113532, 62108394868, 62109684634, 62110984084,
+    62112294891, 62113616811, 62114950187, 62116292982, 62117644289, 62119000501,
+    62120359891, 62121718088, 62123073246, 62124421400, 62125761325, 62127090413,
+    62128408600, 62129715062, 62131011080, 62132297464, 62133576678, 62134850621,
+    62136122499, 62137394627, 62138670342, 62139951706, 62141241507, 62142540979,
+    62143851704, 62145173696, 62146506827, 62147849839, 62149200733, 62150557358,
+    62151916231, 62153275012, 62154629646, 62155978433, 62157317873, 62158647539,
+    62159965292, 62161272254, 62162567863, 62163854672, 62165133439, 62166407740,
+    62167679106, 62168951559, 62170226725, 62171508415, 62172797684, 62174097486,
+    62175407760, 62176730053, 62178062888, 62179406099, 62180756931, 62182113574,
+    62183472667, 62184831283, 62186186412, 62187534914, 62188875012, 62190204292,
+    62191522714, 62192829188, 62194125397, 62195411636, 62196690942, 62197964633,
+    62199236510, 62200508339, 62201784013, 62203065083, 62204354884, 62205654085,
+    62206964930, 62208286649, 62209620070, 62210962769, 62212314119, 62213670370,
+    62215029773, 62216388150, 62217743309, 62219091781, 62220431706, 62221761165,
+    62223079305, 62224386087, 62225681963, 62226968561, 62228247522, 62229521573,
+    62230793119, 62232065292, 62233340652, 62234622069, 62235911556, 62237211146,
+    62238521633, 62239843821, 62241176783, 62242520029, 62243870810, 62245227634,
+    62246586441, 62247945332, 62249299968, 62250648807, 62251988364, 62253318066,
+    62254636035, 62255943009, 62257238858, 62258525640, 62259804623, 62261078861,
+    62262350395, 62263622740, 62264898005, 62266179521, 62267468826, 62268768398,
+    62270078700, 62271400731, 62272733632, 62274076562, 62275427499, 62276783856,
+    62278143066, 62279501410, 62280856630, 62282204920, 62283545104, 62284874306,
+    62286192879, 62287499436, 62288795878, 62290082307, 62291361877, 62292635756,
+    62293907850, 62295179774, 62296455552, 62297736581, 62299026347, 62300325399,
+    62301636090, 62302957632, 62304290831, 62305633420, 62306984521, 62308340785,
+    62309699964, 62311058504, 62312413493, 62313762217, 62315101997, 62316431712,
+    62317749724, 62319056761, 62320352556, 62321639442, 62322918369, 62324192733,
+    62325464242, 62326736706, 62328011968, 62329293595, 62330582886, 62331882576,
+    62333192787, 62334514976, 62335847664, 62337190864, 62338541473, 62339898251,
+    62341257050, 62342615906, 62343970701, 62345319495, 62346659292, 62347988891,
+    62349307083, 62350613881, 62351909914, 62353196488, 62354475656, 62355749706,
+    62357021463, 62358293665, 62359569205, 62360850625, 62362140249, 62363439735,
+    62364750344, 62366072232, 62367405360, 62368748060, 62370099121, 62371455224,
+    62372814472, 62374172618, 62375527814, 62376876014, 62378216141, 62379545353,
+    62380863836, 62382170439, 62383466749, 62384753219, 62386032649, 62387306588,
+    62388578592, 62389850639, 62391126417, 62392407657, 62393697491, 62394996814,
+    62396307560, 62397629372, 62398962512, 62400305306, 62401656185, 62403012573,
+    62404371417, 62405730014, 62407084660, 62408433406, 62409772944, 62411102724,
+    62412420654, 62413727829, 62415023641, 62416310676, 62417589601, 62418864057,
+    62420135493, 62421407996, 62422683138, 62423964793, 62425253978, 62426553715,
+    62427863877, 62429186121, 62430518830, 62431862030, 62433212711, 62434569369,
+    62435928277, 62437286912, 62438641853, 62439990403, 62441330385, 62442659782,
+    62443978202, 62445284870, 62446581167, 62447867646, 62449147068, 62450420985,
+    62451692933, 62452964917, 62454240568, 62455521698, 62456811389, 62458110580,
+    62459421282, 62460742961, 62462076268, 62463418922, 62464770224, 62466126420,
+    62467485836, 62468844119, 62470199310, 62471547638, 62472887607, 62474216920,
+    62475535154, 62476841850, 62478137893, 62479424483, 62480703675, 62481977764,
+    62483249558, 62484521758, 62485797323, 62487078698, 62488368307, 62489667769,
+    62490978302, 62492300311, 62493633287, 62494976365, 62496327159, 62497683880,
+    62499042712, 62500401583, 62501756229, 62503105090, 62504444593, 62505774311,
+    62507092172, 62508399169, 62509694909, 62510981756, 62512260675, 62513535031,
+    62514806555, 62516079053, 62517354328, 62518635991, 62519925274, 62521224950,
+    62522535161, 62523857247, 62525189999, 62526532973, 62527883753, 62529240179,
+    62530599275, 62531957723, 62533312905, 62534661313, 62536001503, 62537330771,
+    62538649329, 62539955867, 62541252246, 62542538598, 62543818085, 62545091889,
+    62546363922, 62547635816, 62548911582, 62550192634, 62551482432, 62552781524,
+    62554092263, 62555413809, 62556747051, 62558089586, 62559440742, 62560796921,
+    62562156193, 62563514647, 62564869777, 62566218449, 62567558403, 62568888097,
+    62570206264, 62571513257, 62572809132, 62574095900, 62575374820, 62576648995,
+    62577920451, 62579192702, 62580467924, 62581749373, 62583038679, 62584338259,
+    62585648540, 62586970686, 62588303457, 62589646656, 62590997317, 62592354134,
+    62593712946, 62595071892, 62596426673, 62597775610, 62599115390, 62600445173,
+    62601763355, 62603070339, 62604366332, 62605653038, 62606932083, 62608206168,
+    62609477705, 62610749853, 62612025107, 62613306441, 62614595781, 62615895223,
+    62617205615, 62618527546, 62619860552, 62621203375, 62622554396, 62623910647,
+    62625269915, 62626628186, 62627983456, 62629331741, 62630671981, 62632001247,
+    62633319873, 62634626512, 62635922969, 62637209446, 62638488981, 62639762860,
+    62641034882, 62642306772, 62643582462, 62644863451, 62646153128, 62647452161,
+    62648762767, 62650084328, 62651417436, 62652760075, 62654111063, 62655467397,
+    62656826445, 62658185063, 62659539936, 62660888747, 62662228477, 62663558332,
+    62664876405, 62666183651, 62667479569, 62668766660, 62670045656, 62671320127,
+    62672591580, 62673864023, 62675139100, 62676420597, 62677709617, 62679009118,
+    62680319048, 62681641052, 62682973535, 62684316601, 62685667138, 62687023845,
+    62688382719, 62689741562, 62691096553, 62692445390, 62693785447, 62695115116,
+    62696433580, 62697740452, 62699036740, 62700323363, 62701602732, 62702876752,
+    62704148610, 62705420657, 62706696169, 62707977307, 62709266792, 62710565915,
+    62711876344, 62713197887, 62714530903, 62715873400, 62717224493, 62718580591,
+    62719939974, 62721298265, 62722653615, 62724002040, 62725342291, 62726671730,
+    62727990270, 62729297046, 62730593335, 62731879919, 62733159268, 62734433273,
+    62735705155, 62736977219, 62738252829, 62739534030, 62740823648, 62742122895,
+    62743433394, 62744755136, 62746088035, 62747430812, 62748781513, 62750137980,
+    62751496765, 62752855528, 62754210232, 62755559173, 62756898833, 62758228777,
+    62759546839, 62760854108, 62762150012, 62763437077, 62764716057, 62765990520,
+    62767261994, 62768534493, 62769809640, 62771091241, 62772380358, 62773679955,
+    62774989976, 62776311992, 62777644526, 62778987443, 62780337978, 62781694366,
+    62783053228, 62784411690, 62785766732, 62787115249, 62788455448, 62789784929,
+    62791103629, 62792410436, 62793707010, 62794993615, 62796273250, 62797547219,
+    62798819287, 62800091225, 62801366904, 62802647900, 62803937535, 62805236516,
+    62806547082, 62807868503, 62809201613, 62810544014, 62811895097, 62813251127,
+    62814610379, 62815968668, 62817323835, 62818672371, 62820012441, 62821342086,
+    62822660467, 62823967510, 62825263670, 62826550545, 62827829760, 62829104018,
+    62830375711, 62831647949, 62832923297, 62834204610, 62835493928, 62836793284,
+    62838103508, 62839425413, 62840758120, 62842101128, 62843451739, 62844808448,
+    62846167215, 62847526129, 62848880844, 62850229806, 62851569500, 62852899366,
+    62854217489, 62855524627, 62856820622, 62858107551, 62859386652, 62860660993,
+    62861932591, 62863204969, 62864480229, 62865761710, 62867050952, 62868350439,
+    62869660631, 62870982541, 62872315303, 62873658103, 62875008913, 62876365184,
+    62877724322, 62879082649, 62880437878, 62881786218, 62883126467, 62884455750,
+    62885774402, 62887081028, 62888377533, 62889664011, 62890943629, 62892217548,
+    62893489687, 62894761644, 62896037456, 62897318498, 62898608262, 62899907281,
+    62901217908, 62902539360, 62903872445, 62905214908, 62906565892, 62907922052,
+    62909281162, 62910639660, 62911994662, 62913343425, 62914683307, 62916013153,
+    62917331345, 62918638561, 62919934536, 62921221558, 62922500573, 62923774963,
+    62925046445, 62926318827, 62927593971, 62928875444, 62930164564, 62931464067,
+    62932774086, 62934096089, 62935428603, 62936771651, 62938122148, 62939478862,
+    62940837660, 62942196580, 62943551504, 62944900490, 62946240514, 62947570380,
+    62948888832, 62950195891, 62951492135, 62952778883, 62954058135, 62955332207,
+    62956603887, 62957875950, 62959151274, 62960432443, 62961721779, 62963020984,
+    62964331321, 62965652993, 62966985962, 62968328586, 62969679647, 62971035824,
+    62972395200, 62973753522, 62975108929, 62976457370, 62977797745, 62979127206,
+    62980445922, 62981752722, 62983049193, 62984335764, 62985615240, 62986889153,
+    62988161068, 62989432951, 62990708517, 62991989489, 62993279047, 62994578080,
+    62995888576, 62997210169, 62998543166, 62999885873, 63001236751, 63002593196,
+    63003952163, 63005310926, 63006665778, 63008014751, 63009354529, 63010684547,
+    63012002710, 63013310085, 63014606078, 63015893253, 63017172292, 63018446822,
+    63019718289, 63020990764, 63022265812, 63023547293, 63024836235, 63026135672,
+    63027445497, 63028767403, 63030099790, 63031442726, 63032793202, 63034149754,
+    63035508625, 63036867322, 63038222390, 63039571136, 63040911355, 63042241031,
+    63043559745, 63044866715, 63046163303, 63047450052, 63048729695, 63050003787,
+    63051275829, 63052547841, 63053823423, 63055104410, 63056393862, 63057692750,
+    63059003077, 63060324360, 63061657260, 63062999545, 63064350547, 63065706547,
+    63067065899, 63068424246, 63069779646, 63071128265, 63072468599, 63073798291,
+    63075116901, 63076423934, 63077720271, 63079007090, 63080286447, 63081560628,
+    63082832442, 63084104583, 63085380024, 63086661198, 63087950560, 63089249715,
+    63090559918, 63091881570, 63093214210, 63094556964, 63095907514, 63097264063,
+    63098622836, 63099981761, 63101336579, 63102685711, 63104025550, 63105355655,
+    63106673893, 63107981248, 63109277284, 63110564360, 63111843422, 63113117846,
+    63114389356, 63115661778, 63116936929, 63118218436, 63119507548, 63120807044,
+    63122117062, 63123438953, 63124771490, 63126114252, 63127464815, 63128821063,
+    63130180002, 63131538374, 63132893541, 63134242028, 63135582371, 63136911868,
+    63138230701, 63139537536, 63140834212, 63142120828, 63143400533, 63144674490,
+    63145946610, 63147218521, 63148494245, 63149775198, 63151064853, 63152363767,
+    63153674297, 63154995628, 63156328638, 63157670946, 63159021886, 63160377864,
+    63161736971, 63163095291, 63164450358, 63165799018, 63167139062, 63168468923,
+    63169787358, 63171094669, 63172390909, 63173678024, 63174957254, 63176231662,
+    63177503263, 63178775555, 63180050720, 63181332013, 63182621092, 63183920386,
+    63185230349, 63186552168, 63187884629, 63189227545, 63190577983, 63191934628,
+    63193293339, 63194652248, 63196007058, 63197356090, 63198696014, 63200026009,
+    63201344433, 63202651707, 63203947991, 63205235001, 63206514309, 63207788628,
+    63209060313, 63210332542, 63211607773, 63212888999, 63214178138, 63215477318,
+    63216787399, 63218109025, 63219441748, 63220784352, 63222135226, 63223491411,
+    63224850676, 63226209009, 63227564376, 63228912795, 63230253175, 63231582590,
+    63232901358, 63234208129, 63235504713, 63236791300, 63238070937, 63239344896,
+    63240616979, 63241888894, 63243164582, 63244445517, 63245735110, 63247034006,
+    63248344457, 63249665835, 63250998770, 63252341244, 63253692112, 63255048367,
+    63256407394, 63257766042, 63259121001, 63260469927, 63261809800, 63263139791,
+    63264457998, 63265765340, 63267061346, 63268348498, 63269627561, 63270902096,
+    63272173617, 63273446118, 63274721236, 63276002734, 63277291720, 63278591134,
+    63279900931, 63281222763, 63282555039, 63283897893, 63285248219, 63286604752,
+    63287963487, 63289322262, 63290677247, 63292026155, 63293366341, 63294696202,
+    63296014883, 63297321988, 63298618491, 63299905305, 63301184809, 63302458926,
+    63303730810, 63305002850, 63306278292, 63307559336, 63308848679, 63310147646,
+    63311457879, 63312779225, 63314112024, 63315454317, 63316805224, 63318161186,
+    63319520504, 63320878810, 63322234275, 63323582877, 63324923369, 63326253074,
+    63327571889, 63328878924, 63330175441, 63331462193, 63332741645, 63334015668,
+    63335287490, 63336559412, 63337834824, 63339115773, 63340405128, 63341704097,
+    63343014352, 63344335868, 63345668606, 63347011254, 63348361904, 63349718361,
+    63351077209, 63352436088, 63353790970, 63355140134, 63356480048, 63357810270,
+    63359128598, 63360436119, 63361732234, 63363019460, 63364298538, 63365573025,
+    63366844448, 63368116820, 63369391788, 63370673167, 63371962051, 63373261419,
+    63374571227, 63375893065, 63377225450, 63378568270, 63379918744, 63381275130,
+    63382634009, 63383992542, 63385347669, 63386696314, 63388036657, 63389366316,
+    63390685204, 63391992208, 63393288976, 63394575754, 63395855534, 63397129607,
+    63398401727, 63399673662, 63400949271, 63402230138, 63403519582, 63404818333,
+    63406128630, 63407449788, 63408782642, 63410124834, 63411475764, 63412831705,
+    63414190943, 63415549273, 63416904547, 63418253217, 63419593481, 63420923343,
+    63422241989, 63423549304, 63424845750, 63426132874, 63427412303, 63428686707,
+    63429958477, 63431230712, 63432505976, 63433787120, 63435076199, 63436375244,
+    63437685119, 63439006646, 63440338993, 63441681670, 63443032040, 63444388590,
+    63445747320, 63447106309, 63448461206, 63449810438, 63451150454, 63452480678,
+    63453799146, 63455106619, 63456402896, 63457690069, 63458969340, 63460243802,
+    63461515435, 63462787790, 63464062944, 63465344256, 63466633263, 63467932466,
+    63469242337, 63470563925, 63471896381, 63473238931, 63474589554, 63475945728,
+    63477304843, 63478663252, 63480018633, 63481367210, 63482707741, 63484037339,
+    63485356303, 63486663214, 63487959957, 63489246608, 63490526336, 63491800296,
+    63493072418, 63494344303, 63495620005, 63496900896, 63498190491, 63499489316,
+    63500799747, 63502120998, 63503453890, 63504796170, 63506146999, 63507503036,
+    63508862076, 63510220558, 63511575622, 63512924502, 63514264576, 63515594648,
+    63516913110, 63518220588, 63519516833, 63520804087, 63522083312, 63523357860,
+    63524629451, 63525901875, 63527176996, 63528458370, 63529747336, 63531046626,
+    63532356400, 63533678133, 63535010366, 63536353142, 63537703382, 63539059873,
+    63540418486, 63541777281, 63543132148, 63544481159, 63545821285, 63547151345,
+    63548470050, 63549777423, 63551074000, 63552361091, 63553640645, 63554914981,
+    63556186832, 63557458994, 63558734307, 63560015388, 63561304540, 63562603508,
+    63563913547, 63565234911, 63566567556, 63567909886, 63569260690, 63570616674,
+    63571975935, 63573334226, 63574689684, 63576038237, 63577378774, 63578708432,
+    63580027369, 63581334403, 63582631117, 63583917917, 63585197601, 63586471676,
+    63587743703, 63589015626, 63590291163, 63591572023, 63592861413, 63594160211,
+    63595470451, 63596791766, 63598124513, 63599466989, 63600817710, 63602174051,
+    63603533001, 63604891812, 63606246781, 63607595909, 63608935865, 63610266068,
+    63611584403, 63612891933, 63614188061, 63615475343, 63616754467, 63618029050,
+    63619300545, 63620573016, 63621848044, 63623129479, 63624418363, 63625717718,
+    63627027439, 63628349221, 63629681462, 63631024256, 63632374596, 63633731049,
+    63635089842, 63636448521, 63637803601, 63639152413, 63640492718, 63641822507,
+    63643141329, 63644448400, 63645745069, 63647031878, 63648311559, 63649585677,
+    63650857725, 63652129742, 63653405310, 63654686281, 63655975691, 63657274528,
+    63658584767, 63659905953, 63661238722, 63662580878, 63663931749, 63665287638,
+    63666646913, 63668005221, 63669360640, 63670709315, 63672049782, 63673379647,
+    63674698483, 63676005744, 63677302305, 63678589290, 63679868755, 63681142965,
+    63682414738, 63683686774, 63684962061, 63686243038, 63687532186, 63688831107,
+    63690141088, 63691462517, 63692794968, 63694137549, 63695487986, 63696844457,
+    63698203233, 63699562224, 63700917185, 63702266521, 63703606614, 63704937011,
+    63706255540, 63707563186, 63708859464, 63710146737, 63711425910, 63712700368,
+    63713971806, 63715244080, 63716518999, 63717800220, 63719089012, 63720388177,
+    63721697889, 63723019529, 63724351883, 63725694557, 63727045106, 63728401421,
+    63729760468, 63731119012, 63732474371, 63733823096, 63735163682, 63736493440,
+    63737812516, 63739119574, 63740416435, 63741703186, 63742982970, 63744256941,
+    63745529006, 63746800791, 63748076328, 63749357038, 63750646422, 63751945048,
+    63753255307, 63754576403, 63755909231, 63757251427, 63758602326, 63759958330,
+    63761317529, 63762675985, 63764031238, 63765380098, 63766720376, 63768050465,
+    63769369143, 63770676670, 63771973127, 63773260425, 63774539826, 63775814359,
+    63777086044, 63778358346, 63779633447, 63780914581, 63782203425, 63783502406,
+    63784812014, 63786133458, 63787465557, 63788808156, 63790158349, 63791514831,
+    63792873481, 63794232420, 63795587348, 63796936571, 63798276738, 63799607023,
+    63800925748, 63802233343, 63803529930, 63804817230, 63806096776, 63807371292,
+    63808643091, 63809915372, 63811190553, 63812471657, 63813760574, 63815059466,
+    63816369184, 63817690417, 63819022726, 63820364950, 63821715501, 63823071469,
+    63824430641, 63825789027, 63827144573, 63828493278, 63829834003, 63831163798,
+    63832482934, 63833790050, 63835086935, 63836373761, 63837653575, 63838927640,
+    63840199762, 63841471642, 63842747227, 63844027992, 63845317365, 63846615985,
+    63847926137, 63849247187, 63850579805, 63851921971, 63853272594, 63854628660,
+    63855987603, 63857346266, 63858701356, 63860050503, 63861390680, 63862721022,
+    63864039597, 63865347287, 63866643604, 63867930991, 63869210223, 63870484835,
+    63871756367, 63873028808, 63874303828, 63875585194, 63876874038, 63878173289,
+    63879482916, 63880804561, 63882136633, 63883479279, 63884829392, 63886185736,
+    63887544299, 63888902967, 63890257895, 63891606831, 63892947117, 63894277160,
+    63895596073, 63896903456, 63898200244, 63899487335, 63900767077, 63902041385,
+    63903313390, 63904585496, 63905860928, 63907141916, 63908431140, 63909729959,
+    63911040000, 63912361148, 63913693724, 63915035805, 63916386501, 63917742270,
+    63919101417, 63920459585, 63921814963, 63923163529, 63924504076, 63925833914,
+    63927152957, 63928460277, 63929757125, 63931044201, 63932323952, 63933598214,
+    63934870198, 63936142190, 63937417578, 63938698409, 63939987573, 63941286282,
+    63942596251, 63943917458, 63945249912, 63946592294, 63947942748, 63949299050,
+    63950657823, 63952016679, 63953371606, 63954720859, 63956060908, 63957391303,
+    63958709826, 63960017572, 63961313915, 63962601374, 63963880661, 63965155330,
+    63966426879, 63967699317, 63968974273, 63970255562, 63971544287, 63972843430,
+    63974152986, 63975474571, 63976806732, 63978149389, 63979499760, 63980856120,
+    63982215018, 63983573639, 63984928871, 63986277656, 63987618130, 63988947920,
+    63990266911, 63991574004, 63992870836, 63994157664, 63995437481, 63996711581,
+    63997983715, 63999255653, 64000531247, 64001812076, 64003101457, 64004400119,
+    64005710304, 64007031342, 64008364066, 64009706152, 64011056998, 64012412897,
+    64013772143, 64015130525, 64016485904, 64017834697, 64019175114, 64020505111,
+    64021823888, 64023131288, 64024427806, 64025714964, 64026994428, 64028268848,
+    64029540634, 64030812864, 64032088108, 64033369197, 64034658198, 64035957127,
+    64037266861, 64038588216, 64039920378, 64041262866, 64042613070, 64043969478,
+    64045328129, 64046687093, 64048042040, 64049391384, 64050731570, 64052062015,
+    64053380717, 64054688435, 64055984924, 64057272276, 64058551657, 64059826177,
+    64061097789, 64062370078, 64063645099, 64064926255, 64066215063, 64067514058,
+    64068823704, 64070145074, 64071477312, 64072819675, 64074170142, 64075526228,
+    64076885331, 64078243828, 64079599376, 64080948200, 64082289011, 64083618919,
+    64084938179, 64086245367, 64087542340, 64088829156, 64090108973, 64091382933,
+    64092654967, 64093926679, 64095202139, 64096482735, 64097772015, 64099070515,
+    64100380656, 64101701650, 64103034352, 64104376500, 64105727279, 64107083326,
+    64108442454, 64109801085, 64111156364, 64112505501, 64113845875, 64115176255,
+    64116495025, 64117802775, 64119099257, 64120386672, 64121666000, 64122940557,
+    64124212087, 64125484368, 64126759296, 64128040430, 64129329142, 64130628165,
+    64131937689, 64133259188, 64134591227, 64135933859, 64137284007, 64138640469,
+    64139999097, 64141357969, 64142712946, 64144062111, 64145402422, 64146732701,
+    64148051637, 64149359257, 64150656065, 64151943371, 64153223096, 64154497561,
+    64155769471, 64157041639, 64158316870, 64159597813, 64160886744, 64162185450,
+    64163495175, 64164816224, 64166148550, 64167490614, 64168841201, 64170197052,
+    64171556259, 64172914581, 64174270147, 64175618866, 64176959639, 64178289575,
+    64179608827, 64180916188, 64182213220, 64183500298, 64184780209, 64186054441,
+    64187326543, 64188598456, 64189873895, 64191154570, 64192443699, 64193742163,
+    64195052032, 64196372939, 64197705297, 64199047407, 64200397850, 64201753989,
+    64203112871, 64204471722, 64205826861, 64207176251, 64208516550, 64209847138,
+    64211165862, 64212473771, 64213770232, 64215057793, 64216337132, 64217611853,
+    64218883412, 64220155864, 64221430797, 64222712059, 64224000711, 64225299772,
+    64226609177, 64227930631, 64229262564, 64230605094, 64231955221, 64233311535,
+    64234670254, 64236028961, 64237384137, 64238733145, 64240073700, 64241403800,
+    64242722940, 64244030331, 64245327281, 64246614319, 64247894163, 64249168374,
+    64250440445, 64251712425, 64252987899, 64254268736, 64255557973, 64256856618,
+    64258166644, 64259487621, 64260820169, 64262162129, 64263512812, 64264868547,
+    64266227709, 64267585957, 64268941383, 64270290123, 64271630735, 64272960787,
+    64274279871, 64275587394, 64276884246, 64278171505, 64279451239, 64280725667,
+    64281997609, 64283269732, 64284545028, 64285825929, 64287114930, 64288413640,
+    64289723369, 64291044514, 64292376673, 64293718964, 64295069139, 64296425365,
+    64297783953, 64299142795, 64300497680, 64301847009, 64303187178, 64304517736,
+    64305836496, 64307144442, 64308441053, 64309728681, 64311008184, 64312282941,
+    64313554601, 64314827021, 64316101976, 64317383146, 64318671784, 64319970723,
+    64321280148, 64322601468, 64323933491, 64325275854, 64326626131, 64327982247,
+    64329341171, 64330699691, 64332055087, 64333403921, 64334744644, 64336074578,
+    64337393838, 64338701105, 64339998175, 64341285133, 64342565106, 64343839237,
+    64345111419, 64346383265, 64347658796, 64348939431, 64350228676, 64351527104,
+    64352837133, 64354157976, 64355490563, 64356832546, 64358183284, 64359539185,
+    64360898356, 64362256850, 64363612205, 64364961201, 64366301648, 64367631897,
+    64368950734, 64370258387, 64371554960, 64372842333, 64374121805, 64375396373,
+    64376668090, 64377940400, 64379215511, 64380496639, 64381785472, 64383084411,
+    64384393958, 64385715298, 64387047273, 64388389733, 64389739788, 64391096153,
+    64392454711, 64393813603, 64395168523, 64396517779, 64397858016, 64399188396,
+    64400507220, 64401814920, 64403111588, 64404398960, 64405678550, 64406953101,
+    64408224910, 64409497205, 64410772373, 64412053470, 64413342350, 64414641201,
+    64415950841, 64417271989, 64418604173, 64419946278, 64421296695, 64422652552,
+    64424011638, 64425369981, 64426725530, 64428074289, 64429415131, 64430745094,
+    64432064437, 64433371775, 64434668861, 64435955845, 64437235756, 64438509846,
+    64439781923, 64441053698, 64442329128, 64443609703, 64444898868, 64446197270,
+    64447507218, 64448828070, 64450160527, 64451502552, 64452853091, 64454209105,
+    64455568073, 64456926810, 64458282048, 64459631390, 64460971813, 64462302420,
+    64463621265, 64464929213, 64466225752, 64467513307, 64468792644, 64470067277,
+    64471338754, 64472611049, 64473885861, 64475166952, 64476455499, 64477754437,
+    64479063789, 64480385207, 64481717132, 64483059717, 64484409844, 64485766271,
+    64487124959, 64488483804, 64489838920, 64491188084, 64492528595, 64493858875,
+    64495178002, 64496485582, 64497782523, 64499069722, 64500349516, 64501623819,
+    64502895755, 64504167737, 64505442982, 64506723746, 64508012706, 64509311262,
+    64510621042, 64511941976, 64513274375, 64514616364, 64515967025, 64517322838,
+    64518682088, 64520040412, 64521395983, 64522744754, 64524085531, 64525415581,
+    64526734843, 64528042356, 64529339395, 64530626635, 64531906538, 64533180911,
+    64534452964, 64535724956, 64537000269, 64538280942, 64539569872, 64540868277,
+    64542177903, 64543498741, 64544830846, 64546172915, 64547523139, 64548879283,
+    64550238021, 64551596926, 64552952004, 64554301476, 64555641803, 64556972508,
+    64558291350, 64559599418, 64560896055, 64562183781, 64563463282, 64564738113,
+    64566009747, 64567282202, 64568557085, 64569838228, 64571126722, 64572425565,
+    64573734766, 64575055958, 64576387717, 64577730000, 64579080057, 64580436214,
+    64581795034, 64583153733, 64584509157, 64585858257, 64587199095, 64588529291,
+    64589848666, 64591156120, 64592453245, 64593740301, 64595020266, 64596294439,
+    64597566569, 64598838433, 64600113884, 64601394516, 64602683654, 64603982036,
+    64605291924, 64606612653, 64607945076, 64609286889, 64610637504, 64611993242,
+    64613352414, 64614710822, 64616066338, 64617415356, 64618756092, 64620086445,
+    64621405610, 64622713370, 64624010216, 64625297616, 64626577255, 64627851741,
+    64629123528, 64630395679, 64631670807, 64632951743, 64634240581, 64635539324,
+    64636848869, 64638170015, 64639501964, 64640844235, 64642194230, 64643550444,
+    64644908935, 64646267784, 64647622681, 64648972047, 64650312338, 64651642964,
+    64652961907, 64654269918, 64655566710, 64656854363, 64658134004, 64659408735,
+    64660680480, 64661952836, 64663227834, 64664508913, 64665797570, 64667096383,
+    64668405801, 64669726939, 64671058926, 64672401057, 64673751297, 64675107188,
+    64676466120, 64677824490, 64679179957, 64680528768, 64681869647, 64683199719,
+    64684519217, 64685826717, 64687124027, 64688411186, 64689691314, 64690965528,
+    64692237738, 64693509534, 64694784974, 64696065455, 64697354530, 64698652759,
+    64699962588, 64701283247, 64702615634, 64703957492, 64705308050, 64706663927,
+    64708022974, 64709381585, 64710736917, 64712086157, 64713426686, 64714757250,
+    64716076235, 64717384214, 64718680935, 64719968578, 64721248125, 64722522854,
+    64723794520, 64725066860, 64726341785, 64727622825, 64728911380, 64730210173,
+    64731519447, 64732840683, 64734172494, 64735514946, 64736864974, 64738221380,
+    64739580006, 64740938938, 64742294002, 64743643296, 64744983736, 64746314148,
+    64747633196, 64748940917, 64750237799, 64751525166, 64752804936, 64754079439,
+    64755351374, 64756623561, 64757898789, 64759179721, 64760468604, 64761767250,
+    64763076876, 64764397822, 64765730020, 64767071980, 64768422465, 64769778255,
+    64771137435, 64772495779, 64773851407, 64775200221, 64776541124, 64777871185,
+    64779190570, 64780498041, 64781795175, 64783082333, 64784362318, 64785636603,
+    64786908743, 64788180666, 64789456081, 64790736700, 64792025737, 64793324074,
+    64794633790, 64795954511, 64797286677, 64798628585, 64799978855, 64801334838,
+    64802693633, 64804052445, 64805407624, 64806757113, 64808097580, 64809428376,
+    64810747339, 64812055496, 64813352183, 64814639938, 64815919410, 64817194203,
+    64818465760, 64819738147, 64821012954, 64822294045, 64823582492, 64824881324,
+    64826190499, 64827511719, 64828843437, 64830185779, 64831535759, 64832891999,
+    64834250719, 64835609528, 64836964868, 64838314120, 64839654938, 64840985332,
+    64842304748, 64843612405, 64844909570, 64846196776, 64847476714, 64848750942,
+    64850022946, 64851294781, 64852570034, 64853850602, 64855139533, 64856437870,
+    64857747604, 64859068332, 64860400684, 64861742522, 64863093145, 64864448900,
+    64865808146, 64867166540, 64868522169, 64869871149, 64871212043, 64872542376,
+    64873861751, 64875169527, 64876466605, 64877754020, 64879033860, 64880308304,
+    64881580208, 64882852216, 64884127355, 64885408050, 64886696825, 64887995282,
+    64889304761, 64890625657, 64891957603, 64893299720, 64894649783, 64896005951,
+    64897364551, 64898723448, 64900078440, 64901427907, 64902768250, 64904099003,
+    64905417974, 64906726146, 64908022972, 64909310807, 64910590483, 64911865377,
+    64913137117, 64914409567, 64915684475, 64916965543, 64918253998, 64919552707,
+    64920861843, 64922182858, 64923514564, 64924856649, 64926206689, 64927562649,
+    64928921496, 64930280033, 64931635520, 64932984530, 64934325485, 64935655710,
+    64936975278, 64938282869, 64939580232, 64940867452, 64942147630, 64943421903,
+    64944694155, 64945965997, 64947241441, 64948521918, 64949810928, 64951109062,
+    64952418750, 64953739221, 64955071442, 64956413079, 64957763540, 64959119242,
+    64960478333, 64961836858, 64963192367, 64964541615, 64965882398, 64967213017,
+    64968532241, 64969840252, 64971137144, 64972424762, 64973704420, 64974979083,
+    64976250835, 64977523092, 64978798094, 64980079039, 64981367649, 64982666315,
+    64983975588, 64985296646, 64986628372, 64987970614, 64989320497, 64990676743,
+    64992035239, 64993394149, 64994749152, 64996098577, 64997439040, 64998769696,
+    65000088814, 65001396808, 65002693736, 65003981321, 65005261057, 65006535691,
+    65007807510, 65009079761, 65010354827, 65011635794, 65012924502, 65014223180,
+    65015532626, 65016853595, 65018185593, 65019527541, 65020877801, 65022233538,
+    65023592528, 65024950824, 65026306373, 65027655191, 65028996156, 65030326287,
+    65031645850, 65032953437, 65034250795, 65035538055, 65036818226, 65038092535,
+    65039364765, 65040636614, 65041912025, 65043192499, 65044481487, 65045779653,
+    65047089329, 65048409882, 65049742049, 65051083790, 65052434089, 65053789887,
+    65055148708, 65056507334, 65057862538, 65059211902, 65060552428, 65061883199,
+    65063202276, 65064510505, 65065807354, 65067095231, 65068374871, 65069649764,
+    65070921436, 65072193841, 65073468672, 65074749683, 65076038066, 65077336756,
+    65078645817, 65079966903, 65081298501, 65082640781, 65083990657, 65085346918,
+    65086705530, 65088064403, 65089419608, 65090768932, 65092109615, 65093440098,
+    65094759417, 65096067202, 65097364328, 65098651705, 65099931647, 65101206069,
+    65102478078, 65103750085, 65105025292, 65106305963, 65107594765, 65108893122,
+    65110202664, 65111523355, 65112855514, 65114197308, 65115547810, 65116903543,
+    65118262779, 65119621166, 65120976862, 65122325804, 65123666784, 65124997028,
+    65126316481, 65127624140, 65128921301, 65130208609, 65131488559, 65132762930,
+    65134034974, 65135306934, 65136582221, 65137862858, 65139151750, 65140450095,
+    65141759638, 65143080357, 65144412327, 65145754246, 65147104333, 65148460352,
+    65149819012, 65151177868, 65152532959, 65153882484, 65155222919, 65156553759,
+    65157872757, 65159180983, 65160477757, 65161765597, 65163045174, 65164320049,
+    65165591689, 65166864128, 65168138962, 65169420045, 65170708448, 65172007192,
+    65173316266, 65174637318, 65175968922, 65177311050, 65178660954, 65180016987,
+    65181375715, 65182734380, 65184089817, 65185439012, 65186780001, 65188110423,
+    65189430052, 65190737786, 65192035156, 65193322418, 65194602510, 65195876734,
+    65197148825, 65198420576, 65199695840, 65200976243, 65202265112, 65203563220,
+    65204872837, 65206193318, 65207525532, 65208867177, 65210217681, 65211573363,
+    65212932550, 65214291039, 65215646706, 65216995936, 65218336939, 65219667581,
+    65220987058, 65222295109, 65223592228, 65224879838, 65226159638, 65227434188,
+    65228705967, 65229978000, 65231252943, 65232533606, 65233822136, 65235120543,
+    65236429784, 65237750665, 65239082436, 65240424602, 65241774574, 65243130828,
+    65244489413, 65245848402, 65247203469, 65248553037, 65249893551, 65251224408,
+    65252543585, 65253851819, 65255148805, 65256436621, 65257716371, 65258991162,
+    65260262898, 65261535189, 65262810050, 65264090942, 65265379354, 65266677905,
+    65267987040, 65269307925, 65270639683, 65271981662, 65273331800, 65274687678,
+    65276046658, 65277405142, 65278760761, 65280109757, 65281450839, 65282781114,
+    65284100821, 65285408531, 65286706048, 65287993418, 65289273740, 65290548124,
+    65291820452, 65293092301, 65294367708, 65295648074, 65296936945, 65298234895,
+    65299544387, 65300864671, 65302196687, 65303538198, 65304888481, 65306244156,
+    65307603124, 65308961742, 65310317196, 65311666630, 65313007428, 65314338291,
+    65315657601, 65316965903, 65318262933, 65319550856, 65320830645, 65322105560,
+    65323377355, 65324649745, 65325924650, 65327205581, 65328493955, 65329792481,
+    65331101436, 65332422292, 65333753713, 65335095779, 65336445477, 65337801650,
+    65339160167, 65340519135, 65341874349, 65343223913, 65344564677, 65345895464,
+    65347214878, 65348522950, 65349820122, 65351107722, 65352387647, 65353662232,
+    65354934177, 65356206309, 65357481420, 65358762187, 65360050856, 65361349264,
+    65362658621, 65363979300, 65365311222, 65366652939, 65368003196, 65369358828,
+    65370717910, 65372076248, 65373431960, 65374780950, 65376122108, 65377452470,
+    65378772196, 65380079992, 65381377430, 65382664826, 65383944987, 65385219361,
+    65386491530, 65387763418, 65389038764, 65390319285, 65391608202, 65392906400,
+    65394215956, 65395536493, 65396868467, 65398210168, 65399560239, 65400916020,
+    65402274650, 65403633313, 65404988413, 65406337873, 65407678398, 65409009317,
+    65410328476, 65411636881, 65412933845, 65414221887, 65415501624, 65416776642,
+    65418048363, 65419320848, 65420595675, 65421876723, 65423165057, 65424463732,
+    65425772707, 65427093703, 65428425189, 65429767298, 65431117060, 65432473106,
+    65433831658, 65435190343, 65436545593, 65437894833, 65439235696, 65440566227,
+    65441885833, 65443193748, 65444491182, 65445778673, 65447058865, 65448333314,
+    65449605471, 65450877390, 65452152636, 65453433119, 65454721881, 65456019993,
+    65457329460, 65458649903, 65459981981, 65461323575, 65462674001, 65464029626,
+    65465388808, 65466747208, 65468102902, 65469451993, 65470793036, 65472123529,
+    65473443086, 65474751036, 65476048296, 65477335870, 65478615867, 65479890424,
+    65481162423, 65482434460, 65483709592, 65484990205, 65486278854, 65487577131,
+    65488886420, 65490207117, 65491538902, 65492880888, 65494230873, 65495587006,
+    65496945623, 65498304580, 65499659673, 65501009261, 65502349740, 65503680615,
+    65504999692, 65506307940, 65507604808, 65508892662, 65510172329, 65511447202,
+    65512718908, 65513991323, 65515266186, 65516547212, 65517835610, 65519134264,
+    65520443323, 65521764265, 65523095883, 65524437900, 65525787873, 65527143807,
+    65528502651, 65529861230, 65531216789, 65532565907, 65533906989, 65535237350,
+    65536557047, 65537864759, 65539162215, 65540449520, 65541729746, 65543004048,
+    65544276286, 65545548083, 65546823441, 65548103806, 65549392673, 65550690651,
+    65552000165, 65553320454, 65554652497, 65555993962, 65557344285, 65558699876,
+    65560058927, 65561417456, 65562773048, 65564122434, 65565463418, 65566794271,
+    65568113759, 65569422030, 65570719162, 65572006973, 65573286765, 65574561477,
+    65575833209, 65577105354, 65578380191, 65579660903, 65580949259, 65582247640,
+    65583556644, 65584877434, 65586208938, 65587550991, 65588900755, 65590256958,
+    65591615503, 65592974551, 65594329761, 65595679460, 65597020217, 65598351189,
+    65599670606, 65600978877, 65602276026, 65603563779, 65604843601, 65606118240,
+    65607389975, 65608662058, 65609936877, 65611217544, 65612505909, 65613804247,
+    65615113362, 65616434061, 65617765839, 65619107665, 65620457867, 65621813646,
+    65623172738, 65624531211, 65625886986, 65627236078, 65628577346, 65629907786,
+    65631227660, 65632535521, 65633833119, 65635120551, 65636400831, 65637675168,
+    65638947361, 65640219104, 65641494355, 65642774625, 65644063363, 65645361254,
+    65646670634, 65647990893, 65649322797, 65650664318, 65652014470, 65653370184,
+    65654729011, 65656087689, 65657443022, 65658792544, 65660133277, 65661464269,
+    65662783594, 65664092072, 65665389167, 65666677273, 65667957107, 65669232151,
+    65670503916, 65671776348, 65673051132, 65674332022, 65675620209, 65676918639,
+    65678227388, 65679548124, 65680879377, 65682221327, 65683570930, 65684926998,
+    65686285506, 65687644382, 65688999679, 65690349206, 65691690155, 65693020978,
+    65694340651, 65695648805, 65696946256, 65698233928, 65699514094, 65700788680,
+    65702060770, 65703332780, 65704607902, 65705888414, 65707176974, 65708475031,
+    65709784218, 65711104527, 65712436297, 65713777730, 65715127918, 65716483434,
+    65717842550, 65719200945, 65720556770, 65721905955, 65723247270, 65724577898,
+    65725897769, 65727205821, 65728503342, 65729790937, 65731071108, 65732345602,
+    65733617701, 65734889616, 65736164797, 65737445246, 65738733904, 65740031970,
+    65741341228, 65742661661, 65743993377, 65745335065, 65746684964, 65748040835,
+    65749399409, 65750758235, 65752113382, 65753463028, 65754803662, 65756134748,
+    65757454035, 65758762557, 65760059613, 65761347702, 65762627471, 65763902477,
+    65765174179, 65766446618, 65767721393, 65769002374, 65770290631, 65771589213,
+    65772898100, 65774218969, 65775550383, 65776892339, 65778242076, 65779597970,
+    65780956580, 65782315168, 65783670567, 65785019786, 65786360849, 65787691411,
+    65789011228, 65790319211, 65791616858, 65792904435, 65794184825, 65795459325,
+    65796731621, 65798003497, 65799278786, 65800559123, 65801847834, 65803145720,
+    65804455058, 65805775234, 65807107136, 65808448481, 65809798720, 65811154177,
+    65812513205, 65813871581, 65815227207, 65816576455, 65817917547, 65819248335,
+    65820568025, 65821876331, 65823173743, 65824461655, 65825741754, 65827016561,
+    65828288555, 65829560715, 65830835712, 65832116321, 65833404720, 65834702902,
+    65836011872, 65837332429, 65838663884, 65840005743, 65841355471, 65842711560,
+    65844070079, 65845429097, 65846784260, 65848133982, 65849474663, 65850805701,
+    65852125052, 65853433455, 65854730593, 65856018551, 65857298421, 65858573312,
+    65859845117, 65861117440, 65862392289, 65863673124, 65864961422, 65866259826,
+    65867568768, 65868889455, 65870221004, 65871562813, 65872912801, 65874268604,
+    65875627558, 65876986094, 65878341817, 65879690973, 65881032239, 65882362700,
+    65883682581, 65884990426, 65886288042, 65887575465, 65888855803, 65890130175,
+    65891402474, 65892674295, 65893949679, 65895230032, 65896518880, 65897816799,
+    65899126226, 65900446414, 65901778311, 65903119681, 65904469831, 65905825381,
+    65907184267, 65908542823, 65909898280, 65911247750, 65912588641, 65913919620,
+    65915239078, 65916547524, 65917844688, 65919132718, 65920412577, 65921687526,
+    65922959322, 65924231681, 65925506537, 65926787396, 65928075691, 65929374120,
+    65930682973, 65932003705, 65933335003, 65934676928, 65936026498, 65937382558,
+    65938740995, 65940099932, 65941455167, 65942804833, 65944145751, 65945476765,
+    65946796424, 65948104763, 65949402162, 65950689953, 65951969990, 65953244618,
+    65954516517, 65955788529, 65957063449, 65958343981, 65959632380, 65960930518,
+    65962239609, 65963560058, 65964891785, 65966233365, 65967583529, 65968939142,
+    65970298253, 65971656696, 65973012568, 65974361781, 65975703205, 65977033857,
+    65978353884, 65979661955, 65980959642, 65982247222, 65983527510, 65984801917,
+    65986074046, 65987345792, 65988620929, 65989901161, 65991189757, 65992487620,
+    65993796874, 65995117164, 65996448976, 65997790593, 65999140664, 66000496504,
+    66001855256, 66003214067, 66004569360, 66005919022, 66007259773, 66008590913,
+    66009910299, 66011218909, 66012516052, 66013804234, 66015084063, 66016359120,
+    66017630822, 66018903226, 66020177915, 66021458770, 66022746864, 66024045277,
+    66025353974, 66026674715, 66028005979, 66029347928, 66030697596, 66032053629,
+    66033412237, 66034771046, 66036126462, 66037475909, 66038816982, 66040147740,
+    66041467560, 66042775701, 66044073346, 66045361059, 66046641437, 66047916050,
+    66049188299, 66050460244, 66051735423, 66053015761, 66054304286, 66055602098,
+    66056911201, 66058231256, 66059562943, 66060904180, 66062254318, 66063609744,
+    66064968840, 66066327265, 66067683097, 66069032418, 66070373764, 66071704597,
+    66073024518, 66074332815, 66075630403, 66076918256, 66078198486, 66079473203,
+    66080745302, 66082017348, 66083292424, 66084572884, 66085861320, 66087159301,
+    66088468253, 66089788559, 66091119954, 66092461554, 66093811224, 66095167135,
+    66096525660, 66097884658, 66099239918, 66100589783, 66101930607, 66103261871,
+    66104581348, 66105889968, 66107187159, 66108475263, 66109755096, 66111030052,
+    66112301756, 66113574093, 66114848811, 66116129639, 66117417791, 66118716177,
+    66120024944, 66121345603, 66122676940, 66124018714, 66125368465, 66126724250,
+    66128082996, 66129441571, 66130797205, 66132146495, 66133487820, 66134818486,
+    66136138523, 66137446579, 66138744354, 66140031930, 66141312350, 66142586774,
+    66143859053, 66145130834, 66146406119, 66147686379, 66148975099, 66150272907,
+    66151582215, 66152902282, 66154234092, 66155575322, 66156925423, 66158280804,
+    66159639683, 66160998061, 66162353574, 66163702929, 66165043972, 66166374952,
+    66167694654, 66169003189, 66170300632, 66171588764, 66172868866, 66174143846,
+    66175415786, 66176688057, 66177962940, 66179243604, 66180531841, 66181830027,
+    66183138797, 66184459306, 66185790533, 66187132297, 66188481803, 66189837779,
+    66191196141, 66192555058, 66193910192, 66195259898, 66196600721, 66197931852,
+    66199251476, 66200560014, 66201857440, 66203145486, 66204425574, 66205700448,
+    66206972356, 66208244538, 66209519369, 66210799959, 66212088157, 66213386262,
+    66214695086, 66216015477, 66217346944, 66218688498, 66220038466, 66221394098,
+    66222753101, 66224111576, 66225467412, 66226816626, 66228158049, 66229488665,
+    66230808730, 66232116774, 66233414558, 66234702156, 66235982595, 66237257059,
+    66238529356, 66239801153, 66241076417, 66242356635, 66243645273, 66244943019,
+    66246252228, 66247572312, 66248904056, 66250245437, 66251595487, 66252951131,
+    66254309942, 66255668636, 66257024045, 66258373658, 66259714518, 66261045628,
+    66262365073, 66263673641, 66264970806, 66266258952, 66267538807, 66268813852,
+    66270085611, 66271358027, 66272632793, 66273913658, 66275201810, 66276500196,
+    66277808881, 66279129542, 66280460707, 66281802563, 66283152084, 66284508088,
+    66285866564, 66287225446, 66288580784, 66289930396, 66291271443, 66292602396,
+    66293922191, 66295230485, 66296528053, 66297815846, 66299096090, 66300370736,
+)
+
+# 农历月：每三个数为 (农历年, 月, 初一的公历序数)，闰月为负，按初一排序
+LUNAR_MONTHS = (
+    1849, 1, 674992, 1849, 2, 675022, 1849, 3, 675051, 1849, 4, 675081,
+    1849, -4, 675110, 1849, 5, 675139, 1849, 6, 675169, 1849, 7, 675198,
+    1849, 8, 675228, 1849, 9, 675257, 1849, 10, 675287, 1849, 11, 675316,
+    1849, 12, 675346, 1850, 1, 675376, 1850, 2, 675406, 1850, 3, 675435,
+    1850, 4, 675465, 1850, 5, 675494, 1850, 6, 675523, 1850, 7, 675553,
+    1850, 8, 675582, 1850, 9, 675611, 1850, 10, 675641, 1850, 11, 675671,
+    1850, 12, 675700, 1851, 1, 675730, 1851, 2, 675760, 1851, 3, 675790,
+    1851, 4, 675819, 1851, 5, 675849, 1851, 6, 675878, 1851, 7, 675907,
+    1851, 8, 675937, 1851, -8, 675966, 1851, 9, 675995, 1851, 10, 676025,
+    1851, 11, 676054, 1851, 12, 676084, 1852, 1, 676114, 1852, 2, 676144,
+    1852, 3, 676173, 1852, 4, 676203, 1852, 5, 676233, 1852, 6, 676262,
+    1852, 7, 676291, 1852, 8, 676321, 1852, 9, 676350, 1852, 10, 676380,
+    1852, 11, 676409, 1852, 12, 676438, 1853, 1, 676468, 1853, 2, 676498,
+    1853, 3, 676527, 1853, 4, 676557, 1853, 5, 676587, 1853, 6, 676616,
+    1853, 7, 676646, 1853, 8, 676675, 1853, 9, 676705, 1853, 10, 676734,
+    1853, 11, 676764, 1853, 12, 676793, 1854, 1, 676823, 1854, 2, 676852,
+    1854, 3, 676882, 1854, 4, 676911, 1854, 5, 676941, 1854, 6, 676970,
+    1854, 7, 677000, 1854, -7, 677030, 1854, 8, 677059, 1854, 9, 677089,
+    1854, 10, 677118, 1854, 11, 677148, 1854, 12, 677177, 1855, 1, 677207,
+    1855, 2, 677236, 1855, 3, 677265, 1855, 4, 677295, 1855, 5, 677324,
+    1855, 6, 677354, 1855, 7, 677384, 1855, 8, 677413, 1855, 9, 677443,
+    1855, 10, 677473, 1855, 11, 677502, 1855, 12, 677532, 1856, 1, 677561,
+    1856, 2, 677591, 1856, 3, 677620, 1856, 4, 677649, 1856, 5, 677679,
+    1856, 6, 677708, 1856, 7, 677738, 1856, 8, 677767, 1856, 9, 677797,
+    1856, 10, 677827, 1856, 11, 677857, 1856, 12, 677886, 1857, 1, 677916,
+    1857, 2, 677945, 1857, 3, 677975, 1857, 4, 678004, 1857, 5, 678033,
+    1857, -5, 678063, 1857, 6, 678092, 1857, 7, 678122, 1857, 8, 678151,
+    1857, 9, 678181, 1857, 10, 678210, 1857, 11, 678240, 1857, 12, 678270,
+    1858, 1, 678300, 1858, 2, 678329, 1858, 3, 678359, 1858, 4, 678388,
+    1858, 5, 678417, 1858, 6, 678447, 1858, 7, 678476, 1858, 8, 678505,
+    1858, 9, 678535, 1858, 10, 678565, 1858, 11, 678594, 1858, 12, 678624,
+    1859, 1, 678654, 1859, 2, 678684, 1859, 3, 678713, 1859, 4, 678743,
+    1859, 5, 678772, 1859, 6, 678801, 1859, 7, 678831, 1859, 8, 678860,
+    1859, 9, 678889, 1859, 10, 678919, 1859, 11, 678948, 1859, 12, 678978,
+    1860, 1, 679008, 1860, 2, 679038, 1860, 3, 679067, 1860, -3, 679097,
+    1860, 4, 679127, 1860, 5, 679156, 1860, 6, 679185, 1860, 7, 679215,
+    1860, 8, 679244, 1860, 9, 679273, 1860, 10, 679303, 1860, 11, 679332,
+    1860, 12, 679362, 1861, 1, 679392, 1861, 2, 679421, 1861, 3, 679451,
+    1861, 4, 679481, 1861, 5, 679510, 1861, 6, 679540, 1861, 7, 679569,
+    1861, 8, 679599, 1861, 9, 679628, 1861, 10, 679658, 1861, 11, 679687,
+    1861, 12, 679716, 1862, 1, 679746, 1862, 2, 679776, 1862, 3, 679805,
+    1862, 4, 679835, 1862, 5, 679864, 1862, 6, 679894, 1862, 7, 679924,
+    1862, 8, 679953, 1862, -8, 679983, 1862, 9, 680012, 1862, 10, 680042,
+    1862, 11, 680071, 1862, 12, 680100, 1863, 1, 680130, 1863, 2, 680159,
+    1863, 3, 680189, 1863, 4, 680219, 1863, 5, 680248, 1863, 6, 680278,
+    1863, 7, 680307, 1863, 8, 680337, 1863, 9, 680367, 1863, 10, 680396,
+    1863, 11, 680426, 1863, 12, 680455, 1864, 1, 680485, 1864, 2, 680514,
+    1864, 3, 680543, 1864, 4, 680573, 1864, 5, 680602, 1864, 6, 680632,
+    1864, 7, 680661, 1864, 8, 680691, 1864, 9, 680721, 1864, 10, 680750,
+    1864, 11, 680780, 1864, 12, 680810, 1865, 1, 680839, 1865, 2, 680869,
+    1865, 3, 680898, 1865, 4, 680927, 1865, 5, 680957, 1865, -5, 680986,
+    1865, 6, 681016, 1865, 7, 681045, 1865, 8, 681075, 1865, 9, 681105,
+    1865, 10, 681134, 1865, 11, 681164, 1865, 12, 681194, 1866, 1, 681223,
+    1866, 2, 681253, 1866, 3, 681282, 1866, 4, 681311, 1866, 5, 681341,
+    1866, 6, 681370, 1866, 7, 681399, 1866, 8, 681429, 1866, 9, 681459,
+    1866, 10, 681488, 1866, 11, 681518, 1866, 12, 681548, 1867, 1, 681578,
+    1867, 2, 681607, 1867, 3, 681637, 1867, 4, 681666, 1867, 5, 681695,
+    1867, 6, 681725, 1867, 7, 681754, 1867, 8, 681783, 1867, 9, 681813,
+    1867, 10, 681842, 1867, 11, 681872, 1867, 12, 681902, 1868, 1, 681932,
+    1868, 2, 681961, 1868, 3, 681991, 1868, 4, 682021, 1868, -4, 682050,
+    1868, 5, 682079, 1868, 6, 682109, 1868, 7, 682138, 1868, 8, 682167,
+    1868, 9, 682197, 1868, 10, 682226, 1868, 11, 682256, 1868, 12, 682286,
+    1869, 1, 682315, 1869, 2, 682345, 1869, 3, 682375, 1869, 4, 682405,
+    1869, 5, 682434, 1869, 6, 682463, 1869, 7, 682493, 1869, 8, 682522,
+    1869, 9, 682551, 1869, 10, 682581, 1869, 11, 682610, 1869, 12, 682640,
+    1870, 1, 682669, 1870, 2, 682699, 1870, 3, 682729, 1870, 4, 682759,
+    1870, 5, 682788, 1870, 6, 682818, 1870, 7, 682847, 1870, 8, 682877,
+    1870, 9, 682906, 1870, 10, 682935, 1870, -10, 682965, 1870, 11, 682994,
+    1870, 12, 683024, 1871, 1, 683053, 1871, 2, 683083, 1871, 3, 683113,
+    1871, 4, 683142, 1871, 5, 683172, 1871, 6, 683202, 1871, 7, 683231,
+    1871, 8, 683261, 1871, 9, 683290, 1871, 10, 683320, 1871, 11, 683349,
+    1871, 12, 683378, 1872, 1, 683408, 1872, 2, 683437, 1872, 3, 683467,
+    1872, 4, 683496, 1872, 5, 683526, 1872, 6, 683556, 1872, 7, 683585,
+    1872, 8, 683615, 1872, 9, 683644, 1872, 10, 683674, 1872, 11, 683704,
+    1872, 12, 683733, 1873, 1, 683763, 1873, 2, 683792, 1873, 3, 683821,
+    1873, 4, 683851, 1873, 5, 683880, 1873, 6, 683910, 1873, -6, 683939,
+    1873, 7, 683969, 1873, 8, 683999, 1873, 9, 684028, 1873, 10, 684058,
+    1873, 11, 684088, 1873, 12, 684117, 1874, 1, 684147, 1874, 2, 684176,
+    1874, 3, 684205, 1874, 4, 684235, 1874, 5, 684264, 1874, 6, 684294,
+    1874, 7, 684323, 1874, 8, 684353, 1874, 9, 684382, 1874, 10, 684412,
+    1874, 11, 684442, 1874, 12, 684472, 1875, 1, 684501, 1875, 2, 684531,
+    1875, 3, 684560, 1875, 4, 684589, 1875, 5, 684619, 1875, 6, 684648,
+    1875, 7, 684677, 1875, 8, 684707, 1875, 9, 684736, 1875, 10, 684766,
+    1875, 11, 684796, 1875, 12, 684826, 1876, 1, 684855, 1876, 2, 684885,
+    1876, 3, 684915, 1876, 4, 684944, 1876, 5, 684973, 1876, -5, 685003,
+    1876, 6, 685032, 1876, 7, 685061, 1876, 8, 685091, 1876, 9, 685120,
+    1876, 10, 685150, 1876, 11, 685180, 1876, 12, 685209, 1877, 1, 685239,
+    1877, 2, 685269, 1877, 3, 685299, 1877, 4, 685328, 1877, 5, 685357,
+    1877, 6, 685387, 1877, 7, 685416, 1877, 8, 685445, 1877, 9, 685475,
+    1877, 10, 685504, 1877, 11, 685534, 1877, 12, 685563, 1878, 1, 685593,
+    1878, 2, 685623, 1878, 3, 685653, 1878, 4, 685682, 1878, 5, 685712,
+    1878, 6, 685741, 1878, 7, 685771, 1878, 8, 685800, 1878, 9, 685829,
+    1878, 10, 685859, 1878, 11, 685888, 1878, 12, 685918, 1879, 1, 685947,
+    1879, 2, 685977, 1879, 3, 686007, 1879, -3, 686036, 1879, 4, 686066,
+    1879, 5, 686096, 1879, 6, 686125, 1879, 7, 686155, 1879, 8, 686184,
+    1879, 9, 686213, 1879, 10, 686243, 1879, 11, 686272, 1879, 12, 686302,
+    1880, 1, 686331, 1880, 2, 686361, 1880, 3, 686390, 1880, 4, 686420,
+    1880, 5, 686450, 1880, 6, 686479, 1880, 7, 686509, 1880, 8, 686539,
+    1880, 9, 686568, 1880, 10, 686598, 1880, 11, 686627, 1880, 12, 686656,
+    1881, 1, 686686, 1881, 2, 686715, 1881, 3, 686745, 1881, 4, 686774,
+    1881, 5, 686804, 1881, 6, 686833, 1881, 7, 686863, 1881, -7, 686893,
+    1881, 8, 686922, 1881, 9, 686952, 1881, 10, 686982, 1881, 11, 687011,
+    1881, 12, 687041, 1882, 1, 687070, 1882, 2, 687099, 1882, 3, 687129,
+    1882, 4, 687158, 1882, 5, 687188, 1882, 6, 687217, 1882, 7, 687247,
+    1882, 8, 687276, 1882, 9, 687306, 1882, 10, 687336, 1882, 11, 687365,
+    1882, 12, 687395, 1883, 1, 687425, 1883, 2, 687454, 1883, 3, 687483,
+    1883, 4, 687513, 1883, 5, 687542, 1883, 6, 687571, 1883, 7, 687601,
+    1883, 8, 687630, 1883, 9, 687660, 1883, 10, 687690, 1883, 11, 687720,
+    1883, 12, 687749, 1884, 1, 687779, 1884, 2, 687809, 1884, 3, 687838,
+    1884, 4, 687867, 1884, 5, 687897, 1884, -5, 687926, 1884, 6, 687955,
+    1884, 7, 687985, 1884, 8, 688014, 1884, 9, 688044, 1884, 10, 688074,
+    1884, 11, 688103, 1884, 12, 688133, 1885, 1, 688163, 1885, 2, 688193,
+    1885, 3, 688222, 1885, 4, 688251, 1885, 5, 688281, 1885, 6, 688310,
+    1885, 7, 688339, 1885, 8, 688369, 1885, 9, 688398, 1885, 10, 688428,
+    1885, 11, 688457, 1885, 12, 688487, 1886, 1, 688517, 1886, 2, 688547,
+    1886, 3, 688576, 1886, 4, 688606, 1886, 5, 688635, 1886, 6, 688665,
+    1886, 7, 688694, 1886, 8, 688723, 1886, 9, 688753, 1886, 10, 688782,
+    1886, 11, 688812, 1886, 12, 688841, 1887, 1, 688871, 1887, 2, 688901,
+    1887, 3, 688931, 1887, 4, 688960, 1887, -4, 688990, 1887, 5, 689019,
+    1887, 6, 689049, 1887, 7, 689078, 1887, 8, 689107, 1887, 9, 689137,
+    1887, 10, 689166, 1887, 11, 689196, 1887, 12, 689225, 1888, 1, 689255,
+    1888, 2, 689285, 1888, 3, 689314, 1888, 4, 689344, 1888, 5, 689374,
+    1888, 6, 689403, 1888, 7, 689433, 1888, 8, 689462, 1888, 9, 689491,
+    1888, 10, 689521, 1888, 11, 689550, 1888, 12, 689580, 1889, 1, 689609,
+    1889, 2, 689639, 1889, 3, 689668, 1889, 4, 689698, 1889, 5, 689728,
+    1889, 6, 689757, 1889, 7, 689787, 1889, 8, 689816, 1889, 9, 689846,
+    1889, 10, 689875, 1889, 11, 689905, 1889, 12, 689934, 1890, 1, 689964,
+    1890, 2, 689993, 1890, -2, 690023, 1890, 3, 690052, 1890, 4, 690082,
+    1890, 5, 690111, 1890, 6, 690141, 1890, 7, 690171, 1890, 8, 690200,
+    1890, 9, 690230, 1890, 10, 690259, 1890, 11, 690289, 1890, 12, 690318,
+    1891, 1, 690348, 1891, 2, 690377, 1891, 3, 690407, 1891, 4, 690436,
+    1891, 5, 690466, 1891, 6, 690495, 1891, 7, 690525, 1891, 8, 690554,
+    1891, 9, 690584, 1891, 10, 690614, 1891, 11, 690643, 1891, 12, 690673,
+    1892, 1, 690703, 1892, 2, 690732, 1892, 3, 690761, 1892, 4, 690791,
+    1892, 5, 690820, 1892, 6, 690849, 1892, -6, 690879, 1892, 7, 690908,
+    1892, 8, 690938, 1892, 9, 690968, 1892, 10, 690997, 1892, 11, 691027,
+    1892, 12, 691057, 1893, 1, 691087, 1893, 2, 691116, 1893, 3, 691145,
+    1893, 4, 691175, 1893, 5, 691204, 1893, 6, 691233, 1893, 7, 691263,
+    1893, 8, 691292, 1893, 9, 691322, 1893, 10, 691351, 1893, 11, 691381,
+    1893, 12, 691411, 1894, 1, 691441, 1894, 2, 691470, 1894, 3, 691500,
+    1894, 4, 691529, 1894, 5, 691559, 1894, 6, 691588, 1894, 7, 691617,
+    1894, 8, 691647, 1894, 9, 691676, 1894, 10, 691706, 1894, 11, 691735,
+    1894, 12, 691765, 1895, 1, 691795, 1895, 2, 691825, 1895, 3, 691854,
+    1895, 4, 691884, 1895, 5, 691913, 1895, -5, 691943, 1895, 6, 691972,
+    1895, 7, 692001, 1895, 8, 692031, 1895, 9, 692060, 1895, 10, 692090,
+    1895, 11, 692119, 1895, 12, 692149, 1896, 1, 692178, 1896, 2, 692208,
+    1896, 3, 692238, 1896, 4, 692268, 1896, 5, 692297, 1896, 6, 692327,
+    1896, 7, 692356, 1896, 8, 692385, 1896, 9, 692415, 1896, 10, 692444,
+    1896, 11, 692474, 1896, 12, 692503, 1897, 1, 692533, 1897, 2, 692562,
+    1897, 3, 692592, 1897, 4, 692622, 1897, 5, 692651, 1897, 6, 692681,
+    1897, 7, 692710, 1897, 8, 692740, 1897, 9, 692769, 1897, 10, 692799,
+    1897, 11, 692828, 1897, 12, 692858, 1898, 1, 692887, 1898, 2, 692917,
+    1898, 3, 692946, 1898, -3, 692976, 1898, 4, 693005, 1898, 5, 693035,
+    1898, 6, 693065, 1898, 7, 693094, 1898, 8, 693124, 1898, 9, 693153,
+    1898, 10, 693183, 1898, 11, 693212, 1898, 12, 693242, 1899, 1, 693271,
+    1899, 2, 693301, 1899, 3, 693330, 1899, 4, 693360, 1899, 5, 693389,
+    1899, 6, 693419, 1899, 7, 693448, 1899, 8, 693478, 1899, 9, 693508,
+    1899, 10, 693537, 1899, 11, 693567, 1899, 12, 693596, 1900, 1, 693626,
+    1900, 2, 693655, 1900, 3, 693685, 1900, 4, 693714, 1900, 5, 693743,
+    1900, 6, 693773, 1900, 7, 693802, 1900, 8, 693832, 1900, -8, 693862,
+    1900, 9, 693891, 1900, 10, 693921, 1900, 11, 693951, 1900, 12, 693980,
+    1901, 1, 694010, 1901, 2, 694039, 1901, 3, 694069, 1901, 4, 694098,
+    1901, 5, 694127, 1901, 6, 694157, 1901, 7, 694186, 1901, 8, 694216,
+    1901, 9, 694245, 1901, 10, 694275, 1901, 11, 694305, 1901, 12, 694335,
+    1902, 1, 694364, 1902, 2, 694394, 1902, 3, 694423, 1902, 4, 694453,
+    1902, 5, 694482, 1902, 6, 694511, 1902, 7, 694541, 1902, 8, 694570,
+    1902, 9, 694600, 1902, 10, 694629, 1902, 11, 694659, 1902, 12, 694689,
+    1903, 1, 694719, 1903, 2, 694748, 1903, 3, 694778, 1903, 4, 694807,
+    1903, 5, 694837, 1903, -5, 694866, 1903, 6, 694895, 1903, 7, 694925,
+    1903, 8, 694954, 1903, 9, 694983, 1903, 10, 695013, 1903, 11, 695043,
+    1903, 12, 695072, 1904, 1, 695102, 1904, 2, 695132, 1904, 3, 695162,
+    1904, 4, 695191, 1904, 5, 695221, 1904, 6, 695250, 1904, 7, 695279,
+    1904, 8, 695309, 1904, 9, 695338, 1904, 10, 695367, 1904, 11, 695397,
+    1904, 12, 695427, 1905, 1, 695456, 1905, 2, 695486, 1905, 3, 695516,
+    1905, 4, 695545, 1905, 5, 695575, 1905, 6, 695605, 1905, 7, 695634,
+    1905, 8, 695663, 1905, 9, 695693, 1905, 10, 695722, 1905, 11, 695752,
+    1905, 12, 695781, 1906, 1, 695811, 1906, 2, 695840, 1906, 3, 695870,
+    1906, 4, 695900, 1906, -4, 695929, 1906, 5, 695959, 1906, 6, 695988,
+    1906, 7, 696018, 1906, 8, 696047, 1906, 9, 696077, 1906, 10, 696106,
+    1906, 11, 696136, 1906, 12, 696165, 1907, 1, 696195, 1907, 2, 696224,
+    1907, 3, 696254, 1907, 4, 696283, 1907, 5, 696313, 1907, 6, 696342,
+    1907, 7, 696372, 1907, 8, 696402, 1907, 9, 696431, 1907, 10, 696461,
+    1907, 11, 696490, 1907, 12, 696520, 1908, 1, 696549, 1908, 2, 696579,
+    1908, 3, 696608, 1908, 4, 696637, 1908, 5, 696667, 1908, 6, 696697,
+    1908, 7, 696726, 1908, 8, 696756, 1908, 9, 696785, 1908, 10, 696815,
+    1908, 11, 696845, 1908, 12, 696874, 1909, 1, 696904, 1909, 2, 696933,
+    1909, -2, 696963, 1909, 3, 696992, 1909, 4, 697021, 1909, 5, 697051,
+    1909, 6, 697080, 1909, 7, 697110, 1909, 8, 697139, 1909, 9, 697169,
+    1909, 10, 697199, 1909, 11, 697229, 1909, 12, 697258, 1910, 1, 697288,
+    1910, 2, 697317, 1910, 3, 697347, 1910, 4, 697376, 1910, 5, 697405,
+    1910, 6, 697435, 1910, 7, 697464, 1910, 8, 697494, 1910, 9, 697523,
+    1910, 10, 697553, 1910, 11, 697583, 1910, 12, 697613, 1911, 1, 697642,
+    1911, 2, 697672, 1911, 3, 697701, 1911, 4, 697731, 1911, 5, 697760,
+    1911, 6, 697789, 1911, -6, 697819, 1911, 7, 697848, 1911, 8, 697877,
+    1911, 9, 697907, 1911, 10, 697937, 1911, 11, 697966, 1911, 12, 697996,
+    1912, 1, 698026, 1912, 2, 698056, 1912, 3, 698085, 1912, 4, 698115,
+    1912, 5, 698144, 1912, 6, 698173, 1912, 7, 698203, 1912, 8, 698232,
+    1912, 9, 698261, 1912, 10, 698291, 1912, 11, 698321, 1912, 12, 698350,
+    1913, 1, 698380, 1913, 2, 698410, 1913, 3, 698440, 1913, 4, 698469,
+    1913, 5, 698499, 1913, 6, 698528, 1913, 7, 698557, 1913, 8, 698587,
+    1913, 9, 698616, 1913, 10, 698645, 1913, 11, 698675, 1913, 12, 698704,
+    1914, 1, 698734, 1914, 2, 698764, 1914, 3, 698794, 1914, 4, 698823,
+    1914, 5, 698853, 1914, -5, 698882, 1914, 6, 698912, 1914, 7, 698941,
+    1914, 8, 698971, 1914, 9, 699000, 1914, 10, 699029, 1914, 11, 699059,
+    1914, 12, 699088, 1915, 1, 699118, 1915, 2, 699148, 1915, 3, 699177,
+    1915, 4, 699207, 1915, 5, 699237, 1915, 6, 699266, 1915, 7, 699296,
+    1915, 8, 699325, 1915, 9, 699355, 1915, 10, 699384, 1915, 11, 699414,
+    1915, 12, 699443, 1916, 1, 699472, 1916, 2, 699502, 1916, 3, 699532,
+    1916, 4, 699561, 1916, 5, 699591, 1916, 6, 699620, 1916, 7, 699650,
+    1916, 8, 699680, 1916, 9, 699709, 1916, 10, 699739, 1916, 11, 699768,
+    1916, 12, 699798, 1917, 1, 699827, 1917, 2, 699857, 1917, -2, 699886,
+    1917, 3, 699915, 1917, 4, 699945, 1917, 5, 699974, 1917, 6, 700004,
+    1917, 7, 700034, 1917, 8, 700063, 1917, 9, 700093, 1917, 10, 700123,
+    1917, 11, 700152, 1917, 12, 700182, 1918, 1, 700211, 1918, 2, 700241,
+    1918, 3, 700270, 1918, 4, 700299, 1918, 5, 700329, 1918, 6, 700358,
+    1918, 7, 700388, 1918, 8, 700417, 1918, 9, 700447, 1918, 10, 700477,
+    1918, 11, 700506, 1918, 12, 700536, 1919, 1, 700566, 1919, 2, 700595,
+    1919, 3, 700625, 1919, 4, 700654, 1919, 5, 700683, 1919, 6, 700713,
+    1919, 7, 700742, 1919, -7, 700771, 1919, 8, 700801, 1919, 9, 700831,
+    1919, 10, 700860, 1919, 11, 700890, 1919, 12, 700920, 1920, 1, 700950,
+    1920, 2, 700979, 1920, 3, 701009, 1920, 4, 701038, 1920, 5, 701067,
+    1920, 6, 701097, 1920, 7, 701126, 1920, 8, 701155, 1920, 9, 701185,
+    1920, 10, 701214, 1920, 11, 701244, 1920, 12, 701274, 1921, 1, 701304,
+    1921, 2, 701334, 1921, 3, 701363, 1921, 4, 701393, 1921, 5, 701422,
+    1921, 6, 701451, 1921, 7, 701481, 1921, 8, 701510, 1921, 9, 701539,
+    1921, 10, 701569, 1921, 11, 701598, 1921, 12, 701628, 1922, 1, 701658,
+    1922, 2, 701688, 1922, 3, 701717, 1922, 4, 701747, 1922, 5, 701777,
+    1922, -5, 701806, 1922, 6, 701835, 1922, 7, 701865, 1922, 8, 701894,
+    1922, 9, 701923, 1922, 10, 701953, 1922, 11, 701982, 1922, 12, 702012,
+    1923, 1, 702042, 1923, 2, 702071, 1923, 3, 702101, 1923, 4, 702131,
+    1923, 5, 702160, 1923, 6, 702190, 1923, 7, 702219, 1923, 8, 702249,
+    1923, 9, 702278, 1923, 10, 702307, 1923, 11, 702337, 1923, 12, 702366,
+    1924, 1, 702396, 1924, 2, 702425, 1924, 3, 702455, 1924, 4, 702485,
+    1924, 5, 702514, 1924, 6, 702544, 1924, 7, 702574, 1924, 8, 702603,
+    1924, 9, 702633, 1924, 10, 702662, 1924, 11, 702692, 1924, 12, 702721,
+    1925, 1, 702750, 1925, 2, 702780, 1925, 3, 702809, 1925, 4, 702839,
+    1925, -4, 702868, 1925, 5, 702898, 1925, 6, 702928, 1925, 7, 702957,
+    1925, 8, 702987, 1925, 9, 703017, 1925, 10, 703046, 1925, 11, 703076,
+    1925, 12, 703105, 1926, 1, 703135, 1926, 2, 703164, 1926, 3, 703193,
+    1926, 4, 703223, 1926, 5, 703252, 1926, 6, 703282, 1926, 7, 703311,
+    1926, 8, 703341, 1926, 9, 703371, 1926, 10, 703400, 1926, 11, 703430,
+    1926, 12, 703460, 1927, 1, 703489, 1927, 2, 703519, 1927, 3, 703548,
+    1927, 4, 703577, 1927, 5, 703607, 1927, 6, 703636, 1927, 7, 703666,
+    1927, 8, 703695, 1927, 9, 703725, 1927, 10, 703754, 1927, 11, 703784,
+    1927, 12, 703814, 1928, 1, 703844, 1928, 2, 703873, 1928, -2, 703903,
+    1928, 3, 703932, 1928, 4, 703961, 1928, 5, 703991, 1928, 6, 704020,
+    1928, 7, 704049, 1928, 8, 704079, 1928, 9, 704108, 1928, 10, 704138,
+    1928, 11, 704168, 1928, 12, 704198, 1929, 1, 704228, 1929, 2, 704257,
+    1929, 3, 704287, 1929, 4, 704316, 1929, 5, 704345, 1929, 6, 704375,
+    1929, 7, 704404, 1929, 8, 704433, 1929, 9, 704463, 1929, 10, 704492,
+    1929, 11, 704522, 1929, 12, 704552, 1930, 1, 704582, 1930, 2, 704611,
+    1930, 3, 704641, 1930, 4, 704671, 1930, 5, 704700, 1930, 6, 704729,
+    1930, -6, 704759, 1930, 7, 704788, 1930, 8, 704817, 1930, 9, 704847,
+    1930, 10, 704876, 1930, 11, 704906, 1930, 12, 704936, 1931, 1, 704965,
+    1931, 2, 704995, 1931, 3, 705025, 1931, 4, 705054, 1931, 5, 705084,
+    1931, 6, 705113, 1931, 7, 705143, 1931, 8, 705172, 1931, 9, 705201,
+    1931, 10, 705231, 1931, 11, 705260, 1931, 12, 705290, 1932, 1, 705319,
+    1932, 2, 705349, 1932, 3, 705379, 1932, 4, 705409, 1932, 5, 705438,
+    1932, 6, 705468, 1932, 7, 705497, 1932, 8, 705527, 1932, 9, 705556,
+    1932, 10, 705585, 1932, 11, 705615, 1932, 12, 705644, 1933, 1, 705674,
+    1933, 2, 705703, 1933, 3, 705733, 1933, 4, 705763, 1933, 5, 705792,
+    1933, -5, 705822, 1933, 6, 705852, 1933, 7, 705881, 1933, 8, 705911,
+    1933, 9, 705940, 1933, 10, 705970, 1933, 11, 705999, 1933, 12, 706028,
+    1934, 1, 706058, 1934, 2, 706087, 1934, 3, 706117, 1934, 4, 706146,
+    1934, 5, 706176, 1934, 6, 706206, 1934, 7, 706235, 1934, 8, 706265,
+    1934, 9, 706294, 1934, 10, 706324, 1934, 11, 706354, 1934, 12, 706383,
+    1935, 1, 706413, 1935, 2, 706442, 1935, 3, 706471, 1935, 4, 706501,
+    1935, 5, 706530, 1935, 6, 706560, 1935, 7, 706589, 1935, 8, 706619,
+    1935, 9, 706649, 1935, 10, 706678, 1935, 11, 706708, 1935, 12, 706738,
+    1936, 1, 706767, 1936, 2, 706797, 1936, 3, 706826, 1936, -3, 706855,
+    1936, 4, 706885, 1936, 5, 706914, 1936, 6, 706943, 1936, 7, 706973,
+    1936, 8, 707003, 1936, 9, 707032, 1936, 10, 707062, 1936, 11, 707092,
+    1936, 12, 707122, 1937, 1, 707151, 1937, 2, 707181, 1937, 3, 707210,
+    1937, 4, 707239, 1937, 5, 707269, 1937, 6, 707298, 1937, 7, 707327,
+    1937, 8, 707357, 1937, 9, 707386, 1937, 10, 707416, 1937, 11, 707446,
+    1937, 12, 707476, 1938, 1, 707505, 1938, 2, 707535, 1938, 3, 707565,
+    1938, 4, 707594, 1938, 5, 707623, 1938, 6, 707653, 1938, 7, 707682,
+    1938, -7, 707711, 1938, 8, 707741, 1938, 9, 707770, 1938, 10, 707800,
+    1938, 11, 707830, 1938, 12, 707859, 1939, 1, 707889, 1939, 2, 707919,
+    1939, 3, 707949, 1939, 4, 707978, 1939, 5, 708007, 1939, 6, 708037,
+    1939, 7, 708066, 1939, 8, 708095, 1939, 9, 708125, 1939, 10, 708154,
+    1939, 11, 708184, 1939, 12, 708213, 1940, 1, 708243, 1940, 2, 708273,
+    1940, 3, 708303, 1940, 4, 708332, 1940, 5, 708362, 1940, 6, 708391,
+    1940, 7, 708421, 1940, 8, 708450, 1940, 9, 708479, 1940, 10, 708509,
+    1940, 11, 708538, 1940, 12, 708568, 1941, 1, 708597, 1941, 2, 708627,
+    1941, 3, 708657, 1941, 4, 708686, 1941, 5, 708716, 1941, 6, 708746,
+    1941, -6, 708775, 1941, 7, 708805, 1941, 8, 708834, 1941, 9, 708863,
+    1941, 10, 708893, 1941, 11, 708922, 1941, 12, 708952, 1942, 1, 708981,
+    1942, 2, 709011, 1942, 3, 709040, 1942, 4, 709070, 1942, 5, 709100,
+    1942, 6, 709129, 1942, 7, 709159, 1942, 8, 709188, 1942, 9, 709218,
+    1942, 10, 709247, 1942, 11, 709277, 1942, 12, 709306, 1943, 1, 709336,
+    1943, 2, 709365, 1943, 3, 709395, 1943, 4, 709424, 1943, 5, 709454,
+    1943, 6, 709483, 1943, 7, 709513, 1943, 8, 709543, 1943, 9, 709572,
+    1943, 10, 709602, 1943, 11, 709631, 1943, 12, 709661, 1944, 1, 709690,
+    1944, 2, 709720, 1944, 3, 709749, 1944, 4, 709779, 1944, -4, 709808,
+    1944, 5, 709838, 1944, 6, 709867, 1944, 7, 709897, 1944, 8, 709926,
+    1944, 9, 709956, 1944, 10, 709986, 1944, 11, 710015, 1944, 12, 710045,
+    1945, 1, 710075, 1945, 2, 710104, 1945, 3, 710133, 1945, 4, 710163,
+    1945, 5, 710192, 1945, 6, 710221, 1945, 7, 710251, 1945, 8, 710280,
+    1945, 9, 710310, 1945, 10, 710340, 1945, 11, 710370, 1945, 12, 710399,
+    1946, 1, 710429, 1946, 2, 710459, 1946, 3, 710488, 1946, 4, 710517,
+    1946, 5, 710547, 1946, 6, 710576, 1946, 7, 710605, 1946, 8, 710635,
+    1946, 9, 710664, 1946, 10, 710694, 1946, 11, 710724, 1946, 12, 710753,
+    1947, 1, 710783, 1947, 2, 710813, 1947, -2, 710843, 1947, 3, 710872,
+    1947, 4, 710901, 1947, 5, 710931, 1947, 6, 710960, 1947, 7, 710989,
+    1947, 8, 711019, 1947, 9, 711048, 1947, 10, 711078, 1947, 11, 711107,
+    1947, 12, 711137, 1948, 1, 711167, 1948, 2, 711197, 1948, 3, 711226,
+    1948, 4, 711256, 1948, 5, 711285, 1948, 6, 711315, 1948, 7, 711344,
+    1948, 8, 711373, 1948, 9, 711403, 1948, 10, 711432, 1948, 11, 711462,
+    1948, 12, 711491, 1949, 1, 711521, 1949, 2, 711551, 1949, 3, 711580,
+    1949, 4, 711610, 1949, 5, 711640, 1949, 6, 711669, 1949, 7, 711699,
+    1949, -7, 711728, 1949, 8, 711757, 1949, 9, 711787, 1949, 10, 711816,
+    1949, 11, 711846, 1949, 12, 711875, 1950, 1, 711905, 1950, 2, 711934,
+    1950, 3, 711964, 1950, 4, 711994, 1950, 5, 712023, 1950, 6, 712053,
+    1950, 7, 712083, 1950, 8, 712112, 1950, 9, 712141, 1950, 10, 712171,
+    1950, 11, 712200, 1950, 12, 712230, 1951, 1, 712259, 1951, 2, 712289,
+    1951, 3, 712318, 1951, 4, 712348, 1951, 5, 712378, 1951, 6, 712407,
+    1951, 7, 712437, 1951, 8, 712466, 1951, 9, 712496, 1951, 10, 712525,
+    1951, 11, 712555, 1951, 12, 712584, 1952, 1, 712614, 1952, 2, 712643,
+    1952, 3, 712673, 1952, 4, 712702, 1952, 5, 712732, 1952, -5, 712761,
+    1952, 6, 712791, 1952, 7, 712820, 1952, 8, 712850, 1952, 9, 712880,
+    1952, 10, 712909, 1952, 11, 712939, 1952, 12, 712968, 1953, 1, 712998,
+    1953, 2, 713027, 1953, 3, 713057, 1953, 4, 713086, 1953, 5, 713115,
+    1953, 6, 713145, 1953, 7, 713175, 1953, 8, 713204, 1953, 9, 713234,
+    1953, 10, 713264, 1953, 11, 713293, 1953, 12, 713323, 1954, 1, 713352,
+    1954, 2, 713382, 1954, 3, 713411, 1954, 4, 713441, 1954, 5, 713470,
+    1954, 6, 713499, 1954, 7, 713529, 1954, 8, 713558, 1954, 9, 713588,
+    1954, 10, 713618, 1954, 11, 713647, 1954, 12, 713677, 1955, 1, 713707,
+    1955, 2, 713736, 1955, 3, 713766, 1955, -3, 713795, 1955, 4, 713825,
+    1955, 5, 713854, 1955, 6, 713883, 1955, 7, 713913, 1955, 8, 713942,
+    1955, 9, 713972, 1955, 10, 714001, 1955, 11, 714031, 1955, 12, 714061,
+    1956, 1, 714091, 1956, 2, 714120, 1956, 3, 714150, 1956, 4, 714179,
+    1956, 5, 714209, 1956, 6, 714238, 1956, 7, 714267, 1956, 8, 714297,
+    1956, 9, 714326, 1956, 10, 714356, 1956, 11, 714385, 1956, 12, 714415,
+    1957, 1, 714445, 1957, 2, 714475, 1957, 3, 714504, 1957, 4, 714534,
+    1957, 5, 714563, 1957, 6, 714593, 1957, 7, 714622, 1957, 8, 714651,
+    1957, -8, 714681, 1957, 9, 714710, 1957, 10, 714740, 1957, 11, 714769,
+    1957, 12, 714799, 1958, 1, 714828, 1958, 2, 714858, 1958, 3, 714888,
+    1958, 4, 714918, 1958, 5, 714947, 1958, 6, 714977, 1958, 7, 715006,
+    1958, 8, 715035, 1958, 9, 715065, 1958, 10, 715094, 1958, 11, 715124,
+    1958, 12, 715153, 1959, 1, 715183, 1959, 2, 715212, 1959, 3, 715242,
+    1959, 4, 715272, 1959, 5, 715301, 1959, 6, 715331, 1959, 7, 715360,
+    1959, 8, 715390, 1959, 9, 715419, 1959, 10, 715449, 1959, 11, 715478,
+    1959, 12, 715508, 1960, 1, 715537, 1960, 2, 715567, 1960, 3, 715596,
+    1960, 4, 715626, 1960, 5, 715655, 1960, 6, 715685, 1960, -6, 715715,
+    1960, 7, 715744, 1960, 8, 715774, 1960, 9, 715803, 1960, 10, 715833,
+    1960, 11, 715862, 1960, 12, 715892, 1961, 1, 715921, 1961, 2, 715951,
+    1961, 3, 715980, 1961, 4, 716010, 1961, 5, 716039, 1961, 6, 716069,
+    1961, 7, 716098, 1961, 8, 716128, 1961, 9, 716158, 1961, 10, 716187,
+    1961, 11, 716217, 1961, 12, 716246, 1962, 1, 716276, 1962, 2, 716305,
+    1962, 3, 716335, 1962, 4, 716364, 1962, 5, 716393, 1962, 6, 716423,
+    1962, 7, 716452, 1962, 8, 716482, 1962, 9, 716512, 1962, 10, 716541,
+    1962, 11, 716571, 1962, 12, 716601, 1963, 1, 716630, 1963, 2, 716660,
+    1963, 3, 716689, 1963, 4, 716719, 1963, -4, 716748, 1963, 5, 716777,
+    1963, 6, 716807, 1963, 7, 716836, 1963, 8, 716866, 1963, 9, 716895,
+    1963, 10, 716925, 1963, 11, 716955, 1963, 12, 716985, 1964, 1, 717014,
+    1964, 2, 717044, 1964, 3, 717073, 1964, 4, 717103, 1964, 5, 717132,
+    1964, 6, 717161, 1964, 7, 717191, 1964, 8, 717220, 1964, 9, 717250,
+    1964, 10, 717279, 1964, 11, 717309, 1964, 12, 717339, 1965, 1, 717369,
+    1965, 2, 717398, 1965, 3, 717428, 1965, 4, 717457, 1965, 5, 717487,
+    1965, 6, 717516, 1965, 7, 717545, 1965, 8, 717575, 1965, 9, 717604,
+    1965, 10, 717633, 1965, 11, 717663, 1965, 12, 717693, 1966, 1, 717722,
+    1966, 2, 717752, 1966, 3, 717782, 1966, -3, 717812, 1966, 4, 717841,
+    1966, 5, 717871, 1966, 6, 717900, 1966, 7, 717929, 1966, 8, 717959,
+    1966, 9, 717988, 1966, 10, 718017, 1966, 11, 718047, 1966, 12, 718077,
+    1967, 1, 718106, 1967, 2, 718136, 1967, 3, 718166, 1967, 4, 718195,
+    1967, 5, 718225, 1967, 6, 718255, 1967, 7, 718284, 1967, 8, 718313,
+    1967, 9, 718343, 1967, 10, 718372, 1967, 11, 718402, 1967, 12, 718431,
+    1968, 1, 718461, 1968, 2, 718490, 1968, 3, 718520, 1968, 4, 718549,
+    1968, 5, 718579, 1968, 6, 718609, 1968, 7, 718638, 1968, -7, 718668,
+    1968, 8, 718697, 1968, 9, 718727, 1968, 10, 718756, 1968, 11, 718786,
+    1968, 12, 718815, 1969, 1, 718845, 1969, 2, 718874, 1969, 3, 718904,
+    1969, 4, 718933, 1969, 5, 718963, 1969, 6, 718992, 1969, 7, 719022,
+    1969, 8, 719052, 1969, 9, 719081, 1969, 10, 719111, 1969, 11, 719140,
+    1969, 12, 719170, 1970, 1, 719199, 1970, 2, 719229, 1970, 3, 719258,
+    1970, 4, 719287, 1970, 5, 719317, 1970, 6, 719346, 1970, 7, 719376,
+    1970, 8, 719406, 1970, 9, 719435, 1970, 10, 719465, 1970, 11, 719495,
+    1970, 12, 719524, 1971, 1, 719554, 1971, 2, 719583, 1971, 3, 719613,
+    1971, 4, 719642, 1971, 5, 719671, 1971, -5, 719701, 1971, 6, 719730,
+    1971, 7, 719760, 1971, 8, 719789, 1971, 9, 719819, 1971, 10, 719849,
+    1971, 11, 719879, 1971, 12, 719908, 1972, 1, 719938, 1972, 2, 719967,
+    1972, 3, 719997, 1972, 4, 720026, 1972, 5, 720055, 1972, 6, 720085,
+    1972, 7, 720114, 1972, 8, 720144, 1972, 9, 720173, 1972, 10, 720203,
+    1972, 11, 720233, 1972, 12, 720262, 1973, 1, 720292, 1973, 2, 720322,
+    1973, 3, 720351, 1973, 4, 720381, 1973, 5, 720410, 1973, 6, 720439,
+    1973, 7, 720469, 1973, 8, 720498, 1973, 9, 720527, 1973, 10, 720557,
+    1973, 11, 720587, 1973, 12, 720616, 1974, 1, 720646, 1974, 2, 720676,
+    1974, 3, 720706, 1974, 4, 720735, 1974, -4, 720765, 1974, 5, 720794,
+    1974, 6, 720823, 1974, 7, 720853, 1974, 8, 720882, 1974, 9, 720911,
+    1974, 10, 720941, 1974, 11, 720971, 1974, 12, 721000, 1975, 1, 721030,
+    1975, 2, 721060, 1975, 3, 721090, 1975, 4, 721119, 1975, 5, 721149,
+    1975, 6, 721178, 1975, 7, 721207, 1975, 8, 721237, 1975, 9, 721266,
+    1975, 10, 721295, 1975, 11, 721325, 1975, 12, 721354, 1976, 1, 721384,
+    1976, 2, 721414, 1976, 3, 721444, 1976, 4, 721473, 1976, 5, 721503,
+    1976, 6, 721532, 1976, 7, 721562, 1976, 8, 721591, 1976, -8, 721621,
+    1976, 9, 721650, 1976, 10, 721679, 1976, 11, 721709, 1976, 12, 721738,
+    1977, 1, 721768, 1977, 2, 721798, 1977, 3, 721827, 1977, 4, 721857,
+    1977, 5, 721887, 1977, 6, 721916, 1977, 7, 721946, 1977, 8, 721975,
+    1977, 9, 722005, 1977, 10, 722034, 1977, 11, 722064, 1977, 12, 722093,
+    1978, 1, 722122, 1978, 2, 722152, 1978, 3, 722181, 1978, 4, 722211,
+    1978, 5, 722241, 1978, 6, 722270, 1978, 7, 722300, 1978, 8, 722330,
+    1978, 9, 722359, 1978, 10, 722389, 1978, 11, 722418, 1978, 12, 722448,
+    1979, 1, 722477, 1979, 2, 722507, 1979, 3, 722536, 1979, 4, 722565,
+    1979, 5, 722595, 1979, 6, 722624, 1979, -6, 722654, 1979, 7, 722684,
+    1979, 8, 722713, 1979, 9, 722743, 1979, 10, 722773, 1979, 11, 722802,
+    1979, 12, 722832, 1980, 1, 722861, 1980, 2, 722891, 1980, 3, 722920,
+    1980, 4, 722949, 1980, 5, 722979, 1980, 6, 723008, 1980, 7, 723038,
+    1980, 8, 723067, 1980, 9, 723097, 1980, 10, 723127, 1980, 11, 723156,
+    1980, 12, 723186, 1981, 1, 723216, 1981, 2, 723245, 1981, 3, 723275,
+    1981, 4, 723304, 1981, 5, 723333, 1981, 6, 723363, 1981, 7, 723392,
+    1981, 8, 723421, 1981, 9, 723451, 1981, 10, 723481, 1981, 11, 723510,
+    1981, 12, 723540, 1982, 1, 723570, 1982, 2, 723600, 1982, 3, 723629,
+    1982, 4, 723659, 1982, -4, 723688, 1982, 5, 723717, 1982, 6, 723747,
+    1982, 7, 723776, 1982, 8, 723805, 1982, 9, 723835, 1982, 10, 723864,
+    1982, 11, 723894, 1982, 12, 723924, 1983, 1, 723954, 1983, 2, 723984,
+    1983, 3, 724013, 1983, 4, 724043, 1983, 5, 724072, 1983, 6, 724101,
+    1983, 7, 724131, 1983, 8, 724160, 1983, 9, 724189, 1983, 10, 724219,
+    1983, 11, 724248, 1983, 12, 724278, 1984, 1, 724308, 1984, 2, 724338,
+    1984, 3, 724367, 1984, 4, 724397, 1984, 5, 724427, 1984, 6, 724456,
+    1984, 7, 724485, 1984, 8, 724515, 1984, 9, 724544, 1984, 10, 724573,
+    1984, -10, 724603, 1984, 11, 724632, 1984, 12, 724662, 1985, 1, 724692,
+    1985, 2, 724721, 1985, 3, 724751, 1985, 4, 724781, 1985, 5, 724810,
+    1985, 6, 724840, 1985, 7, 724869, 1985, 8, 724899, 1985, 9, 724928,
+    1985, 10, 724957, 1985, 11, 724987, 1985, 12, 725016, 1986, 1, 725046,
+    1986, 2, 725075, 1986, 3, 725105, 1986, 4, 725135, 1986, 5, 725164,
+    1986, 6, 725194, 1986, 7, 725224, 1986, 8, 725253, 1986, 9, 725283,
+    1986, 10, 725312, 1986, 11, 725342, 1986, 12, 725371, 1987, 1, 725400,
+    1987, 2, 725430, 1987, 3, 725459, 1987, 4, 725489, 1987, 5, 725518,
+    1987, 6, 725548, 1987, -6, 725578, 1987, 7, 725607, 1987, 8, 725637,
+    1987, 9, 725667, 1987, 10, 725696, 1987, 11, 725726, 1987, 12, 725755,
+    1988, 1, 725784, 1988, 2, 725814, 1988, 3, 725843, 1988, 4, 725873,
+    1988, 5, 725902, 1988, 6, 725932, 1988, 7, 725961, 1988, 8, 725991,
+    1988, 9, 726021, 1988, 10, 726050, 1988, 11, 726080, 1988, 12, 726110,
+    1989, 1, 726139, 1989, 2, 726169, 1989, 3, 726198, 1989, 4, 726227,
+    1989, 5, 726257, 1989, 6, 726286, 1989, 7, 726316, 1989, 8, 726345,
+    1989, 9, 726375, 1989, 10, 726404, 1989, 11, 726434, 1989, 12, 726464,
+    1990, 1, 726494, 1990, 2, 726523, 1990, 3, 726553, 1990, 4, 726582,
+    1990, 5, 726611, 1990, -5, 726641, 1990, 6, 726670, 1990, 7, 726699,
+    1990, 8, 726729, 1990, 9, 726758, 1990, 10, 726788, 1990, 11, 726818,
+    1990, 12, 726848, 1991, 1, 726878, 1991, 2, 726907, 1991, 3, 726937,
+    1991, 4, 726966, 1991, 5, 726995, 1991, 6, 727025, 1991, 7, 727054,
+    1991, 8, 727083, 1991, 9, 727113, 1991, 10, 727142, 1991, 11, 727172,
+    1991, 12, 727202, 1992, 1, 727232, 1992, 2, 727261, 1992, 3, 727291,
+    1992, 4, 727321, 1992, 5, 727350, 1992, 6, 727379, 1992, 7, 727409,
+    1992, 8, 727438, 1992, 9, 727467, 1992, 10, 727497, 1992, 11, 727526,
+    1992, 12, 727556, 1993, 1, 727586, 1993, 2, 727615, 1993, 3, 727645,
+    1993, -3, 727675, 1993, 4, 727704, 1993, 5, 727734, 1993, 6, 727763,
+    1993, 7, 727793, 1993, 8, 727822, 1993, 9, 727851, 1993, 10, 727881,
+    1993, 11, 727910, 1993, 12, 727940, 1994, 1, 727969, 1994, 2, 727999,
+    1994, 3, 728029, 1994, 4, 728059, 1994, 5, 728088, 1994, 6, 728118,
+    1994, 7, 728147, 1994, 8, 728177, 1994, 9, 728206, 1994, 10, 728235,
+    1994, 11, 728265, 1994, 12, 728294, 1995, 1, 728324, 1995, 2, 728353,
+    1995, 3, 728383, 1995, 4, 728413, 1995, 5, 728442, 1995, 6, 728472,
+    1995, 7, 728501, 1995, 8, 728531, 1995, -8, 728561, 1995, 9, 728590,
+    1995, 10, 728619, 1995, 11, 728649, 1995, 12, 728678, 1996, 1, 728708,
+    1996, 2, 728737, 1996, 3, 728767, 1996, 4, 728796, 1996, 5, 728826,
+    1996, 6, 728856, 1996, 7, 728885, 1996, 8, 728915, 1996, 9, 728944,
+    1996, 10, 728974, 1996, 11, 729004, 1996, 12, 729033, 1997, 1, 729062,
+    1997, 2, 729092, 1997, 3, 729121, 1997, 4, 729151, 1997, 5, 729180,
+    1997, 6, 729210, 1997, 7, 729239, 1997, 8, 729269, 1997, 9, 729299,
+    1997, 10, 729328, 1997, 11, 729358, 1997, 12, 729388, 1998, 1, 729417,
+    1998, 2, 729447, 1998, 3, 729476, 1998, 4, 729505, 1998, 5, 729535,
+    1998, -5, 729564, 1998, 6, 729593, 1998, 7, 729623, 1998, 8, 729653,
+    1998, 9, 729682, 1998, 10, 729712, 1998, 11, 729742, 1998, 12, 729771,
+    1999, 1, 729801, 1999, 2, 729831, 1999, 3, 729860, 1999, 4, 729889,
+    1999, 5, 729919, 1999, 6, 729948, 1999, 7, 729977, 1999, 8, 730007,
+    1999, 9, 730036, 1999, 10, 730066, 1999, 11, 730096, 1999, 12, 730126,
+    2000, 1, 730155, 2000, 2, 730185, 2000, 3, 730215, 2000, 4, 730244,
+    2000, 5, 730273, 2000, 6, 730303, 2000, 7, 730332, 2000, 8, 730361,
+    2000, 9, 730391, 2000, 10, 730420, 2000, 11, 730450, 2000, 12, 730480,
+    2001, 1, 730509, 2001, 2, 730539, 2001, 3, 730569, 2001, 4, 730598,
+    2001, -4, 730628, 2001, 5, 730657, 2001, 6, 730687, 2001, 7, 730716,
+    2001, 8, 730745, 2001, 9, 730775, 2001, 10, 730804, 2001, 11, 730834,
+    2001, 12, 730863, 2002, 1, 730893, 2002, 2, 730923, 2002, 3, 730953,
+    2002, 4, 730982, 2002, 5, 731012, 2002, 6, 731041, 2002, 7, 731071,
+    2002, 8, 731100, 2002, 9, 731129, 2002, 10, 731159, 2002, 11, 731188,
+    2002, 12, 731218, 2003, 1, 731247, 2003, 2, 731277, 2003, 3, 731307,
+    2003, 4, 731336, 2003, 5, 731366, 2003, 6, 731396, 2003, 7, 731425,
+    2003, 8, 731455, 2003, 9, 731484, 2003, 10, 731513, 2003, 11, 731543,
+    2003, 12, 731572, 2004, 1, 731602, 2004, 2, 731631, 2004, -2, 731661,
+    2004, 3, 731690, 2004, 4, 731720, 2004, 5, 731750, 2004, 6, 731779,
+    2004, 7, 731809, 2004, 8, 731838, 2004, 9, 731868, 2004, 10, 731897,
+    2004, 11, 731927, 2004, 12, 731956, 2005, 1, 731986, 2005, 2, 732015,
+    2005, 3, 732045, 2005, 4, 732074, 2005, 5, 732104, 2005, 6, 732133,
+    2005, 7, 732163, 2005, 8, 732193, 2005, 9, 732222, 2005, 10, 732252,
+    2005, 11, 732281, 2005, 12, 732311, 2006, 1, 732340, 2006, 2, 732370,
+    2006, 3, 732399, 2006, 4, 732429, 2006, 5, 732458, 2006, 6, 732488,
+    2006, 7, 732517, 2006, -7, 732547, 2006, 8, 732576, 2006, 9, 732606,
+    2006, 10, 732636, 2006, 11, 732665, 2006, 12, 732695, 2007, 1, 732725,
+    2007, 2, 732754, 2007, 3, 732783, 2007, 4, 732813, 2007, 5, 732842,
+    2007, 6, 732871, 2007, 7, 732901, 2007, 8, 732930, 2007, 9, 732960,
+    2007, 10, 732990, 2007, 11, 733020, 2007, 12, 733049, 2008, 1, 733079,
+    2008, 2, 733109, 2008, 3, 733138, 2008, 4, 733167, 2008, 5, 733197,
+    2008, 6, 733226, 2008, 7, 733255, 2008, 8, 733285, 2008, 9, 733314,
+    2008, 10, 733344, 2008, 11, 733374, 2008, 12, 733403, 2009, 1, 733433,
+    2009, 2, 733463, 2009, 3, 733493, 2009, 4, 733522, 2009, 5, 733551,
+    2009, -5, 733581, 2009, 6, 733610, 2009, 7, 733639, 2009, 8, 733669,
+    2009, 9, 733698, 2009, 10, 733728, 2009, 11, 733757, 2009, 12, 733787,
+    2010, 1, 733817, 2010, 2, 733847, 2010, 3, 733876, 2010, 4, 733906,
+    2010, 5, 733935, 2010, 6, 733965, 2010, 7, 733994, 2010, 8, 734023,
+    2010, 9, 734053, 2010, 10, 734082, 2010, 11, 734112, 2010, 12, 734141,
+    2011, 1, 734171, 2011, 2, 734201, 2011, 3, 734230, 2011, 4, 734260,
+    2011, 5, 734290, 2011, 6, 734319, 2011, 7, 734349, 2011, 8, 734378,
+    2011, 9, 734407, 2011, 10, 734437, 2011, 11, 734466, 2011, 12, 734496,
+    2012, 1, 734525, 2012, 2, 734555, 2012, 3, 734584, 2012, 4, 734614,
+    2012, -4, 734644, 2012, 5, 734673, 2012, 6, 734703, 2012, 7, 734732,
+    2012, 8, 734762, 2012, 9, 734791, 2012, 10, 734821, 2012, 11, 734850,
+    2012, 12, 734880, 2013, 1, 734909, 2013, 2, 734939, 2013, 3, 734968,
+    2013, 4, 734998, 2013, 5, 735027, 2013, 6, 735057, 2013, 7, 735087,
+    2013, 8, 735116, 2013, 9, 735146, 2013, 10, 735175, 2013, 11, 735205,
+    2013, 12, 735234, 2014, 1, 735264, 2014, 2, 735293, 2014, 3, 735323,
+    2014, 4, 735352, 2014, 5, 735382, 2014, 6, 735411, 2014, 7, 735441,
+    2014, 8, 735470, 2014, 9, 735500, 2014, -9, 735530, 2014, 10, 735559,
+    2014, 11, 735589, 2014, 12, 735618, 2015, 1, 735648, 2015, 2, 735677,
+    2015, 3, 735707, 2015, 4, 735736, 2015, 5, 735765, 2015, 6, 735795,
+    2015, 7, 735824, 2015, 8, 735854, 2015, 9, 735884, 2015, 10, 735914,
+    2015, 11, 735943, 2015, 12, 735973, 2016, 1, 736002, 2016, 2, 736032,
+    2016, 3, 736061, 2016, 4, 736091, 2016, 5, 736120, 2016, 6, 736149,
+    2016, 7, 736179, 2016, 8, 736208, 2016, 9, 736238, 2016, 10, 736268,
+    2016, 11, 736297, 2016, 12, 736327, 2017, 1, 736357, 2017, 2, 736386,
+    2017, 3, 736416, 2017, 4, 736445, 2017, 5, 736475, 2017, 6, 736504,
+    2017, -6, 736533, 2017, 7, 736563, 2017, 8, 736592, 2017, 9, 736622,
+    2017, 10, 736651, 2017, 11, 736681, 2017, 12, 736711, 2018, 1, 736741,
+    2018, 2, 736770, 2018, 3, 736800, 2018, 4, 736829, 2018, 5, 736859,
+    2018, 6, 736888, 2018, 7, 736917, 2018, 8, 736947, 2018, 9, 736976,
+    2018, 10, 737006, 2018, 11, 737035, 2018, 12, 737065, 2019, 1, 737095,
+    2019, 2, 737125, 2019, 3, 737154, 2019, 4, 737184, 2019, 5, 737213,
+    2019, 6, 737243, 2019, 7, 737272, 2019, 8, 737301, 2019, 9, 737331,
+    2019, 10, 737360, 2019, 11, 737389, 2019, 12, 737419, 2020, 1, 737449,
+    2020, 2, 737478, 2020, 3, 737508, 2020, 4, 737538, 2020, -4, 737568,
+    2020, 5, 737597, 2020, 6, 737627, 2020, 7, 737656, 2020, 8, 737685,
+    2020, 9, 737715, 2020, 10, 737744, 2020, 11, 737774, 2020, 12, 737803,
+    2021, 1, 737833, 2021, 2, 737862, 2021, 3, 737892, 2021, 4, 737922,
+    2021, 5, 737951, 2021, 6, 737981, 2021, 7, 738010, 2021, 8, 738040,
+    2021, 9, 738069, 2021, 10, 738099, 2021, 11, 738128, 2021, 12, 738158,
+    2022, 1, 738187, 2022, 2, 738217, 2022, 3, 738246, 2022, 4, 738276,
+    2022, 5, 738305, 2022, 6, 738335, 2022, 7, 738365, 2022, 8, 738394,
+    2022, 9, 738424, 2022, 10, 738453, 2022, 11, 738483, 2022, 12, 738512,
+    2023, 1, 738542, 2023, 2, 738571, 2023, -2, 738601, 2023, 3, 738630,
+    2023, 4, 738659, 2023, 5, 738689, 2023, 6, 738719, 2023, 7, 738748,
+    2023, 8, 738778, 2023, 9, 738808, 2023, 10, 738837, 2023, 11, 738867,
+    2023, 12, 738896, 2024, 1, 738926, 2024, 2, 738955, 2024, 3, 738985,
+    2024, 4, 739014, 2024, 5, 739043, 2024, 6, 739073, 2024, 7, 739102,
+    2024, 8, 739132, 2024, 9, 739162, 2024, 10, 739191, 2024, 11, 739221,
+    2024, 12, 739251, 2025, 1, 739280, 2025, 2, 739310, 2025, 3, 739339,
+    2025, 4, 739369, 2025, 5, 739398, 2025, 6, 739427, 2025, -6, 739457,
+    2025, 7, 739486, 2025, 8, 739516, 2025, 9, 739545, 2025, 10, 739575,
+    2025, 11, 739605, 2025, 12, 739635, 2026, 1, 739664, 2026, 2, 739694,
+    2026, 3, 739723, 2026, 4, 739753, 2026, 5, 739782, 2026, 6, 739811,
+    2026, 7, 739841, 2026, 8, 739870, 2026, 9, 739899, 2026, 10, 739929,
+    2026, 11, 739959, 2026, 12, 739989, 2027, 1, 740018, 2027, 2, 740048,
+    2027, 3, 740078, 2027, 4, 740107, 2027, 5, 740137, 2027, 6, 740166,
+    2027, 7, 740195, 2027, 8, 740225, 2027, 9, 740254, 2027, 10, 740283,
+    2027, 11, 740313, 2027, 12, 740343, 2028, 1, 740372, 2028, 2, 740402,
+    2028, 3, 740432, 2028, 4, 740462, 2028, 5, 740491, 2028, -5, 740521,
+    2028, 6, 740550, 2028, 7, 740579, 2028, 8, 740609, 2028, 9, 740638,
+    2028, 10, 740667, 2028, 11, 740697, 2028, 12, 740727, 2029, 1, 740756,
+    2029, 2, 740786, 2029, 3, 740816, 2029, 4, 740845, 2029, 5, 740875,
+    2029, 6, 740904, 2029, 7, 740934, 2029, 8, 740963, 2029, 9, 740993,
+    2029, 10, 741022, 2029, 11, 741051, 2029, 12, 741081, 2030, 1, 741111,
+    2030, 2, 741140, 2030, 3, 741170, 2030, 4, 741199, 2030, 5, 741229,
+    2030, 6, 741259, 2030, 7, 741288, 2030, 8, 741318, 2030, 9, 741347,
+    2030, 10, 741377, 2030, 11, 741406, 2030, 12, 741436, 2031, 1, 741465,
+    2031, 2, 741494, 2031, 3, 741524, 2031, -3, 741554, 2031, 4, 741583,
+    2031, 5, 741613, 2031, 6, 741642, 2031, 7, 741672, 2031, 8, 741702,
+    2031, 9, 741731, 2031, 10, 741761, 2031, 11, 741790, 2031, 12, 741820,
+    2032, 1, 741849, 2032, 2, 741879, 2032, 3, 741908, 2032, 4, 741937,
+    2032, 5, 741967, 2032, 6, 741996, 2032, 7, 742026, 2032, 8, 742056,
+    2032, 9, 742085, 2032, 10, 742115, 2032, 11, 742145, 2032, 12, 742174,
+    2033, 1, 742204, 2033, 2, 742233, 2033, 3, 742263, 2033, 4, 742292,
+    2033, 5, 742321, 2033, 6, 742351, 2033, 7, 742380, 2033, 8, 742410,
+    2033, 9, 742439, 2033, 10, 742469, 2033, 11, 742499, 2033, -11, 742529,
+    2033, 12, 742558, 2034, 1, 742588, 2034, 2, 742617, 2034, 3, 742647,
+    2034, 4, 742676, 2034, 5, 742705, 2034, 6, 742735, 2034, 7, 742764,
+    2034, 8, 742794, 2034, 9, 742823, 2034, 10, 742853, 2034, 11, 742883,
+    2034, 12, 742912, 2035, 1, 742942, 2035, 2, 742972, 2035, 3, 743001,
+    2035, 4, 743031, 2035, 5, 743060, 2035, 6, 743089, 2035, 7, 743119,
+    2035, 8, 743148, 2035, 9, 743177, 2035, 10, 743207, 2035, 11, 743237,
+    2035, 12, 743266, 2036, 1, 743296, 2036, 2, 743326, 2036, 3, 743356,
+    2036, 4, 743385, 2036, 5, 743415, 2036, 6, 743444, 2036, -6, 743473,
+    2036, 7, 743503, 2036, 8, 743532, 2036, 9, 743561, 2036, 10, 743591,
+    2036, 11, 743620, 2036, 12, 743650, 2037, 1, 743680, 2037, 2, 743710,
+    2037, 3, 743740, 2037, 4, 743769, 2037, 5, 743799, 2037, 6, 743828,
+    2037, 7, 743857, 2037, 8, 743887, 2037, 9, 743916, 2037, 10, 743945,
+    2037, 11, 743975, 2037, 12, 744004, 2038, 1, 744034, 2038, 2, 744064,
+    2038, 3, 744094, 2038, 4, 744123, 2038, 5, 744153, 2038, 6, 744182,
+    2038, 7, 744212, 2038, 8, 744241, 2038, 9, 744271, 2038, 10, 744300,
+    2038, 11, 744329, 2038, 12, 744359, 2039, 1, 744388, 2039, 2, 744418,
+    2039, 3, 744448, 2039, 4, 744477, 2039, 5, 744507, 2039, -5, 744537,
+    2039, 6, 744566, 2039, 7, 744596, 2039, 8, 744625, 2039, 9, 744655,
+    2039, 10, 744684, 2039, 11, 744714, 2039, 12, 744743, 2040, 1, 744772,
+    2040, 2, 744802, 2040, 3, 744831, 2040, 4, 744861, 2040, 5, 744891,
+    2040, 6, 744920, 2040, 7, 744950, 2040, 8, 744979, 2040, 9, 745009,
+    2040, 10, 745039, 2040, 11, 745068, 2040, 12, 745098, 2041, 1, 745127,
+    2041, 2, 745156, 2041, 3, 745186, 2041, 4, 745215, 2041, 5, 745245,
+    2041, 6, 745274, 2041, 7, 745304, 2041, 8, 745334, 2041, 9, 745363,
+    2041, 10, 745393, 2041, 11, 745423, 2041, 12, 745452, 2042, 1, 745482,
+    2042, 2, 745511, 2042, -2, 745541, 2042, 3, 745570, 2042, 4, 745599,
+    2042, 5, 745629, 2042, 6, 745658, 2042, 7, 745688, 2042, 8, 745717,
+    2042, 9, 745747, 2042, 10, 745777, 2042, 11, 745806, 2042, 12, 745836,
+    2043, 1, 745866, 2043, 2, 745895, 2043, 3, 745925, 2043, 4, 745954,
+    2043, 5, 745983, 2043, 6, 746013, 2043, 7, 746042, 2043, 8, 746071,
+    2043, 9, 746101, 2043, 10, 746131, 2043, 11, 746160, 2043, 12, 746190,
+    2044, 1, 746220, 2044, 2, 746250, 2044, 3, 746279, 2044, 4, 746309,
+    2044, 5, 746338, 2044, 6, 746367, 2044, 7, 746397, 2044, -7, 746426,
+    2044, 8, 746455, 2044, 9, 746485, 2044, 10, 746514, 2044, 11, 746544,
+    2044, 12, 746574, 2045, 1, 746604, 2045, 2, 746634, 2045, 3, 746663,
+    2045, 4, 746693, 2045, 5, 746722, 2045, 6, 746751, 2045, 7, 746781,
+    2045, 8, 746810, 2045, 9, 746839, 2045, 10, 746869, 2045, 11, 746898,
+    2045, 12, 746928, 2046, 1, 746958, 2046, 2, 746988, 2046, 3, 747017,
+    2046, 4, 747047, 2046, 5, 747076, 2046, 6, 747106, 2046, 7, 747135,
+    2046, 8, 747165, 2046, 9, 747194, 2046, 10, 747223, 2046, 11, 747253,
+    2046, 12, 747282, 2047, 1, 747312, 2047, 2, 747342, 2047, 3, 747371,
+    2047, 4, 747401, 2047, 5, 747431, 2047, -5, 747460, 2047, 6, 747490,
+    2047, 7, 747519, 2047, 8, 747549, 2047, 9, 747578, 2047, 10, 747607,
+    2047, 11, 747637, 2047, 12, 747666, 2048, 1, 747696, 2048, 2, 747725,
+    2048, 3, 747755, 2048, 4, 747785, 2048, 5, 747814, 2048, 6, 747844,
+    2048, 7, 747874, 2048, 8, 747903, 2048, 9, 747933, 2048, 10, 747962,
+    2048, 11, 747991, 2048, 12, 748021, 2049, 1, 748050, 2049, 2, 748080,
+    2049, 3, 748109, 2049, 4, 748139, 2049, 5, 748168, 2049, 6, 748198,
+    2049, 7, 748228, 2049, 8, 748257, 2049, 9, 748287, 2049, 10, 748317,
+    2049, 11, 748346, 2049, 12, 748376, 2050, 1, 748405, 2050, 2, 748434,
+    2050, 3, 748464, 2050, -3, 748493, 2050, 4, 748523, 2050, 5, 748552,
+    2050, 6, 748582, 2050, 7, 748611, 2050, 8, 748641, 2050, 9, 748671,
+    2050, 10, 748700, 2050, 11, 748730, 2050, 12, 748760, 2051, 1, 748789,
+    2051, 2, 748819, 2051, 3, 748848, 2051, 4, 748877, 2051, 5, 748907,
+    2051, 6, 748936, 2051, 7, 748965, 2051, 8, 748995, 2051, 9, 749025,
+    2051, 10, 749054, 2051, 11, 749084, 2051, 12, 749114, 2052, 1, 749144,
+    2052, 2, 749173, 2052, 3, 749203, 2052, 4, 749232, 2052, 5, 749261,
+    2052, 6, 749291, 2052, 7, 749320, 2052, 8, 749349, 2052, -8, 749379,
+    2052, 9, 749408, 2052, 10, 749438, 2052, 11, 749468, 2052, 12, 749498,
+    2053, 1, 749528, 2053, 2, 749557, 2053, 3, 749587, 2053, 4, 749616,
+    2053, 5, 749645, 2053, 6, 749675, 2053, 7, 749704, 2053, 8, 749733,
+    2053, 9, 749763, 2053, 10, 749792, 2053, 11, 749822, 2053, 12, 749852,
+    2054, 1, 749882, 2054, 2, 749911, 2054, 3, 749941, 2054, 4, 749971,
+    2054, 5, 750000, 2054, 6, 750029, 2054, 7, 750059, 2054, 8, 750088,
+    2054, 9, 750117, 2054, 10, 750147, 2054, 11, 750176, 2054, 12, 750206,
+    2055, 1, 750236, 2055, 2, 750265, 2055, 3, 750295, 2055, 4, 750325,
+    2055, 5, 750354, 2055, 6, 750384, 2055, -6, 750413, 2055, 7, 750443,
+    2055, 8, 750472, 2055, 9, 750501, 2055, 10, 750531, 2055, 11, 750560,
+    2055, 12, 750590, 2056, 1, 750619, 2056, 2, 750649, 2056, 3, 750679,
+    2056, 4, 750709, 2056, 5, 750738, 2056, 6, 750768, 2056, 7, 750797,
+    2056, 8, 750827, 2056, 9, 750856, 2056, 10, 750885, 2056, 11, 750915,
+    2056, 12, 750944, 2057, 1, 750974, 2057, 2, 751003, 2057, 3, 751033,
+    2057, 4, 751063, 2057, 5, 751092, 2057, 6, 751122, 2057, 7, 751151,
+    2057, 8, 751181, 2057, 9, 751211, 2057, 10, 751240, 2057, 11, 751269,
+    2057, 12, 751299, 2058, 1, 751328, 2058, 2, 751358, 2058, 3, 751387,
+    2058, 4, 751417, 2058, -4, 751446, 2058, 5, 751476, 2058, 6, 751505,
+    2058, 7, 751535, 2058, 8, 751565, 2058, 9, 751594, 2058, 10, 751624,
+    2058, 11, 751654, 2058, 12, 751683, 2059, 1, 751712, 2059, 2, 751742,
+    2059, 3, 751771, 2059, 4, 751801, 2059, 5, 751830, 2059, 6, 751860,
+    2059, 7, 751889, 2059, 8, 751919, 2059, 9, 751948, 2059, 10, 751978,
+    2059, 11, 752008, 2059, 12, 752038, 2060, 1, 752067, 2060, 2, 752097,
+    2060, 3, 752126, 2060, 4, 752155, 2060, 5, 752185, 2060, 6, 752214,
+    2060, 7, 752243, 2060, 8, 752273, 2060, 9, 752302, 2060, 10, 752332,
+    2060, 11, 752362, 2060, 12, 752392, 2061, 1, 752421, 2061, 2, 752451,
+    2061, 3, 752481, 2061, -3, 752510, 2061, 4, 752539, 2061, 5, 752569,
+    2061, 6, 752598, 2061, 7, 752627, 2061, 8, 752657, 2061, 9, 752686,
+    2061, 10, 752716, 2061, 11, 752746, 2061, 12, 752776, 2062, 1, 752805,
+    2062, 2, 752835, 2062, 3, 752865, 2062, 4, 752894, 2062, 5, 752923,
+    2062, 6, 752953, 2062, 7, 752982, 2062, 8, 753011, 2062, 9, 753041,
+    2062, 10, 753070, 2062, 11, 753100, 2062, 12, 753130, 2063, 1, 753159,
+    2063, 2, 753189, 2063, 3, 753219, 2063, 4, 753248, 2063, 5, 753278,
+    2063, 6, 753307, 2063, 7, 753337, 2063, -7, 753366, 2063, 8, 753395,
+    2063, 9, 753425, 2063, 10, 753454, 2063, 11, 753484, 2063, 12, 753513,
+    2064, 1, 753543, 2064, 2, 753573, 2064, 3, 753603, 2064, 4, 753632,
+    2064, 5, 753662, 2064, 6, 753691, 2064, 7, 753721, 2064, 8, 753750,
+    2064, 9, 753779, 2064, 10, 753809, 2064, 11, 753838, 2064, 12, 753868,
+    2065, 1, 753897, 2065, 2, 753927, 2065, 3, 753957, 2065, 4, 753986,
+    2065, 5, 754016, 2065, 6, 754046, 2065, 7, 754075, 2065, 8, 754105,
+    2065, 9, 754134, 2065, 10, 754163, 2065, 11, 754193, 2065, 12, 754222,
+    2066, 1, 754252, 2066, 2, 754281, 2066, 3, 754311, 2066, 4, 754340,
+    2066, 5, 754370, 2066, -5, 754400, 2066, 6, 754429, 2066, 7, 754459,
+    2066, 8, 754488, 2066, 9, 754518, 2066, 10, 754547, 2066, 11, 754577,
+    2066, 12, 754606, 2067, 1, 754636, 2067, 2, 754665, 2067, 3, 754695,
+    2067, 4, 754724, 2067, 5, 754754, 2067, 6, 754783, 2067, 7, 754813,
+    2067, 8, 754843, 2067, 9, 754872, 2067, 10, 754902, 2067, 11, 754931,
+    2067, 12, 754961, 2068, 1, 754990, 2068, 2, 755020, 2068, 3, 755049,
+    2068, 4, 755079, 2068, 5, 755108, 2068, 6, 755137, 2068, 7, 755167,
+    2068, 8, 755197, 2068, 9, 755226, 2068, 10, 755256, 2068, 11, 755286,
+    2068, 12, 755315, 2069, 1, 755345, 2069, 2, 755374, 2069, 3, 755404,
+    2069, 4, 755433, 2069, -4, 755463, 2069, 5, 755492, 2069, 6, 755521,
+    2069, 7, 755551, 2069, 8, 755580, 2069, 9, 755610, 2069, 10, 755640,
+    2069, 11, 755670, 2069, 12, 755699, 2070, 1, 755729, 2070, 2, 755758,
+    2070, 3, 755788, 2070, 4, 755817, 2070, 5, 755847, 2070, 6, 755876,
+    2070, 7, 755905, 2070, 8, 755935, 2070, 9, 755964, 2070, 10, 755994,
+    2070, 11, 756024, 2070, 12, 756053, 2071, 1, 756083, 2071, 2, 756113,
+    2071, 3, 756142, 2071, 4, 756172, 2071, 5, 756201, 2071, 6, 756231,
+    2071, 7, 756260, 2071, 8, 756289, 2071, -8, 756319, 2071, 9, 756348,
+    2071, 10, 756378, 2071, 11, 756407, 2071, 12, 756437, 2072, 1, 756467,
+    2072, 2, 756497, 2072, 3, 756526, 2072, 4, 756556, 2072, 5, 756585,
+    2072, 6, 756615, 2072, 7, 756644, 2072, 8, 756673, 2072, 9, 756703,
+    2072, 10, 756732, 2072, 11, 756762, 2072, 12, 756791, 2073, 1, 756821,
+    2073, 2, 756851, 2073, 3, 756880, 2073, 4, 756910, 2073, 5, 756940,
+    2073, 6, 756969, 2073, 7, 756999, 2073, 8, 757028, 2073, 9, 757057,
+    2073, 10, 757087, 2073, 11, 757116, 2073, 12, 757146, 2074, 1, 757175,
+    2074, 2, 757205, 2074, 3, 757234, 2074, 4, 757264, 2074, 5, 757294,
+    2074, 6, 757323, 2074, -6, 757353, 2074, 7, 757382, 2074, 8, 757412,
+    2074, 9, 757441, 2074, 10, 757471, 2074, 11, 757500, 2074, 12, 757530,
+    2075, 1, 757559, 2075, 2, 757589, 2075, 3, 757618, 2075, 4, 757648,
+    2075, 5, 757677, 2075, 6, 757707, 2075, 7, 757737, 2075, 8, 757766,
+    2075, 9, 757796, 2075, 10, 757825, 2075, 11, 757855, 2075, 12, 757884,
+    2076, 1, 757914, 2076, 2, 757943, 2076, 3, 757973, 2076, 4, 758002,
+    2076, 5, 758032, 2076, 6, 758061, 2076, 7, 758091, 2076, 8, 758120,
+    2076, 9, 758150, 2076, 10, 758180, 2076, 11, 758209, 2076, 12, 758239,
+    2077, 1, 758268, 2077, 2, 758298, 2077, 3, 758327, 2077, 4, 758357,
+    2077, -4, 758386, 2077, 5, 758415, 2077, 6, 758445, 2077, 7, 758474,
+    2077, 8, 758504, 2077, 9, 758534, 2077, 10, 758564, 2077, 11, 758593,
+    2077, 12, 758623, 2078, 1, 758652, 2078, 2, 758682, 2078, 3, 758711,
+    2078, 4, 758741, 2078, 5, 758770, 2078, 6, 758799, 2078, 7, 758829,
+    2078, 8, 758858, 2078, 9, 758888, 2078, 10, 758918, 2078, 11, 758947,
+    2078, 12, 758977, 2079, 1, 759007, 2079, 2, 759036, 2079, 3, 759066,
+    2079, 4, 759095, 2079, 5, 759125, 2079, 6, 759154, 2079, 7, 759183,
+    2079, 8, 759213, 2079, 9, 759242, 2079, 10, 759272, 2079, 11, 759301,
+    2079, 12, 759331, 2080, 1, 759361, 2080, 2, 759391, 2080, 3, 759420,
+    2080, -3, 759450, 2080, 4, 759479, 2080, 5, 759509, 2080, 6, 759538,
+    2080, 7, 759567, 2080, 8, 759597, 2080, 9, 759626, 2080, 10, 759655,
+    2080, 11, 759685, 2080, 12, 759715, 2081, 1, 759745, 2081, 2, 759774,
+    2081, 3, 759804, 2081, 4, 759834, 2081, 5, 759863, 2081, 6, 759893,
+    2081, 7, 759922, 2081, 8, 759951, 2081, 9, 759981, 2081, 10, 760010,
+    2081, 11, 760039, 2081, 12, 760069, 2082, 1, 760099, 2082, 2, 760128,
+    2082, 3, 760158, 2082, 4, 760188, 2082, 5, 760218, 2082, 6, 760247,
+    2082, 7, 760276, 2082, -7, 760306, 2082, 8, 760335, 2082, 9, 760365,
+    2082, 10, 760394, 2082, 11, 760423, 2082, 12, 760453, 2083, 1, 760483,
+    2083, 2, 760512, 2083, 3, 760542, 2083, 4, 760572, 2083, 5, 760601,
+    2083, 6, 760631, 2083, 7, 760660, 2083, 8, 760690, 2083, 9, 760719,
+    2083, 10, 760749, 2083, 11, 760778, 2083, 12, 760808, 2084, 1, 760837,
+    2084, 2, 760867, 2084, 3, 760896, 2084, 4, 760926, 2084, 5, 760955,
+    2084, 6, 760985, 2084, 7, 761015, 2084, 8, 761044, 2084, 9, 761074,
+    2084, 10, 761103, 2084, 11, 761133, 2084, 12, 761162, 2085, 1, 761192,
+    2085, 2, 761221, 2085, 3, 761251, 2085, 4, 761280, 2085, 5, 761309,
+    2085, -5, 761339, 2085, 6, 761369, 2085, 7, 761398, 2085, 8, 761428,
+    2085, 9, 761458, 2085, 10, 761487, 2085, 11, 761517, 2085, 12, 761546,
+    2086, 1, 761576, 2086, 2, 761605, 2086, 3, 761635, 2086, 4, 761664,
+    2086, 5, 761693, 2086, 6, 761723, 2086, 7, 761752, 2086, 8, 761782,
+    2086, 9, 761812, 2086, 10, 761841, 2086, 11, 761871, 2086, 12, 761901,
+    2087, 1, 761930, 2087, 2, 761960, 2087, 3, 761989, 2087, 4, 762019,
+    2087, 5, 762048, 2087, 6, 762077, 2087, 7, 762107, 2087, 8, 762136,
+    2087, 9, 762166, 2087, 10, 762195, 2087, 11, 762225, 2087, 12, 762255,
+    2088, 1, 762285, 2088, 2, 762314, 2088, 3, 762344, 2088, 4, 762373,
+    2088, -4, 762403, 2088, 5, 762432, 2088, 6, 762461, 2088, 7, 762491,
+    2088, 8, 762520, 2088, 9, 762549, 2088, 10, 762579, 2088, 11, 762609,
+    2088, 12, 762639, 2089, 1, 762668, 2089, 2, 762698, 2089, 3, 762728,
+    2089, 4, 762757, 2089, 5, 762787, 2089, 6, 762816, 2089, 7, 762845,
+    2089, 8, 762874, 2089, 9, 762904, 2089, 10, 762933, 2089, 11, 762963,
+    2089, 12, 762993, 2090, 1, 763022, 2090, 2, 763052, 2090, 3, 763082,
+    2090, 4, 763112, 2090, 5, 763141, 2090, 6, 763171, 2090, 7, 763200,
+    2090, 8, 763229, 2090, -8, 763259, 2090, 9, 763288, 2090, 10, 763317,
+    2090, 11, 763347, 2090, 12, 763377, 2091, 1, 763406, 2091, 2, 763436,
+    2091, 3, 763466, 2091, 4, 763495, 2091, 5, 763525, 2091, 6, 763554,
+    2091, 7, 763584, 2091, 8, 763613, 2091, 9, 763643, 2091, 10, 763672,
+    2091, 11, 763701, 2091, 12, 763731, 2092, 1, 763760, 2092, 2, 763790,
+    2092, 3, 763820, 2092, 4, 763849, 2092, 5, 763879, 2092, 6, 763909,
+    2092, 7, 763938, 2092, 8, 763968, 2092, 9, 763997, 2092, 10, 764027,
+    2092, 11, 764056, 2092, 12, 764086, 2093, 1, 764115, 2093, 2, 764144,
+    2093, 3, 764174, 2093, 4, 764204, 2093, 5, 764233, 2093, 6, 764263,
+    2093, -6, 764292, 2093, 7, 764322, 2093, 8, 764352, 2093, 9, 764381,
+    2093, 10, 764411, 2093, 11, 764440, 2093, 12, 764470, 2094, 1, 764499,
+    2094, 2, 764528, 2094, 3, 764558, 2094, 4, 764587, 2094, 5, 764617,
+    2094, 6, 764646, 2094, 7, 764676, 2094, 8, 764706, 2094, 9, 764735,
+    2094, 10, 764765, 2094, 11, 764795, 2094, 12, 764824, 2095, 1, 764854,
+    2095, 2, 764883, 2095, 3, 764913, 2095, 4, 764942, 2095, 5, 764971,
+    2095, 6, 765001, 2095, 7, 765030, 2095, 8, 765060, 2095, 9, 765089,
+    2095, 10, 765119, 2095, 11, 765149, 2095, 12, 765179, 2096, 1, 765208,
+    2096, 2, 765238, 2096, 3, 765267, 2096, 4, 765297, 2096, -4, 765326,
+    2096, 5, 765355, 2096, 6, 765385, 2096, 7, 765414, 2096, 8, 765443,
+    2096, 9, 765473, 2096, 10, 765503, 2096, 11, 765533, 2096, 12, 765562,
+    2097, 1, 765592, 2097, 2, 765622, 2097, 3, 765651, 2097, 4, 765681,
+    2097, 5, 765710, 2097, 6, 765739, 2097, 7, 765768, 2097, 8, 765798,
+    2097, 9, 765827, 2097, 10, 765857, 2097, 11, 765887, 2097, 12, 765916,
+    2098, 1, 765946, 2098, 2, 765976, 2098, 3, 766006, 2098, 4, 766035,
+    2098, 5, 766065, 2098, 6, 766094, 2098, 7, 766123, 2098, 8, 766152,
+    2098, 9, 766182, 2098, 10, 766211, 2098, 11, 766241, 2098, 12, 766270,
+    2099, 1, 766300, 2099, 2, 766330, 2099, -2, 766360, 2099, 3, 766389,
+    2099, 4, 766419, 2099, 5, 766449, 2099, 6, 766478, 2099, 7, 766507,
+    2099, 8, 766537, 2099, 9, 766566, 2099, 10, 766595, 2099, 11, 766625,
+    2099, 12, 766654, 2100, 1, 766684, 2100, 2, 766714, 2100, 3, 766744,
+    2100, 4, 766773, 2100, 5, 766803, 2100, 6, 766832, 2100, 7, 766862,
+    2100, 8, 766891, 2100, 9, 766921, 2100, 10, 766950, 2100, 11, 766979,
+    2100, 12, 767009, 2101, 1, 767038, 2101, 2, 767068, 2101, 3, 767098,
+    2101, 4, 767127, 2101, 5, 767157, 2101, 6, 767187, 2101, 7, 767216,
+    2101, -7, 767246, 2101, 8, 767275, 2101, 9, 767305, 2101, 10, 767334,
+    2101, 11, 767363, 2101, 12, 767393, 2102, 1, 767422, 2102, 2, 767452,
+    2102, 3, 767481, 2102, 4, 767511, 2102, 5, 767541, 2102, 6, 767570,
+    2102, 7, 767600, 2102, 8, 767629, 2102, 9, 767659, 2102, 10, 767689,
+    2102, 11, 767718, 2102, 12, 767748,
+)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+干支编译表
+
+把 ganzhi.py / datas.py 中以字符串为键的 dict、bidict 一次性编译成
+以整数下标访问的扁平 tuple：天干 0-9（甲..癸），地支 0-11（子..亥），
+六十甲子 0-59（甲子..癸亥）。排盘引擎全部用整数计算，只在输出时通过
+Gan / Zhi / SHENS / STAGES 等名称表还原成中文。
+
+编译结果连同排盘用到的几张 datas.py 原始表，以 marshal 格式快照在 baziData/tables.snap 中，
+以 ganzhi.py、datas.py 和本文件内容的 crc32 为键（只用于发现改动，不必用更慢的摘要）。导入时一次读入快照，不再导入 ganzhi、datas
+（及 bidict）；源文件有改动或快照不存在时重新编译并写回，目录不可写时只编译不写。
+    python -m baziData.tables build      # 预先生成快照，如打包镜像时
+    python -m baziData.tables check      # 检查快照与重新编译的结果是否一致
+"""
+
+import argparse
+import collections
+import marshal
+import os
+import sys
+import zlib
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_MAGIC = b"FTTABLES"
+_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(_DIR, "tables.snap")
+# 决定编译结果的源文件
+SNAPSHOT_SOURCES = ("ganzhi.py", "datas.py", "tables.py")
+# 排盘引擎直接使用的 datas.py 原始表，随编译结果一起快照
+RAW_TABLES = ("ges", "jianchus", "jinbuhuan", "jins", "minggongs", "rizhus", "tiaohous")
+
+# 五行计分方案：天干每柱计 gan_weights 分，地支藏干按 ZHI_WEIGHTS 乘以 zhi_weights 倍，
+# 两者都按年、月、日、时排列。默认方案即 analyze_bazi 的计分：天干各 5 分，月令计两次
+ScoreScheme = collections.namedtuple("ScoreScheme", "gan_weights zhi_weights")
+SCORE_SCHEMES = {
+    "默认": ScoreScheme((5, 5, 5, 5), (1, 2, 1, 1)),
+    "月令不加倍": ScoreScheme((5, 5, 5, 5), (1, 1, 1, 1)),
+    "月令三倍": ScoreScheme((5, 5, 5, 5), (1, 3, 1, 1)),
+}
+DEFAULT_SCORE_SCHEME = SCORE_SCHEMES["默认"]
+
+
+def _mask(value, index):
+    mask = 0
+    for item in value:
+        if item in index:
+            mask |= 1 << index[item]
+    return mask
+
+
+def zhi_mask(value):
+    """地支字符串/序列 -> 地支位掩码，非地支字符忽略"""
+    return _mask(value, ZHI_INDEX)
+
+
+def gan_mask(value):
+    """天干字符串/序列 -> 天干位掩码，非天干字符忽略"""
+    return _mask(value, GAN_INDEX)
+
+
+def relation_mask(types):
+    """关系类型名序列 -> 关系位掩码"""
+    mask = 0
+    for item in types:
+        mask |= 1 << RELATION_INDEX[item]
+    return mask
+
+
+def jiazi(gan, zhi):
+    """天干、地支下标 -> 六十甲子下标"""
+    return (6 * gan - 5 * zhi) % 60
+
+
+def month_gan(year_gan, month_zhi):
+    """五虎遁：年干、月支下标 -> 月干下标"""
+    return ((year_gan % 5) * 2 + 2 + (month_zhi - 2) % 12) % 10
+
+
+def time_gan(day_gan, time_zhi):
+    """五鼠遁：日干、时支下标 -> 时干下标"""
+    return ((day_gan % 5) * 2 + time_zhi) % 10
+
+
+def compile_tables():
+    """由 ganzhi.py / datas.py 编译全部表，返回 {名称: 值}，值只含 marshal 支持的类型"""
+    from .ganzhi import (Gan, Zhi, ten_deities, zhi5, zhi5_list, gan5, zhi_wuhangs,
+                         zhi_atts, gong_he, zhi_hes, zhi_huis, relations, temps)
+    from .datas import (nayins, empties, wangs, jieshas, year_shens, month_shens,
+                        day_shens, g_shens)
+    from . import datas
+
+    GAN_INDEX = {item: seq for seq, item in enumerate(Gan)}
+    ZHI_INDEX = {item: seq for seq, item in enumerate(Zhi)}
+
+    # 五行，顺序与 analyze_bazi 输出的 scores 字典一致
+    ELEMENTS = ("金", "木", "水", "火", "土")
+    # 十神
+    SHENS = ("比", "劫", "食", "伤", "才", "财", "杀", "官", "枭", "印")
+    # 十二长生
+    STAGES = ("长", "沐", "冠", "建", "帝", "衰", "病", "死", "墓", "绝", "胎", "养")
+
+    SHEN_INDEX = {item: seq for seq, item in enumerate(SHENS)}
+    STAGE_INDEX = {item: seq for seq, item in enumerate(STAGES)}
+
+    GAN_ELEMENT = tuple(ELEMENTS.index(gan5[item]) for item in Gan)
+    ZHI_ELEMENT = tuple(ELEMENTS.index(zhi_wuhangs[item]) for item in Zhi)
+
+    # GAN_SHENS[日主][天干] -> 十神下标；ZHI_STAGES[天干][地支] -> 长生下标
+    GAN_SHENS = tuple(tuple(SHEN_INDEX[ten_deities[me][item]] for item in Gan) for me in Gan)
+    ZHI_STAGES = tuple(tuple(STAGE_INDEX[ten_deities[gan][item]] for item in Zhi) for gan in Gan)
+
+    # 反查：SHEN_GANS[日主][十神] -> 天干；STAGE_ZHIS[天干][长生] -> 地支
+    SHEN_GANS = tuple(tuple(GAN_INDEX[ten_deities[me].inverse[item]] for item in SHENS) for me in Gan)
+    STAGE_ZHIS = tuple(tuple(ZHI_INDEX[ten_deities[gan].inverse[item]] for item in STAGES) for gan in Gan)
+
+    # 天干五合、相冲，无则为 -1
+    GAN_HE = tuple(GAN_INDEX.get(ten_deities[item]['合'], -1) for item in Gan)
+    GAN_CHONG = tuple(GAN_INDEX.get(ten_deities[item]['冲'], -1) for item in Gan)
+
+    # 地支藏干：ZHI_HIDDEN[地支] = ((天干, 分数), ...)，顺序同 zhi5
+    ZHI_HIDDEN = tuple(tuple((GAN_INDEX[gan], score) for gan, score in zhi5[item].items()) for item in Zhi)
+    # 藏干分数矩阵：ZHI_WEIGHTS[地支][天干] -> 分数，未藏的天干为 0
+    ZHI_WEIGHTS = tuple(tuple(dict(hidden).get(gan, 0) for gan in range(len(Gan))) for hidden in ZHI_HIDDEN)
+
+    # 地支藏干本气、中气、余气，顺序同 zhi5_list
+    ZHI_HIDDEN_LIST = tuple(tuple(GAN_INDEX[gan] for gan in zhi5_list[item]) for item in Zhi)
+    # 地支主气
+    ZHI_MAIN = tuple(GAN_INDEX[max(zhi5[item], key=zhi5[item].get)] for item in Zhi)
+
+    TEMPS_GAN = tuple(temps[item] for item in Gan)
+    TEMPS_ZHI = tuple(temps[item] for item in Zhi)
+
+    # RELATIONS[天干五行][地支五行] -> 生克符号
+    RELATIONS = tuple(tuple(relations[(e1, e2)] for e2 in ELEMENTS) for e1 in ELEMENTS)
+
+    JIAZI_GAN = tuple(seq % 10 for seq in range(60))
+    JIAZI_ZHI = tuple(seq % 12 for seq in range(60))
+    JIAZI_NAMES = tuple(Gan[seq % 10] + Zhi[seq % 12] for seq in range(60))
+
+    NAYINS = tuple(nayins[(Gan[seq % 10], Zhi[seq % 12])] for seq in range(60))
+
+    # 空亡：EMPTY_MASKS[日柱甲子] 的第 n 位表示地支 n 落空
+    EMPTY_MASKS = tuple(_mask(empties[(Gan[seq % 10], Zhi[seq % 12])], ZHI_INDEX) for seq in range(60))
+
+    WANGS = tuple(ZHI_INDEX[wangs[item]] for item in Zhi)
+    JIESHAS = tuple(ZHI_INDEX[jieshas[item]] for item in Zhi)
+
+    # 地支关系：ZHI_ATTS[地支] = ((关系, (地支, ...)), ...)，保持 zhi_atts 的顺序
+    ZHI_ATTS = tuple(tuple((type_, tuple(ZHI_INDEX[zhi] for zhi in value))
+                           for type_, value in zhi_atts[item].items()) for item in Zhi)
+    # 地支关系类型（冲 刑 被刑 合 会 害 破 六 暗），第 k 种对应关系位掩码的第 k 位
+    RELATION_TYPES = tuple(zhi_atts[Zhi[0]])
+    RELATION_INDEX = {item: seq for seq, item in enumerate(RELATION_TYPES)}
+    # 地支关系矩阵：ZHI_RELATIONS[地支1][地支2] -> 关系位掩码，第 k 位表示地支2 是地支1 的 RELATION_TYPES[k]
+    ZHI_RELATIONS = tuple(tuple(sum(1 << seq for seq, (_, targets) in enumerate(ZHI_ATTS[z1]) if z2 in targets)
+                                for z2 in range(len(Zhi))) for z1 in range(len(Zhi)))
+
+    # 拱合：GONG_HE[地支1][地支2] -> 所拱地支，无则为 -1
+    GONG_HE = tuple(tuple(ZHI_INDEX[gong_he[z1 + z2]] if z1 + z2 in gong_he else -1 for z2 in Zhi)
+                    for z1 in Zhi)
+
+    # 三合局、三会局：(名称, 地支掩码)
+    ZHI_HE_MASKS = tuple((item, _mask(item, ZHI_INDEX)) for item in zhi_hes)
+    ZHI_HUI_MASKS = tuple((item, _mask(item, ZHI_INDEX)) for item in zhi_huis)
+
+    # 神煞：(名称, 按基准地支/天干下标排列的目标掩码)
+    YEAR_SHENS = tuple((name, tuple(_mask(table[item], ZHI_INDEX) for item in Zhi))
+                       for name, table in year_shens.items())
+    MONTH_SHENS = tuple((name, tuple(_mask(table[item], GAN_INDEX) for item in Zhi),
+                         tuple(_mask(table[item], ZHI_INDEX) for item in Zhi))
+                        for name, table in month_shens.items())
+    DAY_SHENS = tuple((name, tuple(_mask(table[item], ZHI_INDEX) for item in Zhi))
+                      for name, table in day_shens.items())
+    G_SHENS = tuple((name, tuple(_mask(table[item], ZHI_INDEX) for item in Gan))
+                    for name, table in g_shens.items())
+
+    def hits(shens, basis, zhi):
+        return tuple(name for name, targets in shens if targets[basis] >> zhi & 1)
+
+    # 神煞倒排索引：由基准和目标柱直接查出命中的神煞名，顺序同上面各表
+    # YEAR_SHENSHA[年支][地支]、DAY_SHENSHA[日支][地支]、G_SHENSHA[日干][地支] -> (神煞, ...)
+    YEAR_SHENSHA = tuple(tuple(hits(YEAR_SHENS, basis, zhi) for zhi in range(12)) for basis in range(12))
+    DAY_SHENSHA = tuple(tuple(hits(DAY_SHENS, basis, zhi) for zhi in range(12)) for basis in range(12))
+    G_SHENSHA = tuple(tuple(hits(G_SHENS, basis, zhi) for zhi in range(12)) for basis in range(10))
+    # MONTH_SHENSHA[月支][天干][地支] -> ((神煞, ...), 日柱用的 (神煞, ...))，日柱中由天干命中的加 "●"
+    MONTH_SHENSHA = tuple(tuple(tuple(
+        (tuple(name for name, gans, zhis in MONTH_SHENS if gans[basis] >> gan & 1 or zhis[basis] >> zhi & 1),
+         tuple(name + "●" if gans[basis] >> gan & 1 else name
+               for name, gans, zhis in MONTH_SHENS if gans[basis] >> gan & 1 or zhis[basis] >> zhi & 1))
+        for zhi in range(12)) for gan in range(10)) for basis in range(12))
+
+    # 全大写的编译结果、天干地支名表和 RAW_TABLES
+    output = {name: value for name, value in locals().items() if name.isupper()}
+    output.update(Gan=Gan, Zhi=Zhi)
+    output.update((name, getattr(datas, name)) for name in RAW_TABLES)
+    return output
+
+
+def source_key():
+    """快照的键：(快照版本, marshal 版本, Python 版本, 各源文件的 (长度, crc32))"""
+    sources = []
+    for name in SNAPSHOT_SOURCES:
+        with open(os.path.join(_DIR, name), 'rb') as f:
+            data = f.read()
+        sources.append((len(data), zlib.crc32(data)))
+    return (SNAPSHOT_VERSION, marshal.version, tuple(sys.version_info[:2]), tuple(sources))
+
+
+def load_snapshot(path=SNAPSHOT_PATH, key=None):
+    """读入快照，不存在、已损坏或与源文件不一致时返回 None"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data.startswith(SNAPSHOT_MAGIC):
+        return None
+    try:
+        saved_key, tables = marshal.loads(data[len(SNAPSHOT_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return tables if saved_key == (key or source_key()) else None
+
+
+def save_snapshot(tables, path=SNAPSHOT_PATH, key=None):
+    """写入快照；先写临时文件再改名，多个进程同时写时读到的总是完整文件"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC + marshal.dumps((key or source_key(), tables)))
+    os.replace(tmp, path)
+
+
+def _load():
+    key = source_key()
+    tables = load_snapshot(key=key)
+    if tables is None:
+        tables = compile_tables()
+        try:
+            save_snapshot(tables, key=key)
+        except OSError:
+            pass
+    return tables
+
+
+globals().update(_load())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="干支编译表快照")
+    parser.add_argument("command", choices=("build", "check"))
+    parser.add_argument("path", nargs="?", default=SNAPSHOT_PATH)
+    options = parser.parse_args(argv)
+
+    tables = compile_tables()
+    if options.command == "build":
+        save_snapshot(tables, options.path)
+        print(f"写入 {options.path}：{len(tables)} 张表，{os.path.getsize(options.path) / 1024:.0f} KB")
+        return 0
+    snapshot = load_snapshot(options.path)
+    if snapshot is None:
+        print(f"{options.path} 不存在或与源文件不一致")
+        return 1
+    bad = sorted(name for name in tables.keys() | snapshot.keys() if tables.get(name) != snapshot.get(name))
+    print(f"不一致 {len(bad)} 张表" + (f"：{', '.join(bad)}" if bad else ""))
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -31,4 +31,31 @@ DEEPSEEK_CONFIG = {
     },
     "temperature": 0.3,
     "max_tokens": 8192
-} 
\ No newline at end of file
+} 
+
+# Bazi pillar table (built by `python -m utils.bazi_table build`), None to compute every chart
+BAZI_PILLAR_TABLE = None
+
+# Ziwei (iztro) sidecar; options are passed to utils.ziwei_json.SolarAPI.
+# With "workers": 0 the service is started by hand (`node index.js` in ziwei/) at base_url;
+# with "workers": N the app launches and supervises N node processes itself.
+ZIWEI_CONFIG = {
+    "base_url": "http://localhost:3000",
+    "workers": 0,            # node worker processes to launch, e.g. os.cpu_count(); 0 to use base_url
+    "socket_path": None,     # Unix socket instead of TCP, e.g. "/tmp/ziwei.sock" (SOCKET=... node index.js);
+                             # with workers, each worker listens on socket_path.<n>
+    "timeout": (3.0, 30.0),  # (connect, read) seconds
+    "pool_size": 8,          # kept-alive connections / concurrent requests
+    "retries": 2,            # retries on connection errors, timeouts and 502/503/504
+    "backoff": 0.2,          # retry delay is random in [0, backoff * 2^n] (full jitter)
+    "deadline": 20.0,        # seconds per call including retries
+    "breaker_threshold": 5,  # consecutive failures before the circuit opens and calls fail fast
+    "breaker_reset": 30.0,   # seconds the circuit stays open before one trial call
+    "natal_cache": 256,      # cached natal charts, 0 to disable
+    "horoscope_cache": 4096, # cached (natal chart, lunar year) horoscopes
+    "cache_ttl": 3600,       # seconds
+    "profile": "text",       # "text": only the fields the text converters read, "full": whole iztro objects
+}
+
+# Ziwei tool output: compact palace table with a legend (True) or the long prose form (False)
+ZIWEI_COMPACT_TEXT = True
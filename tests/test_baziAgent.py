@@ -0,0 +1,53 @@
+import asyncio
+import datetime
+
+import pytest
+
+# baziAgent 从 config 导入各模型的配置，缺少时跳过
+baziAgent = pytest.importorskip("baziAgent", exc_type=ImportError)
+
+
+class FixedDatetime(datetime.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 4, 15)
+
+
+@pytest.fixture
+def ziwei_period(monkeypatch):
+    """调用紫微斗数工具，返回传给 get_astrolabe_text_async 的 period"""
+    from utils import ziwei_json
+
+    calls = []
+
+    async def fake_text(date, hour, gender, period, **options):
+        calls.append(period)
+        return "紫微命盘"
+
+    monkeypatch.setattr(ziwei_json, "get_astrolabe_text_async", fake_text)
+    monkeypatch.setattr(baziAgent, "datetime", FixedDatetime)
+
+    def call(**kwargs):
+        result = asyncio.run(baziAgent.BaziAnalysisTeam._ziwei_paipan_tool(None, "1996-1-1", 0, "男", **kwargs))
+        assert result == "紫微命盘"
+        return calls.pop()
+
+    return call
+
+
+def test_ziwei_tool_defaults_to_five_years(ziwei_period):
+    assert ziwei_period() == {"from_year": 2025, "to_year": 2029, "granularity": "year"}
+
+
+def test_ziwei_tool_keeps_given_to_year(ziwei_period):
+    assert ziwei_period(to_year=2027) == {"from_year": 2025, "to_year": 2027, "granularity": "year"}
+    assert ziwei_period(to_year=2020) == {"from_year": 2020, "to_year": 2020, "granularity": "year"}
+
+
+def test_ziwei_tool_fills_missing_to_year(ziwei_period):
+    assert ziwei_period(from_year=2030, granularity="month") == {"from_year": 2030, "to_year": 2034,
+                                                                 "granularity": "month"}
+
+
+def test_ziwei_tool_uses_period_without_years(ziwei_period):
+    assert ziwei_period(period=["2026-06-01"]) == ["2026-06-01"]
@@ -0,0 +1,37 @@
+import random
+
+from utils.bazi_batch import analyze_many
+from utils.bazi_json import BaziAnalyzer
+
+SECTIONS = ("四柱", "神煞", "大运", "五行分数")
+
+
+def _births(count, seed=0):
+    rand = random.Random(seed)
+    return [(rand.randint(1900, 2050), rand.randint(1, 12), rand.randint(1, 28), rand.randint(0, 23),
+             rand.randint(0, 59)) for _ in range(count)]
+
+
+def test_record_matches_analyze_bazi():
+    births = _births(200)
+    genders = [seq % 2 == 1 for seq in range(len(births))]
+    batch = analyze_many(births, genders)
+    analyzer = BaziAnalyzer()
+    for seq, (birth, gender) in enumerate(zip(births, genders)):
+        record = batch.record(seq)
+        full = analyzer.analyze_bazi(*birth, gender, True, False, sections=SECTIONS)
+        assert record.pop("性别") == ('女' if gender else '男')
+        assert record == full, birth
+
+
+def test_record_skips_empty_sections():
+    births = _births(2000, seed=1)
+    batch = analyze_many(births, False)
+    empty = [seq for seq in range(len(batch)) if not any(batch.shensha_names(seq))]
+    assert empty
+    analyzer = BaziAnalyzer()
+    for seq in empty:
+        record = batch.record(seq)
+        assert "神煞" not in record
+        del record["性别"]
+        assert record == analyzer.analyze_bazi(*births[seq], False, True, False, sections=SECTIONS)
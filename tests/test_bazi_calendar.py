@@ -0,0 +1,63 @@
+import datetime
+
+from utils.bazi_calendar import (DAY_SECONDS, FIRST_YEAR, JIEQI_FIRST_YEAR, JIEQI_NAMES, JIEQI_SECONDS, LAST_YEAR,
+                                 birth, check_calendar, check_moments, lunar_birth, lunar_python_birth, solar_birth)
+from baziData.tables import time_gan
+
+
+def _moment(seconds):
+    days, rest = divmod(seconds, DAY_SECONDS)
+    return days, rest // 3600, rest % 3600 // 60
+
+
+def _solar(seconds):
+    days, hour, minute = _moment(seconds)
+    date = datetime.date.fromordinal(days)
+    return solar_birth(date.year, date.month, date.day, hour, minute)
+
+
+def test_check_calendar():
+    assert check_calendar(samples=1000) == 0
+
+
+def test_jie_boundaries():
+    cases = []
+    for year in (FIRST_YEAR, 1900, 1949, 1984, 2024, LAST_YEAR):
+        start = (year - JIEQI_FIRST_YEAR) * len(JIEQI_NAMES)
+        # 节为偶数下标，交节前一分钟、交节所在分钟、后一分钟
+        for jie in JIEQI_SECONDS[start:start + len(JIEQI_NAMES):2]:
+            minute = jie // 60 * 60
+            cases += [_moment(minute - 60), _moment(minute), _moment(minute + 60)]
+            assert _solar(minute - 60).zhi_ids[1] != _solar(minute + 60).zhi_ids[1]
+    assert check_moments(cases) == 0
+
+
+def test_late_zi_hour():
+    cases = []
+    for year, month, day in ((1850, 1, 1), (1900, 2, 28), (1984, 2, 4), (2000, 12, 31), (2024, 2, 29)):
+        ordinal = datetime.date(year, month, day).toordinal()
+        cases += [(ordinal, 22, 59), (ordinal, 23, 0), (ordinal, 23, 59), (ordinal + 1, 0, 0)]
+        evening = solar_birth(year, month, day, 22, 59)
+        late = solar_birth(year, month, day, 23, 0)
+        # 晚子时日柱仍算当天，时干按次日日干起
+        assert late.gan_ids[2] == evening.gan_ids[2] and late.zhi_ids[2] == evening.zhi_ids[2]
+        assert late.zhi_ids[3] == 0
+        assert late.gan_ids[3] == time_gan(late.gan_ids[2] + 1, 0)
+        assert late[:5] == lunar_python_birth(year, month, day, 23, 0, True)[:5]
+    assert check_moments(cases) == 0
+
+
+def test_table_edges():
+    for year in (FIRST_YEAR - 1, LAST_YEAR + 1):
+        assert solar_birth(year, 6, 1, 12) is None
+        fallback = birth(year, 6, 1, 12, solar=True)
+        assert fallback.source is not None
+        assert fallback[:5] == lunar_python_birth(year, 6, 1, 12, 0, True)[:5]
+        assert lunar_birth(year, 5, 1, 12) is None
+        assert birth(year, 5, 1, 12)[:5] == lunar_python_birth(year, 5, 1, 12)[:5]
+
+    first = datetime.date(FIRST_YEAR, 1, 1).toordinal()
+    last = datetime.date(LAST_YEAR, 12, 31).toordinal()
+    assert solar_birth(FIRST_YEAR, 1, 1, 0).source is None
+    assert solar_birth(LAST_YEAR, 12, 31, 23, 59).source is None
+    assert check_moments([(first, 0, 0), (first, 23, 30), (last, 0, 0), (last, 23, 59)]) == 0
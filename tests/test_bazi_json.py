@@ -0,0 +1,24 @@
+import json
+import pathlib
+
+import pytest
+
+from utils.bazi_json import BaziAnalyzer
+
+# 固定出生时刻的 analyze_bazi 输出，含农历、闰月、表外年份和部分 sections；
+# 排盘结果有意变化时才重新生成
+GOLDEN = json.loads((pathlib.Path(__file__).parent / "golden" / "analyze_bazi.json").read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("case", GOLDEN, ids=lambda case: ",".join(f"{key}={value}" for key, value in case["args"].items()))
+def test_analyze_bazi_golden(case):
+    result = BaziAnalyzer().analyze_bazi(**case["args"])
+    assert list(result) == list(case["output"])
+    assert result == case["output"]
+
+
+def test_sections_match_full_output():
+    analyzer = BaziAnalyzer()
+    full = analyzer.analyze_bazi(1990, 8, 15, 6, 5, True, True, False)
+    part = analyzer.analyze_bazi(1990, 8, 15, 6, 5, True, True, False, sections=["穷通宝鉴", "三命通会", "六亲分析"])
+    assert part == {name: full[name] for name in ("六亲分析", "穷通宝鉴", "三命通会")}
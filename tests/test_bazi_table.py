@@ -0,0 +1,45 @@
+import pytest
+
+from utils.bazi_json import PILLAR_ORDER, BaziAnalyzer, pillar_chart, resolve_sections
+from utils.bazi_table import PillarTable, build_table, check_table, pillar_at
+
+# 前 RECORDS 条记录为甲子年子月（1984-12-07 至 1985-01-05）的全部日柱、时辰和性别
+RECORDS = 3000
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("table") / "pillars.bin"
+    build_table(path, verbose=False, records=RECORDS)
+    return path
+
+
+def test_check_table(table_path):
+    assert check_table(table_path, samples=RECORDS) == 0
+
+
+def test_chart_sections(table_path):
+    table = PillarTable(table_path)
+    for seq in range(0, RECORDS, 7):
+        gan_ids, zhi_ids, gender = pillar_at(seq)
+        for sections in (["穷通宝鉴"], ["三命通会", "格局分析"], ["六亲分析", "四柱"], ["星宿"]):
+            needed = resolve_sections(sections)
+            chart = table.chart(gan_ids, zhi_ids, gender, needed)
+            expected = pillar_chart.__wrapped__(gan_ids, zhi_ids, gender,
+                                                tuple(item for item in PILLAR_ORDER if item in needed))
+            assert chart.sections == expected.sections
+            assert chart.jianchu == expected.jianchu
+    # 表外的记录返回 None，由调用方实时计算
+    assert table.chart(*pillar_at(RECORDS)) is None
+    table.close()
+
+
+def test_analyze_with_table(table_path):
+    live = BaziAnalyzer()
+    cached = BaziAnalyzer(str(table_path))
+    for day, hour in ((8, 0), (15, 13), (20, 23), (31, 7)):
+        for gender in (False, True):
+            assert cached.analyze_bazi(1984, 12, day, hour, 30, gender, True, False) == \
+                live.analyze_bazi(1984, 12, day, hour, 30, gender, True, False)
+    assert cached.analyze_bazi(1990, 8, 15, 6, 5, True, True, False) == \
+        live.analyze_bazi(1990, 8, 15, 6, 5, True, True, False)
@@ -0,0 +1,19 @@
+from utils import bazi_texts
+from utils.bazi_texts import TextCorpus, TextFile, check_texts
+
+
+def test_texts_bin_matches_sources():
+    # sizi.py、yue.py 修改后须重新运行 python -m utils.bazi_texts build
+    assert check_texts() == 0
+
+
+def test_stale_texts_fall_back_to_sources(monkeypatch):
+    from baziData.yue import months
+
+    monkeypatch.setattr(bazi_texts, "source_key", lambda: [[0, 0], [0, 0]])
+    text_file = TextFile()
+    corpus = TextCorpus("months", text_file)
+    key = next(iter(months))
+    assert corpus[key] == months[key]
+    assert corpus._fallback is months
+    assert text_file._fd is None
@@ -0,0 +1,90 @@
+from utils.ziwei_json import get_async_client, get_client
+
+CONFIG = {"base_url": "http://localhost:3999", "timeout": (1.0, 2.0), "retries": 1, "breaker_threshold": 3}
+
+
+def test_clients_share_one_solar_api():
+    options = {key: value for key, value in CONFIG.items() if key != "base_url"}
+    api = get_client(**CONFIG)
+    assert get_client(CONFIG["base_url"], **options) is api
+    assert get_client(CONFIG["base_url"], **dict(reversed(list(options.items())))) is api
+    assert get_async_client(**CONFIG).api is api
+    assert get_async_client(CONFIG["base_url"], **options).api is api
+    assert get_async_client(**CONFIG) is get_async_client(CONFIG["base_url"], **options)
+
+
+class FakeService:
+    """代替服务端的 get_astrolabe_data：每个日期一项运限，记录请求的日期"""
+
+    def __init__(self, monthly=False):
+        self.monthly = monthly
+        self.calls = []
+
+    def __call__(self, date, timezone, gender, period, is_solar=True):
+        from utils.ziwei_json import _date_key, _lunar_date_text, _period_year
+
+        self.calls.append(list(period))
+        arr = []
+        for item in period:
+            key = _date_key(item)
+            horoscope = {"solarDate": "{}-{}-{}".format(*key), "lunarDate": _lunar_date_text(*key),
+                         "yearly": {"name": f"流年{_period_year(item)}"}}
+            if self.monthly:
+                horoscope["monthly"] = {"name": f"流月{key[1]}"}
+            arr.append(horoscope)
+        return {"astrolabeSolar": {"solarDate": date}, "arr": arr}
+
+
+def make_api(monkeypatch, profile="text"):
+    from utils.ziwei_json import SolarAPI
+
+    api = SolarAPI("http://localhost:3999", profile=profile)
+    service = FakeService(monthly=profile == "full")
+    monkeypatch.setattr(api, "get_astrolabe_data", service)
+    return api, service
+
+
+def test_horoscope_cache_miss_then_hit(monkeypatch):
+    from utils.ziwei_json import _lunar_date_text
+
+    api, service = make_api(monkeypatch)
+    first = api.get_astrolabe("1990-5-5", 2, "男", ["2024-03-01"])
+    assert service.calls == [["2024-03-01"]]
+    assert first["arr"][0]["solarDate"] == "2024-3-1"
+
+    # 同一农历年的另一个日期：不发请求，大限、流年取缓存，日期换成所问的日期
+    second = api.get_astrolabe("1990-5-5", 2, "男", ["2024-10-01"])
+    assert len(service.calls) == 1
+    assert second["arr"][0]["solarDate"] == "2024-10-1"
+    assert second["arr"][0]["lunarDate"] == _lunar_date_text(2024, 10, 1)
+    assert second["arr"][0]["yearly"] == first["arr"][0]["yearly"]
+
+    # 缓存中的条目不被改动
+    third = api.get_astrolabe("1990-5-5", 2, "男", ["2024-03-01"])
+    assert third["arr"][0]["solarDate"] == "2024-3-1"
+    assert api.cache_info()["horoscope"].hits == 2
+
+    # 只请求缺少的年份
+    api.get_astrolabe("1990-5-5", 2, "男", ["2024-05-01", "2026-05-01"])
+    assert service.calls[-1] == ["2026-05-01"]
+
+
+def test_horoscope_cache_hit_for_year_range(monkeypatch):
+    api, service = make_api(monkeypatch)
+    api.get_astrolabe("1990-5-5", 2, "男", ["2024-10-01", "2025-10-01"])
+    data = api.get_astrolabe("1990-5-5", 2, "男", {"from_year": 2024, "to_year": 2025, "granularity": "year"})
+    assert len(service.calls) == 1
+    assert [item["solarDate"] for item in data["arr"]] == ["2024-6-1", "2025-6-1"]
+
+
+def test_full_profile_caches_by_date(monkeypatch):
+    # 完整对象含流月等随日期变化的运限，同一农历年的两个日期各请求一次
+    api, service = make_api(monkeypatch, profile="full")
+    first = api.get_astrolabe("1990-5-5", 2, "男", ["2024-03-01", "2024-10-01"])
+    assert service.calls == [["2024-03-01", "2024-10-01"]]
+    assert [item["monthly"]["name"] for item in first["arr"]] == ["流月3", "流月10"]
+
+    second = api.get_astrolabe("1990-5-5", 2, "男", ["2024-10-01", "2024-11-01"])
+    assert service.calls[-1] == ["2024-11-01"]
+    assert [item["monthly"]["name"] for item in second["arr"]] == ["流月10", "流月11"]
+    assert second["arr"][0]["solarDate"] == "2024-10-1"
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+八字批量排盘
+
+对成批的出生时间一次性计算四柱、五行分数、八字强弱、神煞和大运。四柱和上运年份
+在节气表上整列查出（见 utils.bazi_calendar），之后的所有计算都在干支下标组成的
+numpy 数组上按列完成，结果以列式的 BaziBatch 返回，只有在调用 record / to_json
+时才渲染成与 analyze_bazi 相同格式的中文。
+"""
+
+import datetime
+import json
+
+import numpy as np
+
+from baziData.tables import *
+from utils.bazi_calendar import (lunar_birth, lunar_python_birth, ordinals_many, pillars_many, yun_start,
+                                 yun_years_many)
+from utils.bazi_model import Pillar, Scores, render_dayuns, render_pillars, render_scores, render_shensha
+
+# 神煞名称，顺序与 analyze_bazi 中的输出顺序一致
+SHENSHA_NAMES = tuple(item[0] for item in YEAR_SHENS + MONTH_SHENS + DAY_SHENS + G_SHENS)
+
+_GAN_ELEMENT = np.array(GAN_ELEMENT, dtype=np.int8)
+_GAN_SHENS = np.array(GAN_SHENS, dtype=np.int8)
+_SHEN_GANS = np.array(SHEN_GANS, dtype=np.int8)
+_ZHI_STAGES = np.array(ZHI_STAGES, dtype=np.int8)
+_ZHI_MAIN = np.array(ZHI_MAIN, dtype=np.int8)
+
+# 天干 -> 五行 的投影矩阵 (10, 5)
+_GAN_TO_ELEMENT = np.zeros((len(Gan), len(ELEMENTS)), dtype=np.int16)
+_GAN_TO_ELEMENT[np.arange(len(Gan)), _GAN_ELEMENT] = 1
+
+# 地支藏干分数矩阵 (12, 10)
+_ZHI_WEIGHTS = np.array(ZHI_WEIGHTS, dtype=np.int16)
+# 天干的 one-hot (10, 10)
+_GAN_ONEHOT = np.eye(len(Gan), dtype=np.int16)
+
+# 神煞目标掩码：(神煞数, 12 或 10) 的数组
+_YEAR_TARGETS = np.array([item[1] for item in YEAR_SHENS], dtype=np.int32)
+_MONTH_GAN_TARGETS = np.array([item[1] for item in MONTH_SHENS], dtype=np.int32)
+_MONTH_ZHI_TARGETS = np.array([item[2] for item in MONTH_SHENS], dtype=np.int32)
+_DAY_TARGETS = np.array([item[1] for item in DAY_SHENS], dtype=np.int32)
+_G_TARGETS = np.array([item[1] for item in G_SHENS], dtype=np.int32)
+
+_STRONG_SHENS = [SHEN_INDEX[item] for item in ('比', '劫', '枭', '印')]
+_ROOT_STAGES = [STAGE_INDEX[item] for item in ('长', '帝', '建')]
+
+
+def _birth_fields(births):
+    """出生时间 -> (年, 月, 日, 时, 分) 整数元组列表"""
+    if isinstance(births, np.ndarray) and np.issubdtype(births.dtype, np.datetime64):
+        births = births.astype('datetime64[m]').tolist()
+    fields = []
+    for item in births:
+        if isinstance(item, (datetime.datetime, datetime.date)):
+            fields.append((item.year, item.month, item.day,
+                           getattr(item, 'hour', 0), getattr(item, 'minute', 0)))
+        else:
+            item = tuple(int(value) for value in item)
+            fields.append(item + (0,) * (5 - len(item)))
+    return fields
+
+
+def _broadcast(value, size, dtype=bool):
+    array = np.asarray(value, dtype=dtype)
+    if array.ndim == 0:
+        array = np.full(size, array, dtype=dtype)
+    if len(array) != size:
+        raise ValueError("参数长度与出生时间数量不一致")
+    return array
+
+
+def compute_pillars(births, genders, solar=True, run_months=False):
+    """
+    计算四柱及上运年份：1850–2100 年的日期在节气表上整列计算，其余逐条用 lunar_python
+
+    返回:
+        (gans, zhis, birth_years, yun_years)：gans / zhis 为 (N, 4) 的干支下标，
+        birth_years 为公历出生年，yun_years 为上运的公历年
+    """
+    fields = _birth_fields(births)
+    size = len(fields)
+    genders = _broadcast(genders, size)
+    solar = _broadcast(solar, size)
+    run_months = _broadcast(run_months, size)
+
+    columns = np.array(fields, dtype=np.int64).reshape(size, 5)
+    years, months, days, hours, minutes = columns.T
+    ordinals, in_table = ordinals_many(years, months, days)
+    in_table &= solar & (hours >= 0) & (hours < 24) & (minutes >= 0) & (minutes < 60)
+
+    # 农历先按农历月表换算为公历序数
+    for seq in np.flatnonzero(~solar).tolist():
+        year, month, day, hour, minute = fields[seq]
+        item = lunar_birth(year, -month if run_months[seq] else month, day, hour, minute)
+        if item is not None:
+            ordinals[seq] = datetime.date(*item.solar[:3]).toordinal()
+            in_table[seq] = True
+
+    gans = np.empty((size, 4), dtype=np.int8)
+    zhis = np.empty((size, 4), dtype=np.int8)
+    birth_years = np.empty(size, dtype=np.int16)
+    yun_years = np.empty(size, dtype=np.int16)
+
+    rows = np.flatnonzero(in_table)
+    gans[rows], zhis[rows] = pillars_many(ordinals[rows], hours[rows], minutes[rows])
+    birth_years[rows] = (ordinals[rows] - 719163).astype('datetime64[D]').astype('datetime64[Y]').astype(np.int64) + 1970
+    yun_years[rows] = yun_years_many(ordinals[rows], hours[rows], minutes[rows], gans[rows, 0], genders[rows])
+
+    # 表外的日期逐条计算，相同的出生时间只计算一次
+    charts = {}
+    for seq in np.flatnonzero(~in_table).tolist():
+        year, month, day, hour, minute = fields[seq]
+        key = (year, month, day, hour, minute, bool(solar[seq]), bool(run_months[seq]))
+        item = charts.get(key)
+        if item is None:
+            item = charts[key] = lunar_python_birth(year, month if solar[seq] or not run_months[seq] else -month,
+                                                    day, hour, minute, bool(solar[seq]))
+        gans[seq] = item.gan_ids
+        zhis[seq] = item.zhi_ids
+        birth_years[seq] = item.solar[0]
+        yun_years[seq] = yun_start(item, genders[seq]).year
+
+    return gans, zhis, birth_years, yun_years
+
+
+def score_elements(gans, zhis, scheme=DEFAULT_SCORE_SCHEME):
+    """
+    五行分数：返回 (scores, gan_scores)，形状为 (N, 5) 与 (N, 10)
+
+    十干分数 = 天干 one-hot (N, 4, 10) 与地支藏干分数 (N, 4, 10) 分别按柱乘以 scheme 的权重后求和，
+    五行分数为十干分数乘以 (10, 5) 的投影矩阵。权重都是整数时结果为整数，否则为浮点数。
+    """
+    gan_weights = np.asarray(scheme.gan_weights)
+    zhi_weights = np.asarray(scheme.zhi_weights)
+    if gan_weights.dtype.kind == 'i' and zhi_weights.dtype.kind == 'i':
+        gan_weights, zhi_weights = gan_weights.astype(np.int16), zhi_weights.astype(np.int16)
+    gan_scores = gan_weights @ _GAN_ONEHOT[gans] + zhi_weights @ _ZHI_WEIGHTS[zhis]
+    return gan_scores @ _GAN_TO_ELEMENT, gan_scores
+
+
+def judge_strength(gans, zhis, gan_scores):
+    """八字强弱：返回 (strong, weak)"""
+    me = gans[:, 2]
+    strong = np.take_along_axis(gan_scores, _SHEN_GANS[me][:, _STRONG_SHENS].astype(np.intp), axis=1).sum(axis=1)
+
+    stages = _ZHI_STAGES[me[:, None], zhis]
+    weak = ~np.isin(stages, _ROOT_STAGES).any(axis=1)
+
+    # 天干十神（不含日主）与地支主气十神中比肩的个数
+    me_shens = _GAN_SHENS[me]
+    gan_shens = np.take_along_axis(me_shens, gans[:, [0, 1, 3]].astype(np.intp), axis=1)
+    zhi_shens = np.take_along_axis(me_shens, _ZHI_MAIN[zhis].astype(np.intp), axis=1)
+    bis = (gan_shens == SHEN_INDEX['比']).sum(axis=1) + (zhi_shens == SHEN_INDEX['比']).sum(axis=1)
+    weak &= bis <= 2
+    return (strong if strong.dtype.kind == 'f' else strong.astype(np.int16)), weak
+
+
+def _hits(targets, basis, values):
+    """(神煞数, N) 的目标掩码中 values 对应位是否命中"""
+    return ((targets[:, basis] >> values[None, :].astype(np.int32)) & 1).astype(bool)
+
+
+def find_shensha(gans, zhis):
+    """
+    神煞：返回 (shensha, marks)
+
+    shensha 为 (N, 4) 的位掩码，第 k 位对应 SHENSHA_NAMES[k]；
+    marks 为 (N,) 的位掩码，表示日干命中的月神煞（输出时加 "●"）
+    """
+    size = len(gans)
+    shensha = np.zeros((size, 4), dtype=np.int32)
+    marks = np.zeros(size, dtype=np.int32)
+    bit = 0
+
+    for i in (1, 2, 3):
+        hits = _hits(_YEAR_TARGETS, zhis[:, 0], zhis[:, i])
+        shensha[:, i] |= (hits.T.astype(np.int32) << np.arange(bit, bit + len(hits))).sum(axis=1)
+    bit += len(_YEAR_TARGETS)
+
+    for i in range(4):
+        gan_hits = _hits(_MONTH_GAN_TARGETS, zhis[:, 1], gans[:, i])
+        hits = gan_hits | _hits(_MONTH_ZHI_TARGETS, zhis[:, 1], zhis[:, i])
+        shifts = np.arange(bit, bit + len(hits))
+        shensha[:, i] |= (hits.T.astype(np.int32) << shifts).sum(axis=1)
+        if i == 2:
+            marks |= (gan_hits.T.astype(np.int32) << shifts).sum(axis=1)
+    bit += len(_MONTH_GAN_TARGETS)
+
+    for i in (0, 1, 3):
+        hits = _hits(_DAY_TARGETS, zhis[:, 2], zhis[:, i])
+        shensha[:, i] |= (hits.T.astype(np.int32) << np.arange(bit, bit + len(hits))).sum(axis=1)
+    bit += len(_DAY_TARGETS)
+
+    for i in range(4):
+        hits = _hits(_G_TARGETS, gans[:, 2], zhis[:, i])
+        shensha[:, i] |= (hits.T.astype(np.int32) << np.arange(bit, bit + len(hits))).sum(axis=1)
+
+    return shensha, marks
+
+
+def dayun_sequences(gans, zhis, genders, steps=12):
+    """大运：返回 (direction, dayuns)，dayuns 为 (N, steps) 的六十甲子下标"""
+    # 阳男阴女顺行，阴男阳女逆行
+    yang = gans[:, 0] % 2 == 0
+    direction = np.where(yang != genders, 1, -1).astype(np.int8)
+    month = (6 * gans[:, 1].astype(np.int16) - 5 * zhis[:, 1]) % 60
+    dayuns = (month[:, None] + direction[:, None] * np.arange(1, steps + 1)) % 60
+    return direction, dayuns.astype(np.int8)
+
+
+class BaziBatch:
+    """
+    列式的批量排盘结果
+
+    每个属性都是按出生记录对齐的 numpy 数组：
+        gans, zhis: (N, 4) 干支下标，顺序为年、月、日、时
+        genders: (N,) 女性为 True
+        scores: (N, 5) 五行分数，顺序同 ELEMENTS；gan_scores: (N, 10) 十干分数
+        strong: (N,) 八字强弱；weak: (N,) 是否身弱
+        shensha: (N, 4) 神煞位掩码；shensha_marks: (N,) 日干神煞标记
+        direction: (N,) 大运顺逆；dayuns: (N, 12) 大运六十甲子下标
+        birth_years / yun_years: (N,) 公历出生年、上运年
+    """
+
+    def __init__(self, **columns):
+        for name, value in columns.items():
+            setattr(self, name, value)
+
+    def __len__(self):
+        return len(self.gans)
+
+    def dayun_ages(self, seq):
+        """第 seq 条记录前 9 步大运的起运岁数"""
+        start = int(self.yun_years[seq]) - int(self.birth_years[seq]) + 1
+        return [start + step * 10 for step in range(9)]
+
+    def pillars(self, seq):
+        """第 seq 条记录的四柱，元素为 Pillar"""
+        me = int(self.gans[seq][2])
+        return tuple(Pillar(Gan[gan], Zhi[zhi], None if i == 2 else SHENS[GAN_SHENS[me][gan]],
+                            SHENS[GAN_SHENS[me][ZHI_MAIN[zhi]]])
+                     for i, (gan, zhi) in enumerate(zip(self.gans[seq].tolist(), self.zhis[seq].tolist())))
+
+    def shensha_names(self, seq):
+        """第 seq 条记录四柱各自的神煞名"""
+        shensha = []
+        for i in range(4):
+            names = []
+            for bit, name in enumerate(SHENSHA_NAMES):
+                if self.shensha[seq][i] >> bit & 1:
+                    mark = i == 2 and self.shensha_marks[seq] >> bit & 1
+                    names.append(name + "●" if mark else name)
+            shensha.append(tuple(names))
+        return tuple(shensha)
+
+    def record(self, seq):
+        """第 seq 条记录的字典视图，各部分格式与 analyze_bazi 的同名部分一致，没有内容的部分同样不输出"""
+        scores = Scores(tuple(self.scores[seq].tolist()), self.strong[seq].item(), bool(self.weak[seq]))
+        sections = {
+            "四柱": render_pillars(self.pillars(seq)),
+            "神煞": render_shensha(self.shensha_names(seq)),
+            "大运": render_dayuns(tuple(JIAZI_NAMES[item] for item in self.dayuns[seq])),
+            "五行分数": render_scores(scores),
+        }
+        output = {"性别": '女' if self.genders[seq] else '男'}
+        output.update((name, lines) for name, lines in sections.items() if lines)
+        return output
+
+    def to_json(self, seq):
+        """第 seq 条记录的 JSON 字符串"""
+        return json.dumps(self.record(seq), ensure_ascii=False)
+
+    def records(self):
+        """逐条生成字典视图"""
+        for seq in range(len(self)):
+            yield self.record(seq)
+
+
+def analyze_many(births, genders, solar=True, run_months=False, scheme=DEFAULT_SCORE_SCHEME):
+    """
+    批量排盘
+
+    参数:
+        births: 出生时间序列，元素为 datetime 或 (年, 月, 日, 时[, 分]) 元组，
+                也可以是 numpy datetime64 数组
+        genders: 与 births 等长的布尔序列，女性为 True
+        solar: 公历为True，农历为False，可为标量或序列
+        run_months: 是否闰月，可为标量或序列
+        scheme: 五行计分方案，见 baziData.tables.SCORE_SCHEMES
+
+    返回:
+        BaziBatch 列式结果
+    """
+    fields = _birth_fields(births)
+    genders = _broadcast(genders, len(fields))
+    gans, zhis, birth_years, yun_years = compute_pillars(fields, genders, solar, run_months)
+    scores, gan_scores = score_elements(gans, zhis, scheme)
+    strong, weak = judge_strength(gans, zhis, gan_scores)
+    shensha, marks = find_shensha(gans, zhis)
+    direction, dayuns = dayun_sequences(gans, zhis, genders)
+    return BaziBatch(gans=gans, zhis=zhis, genders=genders, scores=scores, gan_scores=gan_scores,
+                     strong=strong, weak=weak, shensha=shensha, shensha_marks=marks,
+                     direction=direction, dayuns=dayuns, birth_years=birth_years, yun_years=yun_years)
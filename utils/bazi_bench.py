@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+排盘性能基准
+
+固定种子生成 1850–2030 年的随机出生时间（男女、公历农历各半），测量：
+    latency     analyze_bazi、工具输出（render_json + render_summary）、get_astrolabe_text
+                的单次耗时分位数
+    sections    analyze_bazi 内部各步骤（出生时刻、上运、基本信息、各四柱节点、星宿、大运流年、渲染）的耗时
+    memory      单个排盘的内存峰值、结果占用的内存和内存块数，以及进程的最大常驻内存
+    throughput  1 到 N 个线程、进程时每秒排盘数
+结果写入 JSON 文件；给出 --baseline 时与之前的结果逐项比较，便于发现性能回退。
+
+用法:
+    python -m utils.bazi_bench -o bench.json
+    python -m utils.bazi_bench -n 200 --workers 1,2,4 --baseline bench.json -o bench-new.json
+    python -m utils.bazi_bench --ziwei-url http://localhost:3000     # 同时测紫微斗数接口
+"""
+
+import argparse
+import calendar
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from baziData.tables import *
+from utils import bazi_json
+from utils.bazi_calendar import birth as calendar_birth, yun_start
+from utils.bazi_json import PILLAR_ORDER, PillarContext, YunEngine, _PILLAR_NODES, basic_info, get_analyzer, xiu_info
+from utils.bazi_model import render_json, render_summary, render_text
+
+BENCH_VERSION = 1
+FIRST_YEAR = 1850
+LAST_YEAR = 2030
+
+
+def make_corpus(size=500, seed=0):
+    """
+    固定的出生时间语料：(年, 月, 日, 时, 分, 女性, 公历, 闰月)，参数顺序同 analyze_bazi
+
+    农历日期只取 1–29 日且不取闰月，保证都是合法日期。
+    """
+    rand = random.Random(seed)
+    corpus = []
+    for seq in range(size):
+        solar = seq % 2 == 0
+        year = rand.randint(FIRST_YEAR, LAST_YEAR)
+        month = rand.randint(1, 12)
+        day = rand.randint(1, calendar.monthrange(year, month)[1] if solar else 29)
+        corpus.append((year, month, day, rand.randint(0, 23), rand.randint(0, 59), rand.random() < 0.5, solar, False))
+    return corpus
+
+
+def percentiles(samples):
+    """耗时样本（秒）-> 毫秒为单位的分位数"""
+    samples = sorted(samples)
+
+    def at(rate):
+        return samples[min(len(samples) - 1, int(rate * len(samples)))] * 1000
+
+    return {"count": len(samples), "mean_ms": statistics.fmean(samples) * 1000, "p50_ms": at(0.5),
+            "p90_ms": at(0.9), "p99_ms": at(0.99), "max_ms": samples[-1] * 1000}
+
+
+def _clear_caches():
+    bazi_json.BaziAnalyzer.cache_clear()
+    bazi_json.yun_profile.cache_clear()
+
+
+def measure_latency(corpus, ziwei_url=None):
+    """冷缓存下逐条排盘的单次耗时"""
+    analyzer = get_analyzer()
+    _clear_caches()
+    analyze, tool = [], []
+    for item in corpus:
+        start = time.perf_counter()
+        analyzer.analyze_bazi(*item)
+        analyze.append(time.perf_counter() - start)
+
+    # 工具输出：与 _bazi_paipan_tool 相同，排盘后生成紧凑 JSON 和摘要
+    _clear_caches()
+    for item in corpus:
+        start = time.perf_counter()
+        chart = analyzer.analyze(*item)
+        render_json(chart)
+        render_summary(chart)
+        tool.append(time.perf_counter() - start)
+
+    result = {"analyze_bazi": percentiles(analyze), "bazi_tool": percentiles(tool)}
+    if ziwei_url:
+        result["get_astrolabe_text"] = measure_ziwei(corpus, ziwei_url)
+    return result
+
+
+def measure_ziwei(corpus, base_url):
+    """紫微斗数接口的单次耗时，接口不可用时返回错误信息"""
+    from utils.ziwei_json import get_astrolabe_text
+
+    samples = []
+    for year, month, day, hour, minute, female, solar, _ in corpus:
+        start = time.perf_counter()
+        try:
+            get_astrolabe_text(f"{year}-{month}-{day}", hour, '女' if female else '男',
+                               [f"{year + 30}-01-01"], is_solar=solar, base_url=base_url)
+        except Exception as e:
+            return {"error": f"{type(e).__name__}: {e}"}
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def _yun_rows(birth, dayuns, start):
+    engine = YunEngine(birth.gan_ids, birth.zhi_ids, dayuns, start.year, birth.solar[0], birth.solar[0])
+    return tuple(engine.rows())
+
+
+def measure_sections(corpus):
+    """
+    analyze_bazi 内部各步骤的累计耗时，不经过缓存
+
+    步骤与 BaziAnalyzer.analyze 相同：出生时刻 -> 上运 -> 基本信息 -> 四柱各节点 -> 星宿 -> 大运流年 -> 渲染。
+    大运流年包括按四柱预计算六十甲子作用（yun_profile，每次先清空其缓存）和生成各行。
+    """
+    totals = {}
+
+    def timed(name, func, *args):
+        start = time.perf_counter()
+        value = func(*args)
+        totals[name] = totals.get(name, 0.0) + time.perf_counter() - start
+        return value
+
+    for year, month, day, hour, minute, female, solar, run_month in corpus:
+        birth = timed("出生时刻", calendar_birth, year, -month if run_month and not solar else month,
+                      day, hour, minute, solar)
+        start = timed("上运", yun_start, birth, female)
+        timed("基本信息", basic_info, birth, female, start)
+        ctx = PillarContext(birth.gan_ids, birth.zhi_ids, female)
+        for name in PILLAR_ORDER:
+            timed(name, _PILLAR_NODES[name], ctx)
+        timed("星宿", xiu_info, birth, ctx.jianchu)
+        bazi_json.yun_profile.cache_clear()
+        timed("大运流年", _yun_rows, birth, ctx.dayuns, start)
+
+    analyzer = get_analyzer()
+    charts = [analyzer.analyze(*item) for item in corpus]
+    for chart in charts:
+        timed("渲染文本", render_text, chart)
+        timed("紧凑JSON", render_json, chart)
+
+    total = sum(totals.values())
+    return {name: {"mean_us": value / len(corpus) * 1e6, "share": value / total}
+            for name, value in sorted(totals.items(), key=lambda item: -item[1])}
+
+
+def measure_memory(corpus, samples=50):
+    """单个排盘（冷缓存）的内存峰值和结果占用"""
+    analyzer = get_analyzer()
+    # 先排一次，把模块级的表和 lunar_python 的缓存排除在外
+    analyzer.analyze_bazi(*corpus[0])
+    peaks, retained, blocks = [], [], []
+    tracemalloc.start()
+    try:
+        for item in corpus[:samples]:
+            _clear_caches()
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            snapshot = tracemalloc.take_snapshot()
+            result = analyzer.analyze_bazi(*item)
+            current, peak = tracemalloc.get_traced_memory()
+            stats = tracemalloc.take_snapshot().compare_to(snapshot, "filename")
+            peaks.append(peak - before)
+            retained.append(current - before)
+            blocks.append(sum(max(stat.count_diff, 0) for stat in stats))
+            del result
+    finally:
+        tracemalloc.stop()
+    return {"peak_kb": statistics.fmean(peaks) / 1024, "retained_kb": statistics.fmean(retained) / 1024,
+            "blocks": statistics.fmean(blocks), "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+
+
+def _run_chunk(chunk):
+    analyzer = get_analyzer()
+    for item in chunk:
+        analyzer.analyze_bazi(*item)
+    return len(chunk)
+
+
+def measure_throughput(corpus, workers):
+    """共享一个 BaziAnalyzer 的线程池、以及进程池，每秒排盘数"""
+    result = {"threads": {}, "processes": {}}
+    for count in workers:
+        chunks = [corpus[seq::count] for seq in range(count)]
+        _clear_caches()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(count) as pool:
+            done = sum(pool.map(_run_chunk, chunks))
+        result["threads"][str(count)] = done / (time.perf_counter() - start)
+
+        with ProcessPoolExecutor(count) as pool:
+            # 先让每个进程完成导入，只计排盘时间
+            list(pool.map(_run_chunk, [[] for _ in range(count)]))
+            start = time.perf_counter()
+            done = sum(pool.map(_run_chunk, chunks))
+        result["processes"][str(count)] = done / (time.perf_counter() - start)
+    return result
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(),
+            "commit": commit, "time": datetime.datetime.now().isoformat(timespec="seconds")}
+
+
+def run(size=500, seed=0, workers=(1,), ziwei_url=None):
+    """跑完整套基准，返回可写成 JSON 的结果"""
+    corpus = make_corpus(size, seed)
+    return {
+        "version": BENCH_VERSION,
+        "environment": environment(),
+        "corpus": {"size": size, "seed": seed, "years": [FIRST_YEAR, LAST_YEAR]},
+        "latency": measure_latency(corpus, ziwei_url),
+        "sections": measure_sections(corpus),
+        "memory": measure_memory(corpus),
+        "throughput": measure_throughput(corpus, workers),
+    }
+
+
+def _flatten(value, prefix=""):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(item, f"{prefix}{key}.")
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield prefix[:-1], value
+
+
+def compare(result, baseline):
+    """与之前的结果逐项比较，返回 [(指标, 之前, 现在, 变化比例)]；只比较耗时、内存和吞吐"""
+    old = dict(_flatten({key: baseline.get(key, {}) for key in ("latency", "sections", "memory", "throughput")}))
+    rows = []
+    for name, value in _flatten({key: result[key] for key in ("latency", "sections", "memory", "throughput")}):
+        if name in old and old[name] and not name.endswith((".count", ".share")):
+            rows.append((name, old[name], value, value / old[name] - 1))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="排盘性能基准")
+    parser.add_argument("-n", "--size", type=int, default=500, help="语料条数")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", default=f"1,{os.cpu_count() or 1}", help="线程、进程数，逗号分隔")
+    parser.add_argument("--ziwei-url", help="紫微斗数接口地址，不给出时不测")
+    parser.add_argument("--baseline", help="之前的结果文件，逐项比较")
+    parser.add_argument("-o", "--output", default="bench.json")
+    options = parser.parse_args(argv)
+
+    workers = sorted({int(item) for item in options.workers.split(",")})
+    result = run(options.size, options.seed, workers, options.ziwei_url)
+    with open(options.output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    for name, stats in result["latency"].items():
+        if "error" in stats:
+            print(f"{name}: {stats['error']}")
+        else:
+            print(f"{name}: p50 {stats['p50_ms']:.3f} ms  p90 {stats['p90_ms']:.3f} ms  p99 {stats['p99_ms']:.3f} ms")
+    for name, stats in list(result["sections"].items())[:8]:
+        print(f"  {name}: {stats['mean_us']:.1f} us ({stats['share']:.0%})")
+    memory = result["memory"]
+    print(f"内存: 峰值 {memory['peak_kb']:.1f} KB/盘，结果 {memory['retained_kb']:.1f} KB、{memory['blocks']:.0f} 块，"
+          f"常驻 {memory['max_rss_mb']:.0f} MB")
+    for kind, values in result["throughput"].items():
+        print(f"{kind}: " + "  ".join(f"{count}: {rate:.0f}/s" for count, rate in values.items()))
+    print(f"结果写入 {options.output}")
+
+    if options.baseline:
+        with open(options.baseline, encoding="utf-8") as f:
+            rows = compare(result, json.load(f))
+        for name, old, new, change in rows:
+            print(f"{name}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
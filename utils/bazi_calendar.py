@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+节气表与四柱的算术排盘
+
+baziData/jieqi.py 预先存放 1849–2101 年每年 24 个节气的交节时刻和各农历月的初一，
+由 lunar_python 生成。排盘时不再构造 Lunar / EightChar：
+    日柱    儒略日 mod 60
+    年柱    以当年立春交节时刻为界
+    月柱    在交节时刻中二分查找得到月支，月干由五虎遁得出
+    时柱    时支由时刻得出，时干由五鼠遁得出（晚子时取次日日干起时干）
+    上运    按前后节的日数、时辰差折算，规则同 lunar_python 的 Yun（流派 1）
+结果与 lunar_python 的 EightChar（流派 2）一致。公历 1850–2100 年以外的日期或表中
+没有的农历月，由 birth 回退到 lunar_python。
+
+用法:
+    python -m utils.bazi_calendar build      # 重新生成 baziData/jieqi.py
+    python -m utils.bazi_calendar check      # 抽查与 lunar_python 是否一致
+"""
+
+import argparse
+import bisect
+import collections
+import datetime
+import functools
+import random
+import sys
+
+from baziData.jieqi import *
+from baziData.tables import *
+
+DAY_SECONDS = 86400
+JIEQI_LAST_YEAR = JIEQI_FIRST_YEAR + len(JIEQI_SECONDS) // len(JIEQI_NAMES) - 1
+# 可直接查表排盘的公历年份，两端各留一年给前后的节气
+FIRST_YEAR = JIEQI_FIRST_YEAR + 1
+LAST_YEAR = JIEQI_LAST_YEAR - 1
+
+# 节在 JIEQI_NAMES 中为偶数下标，第 k 个节（小寒为 0）起的月支为 (k + 1) % 12
+JIE_SECONDS = JIEQI_SECONDS[::2]
+LICHUN = JIEQI_NAMES.index("立春")
+# 日柱：儒略日 = 公历序数 + 1721425，lunar_python 以 (儒略日 - 11) mod 60 为六十甲子下标
+DAY_OFFSET = (1721425 - 11) % 60
+
+LUNAR_MONTH_YEARS = LUNAR_MONTHS[0::3]
+LUNAR_MONTH_NUMBERS = LUNAR_MONTHS[1::3]
+LUNAR_MONTH_STARTS = LUNAR_MONTHS[2::3]
+LUNAR_MONTH_INDEX = {(year, month): seq for seq, (year, month)
+                     in enumerate(zip(LUNAR_MONTH_YEARS, LUNAR_MONTH_NUMBERS))}
+
+# 出生时刻；solar 为 (年, 月, 日, 时, 分)，lunar 为 (农历年, 月, 日)，闰月为负；
+# week 为星期，0 为周日；source 为回退时的 lunar_python Lunar 对象，查表时为 None
+Birth = collections.namedtuple("Birth", "solar lunar gan_ids zhi_ids week source")
+
+
+def _seconds(ordinal, hour, minute, second=0):
+    return ordinal * DAY_SECONDS + hour * 3600 + minute * 60 + second
+
+
+def _format(seconds):
+    """秒数 -> YYYY-MM-DD HH:MM:SS，同 Solar.toYmdHms"""
+    days, rest = divmod(seconds, DAY_SECONDS)
+    return (datetime.datetime.fromordinal(days) + datetime.timedelta(seconds=rest)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def time_zhi(hour):
+    """小时 -> 时支下标"""
+    return (hour + 1) // 2 % 12
+
+
+def solar_pillars(ordinal, hour, minute):
+    """公历序数和时刻 -> (天干下标, 地支下标)，日期须在 FIRST_YEAR 到 LAST_YEAR 之间"""
+    now = _seconds(ordinal, hour, minute)
+    # 年柱以当年立春交节为界
+    year = datetime.date.fromordinal(ordinal).year
+    if now < JIEQI_SECONDS[(year - JIEQI_FIRST_YEAR) * len(JIEQI_NAMES) + LICHUN]:
+        year -= 1
+    year_jiazi = (year - 4) % 60
+    # 月柱取最近一个已交的节
+    month_zhi = bisect.bisect_right(JIE_SECONDS, now) % 12
+    day_jiazi = (ordinal + DAY_OFFSET) % 60
+    hour_zhi = time_zhi(hour)
+    # 晚子时日柱仍算当天，时干按次日日干起
+    day_gan = JIAZI_GAN[day_jiazi] + (hour == 23)
+    year_gan = JIAZI_GAN[year_jiazi]
+    return ((year_gan, month_gan(year_gan, month_zhi), JIAZI_GAN[day_jiazi], time_gan(day_gan, hour_zhi)),
+            (JIAZI_ZHI[year_jiazi], month_zhi, JIAZI_ZHI[day_jiazi], hour_zhi))
+
+
+def _lunar_date(ordinal):
+    seq = bisect.bisect_right(LUNAR_MONTH_STARTS, ordinal) - 1
+    return LUNAR_MONTH_YEARS[seq], LUNAR_MONTH_NUMBERS[seq], ordinal - LUNAR_MONTH_STARTS[seq] + 1
+
+
+def lunar_year(year, month, day):
+    """公历日期 -> 农历年（以正月初一为界），表外的日期用 lunar_python 计算"""
+    ordinal = datetime.date(year, month, day).toordinal()
+    if LUNAR_MONTH_STARTS[0] <= ordinal < LUNAR_MONTH_STARTS[-1]:
+        return _lunar_date(ordinal)[0]
+    from lunar_python import Solar
+    return Solar.fromYmd(year, month, day).getLunar().getYear()
+
+
+def _table_birth(ordinal, hour, minute):
+    if not 0 <= hour < 24 or not 0 <= minute < 60:
+        return None
+    date = datetime.date.fromordinal(ordinal)
+    if not FIRST_YEAR <= date.year <= LAST_YEAR:
+        return None
+    gan_ids, zhi_ids = solar_pillars(ordinal, hour, minute)
+    return Birth((date.year, date.month, date.day, hour, minute), _lunar_date(ordinal), gan_ids, zhi_ids,
+                 date.isoweekday() % 7, None)
+
+
+def solar_birth(year, month, day, hour, minute=0):
+    """公历出生时刻 -> Birth，不在表中或日期不合法时返回 None"""
+    try:
+        ordinal = datetime.date(int(year), int(month), int(day)).toordinal()
+    except ValueError:
+        return None
+    return _table_birth(ordinal, int(hour), int(minute))
+
+
+def lunar_birth(year, month, day, hour, minute=0):
+    """农历出生时刻 -> Birth，闰月 month 为负；不在表中或日期不合法时返回 None"""
+    seq = LUNAR_MONTH_INDEX.get((int(year), int(month)))
+    if seq is None or seq + 1 >= len(LUNAR_MONTH_STARTS):
+        return None
+    if not 1 <= int(day) <= LUNAR_MONTH_STARTS[seq + 1] - LUNAR_MONTH_STARTS[seq]:
+        return None
+    return _table_birth(LUNAR_MONTH_STARTS[seq] + int(day) - 1, int(hour), int(minute))
+
+
+def birth(year, month, day, hour, minute=0, solar=False):
+    """出生时刻 -> Birth，先查表，查不到时用 lunar_python 计算；农历闰月 month 为负"""
+    result = solar_birth(year, month, day, hour, minute) if solar else lunar_birth(year, month, day, hour, minute)
+    if result is not None:
+        return result
+
+    return lunar_python_birth(year, month, day, hour, minute, solar)
+
+
+def lunar_python_birth(year, month, day, hour, minute=0, solar=False):
+    """用 lunar_python 计算 Birth，表外的日期和 check 使用"""
+    from lunar_python import Lunar, Solar
+    # 公历保留调用方给出的日期（lunar_python 不校验 2 月 30 日这类日期）
+    if solar:
+        solar = Solar.fromYmdHms(int(year), int(month), int(day), int(hour), int(minute), 0)
+        lunar = solar.getLunar()
+    else:
+        lunar = Lunar.fromYmdHms(int(year), int(month), int(day), int(hour), int(minute), 0)
+        solar = lunar.getSolar()
+    ba = lunar.getEightChar()
+    return Birth((solar.getYear(), solar.getMonth(), solar.getDay(), solar.getHour(), solar.getMinute()),
+                 (lunar.getYear(), lunar.getMonth(), lunar.getDay()),
+                 (GAN_INDEX[ba.getYearGan()], GAN_INDEX[ba.getMonthGan()],
+                  GAN_INDEX[ba.getDayGan()], GAN_INDEX[ba.getTimeGan()]),
+                 (ZHI_INDEX[ba.getYearZhi()], ZHI_INDEX[ba.getMonthZhi()],
+                  ZHI_INDEX[ba.getDayZhi()], ZHI_INDEX[ba.getTimeZhi()]),
+                 solar.getWeek(), lunar)
+
+
+def _ordinal(birth):
+    return datetime.date(*birth.solar[:3]).toordinal()
+
+
+def _shift(date, years, months, days):
+    """同 Solar.nextYear(years).nextMonth(months).next(days)：月底的日期截到当月最后一天"""
+    year, month = divmod(date.year * 12 + date.month - 1 + years * 12 + months, 12)
+    month += 1
+    if month == 12:
+        last = 31
+    else:
+        last = (datetime.date(year, month + 1, 1) - datetime.timedelta(days=1)).day
+    # nextYear 先把 2 月 29 日截到 28 日
+    day = date.day
+    if date.month == 2 and day == 29 and not _leap(date.year + years):
+        day = 28
+    return datetime.date(year, month, min(day, last)) + datetime.timedelta(days=days)
+
+
+def _leap(year):
+    return year % 4 == 0 and year % 100 != 0 or year % 400 == 0
+
+
+def _yun_offset(start, end):
+    """起止时刻（秒）-> 起运的 (年, 月, 日)，同 lunar_python Yun 流派 1"""
+    start_days, start_rest = divmod(start, DAY_SECONDS)
+    end_days, end_rest = divmod(end, DAY_SECONDS)
+    end_hour, start_hour = end_rest // 3600, start_rest // 3600
+    hour_diff = (11 if end_hour == 23 else time_zhi(end_hour)) - (11 if start_hour == 23 else time_zhi(start_hour))
+    day_diff = end_days - start_days
+    if hour_diff < 0:
+        hour_diff += 12
+        day_diff -= 1
+    month_diff = hour_diff * 10 // 30
+    months = day_diff * 4 + month_diff
+    return months // 12, months % 12, hour_diff * 10 - month_diff * 30
+
+
+def yun_start(birth, gender):
+    """起运的公历日期 (datetime.date)；gender 女性为 True，阳男阴女顺排"""
+    if birth.source is not None:
+        solar = birth.source.getEightChar().getYun(not gender).getStartSolar()
+        return datetime.date(solar.getYear(), solar.getMonth(), solar.getDay())
+
+    ordinal = _ordinal(birth)
+    now = _seconds(ordinal, *birth.solar[3:])
+    seq = bisect.bisect_right(JIE_SECONDS, now)
+    if (birth.gan_ids[0] % 2 == 0) != bool(gender):
+        years, months, days = _yun_offset(now, JIE_SECONDS[seq])
+    else:
+        years, months, days = _yun_offset(JIE_SECONDS[seq - 1], now)
+    return _shift(datetime.date.fromordinal(ordinal), years, months, days)
+
+
+def near_jieqi(birth):
+    """出生当天以前（含当天）的最后一个节气和之后的第一个节气，各为 (节气, 交节时间)"""
+    if birth.source is not None:
+        prev_jieqi = birth.source.getPrevJieQi(True)
+        next_jieqi = birth.source.getNextJieQi(True)
+        return ((str(prev_jieqi), prev_jieqi.getSolar().toYmdHms()),
+                (str(next_jieqi), next_jieqi.getSolar().toYmdHms()))
+
+    seq = bisect.bisect_left(JIEQI_SECONDS, (_ordinal(birth) + 1) * DAY_SECONDS)
+    return ((JIEQI_NAMES[(seq - 1) % len(JIEQI_NAMES)], _format(JIEQI_SECONDS[seq - 1])),
+            (JIEQI_NAMES[seq % len(JIEQI_NAMES)], _format(JIEQI_SECONDS[seq])))
+
+
+def ming_gong(gan_ids, zhi_ids):
+    """命宫，同 EightChar.getMingGong"""
+    # 月支、时支从寅起数，寅为 1
+    offset = (zhi_ids[1] - 2) % 12 + 1 + (zhi_ids[3] - 2) % 12 + 1
+    offset = 26 - offset if offset >= 14 else 14 - offset
+    gan = ((gan_ids[0] + 1) * 2 + offset - 1) % 10
+    return Gan[gan] + Zhi[(offset + 1) % 12]
+
+
+def tai_yuan(gan_ids, zhi_ids):
+    """胎元：月干进一位，月支进三位"""
+    return Gan[(gan_ids[1] + 1) % 10] + Zhi[(zhi_ids[1] + 3) % 12]
+
+
+@functools.lru_cache(maxsize=None)
+def _arrays():
+    """
+    批量接口用的 numpy 数组：(交节时刻, 各年立春时刻, 五虎遁月干, 五鼠遁时干)
+
+    逐条排盘只用 bisect，numpy 在第一次批量排盘时才导入。
+    """
+    import numpy as np
+
+    return (np.array(JIE_SECONDS, dtype=np.int64),
+            np.array(JIEQI_SECONDS[LICHUN::len(JIEQI_NAMES)], dtype=np.int64),
+            np.array([[month_gan(gan, zhi) for zhi in range(12)] for gan in range(10)], dtype=np.int8),
+            np.array([[time_gan(gan, zhi) for zhi in range(12)] for gan in range(11)], dtype=np.int8))
+
+
+def pillars_many(ordinals, hours, minutes):
+    """
+    批量计算公历出生时刻的四柱
+
+    参数为等长的整数数组：公历序数（datetime.date.toordinal）、时、分，日期须在 FIRST_YEAR
+    到 LAST_YEAR 之间。返回 (gans, zhis)，均为 (N, 4) 的干支下标，顺序为年、月、日、时。
+    """
+    import numpy as np
+
+    jie_seconds, lichun_seconds, month_gans, time_gans = _arrays()
+    ordinals = np.asarray(ordinals, dtype=np.int64)
+    hours = np.asarray(hours, dtype=np.int64)
+    now = ordinals * DAY_SECONDS + hours * 3600 + np.asarray(minutes, dtype=np.int64) * 60
+
+    # 公历序数 719163 为 1970-01-01
+    years = (ordinals - 719163).astype('datetime64[D]').astype('datetime64[Y]').astype(np.int64) + 1970
+    years = years - (now < lichun_seconds[years - JIEQI_FIRST_YEAR])
+    year_jiazi = (years - 4) % 60
+    month_zhi = np.searchsorted(jie_seconds, now, side='right') % 12
+    day_jiazi = (ordinals + DAY_OFFSET) % 60
+    hour_zhi = (hours + 1) // 2 % 12
+
+    gans = np.empty((len(ordinals), 4), dtype=np.int8)
+    zhis = np.empty((len(ordinals), 4), dtype=np.int8)
+    gans[:, 0] = year_jiazi % 10
+    gans[:, 1] = month_gans[gans[:, 0], month_zhi]
+    gans[:, 2] = day_jiazi % 10
+    gans[:, 3] = time_gans[gans[:, 2] + (hours == 23), hour_zhi]
+    zhis[:, 0] = year_jiazi % 12
+    zhis[:, 1] = month_zhi
+    zhis[:, 2] = day_jiazi % 12
+    zhis[:, 3] = hour_zhi
+    return gans, zhis
+
+
+def _month_days(months):
+    """自 1970-01 起的月序号 -> (当月 1 日距 1970-01-01 的天数, 当月天数)"""
+    import numpy as np
+
+    first = months.astype('datetime64[M]').astype('datetime64[D]').astype(np.int64)
+    return first, (months + 1).astype('datetime64[M]').astype('datetime64[D]').astype(np.int64) - first
+
+
+def ordinals_many(years, months, days):
+    """
+    批量把公历年月日换算为公历序数
+
+    返回 (ordinals, valid)：valid 为日期合法且在 FIRST_YEAR 到 LAST_YEAR 之间，不合法处的序数无意义
+    """
+    import numpy as np
+
+    years, months, days = (np.asarray(item, dtype=np.int64) for item in (years, months, days))
+    first, count = _month_days((years - 1970) * 12 + np.clip(months, 1, 12) - 1)
+    valid = ((years >= FIRST_YEAR) & (years <= LAST_YEAR) & (months >= 1) & (months <= 12)
+             & (days >= 1) & (days <= count))
+    return first + days - 1 + 719163, valid
+
+
+def yun_years_many(ordinals, hours, minutes, year_gans, genders):
+    """批量计算起运的公历年份，参数为等长数组，规则同 yun_start"""
+    import numpy as np
+
+    jie_seconds = _arrays()[0]
+    ordinals, hours, minutes = (np.asarray(item, dtype=np.int64) for item in (ordinals, hours, minutes))
+    now = ordinals * DAY_SECONDS + hours * 3600 + minutes * 60
+    seq = np.searchsorted(jie_seconds, now, side='right')
+    forward = (np.asarray(year_gans) % 2 == 0) != np.asarray(genders, dtype=bool)
+    start = np.where(forward, now, jie_seconds[seq - 1])
+    end = np.where(forward, jie_seconds[seq], now)
+
+    def zhi_of(seconds):
+        hour = seconds % DAY_SECONDS // 3600
+        return np.where(hour == 23, 11, (hour + 1) // 2 % 12)
+
+    hour_diff = zhi_of(end) - zhi_of(start)
+    day_diff = end // DAY_SECONDS - start // DAY_SECONDS - (hour_diff < 0)
+    hour_diff = hour_diff % 12
+    month_diff = hour_diff * 10 // 30
+    total = day_diff * 4 + month_diff
+    shift_years, shift_months, shift_days = total // 12, total % 12, hour_diff * 10 - month_diff * 30
+
+    # 同 _shift：先按年、月推移，日期截到当月最后一天，再加日数
+    dates = (ordinals - 719163).astype('datetime64[D]')
+    year = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    month_index = dates.astype('datetime64[M]').astype(np.int64)
+    day = (dates - dates.astype('datetime64[M]').astype('datetime64[D]')).astype(np.int64) + 1
+    target = year + shift_years
+    not_leap = ~((target % 4 == 0) & (target % 100 != 0) | (target % 400 == 0))
+    day = np.where((month_index % 12 == 1) & (day == 29) & not_leap, 28, day)
+    first, count = _month_days(month_index + shift_years * 12 + shift_months)
+    result = (first + np.minimum(day, count) - 1 + shift_days).astype('datetime64[D]')
+    return result.astype('datetime64[Y]').astype(np.int64) + 1970
+
+
+def build_jieqi(path="baziData/jieqi.py", first=1849, last=2101):
+    """用 lunar_python 计算 first 到 last 年的节气和农历月，写成 Python 模块"""
+    from lunar_python import Lunar, LunarYear, Solar
+
+    def seconds_of(julian_day):
+        solar = Solar.fromJulianDay(julian_day)
+        ordinal = datetime.date(solar.getYear(), solar.getMonth(), solar.getDay()).toordinal()
+        return _seconds(ordinal, solar.getHour(), solar.getMinute(), solar.getSecond())
+
+    # LunarYear 的节气表从上一年的大雪排到下一年的惊蛰，取其中属于当年的小寒到冬至
+    names = Lunar.JIE_QI_IN_USE[2:25] + ("冬至",)
+    seconds = []
+    months = []
+    for year in range(first, last + 1):
+        julian_days = LunarYear.fromYear(year).getJieQiJulianDays()
+        seconds.extend(seconds_of(item) for item in julian_days[2:26])
+    for year in range(first, last + 2):
+        for month in LunarYear.fromYear(year).getMonthsInYear():
+            start = Solar.fromJulianDay(month.getFirstJulianDay())
+            months.append((year, month.getMonth(),
+                           datetime.date(start.getYear(), start.getMonth(), start.getDay()).toordinal()))
+    months.sort(key=lambda item: item[2])
+
+    def wrap(values, per_line):
+        values = list(values)
+        return "\n".join("    " + ", ".join(str(item) for item in values[seq:seq + per_line]) + ","
+                          for seq in range(0, len(values), per_line))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"""#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# 由 python -m utils.bazi_calendar build 根据 lunar_python 生成，请勿手工修改
+
+JIEQI_FIRST_YEAR = {first}
+JIEQI_NAMES = {names!r}
+
+# 交节时刻：从 JIEQI_FIRST_YEAR 年起每年 24 个，顺序同 JIEQI_NAMES，
+# 值为 datetime.date.toordinal() * 86400 加当天的秒数（北京时间）
+JIEQI_SECONDS = (
+{wrap(seconds, 6)}
+)
+
+# 农历月：每三个数为 (农历年, 月, 初一的公历序数)，闰月为负，按初一排序
+LUNAR_MONTHS = (
+{wrap((value for item in months for value in item), 12)}
+)
+""")
+    print(f"写入 {path}：{first}–{last} 年 {len(seconds)} 个节气，{len(months)} 个农历月")
+
+
+def check_calendar(samples=20000, seed=0):
+    """随机抽查查表排盘与 lunar_python 是否一致（含交节前后的时刻），返回不一致的条数"""
+    rand = random.Random(seed)
+    first = datetime.date(FIRST_YEAR, 1, 1).toordinal()
+    last = datetime.date(LAST_YEAR, 12, 31).toordinal()
+    cases = []
+    for _ in range(samples):
+        if rand.random() < 0.5:
+            cases.append((rand.randint(first, last), rand.randint(0, 23), rand.randint(0, 59)))
+        else:
+            # 交节前后一分钟内
+            jie = JIEQI_SECONDS[rand.randrange(len(JIEQI_NAMES), len(JIEQI_SECONDS) - len(JIEQI_NAMES))]
+            moment = jie // 60 * 60 + rand.choice((-60, 0, 60))
+            days, rest = divmod(moment, DAY_SECONDS)
+            cases.append((days, rest // 3600, rest % 3600 // 60))
+
+    return check_moments(cases)
+
+
+def check_moments(cases):
+    """
+    逐个比较 (公历序数, 时, 分) 的查表排盘与 lunar_python：四柱、农历日期及其反查、起运、前后节气、
+    命宫、胎元，以及批量接口的四柱和起运年份。返回不一致的条数，表外的时刻跳过
+    """
+    bad = 0
+    for ordinal, hour, minute in cases:
+        date = datetime.date.fromordinal(ordinal)
+        fast = solar_birth(date.year, date.month, date.day, hour, minute)
+        if fast is None:
+            continue
+        slow = lunar_python_birth(date.year, date.month, date.day, hour, minute, True)
+        ba = slow.source.getEightChar()
+        same = (fast[:5] == slow[:5]
+                and lunar_birth(*fast.lunar, hour, minute) == fast
+                and all(yun_start(fast, gender) == yun_start(slow, gender) for gender in (False, True))
+                and near_jieqi(fast) == near_jieqi(slow)
+                and ming_gong(fast.gan_ids, fast.zhi_ids) == ba.getMingGong()
+                and tai_yuan(fast.gan_ids, fast.zhi_ids) == ba.getTaiYuan())
+        gans, zhis = pillars_many([ordinal], [hour], [minute])
+        same = same and tuple(gans[0].tolist()) == fast.gan_ids and tuple(zhis[0].tolist()) == fast.zhi_ids
+        same = same and yun_years_many([ordinal] * 2, [hour] * 2, [minute] * 2, gans[:, 0].repeat(2),
+                                       [False, True]).tolist() == [yun_start(fast, item).year for item in (False, True)]
+        if not same:
+            bad += 1
+            print("不一致:", date, hour, minute)
+    return bad
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="节气表与四柱的算术排盘")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="用 lunar_python 重新生成节气表")
+    build.add_argument("path", nargs="?", default="baziData/jieqi.py")
+    check = subparsers.add_parser("check", help="抽查查表排盘与 lunar_python 是否一致")
+    check.add_argument("-n", "--samples", type=int, default=20000)
+    options = parser.parse_args(argv)
+
+    if options.command == "build":
+        build_jieqi(options.path)
+    else:
+        bad = check_calendar(options.samples)
+        print(f"抽查 {options.samples} 条，不一致 {bad} 条")
+        return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
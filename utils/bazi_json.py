@@ -1,47 +1,53 @@
 #!/usr/bin/env python3
 
-import argparse
 import collections
 import json
 import datetime
-import io
+import functools
 import sys
-from contextlib import redirect_stdout
+import threading
 
-from openai import OpenAI
-
-from lunar_python import Lunar, Solar
+from lunar_python.util import LunarUtil
 from colorama import init
 
-from baziData.datas import *
-from baziData.sizi import summarys
-from baziData.common import *
-from baziData.yue import months
-from baziData.ganzhi import *
+from baziData.tables import *
+from utils.bazi_texts import months, summarys
+from utils.bazi_model import *
+from utils.bazi_calendar import birth as calendar_birth, near_jieqi, ming_gong, tai_yuan, yun_start as get_yun_start
+
+Gans = collections.namedtuple("Gans", "year month day time")
+Zhis = collections.namedtuple("Zhis", "year month day time")
+
+# 六亲，按 SHENS 顺序排列：LIUQINS[是否女命]
+LIUQINS = {
+    False: ('兄弟', '姐妹', '下属', '孙女', '父亲', '妻', '儿子', '女儿', '祖父', '母亲'),
+    True: ('姐妹', '兄弟', '女儿', '儿子', '父亲', '财', '情夫', '丈夫', '偏印', '母亲'),
+}
+
+# 四生、四正、四库
+SI_SHENG = zhi_mask('寅申巳亥')
+SI_ZHENG = zhi_mask('子午卯酉')
+SI_KU = zhi_mask('辰戌丑未')
+TIANLUO_DIWANG = zhi_mask('戌亥辰巳')
+
+SIGNS = ('＋', '－')
+
 
 def get_gen(gan, zhis):
+    """天干在四支中的根，gan 与 zhis 均为下标"""
     zhus = []
     zhongs = []
     weis = []
     result = ""
+    element = GAN_ELEMENT[gan]
     for item in zhis:
-        zhu = zhi5_list[item][0]
-        if ten_deities[gan]['本'] == ten_deities[zhu]['本']:
-            zhus.append(item)
-
-    for item in zhis:
-        if len(zhi5_list[item]) == 1:
-            continue
-        zhong = zhi5_list[item][1]
-        if ten_deities[gan]['本'] == ten_deities[zhong]['本']:
-            zhongs.append(item)
-
-    for item in zhis:
-        if len(zhi5_list[item]) < 3:
-            continue
-        zhong = zhi5_list[item][2]
-        if ten_deities[gan]['本'] == ten_deities[zhong]['本']:
-            weis.append(item)
+        hidden = ZHI_HIDDEN_LIST[item]
+        if GAN_ELEMENT[hidden[0]] == element:
+            zhus.append(Zhi[item])
+        if len(hidden) > 1 and GAN_ELEMENT[hidden[1]] == element:
+            zhongs.append(Zhi[item])
+        if len(hidden) > 2 and GAN_ELEMENT[hidden[2]] == element:
+            weis.append(Zhi[item])
 
     if not (zhus or zhongs or weis):
         return "无根"
@@ -51,70 +57,625 @@ def get_gen(gan, zhis):
         result = result + "弱：{}".format(''.join(weis)) if weis else result
         return result
 
-def gan_zhi_he(zhu):
-    gan, zhi = zhu
-    if ten_deities[gan]['合'] in zhi5[zhi]:
-        return "|"
+def gan_zhi_he(gan, zhi):
+    """天干的五合之干藏于本柱地支"""
+    he = GAN_HE[gan]
+    for item, _ in ZHI_HIDDEN[zhi]:
+        if item == he:
+            return "|"
     return ""
 
 def get_gong(zhis, gans):
+    """相邻两柱天干相同时所夹、所拱的地支，参数与结果均为下标"""
     result = []
     for i in range(3):
         if  gans[i] != gans[i+1]:
             continue
         zhi1 = zhis[i]
         zhi2 = zhis[i+1]
-        if abs(Zhi.index(zhi1) - Zhi.index(zhi2)) == 2:
-            value = Zhi[(Zhi.index(zhi1) + Zhi.index(zhi2))//2]
-            #if value in ("丑", "辰", "未", "戌"):
-            result.append(value)
-        if (zhi1 + zhi2 in gong_he) and (gong_he[zhi1 + zhi2] not in zhis):
-            result.append(gong_he[zhi1 + zhi2]) 
-            
-        #if (zhi1 + zhi2 in gong_hui) and (gong_hui[zhi1 + zhi2] not in zhis):
-            #result.append(gong_hui[zhi1 + zhi2])             
-        
+        if abs(zhi1 - zhi2) == 2:
+            result.append((zhi1 + zhi2)//2)
+        gong = GONG_HE[zhi1][zhi2]
+        if gong >= 0 and gong not in zhis:
+            result.append(gong)
+
     return result
 
+# 地支关系、地支次要关系输出的关系类型，BARE_RELATIONS 中的类型只输出类型名
+MAJOR_RELATIONS = relation_mask(('冲', '被刑', '合', '六', '暗'))
+MINOR_RELATIONS = relation_mask(('会', '害', '破', '刑'))
+BARE_RELATIONS = relation_mask(('冲', '暗'))
+
+
+def relation_bits(zhi, others):
+    """地支与其他地支（下标序列）的关系位掩码，按 ZHI_RELATIONS 逐个按位或"""
+    row = ZHI_RELATIONS[zhi]
+    bits = 0
+    for item in others:
+        bits |= row[item]
+    return bits
+
+
+def format_relations(zhi, bits, others, bare=BARE_RELATIONS):
+    """relation_bits 的结果 -> 文本，如 "冲　合：申辰"；bare 中的类型只输出类型名"""
+    output = []
+    for seq, (type_, targets) in enumerate(ZHI_ATTS[zhi]):
+        if bits >> seq & 1:
+            if bare >> seq & 1:
+                output.append(type_)
+            else:
+                output.append(type_ + "：" + ''.join(Zhi[item] for item in targets if item in others))
+    return chr(12288).join(output)
+
+
+def zhi_relations(zhi, others, types, bare=BARE_RELATIONS):
+    """地支与其他地支的关系，types 为需要输出的关系类型的位掩码"""
+    bits = relation_bits(zhi, others) & types
+    return format_relations(zhi, bits, others, bare) if bits else ""
+
+def hidden_shens(me, zhi):
+    """地支藏干及其十神，如 "甲比　丙食　戊才" """
+    return chr(12288).join(Gan[gan] + SHENS[GAN_SHENS[me][gan]] for gan, _ in ZHI_HIDDEN[zhi])
+
+def get_jia(gan, zhi, gans, zhis, natal_zhis=None):
+    """运岁干支与原局同干时所夹、所拱的地支；natal_zhis 不为空时同时检查拱合"""
+    jia = ""
+    for i in range(len(gans)):
+        if gan != gans[i]:
+            continue
+        other = zhis[i]
+        if abs(zhi - other) == 2:
+            jia = jia + "  --夹：" + Zhi[(zhi + other)//2]
+        if abs(zhi - other) == 10:
+            jia = jia + "  --夹：" + Zhi[(zhi + other)%12]
+        if natal_zhis is not None:
+            gong = GONG_HE[other][zhi]
+            if gong >= 0 and gong not in natal_zhis:
+                jia = jia + "  --拱：" + Zhi[gong]
+    return jia
+
+def get_direction(year_gan, gender):
+    """大运方向：阳男阴女顺行为 1，阴男阳女逆行为 -1"""
+    if year_gan % 2 == 0:
+        return -1 if gender else 1
+    return 1 if gender else -1
+
+
+def get_dayuns(gan_ids, zhi_ids, gender, count=12):
+    """从月柱起排的 count 步大运，返回六十甲子下标"""
+    month_jiazi = jiazi(gan_ids[1], zhi_ids[1])
+    direction = get_direction(gan_ids[0], gender)
+    return tuple((month_jiazi + direction * i) % 60 for i in range(1, count + 1))
+
+
+def popcount(mask):
+    return bin(mask).count('1')
+
+# 四柱决定的排盘结果缓存条数，一条约几 KB
+PILLAR_CACHE_SIZE = 4096
+
+PillarChart = collections.namedtuple("PillarChart", "sections jianchu dayuns")
+
+# 排盘节点的依赖图：输出部分或中间结果 -> 需要先计算的节点
+#   十神: 天干十神、地支主气十神    五行: 五行分数、天干分数    强弱: 八字强弱
+#   大运方向: 顺逆和大运干支        上运: 上运时间（与出生时间有关）  建除: 星宿部分的建除行
+SECTION_DEPS = {
+    "基本信息": ("上运",),
+    "四柱": ("十神",),
+    "纳音和关系": ("大运方向",),
+    "大运": ("大运方向",),
+    "五行分数": ("五行", "强弱"),
+    "强弱": ("十神", "五行"),
+    "星宿": ("建除",),
+    "大运流年": ("大运方向", "上运"),
+}
+
+
+def resolve_sections(sections):
+    """所需部分 -> 连同依赖在内要计算的节点集合，未知的部分名抛出 ValueError"""
+    unknown = [item for item in sections if item not in SECTIONS]
+    if unknown:
+        raise ValueError(f"未知的八字排盘部分: {', '.join(unknown)}")
+
+    needed = set()
+    stack = list(sections)
+    while stack:
+        name = stack.pop()
+        if name not in needed:
+            needed.add(name)
+            stack.extend(SECTION_DEPS.get(name, ()))
+    return needed
+
+
+class PillarContext:
+    """四柱节点的计算环境，中间结果节点把结果写成属性"""
+
+    def __init__(self, gan_ids, zhi_ids, gender):
+        self.gan_ids = gan_ids
+        self.zhi_ids = zhi_ids
+        self.gender = gender
+        self.gans = Gans(*(Gan[item] for item in gan_ids))
+        self.zhis = Zhis(*(Zhi[item] for item in zhi_ids))
+        self.me = gan_ids[2]
+        self.me_shens = GAN_SHENS[self.me]
+        self.me_stages = ZHI_STAGES[self.me]
+        self.natal_mask = zhi_mask(self.zhis)
+
+
+# 只由四柱和性别决定的节点：名称 -> 计算函数，函数按 PILLAR_ORDER 的顺序执行
+_PILLAR_NODES = {}
+
+
+def pillar_node(name):
+    """
+    注册四柱节点：结构化部分返回 bazi_model 中的对象，只有文本的部分返回行的列表
+    （为空时不输出该部分），中间结果写入 ctx
+    """
+    def register(func):
+        _PILLAR_NODES[name] = func
+        return func
+    return register
+
+
+@pillar_node("十神")
+def _shens(ctx):
+    # 天干十神，日主本身为 None
+    ctx.gan_shens = [None if seq == 2 else ctx.me_shens[item] for seq, item in enumerate(ctx.gan_ids)]
+    # 地支的主气神
+    ctx.zhi_shens = [ctx.me_shens[ZHI_MAIN[item]] for item in ctx.zhi_ids]
+
+
+def score_chart(gan_ids, zhi_ids, scheme=DEFAULT_SCORE_SCHEME):
+    """
+    一张盘的五行分数：返回 (五行分数, 十干分数)，按 ELEMENTS、Gan 顺序排列
+
+    十干分数 = Σ 天干权重 · 天干 + Σ 地支倍数 · ZHI_WEIGHTS[地支]，五行分数为其按 GAN_ELEMENT 的投影；
+    scheme 见 baziData.tables.SCORE_SCHEMES，批量计算见 utils.bazi_batch.score_elements。
+    """
+    gan_scores = [0] * len(Gan)
+    for weight, gan in zip(scheme.gan_weights, gan_ids):
+        gan_scores[gan] += weight
+    for weight, zhi in zip(scheme.zhi_weights, zhi_ids):
+        for gan, score in ZHI_HIDDEN[zhi]:
+            gan_scores[gan] += weight * score
+
+    scores = [0] * len(ELEMENTS)
+    for gan, score in enumerate(gan_scores):
+        scores[GAN_ELEMENT[gan]] += score
+    return scores, gan_scores
+
+
+@pillar_node("五行")
+def _scores(ctx):
+    # 计算五行分数
+    ctx.scores, ctx.gan_scores = score_chart(ctx.gan_ids, ctx.zhi_ids)
+
+
+@pillar_node("强弱")
+def _strength(ctx):
+    # 计算八字强弱
+    # 子平真诠的计算
+    weak = True
+    for item in ctx.zhi_ids:
+        if STAGES[ctx.me_stages[item]] in ('长', '帝', '建'):
+            weak = False
+
+    if weak:
+        if (ctx.gan_shens + ctx.zhi_shens).count(SHEN_INDEX['比']) > 2:
+            weak = False
+    ctx.weak = weak
+
+    # 计算五行得分
+    me_gans = SHEN_GANS[ctx.me]
+    gan_scores = ctx.gan_scores
+    ctx.strong = gan_scores[me_gans[SHEN_INDEX['比']]] + gan_scores[me_gans[SHEN_INDEX['劫']]] \
+        + gan_scores[me_gans[SHEN_INDEX['枭']]] + gan_scores[me_gans[SHEN_INDEX['印']]]
+
+
+@pillar_node("大运方向")
+def _direction(ctx):
+    # 计算大运（主要命运周期）
+    ctx.direction = get_direction(ctx.gan_ids[0], ctx.gender)
+    ctx.dayuns = get_dayuns(ctx.gan_ids, ctx.zhi_ids, ctx.gender)
+
+
+@pillar_node("四柱")
+def _sizhu(ctx):
+    return tuple(Pillar(gan, zhi, None if gan_shen is None else SHENS[gan_shen], SHENS[zhi_shen])
+                 for gan, zhi, gan_shen, zhi_shen in zip(ctx.gans, ctx.zhis, ctx.gan_shens, ctx.zhi_shens))
+
+
+@pillar_node("年月日时")
+def _temps(ctx):
+    lines = []
+    for seq, label in enumerate("年月日时"):
+        gan, zhi = ctx.gan_ids[seq], ctx.zhi_ids[seq]
+        lu = '' if seq == 2 else Zhi[STAGE_ZHIS[gan][STAGE_INDEX['建']]]
+        lines.append(f"【{label}】{TEMPS_GAN[gan]}:{TEMPS_ZHI[zhi]}{lu}{gan_zhi_he(gan, zhi)}")
+    return lines
+
+
+@pillar_node("天干")
+def _gans(ctx):
+    lines = []
+    for seq, gan in enumerate(ctx.gan_ids):
+        check = ''
+        if GAN_HE[gan] in ctx.gan_ids:
+            check += "合" + Gan[GAN_HE[gan]]
+        if GAN_CHONG[gan] in ctx.gan_ids:
+            check += "冲" + Gan[GAN_CHONG[gan]]
+        shen = '' if seq == 2 else f"【{SHENS[ctx.me_shens[gan]]}】"
+        lines.append(f"{Gan[gan]}{SIGNS[gan % 2]}{ELEMENTS[GAN_ELEMENT[gan]]}{shen}{check}")
+    return lines
+
+
+@pillar_node("地支")
+def _zhis(ctx):
+    gan_ids = ctx.gan_ids
+    empty_mask = EMPTY_MASKS[jiazi(ctx.me, ctx.zhi_ids[2])]
+    lines = []
+    for seq, zhi in enumerate(ctx.zhi_ids):
+        empty = '空' if seq != 2 and empty_mask >> zhi & 1 else ''
+        lines.append(f"{Zhi[zhi]}{SIGNS[zhi % 2]}{STAGES[ZHI_STAGES[gan_ids[0]][zhi]]}{STAGES[ZHI_STAGES[gan_ids[1]][zhi]]}"
+                     f"【{STAGES[ctx.me_stages[zhi]]}】{STAGES[ZHI_STAGES[gan_ids[3]][zhi]]}{empty}")
+    return lines
+
+
+@pillar_node("地支藏干")
+def _hidden(ctx):
+    return [chr(12288).join(Gan[gan] + ELEMENTS[GAN_ELEMENT[gan]] + SHENS[ctx.me_shens[gan]]
+                            for gan, _ in ZHI_HIDDEN[item]) for item in ctx.zhi_ids]
+
+
+@pillar_node("地支关系")
+def _relations(ctx):
+    zhi_ids = ctx.zhi_ids
+    return [zhi_relations(item, zhi_ids[:seq] + zhi_ids[seq+1:], MAJOR_RELATIONS)
+            for seq, item in enumerate(zhi_ids)]
+
+
+@pillar_node("地支次要关系")
+def _minor_relations(ctx):
+    zhi_ids = ctx.zhi_ids
+    return [zhi_relations(item, zhi_ids[:seq] + zhi_ids[seq+1:], MINOR_RELATIONS, bare=0)
+            for seq, item in enumerate(zhi_ids)]
+
+
+@pillar_node("五行根")
+def _roots(ctx):
+    return [get_gen(item, ctx.zhi_ids) for item in ctx.gan_ids]
+
+
+@pillar_node("纳音和关系")
+def _nayins(ctx):
+    gan_ids, zhi_ids = ctx.gan_ids, ctx.zhi_ids
+    yuanchen = (zhi_ids[0] + ctx.direction*-1*5) % 12
+    lines = []
+    for seq in range(4):
+        gan, zhi = gan_ids[seq], zhi_ids[seq]
+        # 检查空亡
+        result = NAYINS[jiazi(gan, zhi)]
+        if zhi == WANGS[zhi_ids[0]]:
+            result += "－亡"
+        # 天干与地支关系
+        result = RELATIONS[GAN_ELEMENT[gan]][ZHI_ELEMENT[zhi]] + result
+        # 检查劫杀
+        if zhi == JIESHAS[zhi_ids[0]]:
+            result += "－劫杀"
+        # 检查元辰
+        if zhi == yuanchen:
+            result += "－元辰"
+        lines.append(result)
+    return lines
+
+
+# 原局各柱参与的神煞基准：0 年支，1 月令，2 日支，3 日干；年柱不以年支、日柱不以日支为基准
+PILLAR_SHENSHA_BASES = ((1, 2, 3), (0, 1, 2, 3), (0, 1, 3), (0, 1, 2, 3))
+
+
+def pillar_shensha(gan_ids, zhi_ids, gan, zhi, bases=(0, 1, 2, 3), day=False):
+    """
+    以原局为基准，干支为 (gan, zhi) 的一柱命中的神煞名，查 baziData.tables 中的倒排索引
+
+    原局各柱取 PILLAR_SHENSHA_BASES 中的基准；大运、流年取全部基准。day 为 True 时
+    月神煞中由天干命中的加 "●"。
+    """
+    names = ()
+    if 0 in bases:
+        names += YEAR_SHENSHA[zhi_ids[0]][zhi]
+    if 1 in bases:
+        names += MONTH_SHENSHA[zhi_ids[1]][gan][zhi][day]
+    if 2 in bases:
+        names += DAY_SHENSHA[zhi_ids[2]][zhi]
+    if 3 in bases:
+        names += G_SHENSHA[gan_ids[2]][zhi]
+    return names
+
+
+@pillar_node("神煞")
+def _shensha(ctx):
+    gan_ids, zhi_ids = ctx.gan_ids, ctx.zhi_ids
+    return tuple(pillar_shensha(gan_ids, zhi_ids, gan_ids[i], zhi_ids[i], PILLAR_SHENSHA_BASES[i], i == 2)
+                 for i in range(4))
+
+
+@pillar_node("大运")
+def _dayun(ctx):
+    return tuple(JIAZI_NAMES[item] for item in ctx.dayuns)
+
+
+@pillar_node("五行分数")
+def _score_lines(ctx):
+    return Scores(tuple(ctx.scores), ctx.strong, ctx.weak)
+
+
+@pillar_node("格局分析")
+def _geju(ctx):
+    gan_ids, zhi_ids = ctx.gan_ids, ctx.zhi_ids
+    gans, zhis = ctx.gans, ctx.zhis
+    natal_mask = ctx.natal_mask
+
+    # 特定格局检查
+    lacks = []
+    if not natal_mask & SI_SHENG:
+        lacks.append("缺四生: 一生不敢作为")
+    if not natal_mask & SI_ZHENG:
+        lacks.append("缺四柱地支缺四正，一生避是非")
+    if not natal_mask & SI_KU:
+        lacks.append("四柱地支缺四库，一生没有潜伏性凶灾。")
+
+    # 其他特殊格局分析
+    jus = []
+    ju_mask = natal_mask
+    for item in get_gong(zhi_ids, gan_ids):
+        ju_mask |= 1 << item
+    for item, mask in ZHI_HE_MASKS:
+        if mask & ju_mask == mask:
+            jus.append(("三合局", item))
+
+    for item, mask in ZHI_HUI_MASKS:
+        if mask & ju_mask == mask:
+            jus.append(("三会局", item))
+
+    # 命宫
+    minggong = Zhi[11 - (zhi_ids[1] + zhi_ids[3] - 6) % 12]
+
+    # 天罗地网
+    tianluo = []
+    if '辰' in zhis and '巳' in zhis:
+        tianluo.append("地网: 地支辰巳。天罗: 戌亥。天罗地网全凶。")
+
+    if '戌' in zhis and '亥' in zhis:
+        tianluo.append("天罗: 戌亥。地网: 地支辰巳。天罗地网全凶。")
+
+    return Geju(tiaohous['{}{}'.format(gans.day, zhis[1])], jinbuhuan['{}{}'.format(gans.day, zhis[1])],
+                jins['{}'.format(gans.day)], ges[ELEMENTS[GAN_ELEMENT[ctx.me]]][zhis[1]], tuple(lacks), tuple(jus),
+                minggong, minggongs[minggong], rizhus[gans.day+zhis.day], tuple(tianluo))
+
+
+@pillar_node("六亲分析")
+def _liuqin(ctx):
+    liuqins = LIUQINS[bool(ctx.gender)]
+    lines = []
+    for gan in range(len(Gan)):
+        stages = ZHI_STAGES[gan]
+        shen = ctx.me_shens[gan]
+        lines.append(f"{Gan[gan]}: {SHENS[shen]} {liuqins[shen]}- "
+                     f"{' '.join(STAGES[stages[item]] for item in ctx.zhi_ids)}")
+    return lines
+
+
+@pillar_node("穷通宝鉴")
+def _months(ctx):
+    key = ctx.gans.day + ctx.zhis.month
+    return [months[key]] if key in months else []
+
+
+@pillar_node("三命通会")
+def _summarys(ctx):
+    sum_index = ''.join([ctx.gans.day, '日', ctx.gans.time, ctx.zhis.time])
+    return [summarys[sum_index]] if sum_index in summarys else []
+
+
+@pillar_node("建除")
+def _jianchu(ctx):
+    # 接在星宿之后输出
+    ctx.jianchu = f"建除: {jianchus[(ctx.zhi_ids[2] + 12 - ctx.zhi_ids[1])%12][0]}"
+
+
+# 中间结果在前，输出部分按输出顺序
+PILLAR_ORDER = ("十神", "五行", "强弱", "大运方向") + tuple(item for item in SECTIONS if item in _PILLAR_NODES) + ("建除",)
+
+
+@functools.lru_cache(maxsize=PILLAR_CACHE_SIZE)
+def pillar_chart(gan_ids, zhi_ids, gender, sections=None):
+    """
+    只由四柱和性别决定的排盘部分，按 (天干下标, 地支下标, 性别, 所需部分) 缓存
+
+    sections 为 None 时计算全部，否则为所需节点名的 tuple（一般由 resolve_sections 得到），
+    其余节点不计算。返回 PillarChart：sections 为 ((部分名, 值), ...)，顺序同 analyze_bazi
+    输出，值为结构化对象或文本行的 tuple；jianchu 为星宿部分的建除行；dayuns 为十二步大运的
+    六十甲子下标。未计算的 jianchu、dayuns 为 None。结果在多次调用间共享，均不可变。
+    """
+    ctx = PillarContext(gan_ids, zhi_ids, gender)
+    output = []
+    for name in PILLAR_ORDER:
+        if sections is not None and name not in sections:
+            continue
+        value = _PILLAR_NODES[name](ctx)
+        if isinstance(value, list):
+            value = tuple(value)
+        if value:
+            output.append((name, value))
+
+    return PillarChart(tuple(output), getattr(ctx, "jianchu", None), getattr(ctx, "dayuns", None))
+
+
+YunProfile = collections.namedtuple("YunProfile", "parts dayun_jias liunian_jias shenshas relations natal_mask natal_counts")
+
+
+@functools.lru_cache(maxsize=PILLAR_CACHE_SIZE)
+def yun_profile(gan_ids, zhi_ids):
+    """
+    六十甲子作为大运、流年时与原局的作用，按四柱缓存
+
+    parts[甲子] 为与年龄无关的 (干支, 纳音, 天干十神, 天干, 地支长生, 地支, 藏干)，即 YunRow 的对应字段；
+    dayun_jias[甲子] 为作大运时与原局的夹，liunian_jias[甲子] 为作流年时与原局的夹、拱；
+    shenshas[甲子] 为作大运、流年时以原局为基准命中的神煞；
+    relations[地支] 为该地支与原局四支的关系位掩码（见 baziData.tables.ZHI_RELATIONS）；
+    natal_counts 为原局中四生、四正、四库的个数。
+    """
+    me = gan_ids[2]
+    me_shens = GAN_SHENS[me]
+    me_stages = ZHI_STAGES[me]
+    parts = []
+    dayun_jias = []
+    liunian_jias = []
+    for seq in range(60):
+        gan = JIAZI_GAN[seq]
+        zhi = JIAZI_ZHI[seq]
+        parts.append((JIAZI_NAMES[seq], NAYINS[seq], SHENS[me_shens[gan]], Gan[gan],
+                      STAGES[me_stages[zhi]], Zhi[zhi], hidden_shens(me, zhi)))
+        dayun_jias.append(get_jia(gan, zhi, gan_ids, zhi_ids))
+        liunian_jias.append(get_jia(gan, zhi, gan_ids, zhi_ids, zhi_ids))
+    shenshas = tuple(pillar_shensha(gan_ids, zhi_ids, JIAZI_GAN[seq], JIAZI_ZHI[seq]) for seq in range(60))
+    relations = tuple(relation_bits(zhi, zhi_ids) for zhi in range(12))
+
+    natal_mask = zhi_mask(Zhi[item] for item in zhi_ids)
+    natal_counts = (popcount(natal_mask & SI_SHENG), popcount(natal_mask & SI_ZHENG), popcount(natal_mask & SI_KU))
+    return YunProfile(tuple(parts), tuple(dayun_jias), tuple(liunian_jias), shenshas, relations, natal_mask,
+                      natal_counts)
+
+
+class YunEngine:
+    """
+    大运流年行的惰性生成
+
+    六十甲子与原局的作用由 yun_profile 按四柱缓存，这里只补上与出生时间有关的
+    上运年份、年龄和流年干支，并按需生成指定年份范围内的行。
+    """
+
+    def __init__(self, gan_ids, zhi_ids, dayuns, yun_start_year, birth_year, lichun_year, steps=9):
+        """
+        dayuns: 大运的六十甲子下标，从第一步大运起
+        yun_start_year: 上运的公历年份
+        birth_year: 出生的公历年份
+        lichun_year: 出生农历年所取立春的公历年份，流年干支从它起算
+        """
+        self.gan_ids = gan_ids
+        self.zhi_ids = zhi_ids
+        self.dayuns = dayuns[:steps]
+        self.yun_start_year = yun_start_year
+        self.birth_year = birth_year
+        # 与 lunar_python 的 LiuNian 一致：流年干支 = (立春年 - 4 + 流年 - 出生年) % 60
+        self.liunian_base = lichun_year - 4 - birth_year
+        self.profile = yun_profile(gan_ids, zhi_ids)
+
+    def dayun_start(self, seq):
+        """第 seq 步大运（从 0 起）开始的公历年份，与 lunar_python 的 DaYun 一致"""
+        return self.yun_start_year + seq * 10
+
+    def liunian(self, year):
+        """公历年份 -> 流年的六十甲子下标"""
+        return (self.liunian_base + year) % 60
+
+    def rows(self, start_year=None, end_year=None):
+        """按顺序生成与 [start_year, end_year] 相交的大运及其中各年的流年，均为 YunRow；默认全部"""
+        profile = self.profile
+        natal_sheng, natal_zheng, natal_ku = profile.natal_counts
+        for seq, dayun in enumerate(self.dayuns):
+            dayun_year = self.dayun_start(seq)
+            if end_year is not None and dayun_year > end_year:
+                break
+            if start_year is not None and dayun_year + 9 < start_year:
+                continue
+
+            gan_ = JIAZI_GAN[dayun]
+            zhi_ = JIAZI_ZHI[dayun]
+            start_age = dayun_year - self.birth_year + 1
+            yield YunRow("大运", start_age, dayun_year, *profile.parts[dayun], profile.dayun_jias[dayun], (),
+                         profile.shenshas[dayun], profile.relations[zhi_])
+
+            dayun_mask = profile.natal_mask | 1 << zhi_
+            for i in range(10):
+                liunian_year = dayun_year + i
+                if start_year is not None and liunian_year < start_year:
+                    continue
+                if end_year is not None and liunian_year > end_year:
+                    break
+                liunian = self.liunian(liunian_year)
+                zhi2_ = JIAZI_ZHI[liunian]
+
+                # 流年与原局的夹拱已预先算好，只需补上与大运的
+                jia = profile.liunian_jias[liunian] + get_jia(JIAZI_GAN[liunian], zhi2_, (gan_,), (zhi_,), self.zhi_ids)
+                # 检测特殊组合
+                all_zhis = dayun_mask | 1 << zhi2_
+                specials = []
+
+                if all_zhis & TIANLUO_DIWANG == TIANLUO_DIWANG:
+                    specials.append("天罗地网：戌亥辰巳")
+                if all_zhis & SI_SHENG == SI_SHENG and natal_sheng == 2:
+                    specials.append("四生：寅申巳亥")
+                if all_zhis & SI_ZHENG == SI_ZHENG and natal_zheng == 2:
+                    specials.append("四败：子午卯酉")
+                if all_zhis & SI_KU == SI_KU and natal_ku == 2:
+                    specials.append("四库：辰戌丑未")
+
+                # 流年与原局、大运的地支关系
+                relations = profile.relations[zhi2_] | ZHI_RELATIONS[zhi2_][zhi_]
+                yield YunRow("流年", start_age + i, liunian_year, *profile.parts[liunian], jia, tuple(specials),
+                             profile.shenshas[liunian], relations)
+
+
+def basic_info(birth, gender, yun_start):
+    """出生时刻（utils.bazi_calendar.birth 的结果）、性别和上运时间 -> BasicInfo"""
+    solar_date, lunar_date = birth.solar, birth.lunar
+    prev_jieqi, next_jieqi = near_jieqi(birth)
+    return BasicInfo(
+        '女' if gender else '男',
+        "{}年{}月{}日 {}:{}".format(*solar_date),
+        "{}年{}月{}日 {}:{}".format(*lunar_date, *solar_date[3:]),
+        yun_start.isoformat(),
+        ming_gong(birth.gan_ids, birth.zhi_ids),
+        tai_yuan(birth.gan_ids, birth.zhi_ids),
+        prev_jieqi,
+        next_jieqi,
+    )
+
+
+def xiu_info(birth, jianchu):
+    """出生时刻和建除行 -> Xiu"""
+    xiu_name = LunarUtil.XIU[Zhi[birth.zhi_ids[2]] + str(birth.week)]
+    return Xiu(xiu_name, LunarUtil.XIU_SONG[xiu_name], jianchu)
+
+
 class BaziAnalyzer:
-    def __init__(self):
-        self.output_sections = {}
-        self.current_section = "基本信息"
-        self.capture_buffer = io.StringIO()
-        self.client = OpenAI(
-            api_key="",
-            base_url="https://dashscope.aliyuncs.com/compatible-mode/v1"
-        )
-        
-    def add_to_section(self, text):
-        """向当前部分添加文本"""
-        if self.current_section not in self.output_sections:
-            self.output_sections[self.current_section] = []
-        
-        self.output_sections[self.current_section].append(text)
-    
-    def set_section(self, section_name):
-        """更改当前部分"""
-        self.current_section = section_name
-    
-    def capture_print_output(self, func, *args, **kwargs):
-        """捕获函数的打印输出到当前部分"""
-        # 创建一个StringIO对象来捕获输出
-        with redirect_stdout(self.capture_buffer):
-            result = func(*args, **kwargs)
-        
-        # 获取捕获的输出
-        captured_output = self.capture_buffer.getvalue()
-        self.capture_buffer = io.StringIO()  # 重置缓冲区
-        
-        # 按行分割并将非空行添加到当前部分
-        for line in captured_output.split('\n'):
-            if line.strip():
-                self.add_to_section(line.strip())
-        
-        return result
-    
-    def analyze_bazi(self, year, month, day, time, minute=0, gender=False, solar=False, run_month=-1):
+    """
+    八字排盘引擎
+
+    实例不保存任何单次排盘的状态，构造后可在多个线程间共享；共享实例用 get_analyzer 获取。
+    大模型解读由 BaziInterpreter 负责，只在第一次调用 bazi_output 时创建。
+    """
+
+    def __init__(self, pillar_table=None):
+        # 预计算的四柱表（python -m utils.bazi_table build 生成），为 None 时实时计算
+        self.pillar_table = None
+        if pillar_table:
+            from utils.bazi_table import load_pillar_table
+            self.pillar_table = load_pillar_table(pillar_table)
+        self._interpreter = None
+        self._interpreter_lock = threading.Lock()
+
+    @property
+    def interpreter(self):
+        """大模型解读组件，第一次访问时创建"""
+        if self._interpreter is None:
+            with self._interpreter_lock:
+                if self._interpreter is None:
+                    self._interpreter = BaziInterpreter()
+        return self._interpreter
+
+    def analyze_bazi(self, year, month, day, time, minute=0, gender=False, solar=False, run_month=-1, years=None, sections=None):
         """
         分析八字并返回JSON结果
         
@@ -127,472 +688,112 @@ class BaziAnalyzer:
             solar: 公历为True，农历为False(布尔值)
             run_month: 如果是闰月则为True(布尔值)
             minute: 分钟(整数)，默认为0
+            years: 关注的公历年份(整数列表)，大运流年只输出这些年份范围内的行，默认全部输出
+            sections: 需要的部分名列表(见 SECTIONS)，只计算这些部分及其依赖，默认全部输出
         
         返回:
             包含分析结果的JSON字符串
         """
-        self.output_sections = {}
-        self.current_section = "基本信息"
-        
-        # 创建一个解析器对象传递给原始代码
-        parser = argparse.ArgumentParser()
-        options = parser.parse_args([])
-        options.year = year
-        options.month = month
-        options.day = day
-        options.time = time
-        options.n = gender
-        options.g = solar
-        options.r = run_month
-        options.b = False
-        options.start = 1850
-        options.end = '2030'
-        
-        # 设置日期信息
-        if options.g:
-            solar = Solar.fromYmdHms(int(options.year), int(options.month), int(options.day), int(options.time), int(minute), 0)
-            lunar = solar.getLunar()
-        else:
-            month_ = int(options.month)*-1 if options.r else int(options.month)
-            lunar = Lunar.fromYmdHms(int(options.year), month_, int(options.day), int(options.time), int(minute), 0)
-            solar = lunar.getSolar()
-
-        day = lunar
-        ba = lunar.getEightChar() 
-        gans = collections.namedtuple("Gans", "year month day time")(
-            year=ba.getYearGan(), month=ba.getMonthGan(), 
-            day=ba.getDayGan(), time=ba.getTimeGan())
-        zhis = collections.namedtuple("Zhis", "year month day time")(
-            year=ba.getYearZhi(), month=ba.getMonthZhi(), 
-            day=ba.getDayZhi(), time=ba.getTimeZhi())
-
-        # 将基本信息添加到JSON输出
-        self.add_to_section(f"性别: {'女' if options.n else '男'}")
-        self.add_to_section(f"公历: {solar.getYear()}年{solar.getMonth()}月{solar.getDay()}日 {solar.getHour()}:{solar.getMinute()}")
-        
-        yun = ba.getYun(not options.n)
-        self.add_to_section(f"农历: {lunar.getYear()}年{lunar.getMonth()}月{lunar.getDay()}日 {lunar.getHour()}:{lunar.getMinute()}")
-        self.add_to_section(f"上运时间: {yun.getStartSolar().toFullString().split()[0]}")
-        self.add_to_section(f"命宫: {ba.getMingGong()}")
-        self.add_to_section(f"胎元: {ba.getTaiYuan()}")
-        
-        self.add_to_section(f"前节气: {lunar.getPrevJieQi(True)}, {lunar.getPrevJieQi(True).getSolar().toYmdHms()}")
-        self.add_to_section(f"后节气: {lunar.getNextJieQi(True)}, {lunar.getNextJieQi(True).getSolar().toYmdHms()}")
-        
-        # 设置计算所需的变量
-        me = gans.day
-        month = zhis.month
-        alls = list(gans) + list(zhis)
-        zhus = [item for item in zip(gans, zhis)]
-
-        # 这里我们设置原始代码中需要的变量
-        gan_shens = []
-        for seq, item in enumerate(gans):    
-            if seq == 2:
-                gan_shens.append('--')
-            else:
-                gan_shens.append(ten_deities[me][item])
-                
-        zhi_shens = [] # 地支的主气神
-        for item in zhis:
-            d = zhi5[item]
-            zhi_shens.append(ten_deities[me][max(d, key=d.get)])
-            
-        shens = gan_shens + zhi_shens
-
-        zhi_shens2 = [] # 地支的所有神，包含余气和尾气, 混合在一起
-        zhi_shen3 = [] # 地支所有神，字符串格式
-        for item in zhis:
-            d = zhi5[item]
-            tmp = ''
-            for item2 in d:
-                zhi_shens2.append(ten_deities[me][item2])
-                tmp += ten_deities[me][item2]
-            zhi_shen3.append(tmp)
-        shens2 = gan_shens + zhi_shens2
-            
-        
-        # 计算五行分数
-        scores = {"金":0, "木":0, "水":0, "火":0, "土":0}
-        gan_scores = {"甲":0, "乙":0, "丙":0, "丁":0, "戊":0, "己":0, "庚":0, "辛":0,
-                    "壬":0, "癸":0}   
-
-        for item in gans:  
-            scores[gan5[item]] += 5
-            gan_scores[item] += 5
-
-        for item in list(zhis) + [zhis.month]:  
-            for gan in zhi5[item]:
-                scores[gan5[gan]] += zhi5[item][gan]
-                gan_scores[gan] += zhi5[item][gan]
-                
-        # 计算八字强弱
-        # 子平真诠的计算
-        weak = True
-        me_status = []
-        for item in zhis:
-            me_status.append(ten_deities[me][item])
-            if ten_deities[me][item] in ('长', '帝', '建'):
-                weak = False
-                
-        if weak:
-            if shens.count('比') + me_status.count('库') > 2:
-                weak = False
-                
-        # 计算五行得分
-        me_attrs_ = ten_deities[me].inverse
-        strong = gan_scores[me_attrs_['比']] + gan_scores[me_attrs_['劫']] \
-            + gan_scores[me_attrs_['枭']] + gan_scores[me_attrs_['印']]
-
-        # 计算大运（主要命运周期）
-        seq = Gan.index(gans.year)
-        if options.n:
-            if seq % 2 == 0:
-                direction = -1
-            else:
-                direction = 1
-        else:
-            if seq % 2 == 0:
-                direction = 1
-            else:
-                direction = -1
-
-        dayuns = []
-        gan_seq = Gan.index(gans.month)
-        zhi_seq = Zhi.index(zhis.month)
-        for i in range(12):
-            gan_seq += direction
-            zhi_seq += direction
-            dayuns.append(Gan[gan_seq%10] + Zhi[zhi_seq%12])
-            
-        # 设置部分并处理分析的不同部分
-        
-        # 四柱和天干地支分析
-        self.set_section("四柱")
-        self.add_to_section(' '.join(list(gans)) + ' | ' + ' '.join(list(gan_shens)))
-        self.add_to_section(' '.join(list(zhis)) + ' | ' + ' '.join(list(zhi_shens)))
-        self.add_to_section('四柱：' + ' '.join([''.join(item) for item in zip(gans, zhis)]))
-        
-        self.set_section("年月日时")
-        self.add_to_section(f"【年】{temps[gans.year]}:{temps[zhis.year]}{ten_deities[gans.year].inverse['建']}{gan_zhi_he(zhus[0])}")
-        self.add_to_section(f"【月】{temps[gans.month]}:{temps[zhis.month]}{ten_deities[gans.month].inverse['建']}{gan_zhi_he(zhus[1])}")
-        self.add_to_section(f"【日】{temps[me]}:{temps[zhis.day]}{gan_zhi_he(zhus[2])}")
-        self.add_to_section(f"【时】{temps[gans.time]}:{temps[zhis.time]}{ten_deities[gans.time].inverse['建']}{gan_zhi_he(zhus[3])}")
-        
-        # 天干分析
-        self.set_section("天干")
-        self.add_to_section(f"{gans.year}{yinyang(gans.year)}{gan5[gans.year]}【{ten_deities[me][gans.year]}】{check_gan(gans.year, gans)}")
-        self.add_to_section(f"{gans.month}{yinyang(gans.month)}{gan5[gans.month]}【{ten_deities[me][gans.month]}】{check_gan(gans.month, gans)}")
-        self.add_to_section(f"{me}{yinyang(me)}{gan5[me]}{check_gan(me, gans)}")
-        self.add_to_section(f"{gans.time}{yinyang(gans.time)}{gan5[gans.time]}【{ten_deities[me][gans.time]}】{check_gan(gans.time, gans)}")
-        
-        # 地支分析
-        self.set_section("地支")
-        self.add_to_section(f"{zhis.year}{yinyang(zhis.year)}{ten_deities[gans.year][zhis.year]}{ten_deities[gans.month][zhis.year]}【{ten_deities[me][zhis.year]}】{ten_deities[gans.time][zhis.year]}{get_empty(zhus[2],zhis.year)}")
-        self.add_to_section(f"{zhis.month}{yinyang(zhis.month)}{ten_deities[gans.year][zhis.month]}{ten_deities[gans.month][zhis.month]}【{ten_deities[me][zhis.month]}】{ten_deities[gans.time][zhis.month]}{get_empty(zhus[2],zhis.month)}")
-        self.add_to_section(f"{zhis.day}{yinyang(zhis.day)}{ten_deities[gans.year][zhis.day]}{ten_deities[gans.month][zhis.day]}【{ten_deities[me][zhis.day]}】{ten_deities[gans.time][zhis.day]}")
-        self.add_to_section(f"{zhis.time}{yinyang(zhis.time)}{ten_deities[gans.year][zhis.time]}{ten_deities[gans.month][zhis.time]}【{ten_deities[me][zhis.time]}】{ten_deities[gans.time][zhis.time]}{get_empty(zhus[2],zhis.time)}")
-        
-        # 地支藏干
-        self.set_section("地支藏干")
-        for seq, item in enumerate(zhis):
-            out = ''
-            multi = 2 if item == zhis.month and seq == 1 else 1
-            for gan in zhi5[item]:
-                out = out + "{}{}{}　".format(gan, gan5[gan], ten_deities[me][gan])
-            self.add_to_section(out.rstrip('　'))
-            
-        # 地支关系
-        self.set_section("地支关系")
-        for seq, item in enumerate(zhis):
-            output = ''
-            others = zhis[:seq] + zhis[seq+1:] 
-            for type_ in zhi_atts[item]:
-                flag = False
-                if type_ in ('害',"破","会",'刑'):
-                    continue
-                for zhi in zhi_atts[item][type_]:
-                    if zhi in others:
-                        if not flag:
-                            output = output + "　" + type_ + "：" if type_ not in ('冲','暗') else output + "　" + type_
-                            flag = True
-                        if type_ not in ('冲','暗'):
-                            output += zhi
-            output = output.lstrip('　')
-            self.add_to_section(output)
-            
-        # 地支次要关系
-        self.set_section("地支次要关系")
-        for seq, item in enumerate(zhis):
-            output = ''
-            others = zhis[:seq] + zhis[seq+1:] 
-            for type_ in zhi_atts[item]:
-                flag = False
-                if type_ not in ('害',"破","会",'刑'):
-                    continue
-                for zhi in zhi_atts[item][type_]:
-                    if zhi in others:
-                        if not flag:
-                            output = output + "　" + type_ + "："
-                            flag = True
-                        output += zhi
-            output = output.lstrip('　')
-            self.add_to_section(output)
-            
-        # 五行根
-        self.set_section("五行根")
-        for item in gans:
-            self.add_to_section(get_gen(item, zhis))
-            
-        # 纳音和关系
-        self.set_section("纳音和关系")
-        for seq, item in enumerate(zhus):
-            # 检查空亡 
-            result = "{}－{}".format(nayins[item], '亡') if zhis[seq] == wangs[zhis[0]] else nayins[item]
-            
-            # 天干与地支关系
-            result = relations[(gan5[gans[seq]], zhi_wuhangs[zhis[seq]])] + result
-                
-            # 检查劫杀 
-            result = "{}－{}".format(result, '劫杀') if zhis[seq] == jieshas[zhis[0]] else result
-            # 检查元辰
-            result = "{}－{}".format(result, '元辰') if zhis[seq] == Zhi[(Zhi.index(zhis[0]) + direction*-1*5)%12] else result    
-            self.add_to_section(result)
-            
-        # 神煞
-        self.set_section("神煞")
-        strs = ['','','','',]
-
-        all_shens = set()
-        all_shens_list = []
-
-        for item in year_shens:
-            for i in (1,2,3):
-                if zhis[i] in year_shens[item][zhis.year]:    
-                    strs[i] = item if not strs[i] else strs[i] + chr(12288) + item
-                    all_shens.add(item)
-                    all_shens_list.append(item)
-                    
-        for item in month_shens:
-            for i in range(4):
-                if gans[i] in month_shens[item][zhis.month] or zhis[i] in month_shens[item][zhis.month]:     
-                    strs[i] = item if not strs[i] else strs[i] + chr(12288) + item
-                    if i == 2 and gans[i] in month_shens[item][zhis.month]:
-                        strs[i] = strs[i] + "●"
-                    all_shens.add(item)
-                    all_shens_list.append(item)
-                    
-        for item in day_shens:
-            for i in (0,1,3):
-                if zhis[i] in day_shens[item][zhis.day]:     
-                    strs[i] = item if not strs[i] else strs[i] + chr(12288) + item    
-                    all_shens.add(item)
-                    all_shens_list.append(item)
-                    
-        for item in g_shens:
-            for i in range(4):
-                if zhis[i] in g_shens[item][me]:    
-                    strs[i] = item if not strs[i] else strs[i] + chr(12288) + item
-                    all_shens.add(item)
-                    all_shens_list.append(item)
-        
-        for seq in range(4):
-            if strs[seq]:
-                self.add_to_section(f"位置{seq+1}: {strs[seq]}")
-                
-        # 大运
-        self.set_section("大运")
-        self.add_to_section("大运: " + " ".join(dayuns))
-        
-        # 五行分数
-        self.set_section("五行分数")
-        self.add_to_section(f"五行分数: {scores}")
-        self.add_to_section(f"八字强弱: {strong}, 通常>29为强，需要参考月份、坐支等")
-        self.add_to_section(f"weak: {weak}")
-        
-        # 格局分析
-        self.set_section("格局分析")
-        
-        me_lu = ten_deities[me].inverse['建']
-        me_jue = ten_deities[me].inverse['绝']
-        me_tai = ten_deities[me].inverse['胎']
-        me_di = ten_deities[me].inverse['帝']
-        shang = ten_deities[me].inverse['伤']
-        yin = ten_deities[me].inverse['印']
-        xiao = ten_deities[me].inverse['枭']
-        cai = ten_deities[me].inverse['财']
-        piancai = ten_deities[me].inverse['才']
-        guan = ten_deities[me].inverse['官']
-        sha = ten_deities[me].inverse['杀']
-        jie = ten_deities[me].inverse['劫']
-        shi = ten_deities[me].inverse['食']
-        
-        self.add_to_section(f"调候: {tiaohous['{}{}'.format(me, zhis[1])]}")
-        self.add_to_section(f"金不换大运: {jinbuhuan['{}{}'.format(me, zhis[1])]}")
-        self.add_to_section(f"金不换大运说明: {jins['{}'.format(me)]}")
-        self.add_to_section(f"格局选用: {ges[ten_deities[me]['本']][zhis[1]]}")
-        
-        # 特定格局检查
-        if len(set('寅申巳亥')&set(zhis)) == 0:
-            self.add_to_section("缺四生: 一生不敢作为")
-        if len(set('子午卯酉')&set(zhis)) == 0:
-            self.add_to_section("缺四柱地支缺四正，一生避是非")
-        if len(set('辰戌丑未')&set(zhis)) == 0:
-            self.add_to_section("四柱地支缺四库，一生没有潜伏性凶灾。")
-            
-        # 其他特殊格局分析
-        jus = []
-        for item in zhi_hes:
-            if set(item).issubset(set(zhis) | set(get_gong(zhis, gans))):
-                self.add_to_section(f"三合局: {item}")
-                jus.append(ju[ten_deities[me].inverse[zhi_hes[item]]])
-                
-        for item in zhi_huis:
-            if set(item).issubset(set(zhis) | set(get_gong(zhis, gans))):
-                self.add_to_section(f"三会局: {item}")
-                jus.append(ju[ten_deities[me].inverse[zhi_huis[item]]])
-        
-        # 命宫
-        minggong = Zhi[::-1][(Zhi.index(zhis[1]) + Zhi.index(zhis[3]) -6) % 12]
-        self.add_to_section(f"命宫: {minggong} {minggongs[minggong]}")
-        self.add_to_section(f"坐: {rizhus[me+zhis.day]}")
-        
-        # 天罗地网
-        if '辰' in zhis and '巳' in zhis:
-            self.add_to_section("地网: 地支辰巳。天罗: 戌亥。天罗地网全凶。")
-            
-        if '戌' in zhis and '亥' in zhis:
-            self.add_to_section("天罗: 戌亥。地网: 地支辰巳。天罗地网全凶。")
-        
-        # 六亲分析
-        self.set_section("六亲分析")
-        liuqins = bidict({'才': '父亲', "财": '财' if options.n else '妻', "印": '母亲', "枭": '偏印' if options.n else '祖父',
-                         "官": '丈夫' if options.n else '女儿', "杀": '情夫' if options.n else '儿子', "劫": '兄弟' if options.n else '姐妹', 
-                         "比": '姐妹' if options.n else '兄弟', "食": '女儿' if options.n else '下属', "伤": '儿子' if options.n else '孙女'})
-                         
-        for item in Gan:
-            self.add_to_section(f"{item}: {ten_deities[me][item]} {liuqins[ten_deities[me][item]]}- {ten_deities[item][zhis[0]]} {ten_deities[item][zhis[1]]} {ten_deities[item][zhis[2]]} {ten_deities[item][zhis[3]]}")
-        
-        # 穷通宝鉴
-        if me+zhis.month in months:
-            self.set_section("穷通宝鉴")
-            self.add_to_section(months[me+zhis.month])
-        
-        # 三命通会
-        sum_index = ''.join([me, '日', *zhus[3]])
-        if sum_index in summarys:
-            self.set_section("三命通会")
-            self.add_to_section(summarys[sum_index])
-            
-        # 星宿
-        self.set_section("星宿")
-        self.add_to_section(f"星宿: {lunar.getXiu()}, {lunar.getXiuSong()}")
-        
-        # 建除
-        seq = 12 - Zhi.index(zhis.month)
-        self.add_to_section(f"建除: {jianchus[(Zhi.index(zhis.day) + seq)%12][0]}")
-        
+        return render_text(self.analyze(year, month, day, time, minute, gender, solar, run_month, years, sections))
+
+    def analyze(self, year, month, day, time, minute=0, gender=False, solar=False, run_month=-1, years=None, sections=None):
+        """
+        分析八字并返回结构化的 BaziChart（见 utils.bazi_model），参数同 analyze_bazi
+
+        文本、紧凑 JSON 和摘要分别用 render_text / render_json / render_summary 生成。
+        """
+        # 只计算所需部分及其依赖
+        needed = resolve_sections(SECTIONS if sections is None else sections)
+
+        # 出生时刻和四柱：1850–2100 年查节气表，其余年份由 lunar_python 计算
+        birth = calendar_birth(year, -int(month) if run_month and not solar else month, day, time, minute, solar)
+        gan_ids, zhi_ids = birth.gan_ids, birth.zhi_ids
+        gender = bool(gender)
+
+        if "上运" in needed:
+            yun_start = get_yun_start(birth, gender)
+
+        basic = basic_info(birth, gender, yun_start) if "基本信息" in needed else None
+
+        # 四柱决定的部分：配置了预计算表时一次偏移读出全部部分，否则由 pillar_chart 计算并缓存
+        chart = None
+        if self.pillar_table is not None:
+            chart = self.pillar_table.chart(gan_ids, zhi_ids, gender, None if sections is None else needed)
+        if chart is None:
+            pillar_nodes = None if sections is None else tuple(item for item in PILLAR_ORDER if item in needed)
+            chart = pillar_chart(gan_ids, zhi_ids, gender, pillar_nodes)
+        values = {name: value for name, value in chart.sections if name in needed}
+
+        xiu = xiu_info(birth, chart.jianchu) if "星宿" in needed else None
+
         # 添加大运和流年分析
-        self.set_section("大运流年")
-        
-        for dayun in yun.getDaYun()[1:]:
-            gan_ = dayun.getGanZhi()[0]
-            zhi_ = dayun.getGanZhi()[1]
-            fu = '*' if (gan_, zhi_) in zhus else " "
-            zhi5_ = ''
-            for gan in zhi5[zhi_]:
-                zhi5_ = zhi5_ + "{}{}　".format(gan, ten_deities[me][gan]) 
-            
-            zhi__ = set() # 大运地支关系
-            
-            for item in zhis:
-                for type_ in zhi_atts[zhi_]:
-                    if item in zhi_atts[zhi_][type_]:
-                        zhi__.add(type_ + ":" + item)
-            zhi__ = '  '.join(zhi__)
-            
-            empty = chr(12288)
-            if zhi_ in empties[zhus[2]]:
-                empty = '空'        
-            
-            jia = ""
-            if gan_ in gans:
-                for i in range(4):
-                    if gan_ == gans[i]:
-                        if abs(Zhi.index(zhi_) - Zhi.index(zhis[i])) == 2:
-                            jia = jia + "  --夹：" +  Zhi[( Zhi.index(zhi_) + Zhi.index(zhis[i]) )//2]
-                        if abs( Zhi.index(zhi_) - Zhi.index(zhis[i]) ) == 10:
-                            jia = jia + "  --夹：" +  Zhi[(Zhi.index(zhi_) + Zhi.index(zhis[i]))%12]
-                    
-            out = f"大运: {dayun.getStartAge()}岁 {dayun.getGanZhi()} "
-            out += f"{nayins[(gan_, zhi_)]} {ten_deities[me][gan_]}:{gan_} {ten_deities[me][zhi_]}:{zhi_} "
-            out += f"藏干: {zhi5_.strip()} {jia}"
-            
-            self.add_to_section(out)
-            
-            # 流年分析
-            zhis2 = list(zhis) + [zhi_]
-            gans2 = list(gans) + [gan_]
-            
-            for liunian in dayun.getLiuNian():
-                gan2_ = liunian.getGanZhi()[0]
-                zhi2_ = liunian.getGanZhi()[1]
-                fu2 = '*' if (gan2_, zhi2_) in zhus else " "
-                
-                zhi6_ = ''
-                for gan in zhi5[zhi2_]:
-                    zhi6_ = zhi6_ + "{}{}　".format(gan, ten_deities[me][gan])        
-                
-                # 流年地支关系
-                zhi__ = set()
-                for item in zhis2:
-                    for type_ in zhi_atts[zhi2_]:
-                        if type_ == '破':
-                            continue
-                        if item in zhi_atts[zhi2_][type_]:
-                            zhi__.add(type_ + ":" + item)
-                zhi__ = '  '.join(zhi__)
-                
-                empty = chr(12288)
-                if zhi2_ in empties[zhus[2]]:
-                    empty = '空'
-                    
-                jia = ""
-                if gan2_ in gans2:
-                    for i in range(5):
-                        if gan2_ == gans2[i]:
-                            zhi1 = zhis2[i]
-                            if abs(Zhi.index(zhi2_) - Zhi.index(zhis2[i])) == 2:
-                                jia = jia + "  --夹：" +  Zhi[( Zhi.index(zhi2_) + Zhi.index(zhis2[i]) )//2]
-                            if abs( Zhi.index(zhi2_) - Zhi.index(zhis2[i]) ) == 10:
-                                jia = jia + "  --夹：" +  Zhi[(Zhi.index(zhi2_) + Zhi.index(zhis2[i]))%12]  
-
-                            if (zhi1 + zhi2_ in gong_he) and (gong_he[zhi1 + zhi2_] not in zhis):
-                                jia = jia + "  --拱：" + gong_he[zhi1 + zhi2_]
-                
-                out = f"流年: {liunian.getAge()}岁 {liunian.getYear()}年 {gan2_+zhi2_} "
-                out += f"{nayins[(gan2_, zhi2_)]} {ten_deities[me][gan2_]}:{gan2_} {ten_deities[me][zhi2_]}:{zhi2_} "
-                out += f"藏干: {zhi6_.strip()} {jia}"
-                
-                # 检测特殊组合
-                all_zhis = set(zhis2) | {zhi2_}
-                specials = []
-                
-                if set('戌亥辰巳').issubset(all_zhis):
-                    specials.append("天罗地网：戌亥辰巳")
-                if set('寅申巳亥').issubset(all_zhis) and len(set('寅申巳亥')&set(zhis)) == 2:
-                    specials.append("四生：寅申巳亥")   
-                if set('子午卯酉').issubset(all_zhis) and len(set('子午卯酉')&set(zhis)) == 2:
-                    specials.append("四败：子午卯酉")  
-                if set('辰戌丑未').issubset(all_zhis) and len(set('辰戌丑未')&set(zhis)) == 2:
-                    specials.append("四库：辰戌丑未")
-                
-                if specials:
-                    out += " " + " ".join(specials)
-                
-                self.add_to_section(out)
-        
-        return self.output_sections
+        yun_rows = None
+        if "大运流年" in needed:
+            # 立春年份即公历出生年
+            engine = YunEngine(gan_ids, zhi_ids, chart.dayuns, yun_start.year, birth.solar[0], birth.solar[0])
+            window = (min(years), max(years)) if years else (None, None)
+            yun_rows = tuple(engine.rows(*window))
+
+        return BaziChart(
+            basic=basic,
+            pillars=values.get("四柱"),
+            shensha=values.get("神煞"),
+            dayuns=values.get("大运"),
+            scores=values.get("五行分数"),
+            geju=values.get("格局分析"),
+            xiu=xiu,
+            yun=yun_rows,
+            sections=tuple((name, value) for name, value in values.items()
+                           if name in needed and name not in SECTION_RENDERERS),
+        )
+
+    @staticmethod
+    def cache_info():
+        """四柱缓存的命中、未命中次数与当前条数，即 pillar_chart.cache_info()"""
+        return pillar_chart.cache_info()
+
+    @staticmethod
+    def cache_clear():
+        """清空四柱缓存并重置计数"""
+        pillar_chart.cache_clear()
+
+    def analyze_many(self, births, genders, solar=True, run_months=False, scheme=DEFAULT_SCORE_SCHEME):
+        """
+        批量排盘，返回列式的 BaziBatch，参数见 utils.bazi_batch.analyze_many
+        """
+        from utils.bazi_batch import analyze_many
+        return analyze_many(births, genders, solar, run_months, scheme)
+
+    def bazi_output(self, user_question, bazi_json):
+        """
+        使用ds-r1模型分析排盘后，返回分析结果，见 BaziInterpreter.bazi_output
+        """
+        return self.interpreter.bazi_output(user_question, bazi_json)
+
+
+@functools.lru_cache(maxsize=None)
+def get_analyzer(pillar_table=None):
+    """每个进程按预计算表路径共享一个 BaziAnalyzer"""
+    return BaziAnalyzer(pillar_table)
+
+
+class BaziInterpreter:
+    """大模型解读排盘结果；OpenAI 客户端在第一次调用时创建，可在多个线程间共享"""
+
+    def __init__(self, api_key="", base_url="https://dashscope.aliyuncs.com/compatible-mode/v1"):
+        self.api_key = api_key
+        self.base_url = base_url
+        self._client = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._client
 
     def bazi_output(self, user_question, bazi_json):
         """
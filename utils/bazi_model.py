@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+八字排盘结果模型
+
+BaziAnalyzer.analyze 返回结构化的 BaziChart，各部分都是 namedtuple（没有 __dict__）。
+文本、紧凑 JSON、摘要三种视图分别由 render_text / render_json / render_summary 生成，
+调用方直接读字段，不再从显示用的字符串里解析。
+"""
+
+import collections
+import json
+
+from baziData.tables import ELEMENTS, RELATION_TYPES
+
+# analyze_bazi 输出的各部分，按输出顺序排列
+SECTIONS = ("基本信息", "四柱", "年月日时", "天干", "地支", "地支藏干", "地支关系", "地支次要关系", "五行根",
+            "纳音和关系", "神煞", "大运", "五行分数", "格局分析", "六亲分析", "穷通宝鉴", "三命通会", "星宿", "大运流年")
+
+# 基本信息；prev_jieqi / next_jieqi 为 (节气, 交节时间)
+BasicInfo = collections.namedtuple("BasicInfo", "gender solar lunar yun_start minggong taiyuan prev_jieqi next_jieqi")
+# 一柱；日柱的 gan_shen 为 None
+Pillar = collections.namedtuple("Pillar", "gan zhi gan_shen zhi_shen")
+# 五行分数；elements 按 ELEMENTS 顺序排列
+Scores = collections.namedtuple("Scores", "elements strong weak")
+# 格局分析；lacks 为缺四生等断语，jus 为 (三合局/三会局, 局名)，tianluo 为天罗地网断语
+Geju = collections.namedtuple("Geju", "tiaohou jinbuhuan jinbuhuan_note geju lacks jus minggong minggong_note zuo tianluo")
+# 星宿、建除
+Xiu = collections.namedtuple("Xiu", "xiu song jianchu")
+# 大运或流年的一行；kind 为 "大运" 或 "流年"，year 为大运起始或流年的公历年份。以下两项不在文本视图中输出：
+# shensha 为该柱以原局为基准命中的神煞；relations 为该柱地支与原局（流年还包括大运）地支的关系位掩码，
+# 名称由 relation_names 给出
+YunRow = collections.namedtuple("YunRow", "kind age year ganzhi nayin gan_shen gan zhi_stage zhi hidden jia specials "
+                                          "shensha relations")
+
+# 排盘结果；未计算的部分为 None。pillars 为年月日时四柱，shensha 为四柱各自的神煞名，
+# dayuns 为十二步大运的干支，yun 为大运流年行，sections 为其余只有文本的部分 ((部分名, (行, ...)), ...)
+BaziChart = collections.namedtuple("BaziChart", "basic pillars shensha dayuns scores geju xiu yun sections")
+
+
+def render_basic(basic):
+    return [
+        f"性别: {basic.gender}",
+        f"公历: {basic.solar}",
+        f"农历: {basic.lunar}",
+        f"上运时间: {basic.yun_start}",
+        f"命宫: {basic.minggong}",
+        f"胎元: {basic.taiyuan}",
+        f"前节气: {basic.prev_jieqi[0]}, {basic.prev_jieqi[1]}",
+        f"后节气: {basic.next_jieqi[0]}, {basic.next_jieqi[1]}",
+    ]
+
+
+def render_pillars(pillars):
+    return [
+        ' '.join(item.gan for item in pillars) + ' | '
+        + ' '.join('--' if item.gan_shen is None else item.gan_shen for item in pillars),
+        ' '.join(item.zhi for item in pillars) + ' | ' + ' '.join(item.zhi_shen for item in pillars),
+        '四柱：' + ' '.join(item.gan + item.zhi for item in pillars),
+    ]
+
+
+def render_shensha(shensha):
+    return [f"位置{seq+1}: {chr(12288).join(names)}" for seq, names in enumerate(shensha) if names]
+
+
+def render_dayuns(dayuns):
+    return ["大运: " + " ".join(dayuns)]
+
+
+def render_scores(scores):
+    return [
+        f"五行分数: {dict(zip(ELEMENTS, scores.elements))}",
+        f"八字强弱: {scores.strong}, 通常>29为强，需要参考月份、坐支等",
+        f"weak: {scores.weak}",
+    ]
+
+
+def render_geju(geju):
+    lines = [
+        f"调候: {geju.tiaohou}",
+        f"金不换大运: {geju.jinbuhuan}",
+        f"金不换大运说明: {geju.jinbuhuan_note}",
+        f"格局选用: {geju.geju}",
+    ]
+    lines.extend(geju.lacks)
+    lines.extend(f"{kind}: {name}" for kind, name in geju.jus)
+    lines.append(f"命宫: {geju.minggong} {geju.minggong_note}")
+    lines.append(f"坐: {geju.zuo}")
+    lines.extend(geju.tianluo)
+    return lines
+
+
+def render_xiu(xiu):
+    return [f"星宿: {xiu.xiu}, {xiu.song}", xiu.jianchu]
+
+
+def relation_names(bits):
+    """地支关系位掩码 -> 关系类型名，顺序同 RELATION_TYPES"""
+    return tuple(name for seq, name in enumerate(RELATION_TYPES) if bits >> seq & 1)
+
+
+def render_yun_row(row):
+    if row.kind == "大运":
+        head = f"大运: {row.age}岁 "
+    else:
+        head = f"流年: {row.age}岁 {row.year}年 "
+    out = (f"{head}{row.ganzhi} {row.nayin} {row.gan_shen}:{row.gan} {row.zhi_stage}:{row.zhi} "
+           f"藏干: {row.hidden} {row.jia}")
+    if row.specials:
+        out += " " + " ".join(row.specials)
+    return out
+
+
+def render_yun(rows):
+    return [render_yun_row(row) for row in rows]
+
+
+# 结构化部分：部分名 -> (BaziChart 字段, 渲染函数)
+SECTION_RENDERERS = {
+    "基本信息": ("basic", render_basic),
+    "四柱": ("pillars", render_pillars),
+    "神煞": ("shensha", render_shensha),
+    "大运": ("dayuns", render_dayuns),
+    "五行分数": ("scores", render_scores),
+    "格局分析": ("geju", render_geju),
+    "星宿": ("xiu", render_xiu),
+    "大运流年": ("yun", render_yun),
+}
+
+
+def render_section(name, value):
+    """单个部分 -> 文本行；只有文本的部分原样返回"""
+    if name in SECTION_RENDERERS:
+        return SECTION_RENDERERS[name][1](value)
+    return value
+
+
+def render_text(chart):
+    """文本视图：与 analyze_bazi 历来的输出相同，{部分名: [行, ...]}，没有内容的部分不输出"""
+    texts = dict(chart.sections)
+    output = {}
+    for name in SECTIONS:
+        if name in SECTION_RENDERERS:
+            value = getattr(chart, SECTION_RENDERERS[name][0])
+            lines = None if value is None else render_section(name, value)
+        else:
+            lines = texts.get(name)
+        if lines:
+            output[name] = list(lines)
+    return output
+
+
+def _squash(value):
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    return [_squash(item) for item in value]
+
+
+def render_json(chart):
+    """紧凑 JSON 视图：文本视图去掉全角空格、换行和多余空白，不带缩进和分隔空格，供大模型读取"""
+    output = {name: _squash(lines) for name, lines in render_text(chart).items()}
+    return json.dumps(output, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_summary(chart):
+    """摘要视图：前端展示用的基本信息、四柱、五行和格局，空白同紧凑 JSON 视图，缺少的部分为空字符串"""
+    basic, scores, geju = chart.basic, chart.scores, chart.geju
+    return {
+        "性别": basic.gender if basic else "",
+        "真太阳时": basic.solar if basic else "",
+        "命宫": basic.minggong if basic else "",
+        "胎元": basic.taiyuan if basic else "",
+        "四柱": ' '.join(item.gan + item.zhi for item in chart.pillars) if chart.pillars else "",
+        "五行分数": str(dict(zip(ELEMENTS, scores.elements))) if scores else "",
+        "五行总结": f"{scores.strong}, 通常>29为强，需要参考月份、坐支等" if scores else "",
+        "格局分析": {
+            "调候": _squash(str(geju.tiaohou)) if geju else "",
+            "格局选用": _squash(str(geju.geju)) if geju else "",
+            "命宫分析": _squash(f"{geju.minggong} {geju.minggong_note}") if geju else "",
+            "坐支分析": _squash(str(geju.zuo)) if geju else "",
+        },
+    }
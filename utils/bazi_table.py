@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+四柱预计算表
+
+月干由年干、月支决定（五虎遁），时干由日干、时支决定（五鼠遁），所以合法的四柱
+只有 60 年柱 × 12 月支 × 60 日柱 × 12 时支 = 518,400 种；lunar_python 对晚子时
+（23 点）取次日日干起时干，另算一个时辰槽，共 13 个。连同男女两种性别，把
+pillar_chart 的全部部分离线算好写进一个文件，运行时 mmap 打开，按记录号一次
+偏移读出，多个进程共享同一份页缓存。四柱、神煞等结构化部分以 JSON 行存放，读出时
+还原为 utils.bazi_model 中的 namedtuple。六亲分析、穷通宝鉴、三命通会和建除只由
+少数几个干支决定，不逐条记录存放，而是按各自的键放进子表（见 SUB_TABLES）。
+
+文件结构（小端）：
+    MAGIC | uint32 元数据长度 | 元数据 JSON | 按 8 字节对齐的各数据块
+    index         uint32[记录数 + 1]   每条记录在 ids 中的起止位置
+    ids           uint32[...]          每条记录依次输出的行号
+    line_sections uint8[行数]          行所属部分在 sections 中的下标，高两位为 JSON_LINE / JOIN_LINE
+    line_offsets  uint32[行数 + 1]     行文本在 blob 中的起止位置
+    blob          utf-8 文本
+    <部分名>.index uint32[键数 + 1]     SUB_TABLES 中各部分每个键在 <部分名>.ids 中的起止位置
+    <部分名>.ids   uint32[...]          各键依次输出的行号
+
+用法:
+    python -m utils.bazi_table build baziData/pillars.bin
+    python -m utils.bazi_table check baziData/pillars.bin
+"""
+
+import argparse
+import functools
+import json
+import mmap
+import random
+import struct
+import sys
+import time
+from array import array
+
+from baziData.tables import *
+from utils.bazi_json import PillarChart, get_dayuns, pillar_chart
+from utils.bazi_model import Geju, Pillar, Scores
+
+MAGIC = b"FTBZTBL\0"
+TABLE_VERSION = 4
+
+# 12 个时辰 + 晚子时
+HOUR_SLOTS = 13
+TABLE_SIZE = 60 * 12 * 60 * HOUR_SLOTS * 2
+
+# 建除行存放在这个部分名下，读出时还原为 PillarChart.jianchu
+JIANCHU_SECTION = "星宿"
+JSON_LINE = 0x80
+# 接在上一行末尾的片段：六亲分析每行由十神前缀和四柱长生拼成，分开存放可以大幅减少行数
+JOIN_LINE = 0x40
+SPLIT_LINES = {"六亲分析": "- "}
+
+
+def _liuqin_key(gan_ids, zhi_ids, gender):
+    key = gan_ids[2] * 2 + bool(gender)
+    for zhi in zhi_ids:
+        key = key * 12 + zhi
+    return key
+
+
+# 只由少数干支决定的部分：节点名 -> (键数, 由天干下标、地支下标和性别求键的函数)。
+# 这些部分在 PILLAR_ORDER 中排在最后，读出时按这里的顺序接在记录本身的行之后
+SUB_TABLES = {
+    # 日干、性别、四支
+    "六亲分析": (10 * 2 * 12 ** 4, _liuqin_key),
+    # 日干、月支
+    "穷通宝鉴": (10 * 12, lambda gan_ids, zhi_ids, gender: gan_ids[2] * 12 + zhi_ids[1]),
+    # 日干、时柱
+    "三命通会": (10 * 10 * 12, lambda gan_ids, zhi_ids, gender: (gan_ids[2] * 10 + gan_ids[3]) * 12 + zhi_ids[3]),
+    # 日支、月支
+    "建除": (12 * 12, lambda gan_ids, zhi_ids, gender: zhi_ids[2] * 12 + zhi_ids[1]),
+}
+
+
+def _geju(value):
+    tiaohou, jinbuhuan, jinbuhuan_note, geju, lacks, jus, minggong, minggong_note, zuo, tianluo = value
+    return Geju(tiaohou, jinbuhuan, jinbuhuan_note, geju, tuple(lacks), tuple(map(tuple, jus)), minggong,
+                minggong_note, zuo, tuple(tianluo))
+
+
+# 结构化部分：部分名 -> 由 JSON 值（namedtuple、tuple 读出为 list）还原的函数；每条记录中每个结构化部分一行
+TYPED_SECTIONS = {
+    "四柱": lambda value: tuple(Pillar(*item) for item in value),
+    "神煞": lambda value: tuple(map(tuple, value)),
+    "大运": tuple,
+    "五行分数": lambda value: Scores(tuple(value[0]), value[1], value[2]),
+    "格局分析": _geju,
+}
+
+
+def pillar_index(gan_ids, zhi_ids, gender):
+    """四柱下标和性别 -> 记录号，月干、时干不合五虎遁、五鼠遁时返回 -1"""
+    if gan_ids[1] != month_gan(gan_ids[0], zhi_ids[1]):
+        return -1
+    hour = zhi_ids[3]
+    if gan_ids[3] != time_gan(gan_ids[2], hour):
+        if hour != 0 or gan_ids[3] != time_gan(gan_ids[2] + 1, hour):
+            return -1
+        hour = HOUR_SLOTS - 1
+    year = jiazi(gan_ids[0], zhi_ids[0])
+    day = jiazi(gan_ids[2], zhi_ids[2])
+    return (((year * 12 + zhi_ids[1]) * 60 + day) * HOUR_SLOTS + hour) * 2 + bool(gender)
+
+
+def pillar_at(seq):
+    """记录号 -> (天干下标, 地支下标, 性别)，pillar_index 的逆运算"""
+    seq, gender = divmod(seq, 2)
+    seq, hour = divmod(seq, HOUR_SLOTS)
+    seq, day = divmod(seq, 60)
+    year, month_zhi = divmod(seq, 12)
+    day_gan = JIAZI_GAN[day] + (hour == HOUR_SLOTS - 1)
+    gan_ids = (JIAZI_GAN[year], month_gan(JIAZI_GAN[year], month_zhi),
+               JIAZI_GAN[day], time_gan(day_gan, hour % 12))
+    zhi_ids = (JIAZI_ZHI[year], month_zhi, JIAZI_ZHI[day], hour % 12)
+    return gan_ids, zhi_ids, bool(gender)
+
+
+def build_table(path, verbose=True, records=TABLE_SIZE):
+    """计算全部四柱并写入 path；records 小于 TABLE_SIZE 时只写入前 records 条记录，供测试使用"""
+    sections = []
+    lines = {}
+    index = array('I', [0])
+    ids = array('I')
+    line_sections = bytearray()
+    line_offsets = array('I', [0])
+    blob = bytearray()
+    # 子表：部分名 -> 每个键的行号列表，未出现的键为 None
+    sub_lines = {name: [None] * size for name, (size, _) in SUB_TABLES.items()}
+
+    def line_id(name, text, flag=0):
+        if name in TYPED_SECTIONS:
+            text, flag = json.dumps(text, ensure_ascii=False, separators=(',', ':')), JSON_LINE
+        elif not isinstance(text, str):
+            # 穷通宝鉴中有少数条目是 tuple
+            text, flag = json.dumps(text, ensure_ascii=False), JSON_LINE
+        key = (name, text, flag)
+        if key not in lines:
+            if name not in sections:
+                sections.append(name)
+            lines[key] = len(lines)
+            line_sections.append(sections.index(name) | flag)
+            blob.extend(text.encode('utf-8'))
+            line_offsets.append(len(blob))
+        return lines[key]
+
+    def target(name, gan_ids, zhi_ids, gender):
+        # 子表中的部分每个键只写一次，已写过时返回 None
+        if name not in SUB_TABLES:
+            return ids
+        entries = sub_lines[name]
+        key = SUB_TABLES[name][1](gan_ids, zhi_ids, gender)
+        if entries[key] is not None:
+            return None
+        entries[key] = []
+        return entries[key]
+
+    start = time.time()
+    for seq in range(records):
+        gan_ids, zhi_ids, gender = pillar_at(seq)
+        chart = pillar_chart.__wrapped__(gan_ids, zhi_ids, gender)
+        for name, texts in chart.sections:
+            output = target(name, gan_ids, zhi_ids, gender)
+            if output is None:
+                continue
+            if name in TYPED_SECTIONS:
+                output.append(line_id(name, texts))
+                continue
+            for text in texts:
+                if name in SPLIT_LINES:
+                    head, sep, tail = text.partition(SPLIT_LINES[name])
+                    output.append(line_id(name, head + sep))
+                    output.append(line_id(name, tail, JOIN_LINE))
+                else:
+                    output.append(line_id(name, text))
+        output = target("建除", gan_ids, zhi_ids, gender)
+        if output is not None:
+            output.append(line_id(JIANCHU_SECTION, chart.jianchu))
+        index.append(len(ids))
+        if verbose and (seq + 1) % max(records // 20, 1) == 0:
+            print(f"{seq + 1}/{records} 条记录，{len(lines)} 行，{time.time() - start:.0f}s")
+
+    blocks = [("index", index), ("ids", ids), ("line_sections", array('B', line_sections)),
+              ("line_offsets", line_offsets), ("blob", array('B', blob))]
+    for name, entries in sub_lines.items():
+        sub_index = array('I', [0])
+        sub_ids = array('I')
+        for entry in entries:
+            sub_ids.extend(entry or ())
+            sub_index.append(len(sub_ids))
+        blocks += [(name + ".index", sub_index), (name + ".ids", sub_ids)]
+    meta = {"version": TABLE_VERSION, "records": records, "hour_slots": HOUR_SLOTS,
+            "sections": sections, "blocks": {}}
+    # 各块的偏移相对于元数据之后的数据区
+    offset = 0
+    for name, data in blocks:
+        meta["blocks"][name] = [offset, data.typecode, len(data)]
+        offset += _padded(len(data) * data.itemsize)
+    header = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+    base = _padded(len(MAGIC) + 4 + len(header))
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header)) + header)
+        for name, data in blocks:
+            f.seek(base + meta["blocks"][name][0])
+            data.tofile(f)
+        f.truncate(base + offset)
+
+    if verbose:
+        print(f"写入 {path}：{records} 条记录，{len(lines)} 行，{(base + offset) / 2**20:.1f} MB，"
+              f"用时 {time.time() - start:.0f}s")
+
+
+def _padded(size):
+    return (size + 7) // 8 * 8
+
+
+class PillarTable:
+    """只读打开 build_table 写出的预计算表"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} 不是四柱预计算表")
+        (size,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+        meta = json.loads(self._mmap[len(MAGIC) + 4:len(MAGIC) + 4 + size].decode('utf-8'))
+        if meta["version"] != TABLE_VERSION or meta["hour_slots"] != HOUR_SLOTS:
+            raise ValueError(f"{path} 的版本与当前代码不一致，请重新生成")
+
+        self.sections = meta["sections"]
+        self._all = [True] * len(self.sections)
+        view = memoryview(self._mmap)
+        base = _padded(len(MAGIC) + 4 + size)
+        blocks = {}
+        for name, (offset, typecode, count) in meta["blocks"].items():
+            offset += base
+            blocks[name] = view[offset:offset + count * array(typecode).itemsize].cast(typecode)
+        self._index = blocks["index"]
+        self._ids = blocks["ids"]
+        self._line_sections = blocks["line_sections"]
+        self._line_offsets = blocks["line_offsets"]
+        self._sub_tables = [(name, key, blocks[name + ".index"], blocks[name + ".ids"])
+                            for name, (_, key) in SUB_TABLES.items()]
+        # 行文本直接从 mmap 切片解码，比经过 memoryview 快
+        self._blob = base + meta["blocks"]["blob"][0]
+        del blocks["blob"]
+        self._views = list(blocks.values()) + [view]
+
+    def __len__(self):
+        return len(self._index) - 1
+
+    def chart(self, gan_ids, zhi_ids, gender, sections=None):
+        """
+        读出与 pillar_chart(gan_ids, zhi_ids, gender, sections) 相同的 PillarChart，四柱不在表中时返回 None
+
+        sections 为所需节点名的集合（一般由 resolve_sections 得到），其余部分的行不解码；为 None 时读出全部
+        """
+        seq = pillar_index(gan_ids, zhi_ids, gender)
+        if not 0 <= seq < len(self):
+            return None
+
+        if sections is None:
+            wanted = self._all
+        else:
+            wanted = [("建除" if name == JIANCHU_SECTION else name) in sections for name in self.sections]
+        output = []
+        jianchu = self._read(self._ids[self._index[seq]:self._index[seq + 1]], wanted, output)
+        for name, key, index, ids in self._sub_tables:
+            if sections is None or name in sections:
+                key = key(gan_ids, zhi_ids, gender)
+                jianchu = self._read(ids[index[key]:index[key + 1]], wanted, output) or jianchu
+
+        return PillarChart(tuple((name, value if name in TYPED_SECTIONS else tuple(value)) for name, value in output),
+                           jianchu,
+                           get_dayuns(gan_ids, zhi_ids, gender))
+
+    def _read(self, line_ids, wanted, output):
+        """把 line_ids 中所需部分的行解码后追加到 output 的 [(部分名, 值)]，返回其中的建除行"""
+        line_sections = self._line_sections
+        line_offsets = self._line_offsets
+        data = self._mmap
+        blob = self._blob
+        jianchu = None
+        for line_id in line_ids.tolist():
+            flags = line_sections[line_id]
+            section = flags & ~(JSON_LINE | JOIN_LINE)
+            if not wanted[section]:
+                continue
+            text = data[blob + line_offsets[line_id]:blob + line_offsets[line_id + 1]].decode('utf-8')
+            name = self.sections[section]
+            if name in TYPED_SECTIONS:
+                output.append((name, TYPED_SECTIONS[name](json.loads(text))))
+                continue
+            if flags & JSON_LINE:
+                text = tuple(json.loads(text))
+            if flags & JOIN_LINE:
+                output[-1][1][-1] += text
+            elif name == JIANCHU_SECTION:
+                jianchu = text
+            elif output and output[-1][0] == name:
+                output[-1][1].append(text)
+            else:
+                output.append((name, [text]))
+        return jianchu
+
+    def close(self):
+        for item in self._views:
+            item.release()
+        self._mmap.close()
+
+
+@functools.lru_cache(maxsize=None)
+def load_pillar_table(path):
+    """每个进程对同一文件只打开一次"""
+    return PillarTable(path)
+
+
+def check_table(path, samples=2000, seed=0):
+    """随机抽查表中记录与实时计算的 pillar_chart 是否一致，返回不一致的条数"""
+    table = PillarTable(path)
+    if samples >= len(table):
+        seqs = range(len(table))
+    else:
+        seqs = random.Random(seed).sample(range(len(table)), samples)
+    bad = 0
+    for seq in seqs:
+        gan_ids, zhi_ids, gender = pillar_at(seq)
+        chart = pillar_chart.__wrapped__(gan_ids, zhi_ids, gender)
+        if table.chart(gan_ids, zhi_ids, gender) != chart:
+            bad += 1
+    table.close()
+    return bad
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="四柱预计算表")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="计算全部四柱并写入文件")
+    build.add_argument("path", nargs="?", default="baziData/pillars.bin")
+    check = subparsers.add_parser("check", help="抽查表中记录与实时计算是否一致")
+    check.add_argument("path", nargs="?", default="baziData/pillars.bin")
+    check.add_argument("-n", "--samples", type=int, default=2000)
+    options = parser.parse_args(argv)
+
+    if options.command == "build":
+        build_table(options.path)
+    else:
+        bad = check_table(options.path, options.samples)
+        print(f"抽查 {options.samples} 条，不一致 {bad} 条")
+        return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
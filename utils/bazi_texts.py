@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+古籍文本按需读取
+
+三命通会（baziData/sizi.py 的 summarys）和穷通宝鉴（baziData/yue.py 的 months）合计
+两百多 KB，一张盘只用到各一条。这里把两者写进 baziData/texts.bin：文件头是各条目
+在正文中的偏移索引，正文是 utf-8 文本。运行时只读索引，条目按键用 os.pread 读出，
+前面有一个小的 LRU；多个线程可共享同一个 TextCorpus。
+
+文件结构：
+    MAGIC | uint32 索引长度 | 索引 JSON | 正文
+    索引为 {"version": ..., "sources": ..., "corpora": {语料名: {键: [偏移, 长度, 是否 JSON]}}}，
+    偏移相对于正文开头；穷通宝鉴中有少数条目是 tuple，以 JSON 存放。sources 为生成时 sizi.py、yue.py
+    的 (长度, crc32)，与当前文件不一致时不用 texts.bin，退回到导入来源模块（同 baziData/tables.snap）。
+
+sizi.py、yue.py 仍是文本的来源，修改后需重新生成：
+    python -m utils.bazi_texts build
+    python -m utils.bazi_texts check
+"""
+
+import argparse
+import functools
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+import zlib
+
+MAGIC = b"FTTEXTS\0"
+TEXTS_VERSION = 2
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEXTS_PATH = os.path.join(_ROOT, "baziData", "texts.bin")
+TEXT_CACHE_SIZE = 64
+
+# 语料名 -> (来源模块, 变量名)
+SOURCES = {
+    "summarys": ("baziData.sizi", "summarys"),
+    "months": ("baziData.yue", "months"),
+}
+
+
+class StaleTextsError(ValueError):
+    """texts.bin 与 sizi.py、yue.py 不一致"""
+
+
+def _source(name):
+    module, attr = SOURCES[name]
+    return getattr(__import__(module, fromlist=[attr]), attr)
+
+
+def source_key():
+    """来源模块文件的 [(长度, crc32)]，按 SOURCES 的顺序"""
+    sources = []
+    for module, _ in SOURCES.values():
+        with open(os.path.join(_ROOT, *module.split('.')) + ".py", 'rb') as f:
+            data = f.read()
+        sources.append([len(data), zlib.crc32(data)])
+    return sources
+
+
+def build_texts(path=TEXTS_PATH):
+    """把 SOURCES 中的全部语料写入 path"""
+    corpora = {}
+    blob = bytearray()
+    for name in SOURCES:
+        index = corpora[name] = {}
+        for key, value in _source(name).items():
+            is_json = not isinstance(value, str)
+            data = (json.dumps(value, ensure_ascii=False) if is_json else value).encode('utf-8')
+            index[key] = [len(blob), len(data), is_json]
+            blob.extend(data)
+    header = json.dumps({"version": TEXTS_VERSION, "sources": source_key(), "corpora": corpora},
+                        ensure_ascii=False).encode('utf-8')
+    # 先写临时文件再改名，已打开旧文件的进程仍读到完整的旧文件
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header)) + header + blob)
+    os.replace(tmp, path)
+    print(f"写入 {path}：{sum(len(item) for item in corpora.values())} 条，{(len(header) + len(blob)) / 1024:.0f} KB")
+
+
+class TextFile:
+    """只读打开 build_texts 写出的文件，首次读取时才打开"""
+
+    def __init__(self, path=TEXTS_PATH, check_sources=True):
+        """check_sources 时文件与来源模块不一致则打开时抛出 StaleTextsError"""
+        self.path = path
+        self.check_sources = check_sources
+        self.sources = None
+        self._lock = threading.Lock()
+        self._fd = None
+        self._corpora = None
+        self._base = 0
+
+    def _open(self):
+        with self._lock:
+            if self._corpora is None:
+                fd = os.open(self.path, os.O_RDONLY)
+                head = os.pread(fd, len(MAGIC) + 4, 0)
+                if head[:len(MAGIC)] != MAGIC:
+                    os.close(fd)
+                    raise ValueError(f"{self.path} 不是古籍文本文件")
+                (size,) = struct.unpack_from('<I', head, len(MAGIC))
+                meta = json.loads(os.pread(fd, size, len(MAGIC) + 4).decode('utf-8'))
+                if meta["version"] != TEXTS_VERSION:
+                    os.close(fd)
+                    raise ValueError(f"{self.path} 的版本与当前代码不一致，请重新生成")
+                if self.check_sources and meta["sources"] != source_key():
+                    os.close(fd)
+                    raise StaleTextsError(f"{self.path} 与 sizi.py、yue.py 不一致，请运行 python -m utils.bazi_texts build")
+                self._fd = fd
+                self.sources = meta["sources"]
+                self._base = len(MAGIC) + 4 + size
+                self._corpora = meta["corpora"]
+        return self._corpora
+
+    def index(self, name):
+        """语料 name 的 {键: [偏移, 长度, 是否 JSON]}"""
+        return (self._corpora or self._open())[name]
+
+    def read(self, offset, length, is_json):
+        text = os.pread(self._fd, length, self._base + offset).decode('utf-8')
+        return tuple(json.loads(text)) if is_json else text
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+            self._fd = None
+            self._corpora = None
+
+
+class TextCorpus:
+    """
+    按键读取的只读语料，用法同原来的 dict：key in corpus、corpus[key]、corpus.get(key)
+
+    texts.bin 不存在或与来源模块不一致时退回到导入来源模块。
+    """
+
+    def __init__(self, name, text_file=None, cache_size=TEXT_CACHE_SIZE):
+        self.name = name
+        self.text_file = text_file
+        self._fallback = None
+        self._get = functools.lru_cache(maxsize=cache_size)(self._load)
+
+    def _index(self):
+        if self._fallback is None:
+            try:
+                return self.text_file.index(self.name)
+            except FileNotFoundError:
+                self._fallback = _source(self.name)
+            except StaleTextsError as e:
+                logging.warning(f"{e}，改为导入来源模块")
+                self._fallback = _source(self.name)
+        return self._fallback
+
+    def _load(self, key):
+        index = self._index()
+        if index is self._fallback:
+            return index[key]
+        return self.text_file.read(*index[key])
+
+    def __contains__(self, key):
+        return key in self._index()
+
+    def __getitem__(self, key):
+        return self._get(key)
+
+    def get(self, key, default=None):
+        return self._get(key) if key in self else default
+
+    def keys(self):
+        return self._index().keys()
+
+    def __len__(self):
+        return len(self._index())
+
+    def cache_info(self):
+        return self._get.cache_info()
+
+
+TEXT_FILE = TextFile()
+# 三命通会：日干 + '日' + 时柱；穷通宝鉴：日干 + 月支
+summarys = TextCorpus("summarys", TEXT_FILE)
+months = TextCorpus("months", TEXT_FILE)
+
+
+def check_texts(path=TEXTS_PATH):
+    """逐条比较文件与来源模块，返回不一致的条数；文件记录的来源文件与当前不同时另计一条"""
+    text_file = TextFile(path, check_sources=False)
+    bad = 0
+    for name in SOURCES:
+        source = _source(name)
+        index = text_file.index(name)
+        bad += len(index.keys() ^ source.keys())
+        bad += sum(1 for key, value in source.items() if key in index and text_file.read(*index[key]) != value)
+    if text_file.sources != source_key():
+        bad += 1
+    text_file.close()
+    return bad
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="古籍文本按需读取")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="由 sizi.py、yue.py 生成 texts.bin")
+    build.add_argument("path", nargs="?", default=TEXTS_PATH)
+    check = subparsers.add_parser("check", help="检查 texts.bin 与 sizi.py、yue.py 是否一致")
+    check.add_argument("path", nargs="?", default=TEXTS_PATH)
+    options = parser.parse_args(argv)
+
+    if options.command == "build":
+        build_texts(options.path)
+    else:
+        bad = check_texts(options.path)
+        print(f"不一致 {bad} 条")
+        return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -96,7 +96,7 @@ AgentSystemMessage={
          - 所有传入的出生时间都是阳历时间，请使用分段线性插值法计算真太阳时
          - 原则：出生地若在北京西边 → 北京时间需减；东边 → 北京时间需加
          - 示例：成都（比北京西偏约15度） → 真太阳时 = 北京时间 - 1小时
-         - 调整后的真太阳时需要一一对应传入工具，date=日期，hour=时间，minute=分钟，gender=性别，period=涉及的日期，is_solar=是否为阳历数据
+         - 调整后的真太阳时需要一一对应传入工具，date=日期，hour=时间，gender=性别，from_year/to_year/granularity=分析的年份范围
       
       2. 问题理解：
          - 用户输入中【】是用户想要问的问题，你应该首先理解用户的问题。
@@ -106,10 +106,9 @@ AgentSystemMessage={
          - 调用工具前必须先进行真太阳时校准
          - 调用工具前必须根据用户的问题判断应该输入多少年，传入问题相关的年份，获取紫微斗数命盘数据。
          参数说明：
-            - period参数指的是这个list中每一个日期对应的大限与流年信息，同一年中的每一天获取的信息完全一致。
-            - 同一年指的是这一年的立春到下一年的立春，每年立春大致为2月3日-5日。
+            - from_year、to_year 为需要大限与流年信息的起止年份（含两端），工具按年份范围返回每一年的信息，无需逐个列出日期。
+            - granularity 默认为 year（每年一项）；问题跨越几十年时用 decade（每个大限一项），问题具体到月份时用 month（每月一项，范围不宜超过两年）。
             - 你需要根据用户的提问来判断用户应该获取哪些年的大限与流年信息。如果无法判断，则默认分析范围为当前年份起未来5年。
-            - 如果需要5年的数据，则需要传入5个年份的日期。
       
       <调用工具后>
       结合工具返回的数据，进行紫微斗数命盘解读。紫微斗数解读流程如下：
@@ -275,6 +274,7 @@ ToolDescription = {
       - gender（bool，默认False）：是否为女性（True表示女性）
       - solar（bool，默认False）：是否为公历（True为公历，False为农历）
       - run_month（bool，默认False）：是否为农历闰月（仅在solar为False时关注）
+      - period（list of str，可选）：问题涉及的日期列表，格式为["YYYY-MM-DD", "YYYY-MM-DD"]，大运流年只返回这些年份范围内的部分；不传时返回全部大运流年。
 
       注意：必须完成真太阳时校准后再调用工具，不能直接使用原始北京时间，否则会导致八字排盘错误。
 
@@ -292,7 +292,9 @@ ToolDescription = {
       - date（str）：真太阳时校准后的出生日期，格式为"YYYY-MM-DD"。
       - hour（int）：真太阳时校准后的出生小时，24小时制（0-23）。
       - gender（str）：性别，填写"男"或"女"。
-      - period（list of str）：需要分析的大限或流年日期列表，格式为["YYYY-MM-DD", "YYYY-MM-DD"]。注意，period中的日期只需覆盖不同年份（按立春起算年份），同一年中任选一天即可。
+      - from_year（int）、to_year（int）：需要分析的大限或流年的起止年份（含两端），例如 2025 到 2029。
+      - granularity（str）：year（默认，每年一项）、decade（每个大限一项）或 month（每月一项）。
+      - period（list of str，可选）：只需要个别年份时可改为给出日期列表，格式为["YYYY-MM-DD", "YYYY-MM-DD"]，同一年中任选一天即可。
 
       注意事项：
       - 必须完成真太阳时校准后再调用本工具，否则紫微斗数排盘结果将出现偏差。
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+启动耗时
+
+run_steps 依次执行服务就绪前的预热步骤，记录每步耗时；import_report 在子进程中以
+python -X importtime 导入给定模块，按顶层包和单个模块汇总导入耗时。
+
+用法:
+    python -m utils.startup app                 # app.py 冷启动时各模块的导入耗时
+    python -m utils.startup baziAgent -n 20
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_steps(steps):
+    """依次执行 [(步骤名, 函数)]，返回 [(步骤名, 秒, 错误)]；某步出错时记录后继续"""
+    report = []
+    for name, func in steps:
+        start = time.perf_counter()
+        error = None
+        try:
+            func()
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logging.error(f"预热 {name} 出错: {error}")
+        elapsed = time.perf_counter() - start
+        logging.info(f"预热 {name}: {elapsed * 1000:.1f} ms")
+        report.append((name, elapsed, error))
+    return report
+
+
+def import_times(modules, python=sys.executable):
+    """
+    在新的解释器中导入 modules，返回 [(模块名, 自身微秒, 累计微秒, 层级)]
+
+    层级 0 为直接导入的模块；已在解释器启动时导入的模块不计入。
+    """
+    proc = subprocess.run([python, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+                          capture_output=True, text=True, cwd=ROOT)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), int(own), int(cumulative), depth))
+    return rows
+
+
+def import_report(modules, top=15):
+    """导入耗时汇总：总耗时、各顶层包的自身耗时之和、自身耗时最多的 top 个模块，单位毫秒"""
+    rows = import_times(modules)
+    packages = {}
+    for name, own, _, _ in rows:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + own / 1000
+    return {
+        "total_ms": sum(cumulative for _, _, cumulative, depth in rows if depth == 0) / 1000,
+        "packages": dict(sorted(packages.items(), key=lambda item: -item[1])),
+        "modules": [(name, own / 1000, cumulative / 1000)
+                    for name, own, cumulative, _ in sorted(rows, key=lambda row: -row[1])[:top]],
+    }
+
+
+def print_import_report(modules, top=15):
+    """输出 import_report 的结果；导入失败时输出错误并返回 None"""
+    try:
+        report = import_report(modules, top)
+    except RuntimeError as e:
+        print(f"导入 {', '.join(modules)} 失败: {e}")
+        return None
+    print(f"导入 {', '.join(modules)}: {report['total_ms']:.1f} ms")
+    print("按包:")
+    for package, ms in list(report["packages"].items())[:top]:
+        print(f"  {package:<28} {ms:8.1f} ms")
+    print("按模块（自身 / 累计）:")
+    for name, own, cumulative in report["modules"]:
+        print(f"  {name:<40} {own:8.1f} {cumulative:8.1f} ms")
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="启动耗时")
+    parser.add_argument("modules", nargs="*", default=["app"], help="要导入的模块，默认 app")
+    parser.add_argument("-n", "--top", type=int, default=15, help="列出的包和模块数")
+    options = parser.parse_args(argv)
+    if print_import_report(options.modules, options.top) is None:
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+requests 经 Unix 域套接字发送 HTTP 请求
+
+地址写作 http+unix://<URL 编码的套接字路径>/路径，例如 unix_url("/tmp/ziwei.sock") 为
+http+unix://%2Ftmp%2Fziwei.sock。把 UnixAdapter 挂到 Session 的 http+unix:// 上后，
+与 TCP 一样使用连接池和 keep-alive，重试、超时的参数也相同。
+"""
+
+import socket
+import threading
+from urllib.parse import quote, unquote, urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+SCHEME = "http+unix://"
+
+
+def unix_url(path):
+    """套接字路径 -> 基础 URL"""
+    return SCHEME + quote(path, safe="")
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """连接到 socket_path 的 HTTPConnection"""
+
+    def __init__(self, *args, socket_path, **kwargs):
+        self.socket_path = socket_path
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except socket.timeout as e:
+            sock.close()
+            raise ConnectTimeoutError(self, f"连接 {self.socket_path} 超时") from e
+        except OSError as e:
+            sock.close()
+            raise NewConnectionError(self, f"无法连接 {self.socket_path}: {e}") from e
+        return sock
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = UnixHTTPConnection
+
+
+class UnixAdapter(HTTPAdapter):
+    """http+unix:// 的 HTTPAdapter，每个套接字路径一个连接池，参数同 HTTPAdapter"""
+
+    def __init__(self, pool_maxsize=10, max_retries=0, pool_block=False):
+        self._pools = {}
+        self._lock = threading.Lock()
+        super().__init__(pool_connections=1, pool_maxsize=pool_maxsize, max_retries=max_retries, pool_block=pool_block)
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self.get_connection(request.url, proxies)
+
+    def get_connection(self, url, proxies=None):
+        path = unquote(urlsplit(url).netloc)
+        with self._lock:
+            pool = self._pools.get(path)
+            if pool is None:
+                pool = self._pools[path] = UnixHTTPConnectionPool(
+                    "localhost", maxsize=self._pool_maxsize, block=self._pool_block, socket_path=path)
+            return pool
+
+    def close(self):
+        super().close()
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
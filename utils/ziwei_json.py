@@ -1,15 +1,395 @@
-# python_iztro/json2ziwei/solar_api.py
+"""
+紫微斗数排盘客户端和文本转换
+
+排盘由 ziwei/index.js（iztro）计算。SolarAPI 持有一个 requests.Session，连接在调用间保持
+（keep-alive），超时、连接池大小和重试次数可配置；多个线程可共享同一个实例。给出 socket_path 时
+经 Unix 域套接字连接（utils.unix_http），同样保持连接。workers 大于 0 时
+由 utils.ziwei_pool 启动并监控多个服务进程，每个请求发给未完成请求最少的进程。
+AsyncSolarAPI 在独立的线程池里调用 SolarAPI，供 asyncio 代码 await，不阻塞事件循环；
+线程池不绑定事件循环，app.py 每个任务各用一个事件循环时也可共享。
+
+SolarAPI.get_astrolabe 带两级缓存：本命盘以 (日期, 时辰, 性别, 公历/农历) 为键，运限以
+(本命盘键, 农历年) 为键。同一农历年内的大限、流年相同，period 先按农历年去重，只请求缓存中
+没有的年份；本命盘和所需年份都已缓存时不发请求。profile 为 full 时运限含随日期变化的流月、流日、流时，
+改以 (本命盘键, 日期) 为键。两级缓存各有条数上限和过期时间，cache_info() 给出命中率。
+
+period 也可以是年份范围 {"from_year": ..., "to_year": ..., "granularity": "decade" | "year" | "month"}，
+由服务端展开成日期：同一大限各年共用一份大限数据、同一年各月共用一份流年数据，
+返回后由 _share_scopes 还原成与日期列表相同的结构。
+
+批量排盘用 SolarAPI.get_astrolabe_batch：每 chunk_size 个星盘一个 /api/astro/batch 请求，
+结果以 NDJSON 逐行返回、边收边解析，同时有 in_flight 个请求在进行。
+
+每次调用（含重试）在 deadline 秒内结束；连接失败、超时和 502/503/504 按带随机抖动的指数退避重试。
+连续失败 breaker_threshold 次后熔断器打开，breaker_reset 秒内的调用直接抛出 ZiweiUnavailable，
+之后放行一次试探调用，成功则恢复。available() 供编排在服务不可用时跳过紫微斗数，
+metrics() 给出熔断器、缓存和进程池的状态。
+"""
+
+import asyncio
+import collections
+import contextlib
+import functools
+import json
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+
+from utils.unix_http import SCHEME as UNIX_SCHEME, UnixAdapter, unix_url
+
+DEFAULT_BASE_URL = "http://localhost:3000"
+# 连接超时、读取超时（秒）
+DEFAULT_TIMEOUT = (3.0, 30.0)
+# 保持的连接数，也是 AsyncSolarAPI 同时进行的请求数
+DEFAULT_POOL_SIZE = 8
+# 连接失败、超时和 502/503/504 的重试次数，间隔为 0 到 backoff * 2^n 之间的随机数（最多 MAX_BACKOFF）；
+# 排盘接口无副作用，POST 也可重试
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF = 0.2
+MAX_BACKOFF = 5.0
+RETRY_STATUSES = (502, 503, 504)
+# 一次调用（含重试）的最长秒数
+DEFAULT_DEADLINE = 20.0
+# 连续失败多少次后熔断，熔断多少秒后放行一次试探调用
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_RESET = 30.0
+# available() 检查 /health 的超时秒数
+HEALTH_TIMEOUT = 1.0
+# 本命盘、运限缓存的条数上限（0 为不缓存）和过期秒数
+DEFAULT_NATAL_CACHE = 256
+DEFAULT_HOROSCOPE_CACHE = 4096
+DEFAULT_CACHE_TTL = 3600
+# 批量排盘每个请求的星盘数（服务端上限 1000）和同时进行的请求数
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_IN_FLIGHT = 2
+# 服务端返回的字段：text 只含文本转换用到的字段，full 为 iztro 的完整对象
+DEFAULT_PROFILE = "text"
+
+CacheInfo = collections.namedtuple("CacheInfo", "hits misses expired evictions size maxsize hit_rate")
+
+
+class TTLCache:
+    """条数有上限、条目会过期的 LRU 缓存，可在多个线程间共享"""
+
+    def __init__(self, maxsize, ttl, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.expired = self.evictions = 0
+
+    def get(self, key):
+        """命中时返回值，否则返回 None"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                value, deadline = item
+                if deadline > self.clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+                self.expired += 1
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, self.clock() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.expired = self.evictions = 0
+
+    def info(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return CacheInfo(self.hits, self.misses, self.expired, self.evictions, len(self._data), self.maxsize,
+                             self.hits / total if total else 0.0)
+
+
+class ZiweiUnavailable(requests.ConnectionError):
+    """熔断器打开，紫微斗数服务暂不可用"""
+
+
+class CircuitBreaker:
+    """
+    熔断器：closed 时放行全部调用；连续失败 threshold 次后 open，reset_timeout 秒内拒绝调用；
+    之后 half_open，只放行一次试探调用，成功则 closed，失败则重新 open。可在多个线程间共享
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, threshold=DEFAULT_BREAKER_THRESHOLD, reset_timeout=DEFAULT_BREAKER_RESET, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_at = None
+        self.consecutive_failures = 0
+        self.successes = self.failures = self.rejections = self.opened = 0
+        self.last_error = None
+        self.last_failure_at = None
+
+    def _current(self):
+        if self._state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_at = None
+        return self._state
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current()
+
+    def allow(self):
+        """是否放行本次调用；half_open 时只放行一次试探调用（试探超过 reset_timeout 未结束时再放行一次）"""
+        with self._lock:
+            state = self._current()
+            if state == self.CLOSED:
+                return True
+            now = self.clock()
+            if state == self.HALF_OPEN and (self._trial_at is None or now - self._trial_at >= self.reset_timeout):
+                self._trial_at = now
+                return True
+            self.rejections += 1
+            return False
+
+    def retry_after(self):
+        """熔断中时距放行试探调用的秒数，否则为 0"""
+        with self._lock:
+            if self._current() != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self.clock())
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            self._state = self.CLOSED
+            self._trial_at = None
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = None if error is None else f"{type(error).__name__}: {error}"
+            self.last_failure_at = time.time()
+            state = self._current()
+            if state == self.HALF_OPEN or (state == self.CLOSED and self.consecutive_failures >= self.threshold):
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+                self._trial_at = None
+                self.opened += 1
+
+    def info(self):
+        with self._lock:
+            state = self._current()
+            retry_after = max(0.0, self._opened_at + self.reset_timeout - self.clock()) if state == self.OPEN else 0.0
+            return {"state": state, "consecutive_failures": self.consecutive_failures, "threshold": self.threshold,
+                    "reset_timeout": self.reset_timeout, "retry_after": retry_after, "successes": self.successes,
+                    "failures": self.failures, "rejections": self.rejections, "opened": self.opened,
+                    "last_error": self.last_error, "last_failure_at": self.last_failure_at}
+
+
+def _date_key(date):
+    """日期字符串 -> (年, 月, 日)，无法解析时原样返回"""
+    match = re.match(r"\s*(\d{1,4})-(\d{1,2})-(\d{1,2})", str(date))
+    return tuple(int(item) for item in match.groups()) if match else date
+
+
+def _period_year(date):
+    """period 中的日期 -> 所在农历年；无法解析时原样返回，不与其他日期合并"""
+    from utils.bazi_calendar import lunar_year
+
+    key = _date_key(date)
+    if isinstance(key, tuple):
+        try:
+            return lunar_year(*key)
+        except ValueError:
+            pass
+    return date
+
+
+GRANULARITIES = ("decade", "year", "month")
+
+
+def _lunar_date_text(year, month, day):
+    """公历日期 -> 与 iztro 的 lunarDate 相同格式的农历日期，如 二〇二四年四月廿五"""
+    from lunar_python import Solar
+
+    lunar = Solar.fromYmd(year, month, day).getLunar()
+    return f"{lunar.getYearInChinese()}年{lunar.getMonthInChinese()}月{lunar.getDayInChinese()}"
+
+
+def _dated(horoscope, date):
+    """
+    缓存中同一农历年的运限 -> date 的运限：大限、流年相同，只把 solarDate、lunarDate 换成 date 的，
+    不改动缓存中的条目；date 无法解析或日期相同时原样返回
+    """
+    key = _date_key(date)
+    if not isinstance(key, tuple):
+        return horoscope
+    solar_date = "{}-{}-{}".format(*key)
+    if horoscope.get('solarDate') == solar_date:
+        return horoscope
+    return {**horoscope, 'solarDate': solar_date, 'lunarDate': _lunar_date_text(*key)}
+
+
+def year_range(from_year, to_year=None, granularity="year"):
+    """年份范围形式的 period，to_year 缺省时同 from_year"""
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"granularity 只能是 {'、'.join(GRANULARITIES)}")
+    return {"from_year": int(from_year), "to_year": int(from_year if to_year is None else to_year),
+            "granularity": granularity}
+
+
+def _period_fields(period):
+    """period -> 请求体中的 period 或 range 字段"""
+    return {"range": period} if isinstance(period, dict) else {"period": period}
+
+
+def _share_scopes(data):
+    """把 range 请求返回的 scopes 下标换回大限、流年数据，结构同 period 请求"""
+    scopes = data.pop('scopes', None)
+    if scopes:
+        for item in data.get('arr', []):
+            for name in ('decadal', 'yearly'):
+                if isinstance(item.get(name), int):
+                    item[name] = scopes[name][item[name]]
+    return data
+
 
 class SolarAPI:
-    def __init__(self, base_url):
+    def __init__(self, base_url=DEFAULT_BASE_URL, timeout=DEFAULT_TIMEOUT, pool_size=DEFAULT_POOL_SIZE,
+                 retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF, natal_cache=DEFAULT_NATAL_CACHE,
+                 horoscope_cache=DEFAULT_HOROSCOPE_CACHE, cache_ttl=DEFAULT_CACHE_TTL, profile=DEFAULT_PROFILE,
+                 workers=0, node="node", pool=None, socket_path=None, deadline=DEFAULT_DEADLINE,
+                 breaker_threshold=DEFAULT_BREAKER_THRESHOLD, breaker_reset=DEFAULT_BREAKER_RESET):
         """初始化 SolarAPI 类
         
         :param base_url: API 的基础 URL
+        :param timeout: 单次请求的超时秒数，(连接, 读取) 或一个数
+        :param pool_size: 保持的连接数
+        :param retries: 连接失败、超时和 502/503/504 时的重试次数
+        :param backoff: 重试间隔的基数（秒），实际间隔为 0 到 backoff * 2^n 之间的随机数
+        :param natal_cache: 缓存的本命盘条数，0 为不缓存
+        :param horoscope_cache: 缓存的运限条数，0 为不缓存
+        :param cache_ttl: 缓存过期秒数
+        :param profile: 服务端返回的字段，text 或 full
+        :param workers: 大于 0 时由 utils.ziwei_pool 启动这么多个服务进程并分配请求，不用 base_url
+        :param node: workers 大于 0 时使用的 node 可执行文件
+        :param pool: 已启动的 ZiweiPool，给出时不用 base_url 和 workers
+        :param socket_path: 服务监听的 Unix 域套接字路径，给出时不用 base_url；workers 大于 0 时
+            各进程改为监听 socket_path 加序号的套接字
+        :param deadline: 一次调用（含重试）的最长秒数，到收到响应头为止
+        :param breaker_threshold: 连续失败多少次后熔断
+        :param breaker_reset: 熔断多少秒后放行一次试探调用
+        """
+        if pool is None and workers > 0:
+            from utils.ziwei_pool import get_pool
+            pool = get_pool(workers, node, socket_path)
+        self.pool = pool
+        self.base_url = unix_url(socket_path) if socket_path else base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.profile = profile
+        self.retries = retries
+        self.backoff = backoff
+        self.deadline = deadline
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset)
+        self.session = requests.Session()
+        # 重试由 _request 负责（受 deadline 限制、计入熔断器），连接池本身不重试。
+        # pool_block：连接都在用时等待空闲连接，而不是临时新建一个用完即关的连接
+        hosts = len(pool.workers) if pool is not None else 1
+        adapter = HTTPAdapter(pool_connections=hosts, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.mount(UNIX_SCHEME, UnixAdapter(pool_maxsize=pool_size, pool_block=True))
+        self.session.headers["Content-Type"] = "application/json"
+        self.natal_cache = TTLCache(natal_cache, cache_ttl)
+        self.horoscope_cache = TTLCache(horoscope_cache, cache_ttl)
+
+    def _timeout(self, remaining):
+        """单次请求的超时，不超过调用剩余的时间"""
+        if isinstance(self.timeout, tuple):
+            return tuple(min(item, remaining) for item in self.timeout)
+        return min(self.timeout, remaining) if self.timeout is not None else remaining
+
+    @contextlib.contextmanager
+    def _lease(self, tried, remaining):
+        """有进程池时选一个未完成请求最少的进程（尽量避开失败过的），否则为 base_url"""
+        if self.pool is None:
+            yield self.base_url
+            return
+        exclude = tried if len(tried) < len(self.pool.workers) else ()
+        with self.pool.lease(timeout=remaining, exclude=exclude) as base_url:
+            yield base_url
+
+    @contextlib.contextmanager
+    def _request(self, method, path, deadline=None, retries=None, **kwargs):
         """
-        self.base_url = base_url
+        发送请求，产出响应。连接失败、超时和 502/503/504 时按带抖动的指数退避重试（有进程池时换一个进程），
+        重试全部失败或超过 deadline 时抛出最后一次的异常；熔断器打开时直接抛出 ZiweiUnavailable
+        """
+        if not self.breaker.allow():
+            raise ZiweiUnavailable(f"紫微斗数服务暂不可用，{self.breaker.retry_after():.0f} 秒后重试")
+        end = time.monotonic() + (self.deadline if deadline is None else deadline)
+        retries = self.retries if retries is None else retries
+        tried = set()
+        response = error = None
+        for attempt in range(retries + 1):
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                break
+            stack = contextlib.ExitStack()
+            base_url = None
+            try:
+                base_url = stack.enter_context(self._lease(tried, remaining))
+                tried.add(base_url)
+                response = stack.enter_context(self.session.request(
+                    method, base_url + path, timeout=self._timeout(end - time.monotonic()), **kwargs))
+                if response.status_code in RETRY_STATUSES:
+                    raise requests.HTTPError(f"{response.status_code} {response.reason}", response=response)
+                break
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                stack.close()
+                response, error = None, e
+                if self.pool is not None and base_url is not None and not isinstance(e, requests.HTTPError):
+                    self.pool.failed(base_url)
+                if attempt < retries:
+                    delay = random.uniform(0, min(MAX_BACKOFF, self.backoff * 2 ** attempt))
+                    time.sleep(max(0.0, min(delay, end - time.monotonic())))
+            except BaseException:
+                stack.close()
+                raise
+        if response is None:
+            error = error or requests.Timeout(f"{self.deadline if deadline is None else deadline} 秒内未完成")
+            self.breaker.record_failure(error)
+            raise error
+        self.breaker.record_success()
+        with stack:
+            try:
+                yield response
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # 读取响应体时断开或超时
+                self.breaker.record_failure(e)
+                raise
 
     def get_astrolabe_data(self, date, timezone, gender, period, is_solar=True):
         """发送 POST 请求以获取星盘数据
@@ -17,27 +397,199 @@ class SolarAPI:
         :param date: 日期字符串，格式为 "YYYY-MM-DD"
         :param timezone: 时区偏移量
         :param gender: 性别字符串
+        :param period: 日期列表，或 year_range() 给出的年份范围
         :param is_solar: 是否为阳历数据
         :return: 响应的 JSON 数据
         """
         endpoint = "solar" if is_solar else "lunar"
-        url = f"{self.base_url}/api/astro/{endpoint}"
-        headers = {
-            "Content-Type": "application/json"
-        }
         data = {
             "date": date,
             "timezone": timezone,
             "gender": gender,
-            "period": period
+            "profile": self.profile,
+            **_period_fields(period)
         }
 
-        response = requests.post(url, headers=headers, data=json.dumps(data))
-
-        if response.status_code == 200:
-            return response.json()
-        else:
+        with self._request("POST", f"/api/astro/{endpoint}", json=data) as response:
             response.raise_for_status()  # 抛出异常以处理错误
+            return _share_scopes(response.json())
+
+    def _post_batch(self, items):
+        payload = [{"date": date, "timezone": timezone, "gender": gender, "calendar": "solar" if is_solar else "lunar",
+                    **_period_fields(period)}
+                   for date, timezone, gender, period, is_solar in items]
+        results = [None] * len(items)
+        with self._request("POST", "/api/astro/batch", json={"items": payload, "profile": self.profile},
+                        headers={"Accept": "application/x-ndjson"}, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    item = json.loads(line)
+                    results[item["index"]] = (_share_scopes(item["result"]) if "result" in item
+                                              else {"error": item.get("error", "未知错误")})
+        if None in results:
+            # 服务端中途断开
+            raise requests.ConnectionError(f"批量排盘只返回了 {len(items) - results.count(None)}/{len(items)} 项")
+        return results
+
+    def get_astrolabe_batch(self, items, chunk_size=DEFAULT_BATCH_SIZE, in_flight=DEFAULT_BATCH_IN_FLIGHT):
+        """
+        批量获取星盘数据，不经过缓存
+
+        :param items: [(date, timezone, gender, period, is_solar)]，参数同 get_astrolabe_data，period 可为年份范围
+        :param chunk_size: 每个请求的星盘数
+        :param in_flight: 同时进行的请求数
+        :return: 与 items 同序的列表，每项同 get_astrolabe_data 的返回值；出错的项为 {"error": 错误信息}
+        """
+        items = [tuple(item) for item in items]
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+        if len(chunks) <= 1 or in_flight <= 1:
+            return [result for chunk in chunks for result in self._post_batch(chunk)]
+        with ThreadPoolExecutor(min(in_flight, len(chunks)), thread_name_prefix="ziwei-batch") as executor:
+            return [result for chunk in executor.map(self._post_batch, chunks) for result in chunk]
+
+    def get_astrolabe(self, date, timezone, gender, period, is_solar=True):
+        """
+        同 get_astrolabe_data，经过两级缓存
+
+        period 按农历年去重，arr 中每个农历年一项，取该年在 period 中第一次出现的日期，
+        顺序同 period；命中缓存时 solarDate、lunarDate 也是这个日期。profile 为 full 时运限还含流月、
+        流日、流时，随日期变化，改为按日期去重和缓存。period 为年份范围时见 get_astrolabe_range。
+        """
+        if isinstance(period, dict):
+            return self.get_astrolabe_range(date, timezone, gender, is_solar=is_solar, **period)
+        natal_key = (_date_key(date), timezone, gender, is_solar)
+        period_key = _period_year if self.profile == "text" else _date_key
+        years = {}
+        for item in period:
+            years.setdefault(period_key(item), item)
+
+        natal = self.natal_cache.get(natal_key)
+        horoscopes = {}
+        missing = []
+        for year, item in years.items():
+            horoscope = self.horoscope_cache.get((natal_key, year))
+            if horoscope is None:
+                missing.append(year)
+            else:
+                horoscopes[year] = _dated(horoscope, item)
+
+        name = "astrolabeSolar" if is_solar else "astrolabeLunar"
+        if natal is None or missing:
+            data = self.get_astrolabe_data(date, timezone, gender, [years[year] for year in missing], is_solar)
+            natal = data.get(name)
+            self.natal_cache.put(natal_key, natal)
+            for year, horoscope in zip(missing, data.get('arr', [])):
+                horoscopes[year] = horoscope
+                self.horoscope_cache.put((natal_key, year), horoscope)
+        return {name: natal, "arr": [horoscopes[year] for year in years]}
+
+    def get_astrolabe_range(self, date, timezone, gender, from_year, to_year=None, granularity="year", is_solar=True):
+        """
+        按年份范围获取星盘数据，经过缓存
+
+        按年时每年一项，与按日期列表请求共用运限缓存（profile 为 full 时日期列表按日期缓存，
+        不与之共用），都已缓存时不发请求；按大限（每个大限一项）和按月（每月一项）时只缓存本命盘。
+        """
+        period = year_range(from_year, to_year, granularity)
+        natal_key = (_date_key(date), timezone, gender, is_solar)
+        name = "astrolabeSolar" if is_solar else "astrolabeLunar"
+        years = range(period["from_year"], period["to_year"] + 1)
+        if granularity == "year":
+            natal = self.natal_cache.get(natal_key)
+            horoscopes = [self.horoscope_cache.get((natal_key, year)) for year in years]
+            if natal is not None and None not in horoscopes:
+                # 与服务端一致，每年取 6 月 1 日
+                return {name: natal, "arr": [_dated(horoscope, f"{year}-6-1")
+                                             for year, horoscope in zip(years, horoscopes)]}
+
+        data = self.get_astrolabe_data(date, timezone, gender, period, is_solar)
+        self.natal_cache.put(natal_key, data.get(name))
+        if granularity == "year":
+            # 服务端按年取每年 6 月 1 日，所在农历年即该年
+            for year, horoscope in zip(years, data.get('arr', [])):
+                self.horoscope_cache.put((natal_key, year), horoscope)
+        return data
+
+    def cache_info(self):
+        """两级缓存的命中情况"""
+        return {"natal": self.natal_cache.info(), "horoscope": self.horoscope_cache.info()}
+
+    def available(self, probe=True):
+        """
+        服务是否可用：熔断中为 False；probe 时另请求一次 /health（不重试，结果计入熔断器）。
+        编排据此在服务不可用时跳过紫微斗数，而不是让智能体调用工具后再处理错误
+        """
+        if self.breaker.state == CircuitBreaker.OPEN:
+            return False
+        if not probe:
+            return True
+        try:
+            with self._request("GET", "/health", deadline=HEALTH_TIMEOUT, retries=0) as response:
+                return response.ok
+        except requests.RequestException:
+            return False
+
+    def metrics(self):
+        """熔断器、缓存和进程池的状态，可直接转成 JSON"""
+        return {"breaker": self.breaker.info(),
+                "cache": {name: info._asdict() for name, info in self.cache_info().items()},
+                "pool": self.pool.stats() if self.pool is not None else None}
+
+    def close(self):
+        self.session.close()
+
+
+class AsyncSolarAPI:
+    """SolarAPI 的异步版本：在 pool_size 个线程中调用同一个 SolarAPI"""
+
+    def __init__(self, api):
+        self.api = api
+        self._executor = ThreadPoolExecutor(api.pool_size, thread_name_prefix="ziwei")
+
+    async def _call(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def get_astrolabe_data(self, date, timezone, gender, period, is_solar=True):
+        """同 SolarAPI.get_astrolabe_data"""
+        return await self._call(self.api.get_astrolabe_data, date, timezone, gender, period, is_solar)
+
+    async def get_astrolabe(self, date, timezone, gender, period, is_solar=True):
+        """同 SolarAPI.get_astrolabe，与之共用缓存"""
+        return await self._call(self.api.get_astrolabe, date, timezone, gender, period, is_solar)
+
+    async def get_astrolabe_batch(self, items, chunk_size=DEFAULT_BATCH_SIZE, in_flight=DEFAULT_BATCH_IN_FLIGHT):
+        """同 SolarAPI.get_astrolabe_batch"""
+        return await self._call(self.api.get_astrolabe_batch, items, chunk_size, in_flight)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.api.close()
+
+
+def get_client(base_url=DEFAULT_BASE_URL, **options):
+    """
+    每个进程按地址和选项共享一个 SolarAPI，options 同 SolarAPI 的参数
+
+    base_url 按位置还是按关键字给出、options 的顺序都不影响取到的实例，
+    熔断器、缓存和连接池在工具、健康检查和状态接口之间共用。
+    """
+    return _client(base_url, tuple(sorted(options.items())))
+
+
+def get_async_client(base_url=DEFAULT_BASE_URL, **options):
+    """每个进程按地址和选项共享一个 AsyncSolarAPI，其 api 即 get_client 的同一个 SolarAPI"""
+    return _async_client(base_url, tuple(sorted(options.items())))
+
+
+@functools.lru_cache(maxsize=None)
+def _client(base_url, options):
+    return SolarAPI(base_url, **dict(options))
+
+
+@functools.lru_cache(maxsize=None)
+def _async_client(base_url, options):
+    return AsyncSolarAPI(_client(base_url, options))
 
 
 def convert_palace_json_to_text(json_data):
@@ -233,6 +785,27 @@ def convert_yearly_json_to_text(yearly_json_data):
             if suiqian12:
                 output_lines.append(f"流年岁前12神：{', '.join(suiqian12)}")
     
+    # 流月信息（按月请求年份范围时才有）
+    monthly_info = yearly_json_data.get('monthly', {})
+    if monthly_info:
+        output_lines.append(f"流月：{monthly_info.get('name', '')}，天干为{monthly_info.get('heavenlyStem', '')}，地支为{monthly_info.get('earthlyBranch', '')}")
+        
+        mutagen = monthly_info.get('mutagen', [])
+        if mutagen:
+            output_lines.append(f"流月四化星：{', '.join(mutagen)}")
+        
+        palace_names = monthly_info.get('palaceNames', [])
+        star_descriptions = []
+        for i, palace_stars in enumerate(monthly_info.get('stars', [])):
+            if palace_stars:
+                palace_name = palace_names[i] if i < len(palace_names) else f"宫位{i+1}"
+                star_names = [f"{star.get('name', '')}（{star.get('type', '')}，{star.get('scope', '')}）" for star in palace_stars]
+                star_descriptions.append(f"{palace_name}宫：{', '.join(star_names)}")
+        if star_descriptions:
+            output_lines.append("流月星耀分布：")
+            for desc in star_descriptions:
+                output_lines.append(f"  {desc}")
+    
     return "\n".join(output_lines)
 
 def convert_yearly_array_to_text(yearly_array):
@@ -258,48 +831,159 @@ def convert_yearly_array_to_text(yearly_array):
     output_lines.append("---------大限与流年信息----------")
     return "\n".join(output_lines)
 
-def get_astrolabe_text(date, hour, gender, period, is_solar=True, base_url="http://localhost:3000"):
+# 紧凑文本：宫位排成固定列的表格，星耀用简写，图例说明一次；与上面的文本信息相同
+STAR_TYPES = {"major": "主", "soft": "吉", "tough": "煞", "adjective": "杂", "flower": "桃", "helper": "解",
+              "lucun": "存", "tianma": "马"}
+STAR_SCOPES = {"origin": "本", "decadal": "限", "yearly": "年", "monthly": "月", "daily": "日", "hourly": "时"}
+COMPACT_LEGEND = ("图例：星耀写作 星名:亮度四化（亮度为庙旺得利平不陷，四化为禄权科忌，无则省略）；"
+                  "运限星耀写作 星名/类型（" + " ".join(f"{code}={name}" for name, code in (
+                      ("主星", "主"), ("吉星", "吉"), ("煞星", "煞"), ("杂耀", "杂"), ("桃花", "桃"), ("解神", "解"),
+                      ("禄存", "存"), ("天马", "马"))) +
+                  "）；星耀不属于所在盘时后缀 @本/@限/@年/@月；标记 身=身宫 来=来因宫；四化星按禄权科忌的顺序；同上=与上一段相同；空栏为无。")
+PALACE_COLUMNS = "宫|名称|标记|干支|主星|辅星|杂耀|长生|博士|将前|岁前|大限|小限"
+
+
+def compact_star(star, scope="origin", with_type=False):
+    """星耀 -> 简写，scope 为所在盘的范围，星耀的范围与之不同时加后缀"""
+    text = star.get('name', '')
+    if with_type and star.get('type'):
+        text += "/" + STAR_TYPES.get(star['type'], star['type'])
+    suffix = (star.get('brightness') or "") + (star.get('mutagen') or "")
+    if suffix:
+        text += ":" + suffix
+    if star.get('scope', scope) != scope:
+        text += "@" + STAR_SCOPES.get(star['scope'], star['scope'])
+    return text
+
+
+def _stars(stars, scope="origin", with_type=False):
+    return ",".join(compact_star(star, scope, with_type) for star in stars or ())
+
+
+def convert_palace_json_to_compact(json_data):
+    """单个宫位 -> 表格中的一行，列同 PALACE_COLUMNS"""
+    flags = ("身" if json_data.get('isBodyPalace') else "") + ("来" if json_data.get('isOriginalPalace') else "")
+    decadal = json_data.get('decadal')
+    decadal_text = (f"{decadal['range'][0]}-{decadal['range'][1]}{decadal['heavenlyStem']}{decadal['earthlyBranch']}"
+                    if decadal else "")
+    return "|".join(str(item) for item in (
+        json_data['index'], json_data['name'], flags, f"{json_data['heavenlyStem']}{json_data['earthlyBranch']}",
+        _stars(json_data['majorStars']), _stars(json_data['minorStars']), _stars(json_data['adjectiveStars']),
+        json_data['changsheng12'], json_data['boshi12'], json_data['jiangqian12'], json_data['suiqian12'],
+        decadal_text, ",".join(map(str, json_data.get('ages') or ()))))
+
+
+def convert_main_json_to_compact(main_json_data):
+    """本命盘 -> 紧凑文本：一行基本信息加宫位表"""
+    fields = (("性别", 'gender'), ("阳历", 'solarDate'), ("阴历", 'lunarDate'), ("八字", 'chineseDate'),
+              ("时辰", 'time'), ("时段", 'timeRange'), ("星座", 'sign'), ("生肖", 'zodiac'),
+              ("身宫支", 'earthlyBranchOfBodyPalace'), ("命宫支", 'earthlyBranchOfSoulPalace'),
+              ("命主", 'soul'), ("身主", 'body'), ("五行局", 'fiveElementsClass'))
+    output_lines = ["【本命】" + " ".join(f"{name}:{main_json_data[key]}" for name, key in fields
+                                         if main_json_data.get(key))]
+    palaces_data = main_json_data.get('palaces')
+    if palaces_data and isinstance(palaces_data, list):
+        output_lines.append(PALACE_COLUMNS)
+        output_lines.extend(convert_palace_json_to_compact(palace) for palace in palaces_data)
+    else:
+        output_lines.append("宫位信息：数据格式不正确或缺失")
+    return "\n".join(output_lines)
+
+
+def _compact_scope(name, scope_data, scope):
+    """大限或流年 -> 一行概要和一行星耀分布"""
+    lines = [f"{name}:{scope_data.get('name', '')} {scope_data.get('heavenlyStem', '')}{scope_data.get('earthlyBranch', '')}"
+             + (f" 四化:{','.join(scope_data['mutagen'])}" if scope_data.get('mutagen') else "")]
+    palace_names = scope_data.get('palaceNames', [])
+    stars = [f"{palace_names[i] if i < len(palace_names) else f'宫位{i + 1}'}={_stars(palace_stars, scope, True)}"
+             for i, palace_stars in enumerate(scope_data.get('stars') or ()) if palace_stars]
+    if stars:
+        lines.append(f" {name}星:" + ";".join(stars))
+    return lines
+
+
+def convert_yearly_array_to_compact(yearly_array):
+    """运限数组 -> 紧凑文本，每个日期一段"""
+    output_lines = ["【大限与流年】"]
+    previous = {}
+    for yearly_data in yearly_array:
+        output_lines.append(f"〔{yearly_data.get('solarDate', '未知')} 阴历{yearly_data.get('lunarDate', '未知')}〕")
+        if yearly_data.get('decadal'):
+            # 与上一段相同的大限、流年（同一大限内的各年、同一年内的各月）只写“同上”
+            if yearly_data['decadal'] == previous.get('decadal'):
+                output_lines.append("大限:同上")
+            else:
+                output_lines.extend(_compact_scope("大限", yearly_data['decadal'], "decadal"))
+        yearly_info = yearly_data.get('yearly')
+        if yearly_info and yearly_info == previous.get('yearly'):
+            output_lines.append("流年:同上")
+        elif yearly_info:
+            output_lines.extend(_compact_scope("流年", yearly_info, "yearly"))
+            dec_star = yearly_info.get('yearlyDecStar') or {}
+            gods = [f"{name}:{','.join(dec_star[key])}" for name, key in (("将前", 'jiangqian12'), ("岁前", 'suiqian12'))
+                    if dec_star.get(key)]
+            if gods:
+                output_lines.append(" " + " ".join(gods))
+        if yearly_data.get('monthly'):
+            output_lines.extend(_compact_scope("流月", yearly_data['monthly'], "monthly"))
+        previous = yearly_data
+    return "\n".join(output_lines)
+
+
+def hour_to_timezone(hour):
+    """将小时 (0-23) 转换为时辰序号，23:00-1:00 为 0"""
+    return (hour + 1) // 2 % 12
+
+
+def astrolabe_text(json_data, compact=False):
+    """将星盘接口返回的数据转换为本命盘和流年的文本描述，compact 时用紧凑文本"""
+    # 获取本命盘数据（按农历排盘时键为 astrolabeLunar）
+    main_data = json_data.get('astrolabeSolar') or json_data.get('astrolabeLunar')
+    # 获取流年数据
+    yearly_array = json_data.get('arr', [])
+    
+    if compact:
+        return "\n".join((COMPACT_LEGEND, convert_main_json_to_compact(main_data),
+                          convert_yearly_array_to_compact(yearly_array)))
+
+    # 转换本命盘数据为文本
+    main_text = convert_main_json_to_text(main_data)
+    # 转换流年数据为文本
+    yearly_text = convert_yearly_array_to_text(yearly_array)
+    
+    # 组合所有文本
+    return f"{main_text}\n\n{yearly_text}"
+
+
+def get_astrolabe_text(date, hour, gender, period, is_solar=True, base_url=DEFAULT_BASE_URL, compact=False, **options):
     """
     获取紫微斗数文本描述，包括本命盘和流年信息。
 
     参数:
     date (str): 日期字符串，格式为 "YYYY-MM-DD"
     hour (int): 小时 (0-23)
-    minute (int): 分钟 (0-59)
     gender (str): 性别
-    period (list): 时间段，格式为 ["YYYY-MM-DD", "YYYY-MM-DD"]
+    period (list | dict): 时间段，格式为 ["YYYY-MM-DD", "YYYY-MM-DD"]，同一农历年的日期只输出一次；
+        也可以是 year_range() 给出的年份范围
     is_solar (bool): 是否为阳历数据，默认为 True
     base_url (str): API 的基础 URL，默认为 "http://localhost:3000"
+    compact (bool): 是否输出紧凑文本（宫位表格加图例），默认为 False
+    options: 超时、连接池等客户端选项，见 SolarAPI
 
     返回:
     str: 完整的紫微斗数文本描述
     """
-    # 将时间转换为时辰序号
-    timezone = (hour + 1) // 2
-    if timezone == 12:  # 处理23:00-1:00的情况
-        timezone = 0
-    
-    # 初始化 API 客户端
-    solar_api = SolarAPI(base_url)
-    
-    # 获取星盘数据
-    json_data = solar_api.get_astrolabe_data(date, timezone, gender, period, is_solar)
-    
-    # 获取本命盘数据
-    main_data = json_data.get('astrolabeSolar')
-    # 获取流年数据
-    yearly_array = json_data.get('arr', [])
-    
-    # 转换本命盘数据为文本
-    main_text = convert_main_json_to_text(main_data)
-    # 转换流年数据为文本
-    yearly_text = convert_yearly_array_to_text(yearly_array)
-    
-    # 组合所有文本
-    combined_text = f"{main_text}\n\n{yearly_text}"
-    
-    return combined_text
+    json_data = get_client(base_url, **options).get_astrolabe(date, hour_to_timezone(hour), gender, period, is_solar)
+    return astrolabe_text(json_data, compact)
+
+
+async def get_astrolabe_text_async(date, hour, gender, period, is_solar=True, base_url=DEFAULT_BASE_URL, compact=False,
+                                   **options):
+    """get_astrolabe_text 的异步版本，请求在客户端的线程池中进行"""
+    client = get_async_client(base_url, **options)
+    json_data = await client.get_astrolabe(date, hour_to_timezone(hour), gender, period, is_solar)
+    return astrolabe_text(json_data, compact)
 
 # 示例使用
-#result = get_astrolabe_text("2000-8-16", 14, 30, "女", ["2025-01-01", "2026-01-02"])
+#result = get_astrolabe_text("2000-8-16", 14, "女", ["2025-01-01", "2026-01-02"])
 #print(result)
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+紫微斗数服务进程池
+
+ziwei/index.js 是单线程的 Node 进程。ZiweiPool 启动 size 个这样的进程（端口由系统分配），
+后台线程定时检查：进程退出或连续 MAX_FAILURES 次健康检查（GET /health）失败时重启，
+重启间隔按次数指数增长。lease() 从健康的进程中选正在处理的请求最少的一个；
+请求连接失败时调用方用 failed() 报告，换一个进程重试。
+
+socket_path 给出时各进程改为监听 Unix 域套接字。SolarAPI(workers=N) 会通过 get_pool 共享一个进程池，
+也可单独运行：
+    python -m utils.ziwei_pool check -n 4                  # 启动 4 个进程，排一张盘后输出各进程状态
+    python -m utils.ziwei_pool --socket /tmp/ziwei.sock check -n 4
+    python -m utils.ziwei_pool bench -n 1000               # TCP 与 Unix 域套接字的往返耗时
+"""
+
+import argparse
+import atexit
+import contextlib
+import functools
+import logging
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+import requests
+
+from utils.unix_http import SCHEME as UNIX_SCHEME, UnixAdapter, unix_url
+
+ZIWEI_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ziwei")
+# 健康检查间隔、超时（秒），连续失败多少次后重启
+HEALTH_INTERVAL = 5.0
+HEALTH_TIMEOUT = 2.0
+MAX_FAILURES = 3
+# 进程启动后等待其报告端口的秒数，重启间隔的上限
+START_TIMEOUT = 15.0
+MAX_RESTART_DELAY = 30.0
+
+_ADDRESS_PATTERN = re.compile(r"访问地址: (?:http://localhost:(\d+)|unix:(\S+))")
+
+
+class ZiweiWorker:
+    """一个 node index.js 进程"""
+
+    def __init__(self, seq, node="node", script="index.js", cwd=ZIWEI_DIR, socket_path=None):
+        self.seq = seq
+        self.socket_path = socket_path
+        self.node = node
+        self.script = script
+        self.cwd = cwd
+        self.process = None
+        self.base_url = None
+        self.healthy = False
+        self.failures = 0
+        self.outstanding = 0
+        self.served = 0
+        self.restarts = 0
+        self.next_start = 0.0
+        self._ready = threading.Event()
+
+    def start(self):
+        """启动进程，端口由系统分配（或监听 socket_path），地址从其输出的第一行读出"""
+        self.healthy = False
+        self.failures = 0
+        self.base_url = None
+        self._ready.clear()
+        env = dict(os.environ, PORT="0", ZIWEI_SUPERVISED="1")
+        if self.socket_path:
+            env["SOCKET"] = self.socket_path
+        self.process = subprocess.Popen([self.node, self.script], cwd=self.cwd, env=env, stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, text=True, encoding="utf-8", errors="replace")
+        threading.Thread(target=self._read_output, args=(self.process,), name=f"ziwei-{self.seq}-output",
+                         daemon=True).start()
+
+    def _read_output(self, process):
+        # 一直读到进程退出，避免管道写满阻塞 node
+        for line in process.stdout:
+            match = _ADDRESS_PATTERN.search(line)
+            if match and not self._ready.is_set() and process is self.process:
+                port, path = match.groups()
+                self.base_url = unix_url(path) if path else f"http://127.0.0.1:{port}"
+                self._ready.set()
+            logging.info(f"紫微斗数进程 {self.seq}: {line.rstrip()}")
+
+    def wait_ready(self, timeout=START_TIMEOUT):
+        return self._ready.wait(timeout)
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def check(self, session, timeout=HEALTH_TIMEOUT):
+        """健康检查，返回是否健康"""
+        if not self.alive() or self.base_url is None:
+            return False
+        try:
+            response = session.get(f"{self.base_url}/health", timeout=timeout)
+            return response.status_code == 200
+        except requests.RequestException:
+            return False
+
+    def stop(self, timeout=5.0):
+        self.healthy = False
+        process, self.process = self.process, None
+        if process is None:
+            return
+        with contextlib.suppress(OSError):
+            process.stdin.close()
+        process.terminate()
+        try:
+            process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if self.socket_path:
+            with contextlib.suppress(OSError):
+                os.unlink(self.socket_path)
+
+    def stats(self):
+        return {"seq": self.seq, "pid": self.process.pid if self.process else None, "base_url": self.base_url,
+                "healthy": self.healthy, "outstanding": self.outstanding, "served": self.served,
+                "restarts": self.restarts}
+
+
+class ZiweiPool:
+    """size 个 ZiweiWorker，后台线程做健康检查并重启失败的进程，lease() 按最少未完成请求分配"""
+
+    def __init__(self, size, node="node", script="index.js", cwd=ZIWEI_DIR, health_interval=HEALTH_INTERVAL,
+                 socket_path=None):
+        """socket_path 给出时各进程监听 Unix 域套接字 socket_path.<序号>，否则监听系统分配的端口"""
+        if size < 1:
+            raise ValueError("进程数至少为 1")
+        self.workers = [ZiweiWorker(seq, node, script, cwd, f"{socket_path}.{seq}" if socket_path else None)
+                        for seq in range(size)]
+        self.health_interval = health_interval
+        self._session = requests.Session()
+        self._session.mount(UNIX_SCHEME, UnixAdapter())
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self, wait=True):
+        """启动全部进程和监控线程；wait 时等到各进程首次健康检查完成"""
+        with self._condition:
+            if self._thread is not None:
+                return self
+            for worker in self.workers:
+                worker.start()
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._supervise, name="ziwei-pool", daemon=True)
+            self._thread.start()
+        if wait:
+            for worker in self.workers:
+                worker.wait_ready()
+                self._update(worker, worker.check(self._session))
+        return self
+
+    def _update(self, worker, healthy):
+        with self._condition:
+            worker.failures = 0 if healthy else worker.failures + 1
+            worker.healthy = healthy or (worker.healthy and worker.failures < MAX_FAILURES)
+            if worker.healthy:
+                self._condition.notify_all()
+
+    def _restart(self, worker):
+        now = time.monotonic()
+        if now < worker.next_start:
+            return
+        logging.warning(f"重启紫微斗数进程 {worker.seq}（已重启 {worker.restarts} 次）")
+        worker.stop()
+        worker.restarts += 1
+        worker.next_start = now + min(MAX_RESTART_DELAY, 0.5 * 2 ** min(worker.restarts, 6))
+        worker.start()
+
+    def _supervise(self):
+        while not self._stopped.wait(self.health_interval):
+            for worker in self.workers:
+                if self._stopped.is_set():
+                    return
+                if not worker.alive():
+                    worker.healthy = False
+                    self._restart(worker)
+                    continue
+                if worker.base_url is None:
+                    # 仍在启动中
+                    if worker.wait_ready(0):
+                        self._update(worker, worker.check(self._session))
+                    continue
+                self._update(worker, worker.check(self._session))
+                if worker.failures >= MAX_FAILURES:
+                    self._restart(worker)
+
+    @contextlib.contextmanager
+    def lease(self, timeout=START_TIMEOUT, exclude=()):
+        """
+        选一个健康且未完成请求最少的进程（不含 exclude 中的地址），产出其 base_url；
+        timeout 秒内没有这样的进程时抛出 requests.ConnectionError
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                ready = [worker for worker in self.workers
+                         if worker.healthy and worker.alive() and worker.base_url not in exclude]
+                if ready:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopped.is_set():
+                    raise requests.ConnectionError("没有可用的紫微斗数进程")
+                self._condition.wait(min(remaining, 0.5))
+            worker = min(ready, key=lambda item: (item.outstanding, item.served))
+            worker.outstanding += 1
+        try:
+            yield worker.base_url
+        finally:
+            with self._condition:
+                worker.outstanding -= 1
+                worker.served += 1
+
+    def failed(self, base_url):
+        """请求 base_url 时连接失败：计一次健康检查失败，进程已退出时立即不再分配"""
+        for worker in self.workers:
+            if worker.base_url == base_url:
+                self._update(worker, False)
+                if not worker.alive():
+                    worker.healthy = False
+
+    def stats(self):
+        with self._condition:
+            return [worker.stats() for worker in self.workers]
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for worker in self.workers:
+            worker.stop()
+        self._session.close()
+
+
+@functools.lru_cache(maxsize=None)
+def get_pool(size, node="node", socket_path=None):
+    """每个进程按参数共享一个已启动的 ZiweiPool，解释器退出时停止"""
+    pool = ZiweiPool(size, node, socket_path=socket_path)
+    atexit.register(pool.stop)
+    return pool.start()
+
+
+def check(size, node="node", socket_path=None):
+    """启动 size 个进程，排一张盘后输出各进程状态，全部健康时返回 0"""
+    from utils.ziwei_json import SolarAPI
+
+    pool = ZiweiPool(size, node, socket_path=socket_path).start()
+    try:
+        api = SolarAPI(pool=pool)
+        start = time.perf_counter()
+        api.get_astrolabe_data("2000-8-16", 7, "女", ["2025-06-01"])
+        print(f"排盘 {(time.perf_counter() - start) * 1000:.1f} ms")
+        for stats in pool.stats():
+            print(stats)
+        return 0 if all(stats["healthy"] for stats in pool.stats()) else 1
+    finally:
+        pool.stop()
+
+
+def bench(count=500, node="node", socket_path=None):
+    """
+    TCP 与 Unix 域套接字的往返耗时：各启动一个进程，分别测 /health（只含传输）和排一张盘，
+    TCP 另测每次新建连接（不用连接池）的情况。返回 {方式: {请求: 分位数}}
+    """
+    import tempfile
+
+    from utils.bazi_bench import percentiles
+    from utils.ziwei_json import SolarAPI
+
+    directory = None if socket_path else tempfile.mkdtemp(prefix="ziwei-")
+    socket_path = socket_path or os.path.join(directory, "bench.sock")
+    tcp = ZiweiPool(1, node).start()
+    unix = ZiweiPool(1, node, socket_path=socket_path).start()
+    payload = {"date": "2000-8-16", "timezone": 7, "gender": "女", "period": ["2025-06-01"], "profile": "text"}
+    try:
+        clients = {"tcp": SolarAPI(pool=tcp), "unix": SolarAPI(pool=unix)}
+        calls = {
+            "tcp-新建连接": (lambda url: requests.get(f"{url}/health"),
+                        lambda url: requests.post(f"{url}/api/astro/solar", json=payload), tcp),
+        }
+        for name, api in clients.items():
+            calls[name] = (lambda url, api=api: api.session.get(f"{url}/health"),
+                           lambda url, api=api: api.session.post(f"{url}/api/astro/solar", json=payload),
+                           api.pool)
+        result = {}
+        for name, (health, chart, pool) in calls.items():
+            url = pool.workers[0].base_url
+            result[name] = {}
+            for request, func in (("health", health), ("solar", chart)):
+                for _ in range(min(50, count)):
+                    func(url).raise_for_status()
+                samples = []
+                for _ in range(count):
+                    start = time.perf_counter()
+                    func(url).raise_for_status()
+                    samples.append(time.perf_counter() - start)
+                result[name][request] = percentiles(samples)
+        return result
+    finally:
+        tcp.stop()
+        unix.stop()
+        if directory:
+            os.rmdir(directory)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="紫微斗数服务进程池")
+    parser.add_argument("--node", default="node", help="node 可执行文件")
+    parser.add_argument("--socket", help="Unix 域套接字路径（前缀），不给出时用 TCP")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    check_parser = subparsers.add_parser("check", help="启动进程池，排一张盘后输出各进程状态")
+    check_parser.add_argument("-n", "--size", type=int, default=os.cpu_count() or 1, help="进程数，默认为 CPU 数")
+    bench_parser = subparsers.add_parser("bench", help="比较 TCP 与 Unix 域套接字的往返耗时")
+    bench_parser.add_argument("-n", "--count", type=int, default=500, help="每项的请求次数")
+    options = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    if options.command == "check":
+        return check(options.size, options.node, options.socket)
+    for name, requests_ in bench(options.count, options.node, options.socket).items():
+        for request, stats in requests_.items():
+            print(f"{name:<12} {request:<7} p50 {stats['p50_ms']:.3f} ms  p90 {stats['p90_ms']:.3f} ms  "
+                  f"p99 {stats['p99_ms']:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,34 +1,185 @@
 // node index.js
 
+const fs = require("fs");
 const express = require("express");
 const { astro } = require("iztro");
 
 const app = express();
-const PORT = 3000;
+// 端口可由环境变量 PORT 指定，0 为由系统分配（utils/ziwei_pool.py 启动多个进程时使用）
+const PORT = process.env.PORT !== undefined ? Number(process.env.PORT) : 3000;
+// 给出环境变量 SOCKET（套接字路径）时改为监听 Unix 域套接字，与 Python 端在同一台机器时省去 TCP 的开销
+const SOCKET = process.env.SOCKET;
+// 空闲连接保持的毫秒数，长于客户端连接池的复用间隔，避免频繁重新建立连接
+const KEEP_ALIVE_TIMEOUT = 65000;
+// 一次批量请求最多的星盘数
+const BATCH_LIMIT = 1000;
+// range 展开后最多的日期数
+const RANGE_LIMIT = 240;
+const GRANULARITIES = ["decade", "year", "month"];
 
-// 解析 JSON 请求体
-app.use(express.json());
+// 解析 JSON 请求体（批量请求可能较大）
+app.use(express.json({ limit: "20mb" }));
+
+// profile 为 text 时只返回 utils/ziwei_json.py 转换文本用到的字段，full（默认）返回 iztro 的完整对象
+const PROFILES = ["full", "text"];
+
+function pick(source, keys) {
+    const target = {};
+    keys.forEach(key => {
+        if (source[key] !== undefined) {
+            target[key] = source[key];
+        }
+    });
+    return target;
+}
+
+function pickStars(stars) {
+    return (stars || []).map(star => pick(star, ["name", "type", "scope", "brightness", "mutagen"]));
+}
+
+function textAstrolabe(astrolabe) {
+    const result = pick(astrolabe, ["gender", "solarDate", "lunarDate", "chineseDate", "time", "timeRange", "sign",
+        "zodiac", "earthlyBranchOfBodyPalace", "earthlyBranchOfSoulPalace", "soul", "body", "fiveElementsClass"]);
+    result.palaces = astrolabe.palaces.map(palace => {
+        const item = pick(palace, ["index", "name", "isBodyPalace", "isOriginalPalace", "heavenlyStem",
+            "earthlyBranch", "changsheng12", "boshi12", "jiangqian12", "suiqian12", "ages"]);
+        item.majorStars = pickStars(palace.majorStars);
+        item.minorStars = pickStars(palace.minorStars);
+        item.adjectiveStars = pickStars(palace.adjectiveStars);
+        if (palace.decadal) {
+            item.decadal = pick(palace.decadal, ["range", "heavenlyStem", "earthlyBranch"]);
+        }
+        return item;
+    });
+    return result;
+}
+
+function textScope(scope) {
+    if (!scope) {
+        return scope;
+    }
+    const result = pick(scope, ["name", "heavenlyStem", "earthlyBranch", "mutagen", "palaceNames"]);
+    result.stars = (scope.stars || []).map(pickStars);
+    if (scope.yearlyDecStar) {
+        result.yearlyDecStar = pick(scope.yearlyDecStar, ["jiangqian12", "suiqian12"]);
+    }
+    return result;
+}
+
+function textHoroscope(horoscope, monthly) {
+    const result = pick(horoscope, ["solarDate", "lunarDate"]);
+    result.decadal = textScope(horoscope.decadal);
+    result.yearly = textScope(horoscope.yearly);
+    if (monthly) {
+        result.monthly = textScope(horoscope.monthly);
+    }
+    return result;
+}
+
+// range 为 { from_year, to_year, granularity }，检查不通过时返回错误信息
+function checkRange(range) {
+    const { from_year, to_year, granularity = "year" } = range;
+    if (!Number.isInteger(from_year) || !Number.isInteger(to_year) || from_year > to_year) {
+        return "range 的 from_year、to_year 须为整数且 from_year 不大于 to_year";
+    }
+    if (!GRANULARITIES.includes(granularity)) {
+        return `granularity 只能是 ${GRANULARITIES.join("、")}`;
+    }
+    if ((to_year - from_year + 1) * (granularity === "month" ? 12 : 1) > RANGE_LIMIT) {
+        return `range 展开后最多 ${RANGE_LIMIT} 个日期`;
+    }
+    return null;
+}
+
+// 请求参数（单个请求或批量中的一项），检查不通过时返回错误信息
+function checkParams({ date, gender, period, range, profile = "full" }) {
+    if (!date || !gender || (!period && !range)) {
+        return "缺少必要的参数";
+    }
+    if (!PROFILES.includes(profile)) {
+        return `profile 只能是 ${PROFILES.join("、")}`;
+    }
+    return range ? checkRange(range) : null;
+}
+
+// range -> 计算运限的日期。流年取 6 月 1 日（已过春节，仍在同一农历年）；
+// 流月取每个公历月的 15 日；大限取范围内每个大限的第一年，范围起始年总在其中
+function rangeDates(astrolabe, { from_year, to_year, granularity = "year" }) {
+    const years = [];
+    if (granularity === "decade") {
+        // 由虚岁推出出生的农历年，再由各宫的大限虚岁范围得到每个大限的起始年
+        const birthYear = from_year - astrolabe.horoscope(new Date(from_year, 5, 1)).age.nominalAge + 1;
+        const starts = astrolabe.palaces.map(palace => birthYear + palace.decadal.range[0] - 1)
+            .filter(year => year > from_year && year <= to_year);
+        years.push(from_year, ...starts.sort((a, b) => a - b));
+    } else {
+        for (let year = from_year; year <= to_year; year++) {
+            years.push(year);
+        }
+    }
+    if (granularity === "month") {
+        return years.flatMap(year => Array.from({ length: 12 }, (_, month) => new Date(year, month, 15)));
+    }
+    return years.map(year => new Date(year, 5, 1));
+}
+
+// 同一大限内各年的大限数据、同一年内各月的流年数据相同：每种只保留一份放在 scopes 中，
+// arr 中的 decadal、yearly 换成其在 scopes 中的下标，按 profile 投影也只做一次
+function shareScopes(horoscopes, profile, monthly) {
+    const scopes = { decadal: [], yearly: [] };
+    const seen = { decadal: new Map(), yearly: new Map() };
+    const arr = horoscopes.map(horoscope => {
+        const item = profile === "text" ? pick(horoscope, ["solarDate", "lunarDate"]) : { ...horoscope };
+        if (profile === "text" && monthly) {
+            item.monthly = textScope(horoscope.monthly);
+        }
+        ["decadal", "yearly"].forEach(name => {
+            const scope = horoscope[name];
+            const key = `${scope.index}|${scope.heavenlyStem}${scope.earthlyBranch}`;
+            if (!seen[name].has(key)) {
+                seen[name].set(key, scopes[name].length);
+                scopes[name].push(profile === "text" ? textScope(scope) : scope);
+            }
+            item[name] = seen[name].get(key);
+        });
+        return item;
+    });
+    return { arr, scopes };
+}
+
+// 按阳历或农历排出星盘，并计算 period 中每个日期（或 range 展开的日期）的运限
+function computeAstro(date, timezone, gender, period, isSolar, profile = "full", range = null) {
+    const astrolabe = isSolar ? astro.bySolar(date, timezone, gender) : astro.byLunar(date, timezone, gender);
+    const result = profile === "text" ? textAstrolabe(astrolabe) : astrolabe;
+    const name = isSolar ? "astrolabeSolar" : "astrolabeLunar";
+    if (range) {
+        const monthly = range.granularity === "month";
+        const horoscopes = rangeDates(astrolabe, range).map(dateObj => astrolabe.horoscope(dateObj));
+        return { [name]: result, ...shareScopes(horoscopes, profile, monthly) };
+    }
+    const arr = []
+    period.forEach(p => {
+        // 将字符串日期转换为 Date 对象
+        const dateObj = new Date(p);
+        const horoscope = astrolabe.horoscope(dateObj)
+        arr.push(profile === "text" ? textHoroscope(horoscope) : horoscope)
+    });
+    return { [name]: result, arr };
+}
 
 // 创建一个 API 接口，通过阳历获取星盘信息
 app.post("/api/astro/solar", (req, res) => {
-    const { date, timezone, gender, period } = req.body;
+    const { date, timezone, gender, period, range, profile = "full" } = req.body;
 
-    // 检查请求参数
-    if (!date || !gender || !period) {
-        return res.status(400).json({ error: "缺少必要的参数" });
+    // 检查请求参数：period 为日期列表，或以 range 给出年份范围
+    const error = checkParams(req.body);
+    if (error) {
+        return res.status(400).json({ error });
     }
 
     try {
         // 通过阳历获取星盘信息
-        const astrolabeSolar = astro.bySolar(date, timezone, gender)
-        const arr = []
-        period.forEach(p => {
-            // 将字符串日期转换为 Date 对象
-            const dateObj = new Date(p);
-            const horoscope = astrolabeSolar.horoscope(dateObj)
-            arr.push(horoscope)
-        });
-        return res.json({astrolabeSolar, arr});
+        return res.json(computeAstro(date, timezone, gender, period, true, profile, range));
     } catch (error) {
         console.error("计算阳历星盘信息时出错:", error);
         return res.status(500).json({ error: "计算阳历星盘信息时出错" });
@@ -37,31 +188,99 @@ app.post("/api/astro/solar", (req, res) => {
 
 // 创建一个 API 接口，通过农历获取星盘信息
 app.post("/api/astro/lunar", (req, res) => {
-    const { date, timezone, gender, period } = req.body;
+    const { date, timezone, gender, period, range, profile = "full" } = req.body;
 
-    // 检查请求参数
-    if (!date || !gender || !period) {
-        return res.status(400).json({ error: "缺少必要的参数" });
+    // 检查请求参数：period 为日期列表，或以 range 给出年份范围
+    const error = checkParams(req.body);
+    if (error) {
+        return res.status(400).json({ error });
     }
 
     try {
         // 通过农历获取星盘信息
-        const astrolabeLunar = astro.byLunar(date, timezone, gender);
-        const arr = []
-        period.forEach(p => {
-            // 将字符串日期转换为 Date 对象
-            const dateObj = new Date(p);
-            const horoscope = astrolabeLunar.horoscope(dateObj);
-            arr.push(horoscope)
-        });
-        return res.json({astrolabeLunar, arr});
+        return res.json(computeAstro(date, timezone, gender, period, false, profile, range));
     } catch (error) {
         console.error("计算农历星盘信息时出错:", error);
         return res.status(500).json({ error: "计算农历星盘信息时出错" });
     }
 });
 
+// 批量中的一项 -> { index, result } 或 { index, error }，单项出错不影响其他项
+function computeItem(item, index, profile) {
+    const { date, timezone, gender, period, range, calendar = "solar" } = item || {};
+    const error = item ? checkParams(item) : "缺少必要的参数";
+    if (error || (calendar !== "solar" && calendar !== "lunar")) {
+        return { index, error: error || "缺少必要的参数" };
+    }
+    try {
+        return { index, result: computeAstro(date, timezone, gender, period, calendar === "solar", profile, range) };
+    } catch (error) {
+        console.error(`计算第 ${index} 项星盘信息时出错:`, error);
+        return { index, error: "计算星盘信息时出错" };
+    }
+}
+
+// 创建一个 API 接口，一次请求计算多个星盘
+// 请求体为 { items: [{ date, timezone, gender, period 或 range, calendar: "solar" | "lunar" }], profile }；
+// Accept 为 application/x-ndjson 时每算完一项输出一行，否则算完后返回 { results: [...] }
+app.post("/api/astro/batch", async (req, res) => {
+    const { items, profile = "full" } = req.body;
+
+    // 检查请求参数
+    if (!Array.isArray(items)) {
+        return res.status(400).json({ error: "缺少必要的参数" });
+    }
+    if (!PROFILES.includes(profile)) {
+        return res.status(400).json({ error: `profile 只能是 ${PROFILES.join("、")}` });
+    }
+    if (items.length > BATCH_LIMIT) {
+        return res.status(413).json({ error: `一次最多 ${BATCH_LIMIT} 项` });
+    }
+
+    if (req.get("Accept") !== "application/x-ndjson") {
+        return res.json({ results: items.map((item, index) => computeItem(item, index, profile)) });
+    }
+
+    res.setHeader("Content-Type", "application/x-ndjson");
+    let closed = false;
+    res.on("close", () => { closed = true; });
+    for (let index = 0; index < items.length && !closed; index++) {
+        // 写满缓冲时等待对端读取，并让出事件循环，计算期间也能处理其他请求
+        if (!res.write(JSON.stringify(computeItem(items[index], index, profile)) + "\n")) {
+            await new Promise(resolve => {
+                res.once("drain", resolve);
+                res.once("close", resolve);
+            });
+        } else {
+            await new Promise(resolve => setImmediate(resolve));
+        }
+    }
+    res.end();
+});
+
+// 健康检查
+app.get("/health", (req, res) => {
+    return res.json({ status: "ok", pid: process.pid, uptime: process.uptime() });
+});
+
+// 由 utils/ziwei_pool.py 管理时，父进程退出（标准输入关闭）后随之退出
+if (process.env.ZIWEI_SUPERVISED) {
+    process.stdin.on("end", () => process.exit(0));
+    process.stdin.resume();
+}
+
 // 启动服务器
-app.listen(PORT, () => {
-    console.log(`服务器正在运行，访问地址: http://localhost:${PORT}`);
-});
\ No newline at end of file
+let server;
+if (SOCKET) {
+    // 删除上次退出时留下的套接字文件
+    fs.rmSync(SOCKET, { force: true });
+    server = app.listen(SOCKET, () => {
+        console.log(`服务器正在运行，访问地址: unix:${SOCKET}`);
+    });
+} else {
+    server = app.listen(PORT, () => {
+        console.log(`服务器正在运行，访问地址: http://localhost:${server.address().port}`);
+    });
+}
+server.keepAliveTimeout = KEEP_ALIVE_TIMEOUT;
+server.headersTimeout = KEEP_ALIVE_TIMEOUT + 1000;